@@ -0,0 +1,133 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# All rights reserved.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+# pyre-strict
+
+"""
+Compare the compile time of running the Cadence fusion passes to a fixed point
+by repeating the pass list, against FixedPointRewritePass.
+
+The graphs repeat blocks of the patterns from the fusion tests, which only
+fuse completely after several rounds of the pass list:
+
+    mm -> view -> view -> add -> transpose -> permute -> view -> view
+
+Usage:
+    python -m executorch.backends.cadence.aot.benchmark_fixed_point_passes \
+        --num_blocks 10 50 200
+"""
+
+import argparse
+import time
+from collections import Counter
+from typing import cast
+
+import executorch.backends.cadence.aot.ops_registrations  # noqa
+import torch
+from executorch.backends.cadence.aot.fuse_ops import CadenceFuseOpsInGraph
+from executorch.backends.cadence.aot.graph_builder import GraphBuilder
+from executorch.backends.cadence.aot.pass_utils import FixedPointRewritePass
+from executorch.exir.dialects._ops import ops as exir_ops
+from executorch.exir.pass_base import PassResult, ProxyValue
+
+
+def build_graph(num_blocks: int) -> torch.fx.GraphModule:
+    builder = GraphBuilder()
+    h: ProxyValue = builder.placeholder("x", torch.randn(4, 6))
+    for i in range(num_blocks):
+        w = builder.placeholder(f"w{i}", torch.randn(6, 6))
+        b = builder.placeholder(f"b{i}", torch.randn(6))
+        mm = builder.call_operator(op=exir_ops.edge.aten.mm.default, args=(h, w))
+        view = builder.call_operator(
+            op=exir_ops.edge.aten.view_copy.default, args=(mm, [2, 2, 6])
+        )
+        view = builder.call_operator(
+            op=exir_ops.edge.aten.view_copy.default, args=(view, [4, 6])
+        )
+        add = builder.call_operator(op=exir_ops.edge.aten.add.Tensor, args=(view, b))
+        transpose = builder.call_operator(
+            op=exir_ops.edge.aten.transpose_copy.int, args=(add, 0, 1)
+        )
+        permute = builder.call_operator(
+            op=exir_ops.edge.aten.permute_copy.default, args=(transpose, [1, 0])
+        )
+        view = builder.call_operator(
+            op=exir_ops.edge.aten.view_copy.default, args=(permute, [24])
+        )
+        h = builder.call_operator(
+            op=exir_ops.edge.aten.view_copy.default, args=(view, [4, 6])
+        )
+    builder.output([h])
+    return builder.get_graph_module()
+
+
+def op_counts(graph_module: torch.fx.GraphModule) -> Counter[str]:
+    return Counter(
+        str(node.target)
+        for node in graph_module.graph.nodes
+        if node.op == "call_function"
+    )
+
+
+def run_repeated(
+    graph_module: torch.fx.GraphModule,
+) -> tuple[torch.fx.GraphModule, int]:
+    """Repeat the pass list until no pass modifies the graph."""
+    passes = [p() for p in CadenceFuseOpsInGraph.passes]  # pyre-ignore[29]
+    rounds = 0
+    modified = True
+    while modified:
+        modified = False
+        rounds += 1
+        for p in passes:
+            result = cast(PassResult, p(graph_module))
+            graph_module = result.graph_module
+            modified |= result.modified
+    return graph_module, rounds
+
+
+def run_fixed_point(
+    graph_module: torch.fx.GraphModule,
+) -> tuple[torch.fx.GraphModule, FixedPointRewritePass]:
+    driver = FixedPointRewritePass(
+        [p() for p in CadenceFuseOpsInGraph.passes]  # pyre-ignore[29]
+    )
+    return cast(PassResult, driver(graph_module)).graph_module, driver
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num_blocks", type=int, nargs="+", default=[10, 50, 200])
+    args = parser.parse_args()
+
+    print(
+        f"{'blocks':>7} {'nodes':>6} {'rounds':>7} {'repeated (s)':>13} "
+        f"{'visits':>7} {'rewrites':>9} {'fixed point (s)':>16} {'speedup':>8}"
+    )
+    for num_blocks in args.num_blocks:
+        num_nodes = len(build_graph(num_blocks).graph.nodes)
+
+        start = time.perf_counter()
+        repeated, rounds = run_repeated(build_graph(num_blocks))
+        repeated_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        fixed_point, driver = run_fixed_point(build_graph(num_blocks))
+        fixed_point_seconds = time.perf_counter() - start
+
+        assert op_counts(repeated) == op_counts(
+            fixed_point
+        ), f"{op_counts(repeated)} != {op_counts(fixed_point)}"
+        print(
+            f"{num_blocks:>7} {num_nodes:>6} {rounds:>7} {repeated_seconds:>13.3f} "
+            f"{driver.num_visits:>7} {driver.num_rewrites:>9} "
+            f"{fixed_point_seconds:>16.3f} "
+            f"{repeated_seconds / fixed_point_seconds:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
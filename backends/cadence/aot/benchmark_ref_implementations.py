@@ -0,0 +1,145 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# All rights reserved.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+# pyre-strict
+
+"""
+Measure the host run time of the Cadence reference implementations against
+the float eager ops they stand for, on shapes of typical vision and speech
+models, and of a whole quantized model lowered with
+quantize_and_export_to_cadence against the eager model.
+
+Usage:
+    python -m executorch.backends.cadence.aot.benchmark_ref_implementations \
+        --iterations 20
+"""
+
+import argparse
+import time
+from typing import Callable
+
+import executorch.backends.cadence.aot.ops_registrations  # noqa
+import executorch.backends.cadence.aot.ref_implementations  # noqa
+import torch
+from executorch.backends.cadence.aot.compiler import quantize_and_export_to_cadence
+
+# Output scale of 1/256, as out_multiplier and out_shift
+_OUT_MULTIPLIER: int = -(1 << 30)
+_OUT_SHIFT: int = 9
+
+
+def _randint8(*shape: int) -> torch.Tensor:
+    return torch.randint(-128, 128, shape, dtype=torch.int8)
+
+
+def get_op_benchmarks() -> (
+    list[tuple[str, Callable[[], torch.Tensor], Callable[[], torch.Tensor]]]
+):
+    """(name, reference op, eager op) triples on the same shapes."""
+    x, w = _randint8(8, 64, 56, 56), _randint8(64, 64, 3, 3)
+    bias = torch.zeros(64, dtype=torch.int32)
+    xf, wf = x.float(), w.float()
+    conv = (
+        "quantized_conv2d_nchw 8x64x56x56",
+        lambda: torch.ops.cadence.quantized_conv2d_nchw.per_tensor(
+            x, w, bias, [1, 1], [1, 1], [1, 1], 1, 3, 0, 1.0, 1.0, 0, 0, 0
+        ),
+        lambda: torch.nn.functional.conv2d(xf, wf, padding=1),
+    )
+
+    src, weight = _randint8(128, 1024), _randint8(1024, 1024)
+    srcf, weightf = src.float(), weight.float()
+    linear = (
+        "quantized_linear 128x1024x1024",
+        lambda: torch.ops.cadence.quantized_linear.per_tensor(
+            src,
+            weight,
+            torch.zeros(1024, dtype=torch.int32),
+            3,
+            -1,
+            _OUT_MULTIPLIER,
+            _OUT_SHIFT,
+            0,
+            None,
+        ),
+        lambda: torch.nn.functional.linear(srcf, weightf),
+    )
+
+    zero_point = torch.tensor([3], dtype=torch.int32)
+    im2row = (
+        "im2row 8x64x56x56",
+        lambda: torch.ops.cadence.im2row(
+            x, (3, 3), (1, 1), (1, 1), (1, 1), zero_point, False
+        ),
+        lambda: torch.nn.functional.unfold(xf, (3, 3), padding=1).transpose(1, 2),
+    )
+
+    relu = (
+        "quantized_relu 8x64x56x56",
+        lambda: torch.ops.cadence.quantized_relu.per_tensor(
+            x, 3, 0, _OUT_MULTIPLIER, _OUT_SHIFT
+        ),
+        lambda: torch.relu(xf),
+    )
+    return [conv, linear, im2row, relu]
+
+
+class ConvNet(torch.nn.Module):
+    def __init__(self) -> None:
+        super().__init__()
+        self.conv1 = torch.nn.Conv2d(3, 32, 3, stride=2, padding=1)
+        self.conv2 = torch.nn.Conv2d(32, 64, 3, stride=2, padding=1)
+        self.linear = torch.nn.Linear(64 * 8 * 8, 10)
+
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        x = torch.relu(self.conv1(x))
+        x = torch.relu(self.conv2(x))
+        return self.linear(x.flatten(1))
+
+
+def seconds(fn: Callable[[], object], iterations: int) -> float:
+    """Mean run time of fn after a warm up run."""
+    fn()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    torch.manual_seed(0)
+    benchmarks = get_op_benchmarks()
+
+    model = ConvNet().eval()
+    inputs = (torch.randn(8, 3, 32, 32),)
+    simulated = quantize_and_export_to_cadence(model, inputs).exported_program()
+    simulated_module = simulated.module()
+    benchmarks.append(
+        (
+            "ConvNet 8x3x32x32",
+            lambda: simulated_module(*inputs),
+            lambda: model(*inputs),
+        )
+    )
+
+    print(f"{'benchmark':<34} {'reference (ms)':>15} {'eager (ms)':>11} {'ratio':>6}")
+    with torch.no_grad():
+        for name, reference, eager in benchmarks:
+            reference_seconds = seconds(reference, args.iterations)
+            eager_seconds = seconds(eager, args.iterations)
+            print(
+                f"{name:<34} {reference_seconds * 1000:>15.3f} "
+                f"{eager_seconds * 1000:>11.3f} "
+                f"{reference_seconds / eager_seconds:>6.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -17,9 +17,11 @@ from executorch.backends.cadence.aot.compiler_funcs import (
     QuantizedInputWrapper,
     trace as trace_fn,
 )
+from executorch.backends.cadence.aot.idma_scheduling import InsertIdmaPrefetchPass
 from executorch.backends.cadence.aot.memory_planning import (
     CadenceMemoryPlanning,
     print_memory_planning_info,
+    print_memory_traffic_report,
 )
 from executorch.backends.cadence.aot.quantizer.fusion_pass import QuantFusion
 from executorch.backends.cadence.aot.quantizer.quantizer import (
@@ -392,6 +394,7 @@ def export_to_executorch_gen_etrecord(
     alloc_graph_output: bool = True,
     memory_config: Optional[MemoryConfig] = None,
     dump_graphs: bool = False,
+    idma_prefetch: bool = False,
 ) -> ExecutorchProgramManager:
     ep = torch.export.export(model, inputs, strict=True)
     return _lower_ep_to_cadence_gen_etrecord(
@@ -403,6 +406,7 @@ def export_to_executorch_gen_etrecord(
         alloc_graph_output=alloc_graph_output,
         memory_config=memory_config,
         dump_graphs=dump_graphs,
+        idma_prefetch=idma_prefetch,
     )
 
 
@@ -418,6 +422,7 @@ def _lower_ep_to_cadence_gen_etrecord(
     alloc_graph_output: bool = True,
     memory_config: Optional[MemoryConfig] = None,
     dump_graphs: bool = False,
+    idma_prefetch: bool = False,
 ) -> ExecutorchProgramManager:
     edge_prog_manager = _lower_ep_to_edge(ep, dump_graphs)
     cadence_prog_manager = apply_exir_ops_passes(opt_level, edge_prog_manager)
@@ -431,6 +436,12 @@ def _lower_ep_to_cadence_gen_etrecord(
     if memory_config is None:
         memory_config = get_default_memory_config()
 
+    # Stage the operands of matmul and conv ops into fast memory with iDMA
+    if idma_prefetch:
+        cadence_prog_manager = cadence_prog_manager.transform(
+            [InsertIdmaPrefetchPass(memory_config)]
+        )
+
     memory_planning_pass = CadenceMemoryPlanning(
         memory_config,
         opt_level=opt_level,
@@ -457,6 +468,16 @@ def _lower_ep_to_cadence_gen_etrecord(
         alloc_graph_input,
         alloc_graph_output,
     )
+    # Re-plans the graph with every algorithm, so only when asked for
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        print_memory_traffic_report(
+            exec_prog,
+            memory_config,
+            opt_level,
+            alloc_graph_input,
+            alloc_graph_output,
+            log_level=logging.DEBUG,
+        )
 
     if output_dir:
         _gen_etrecord(edge_prog_manager, exec_prog, Path(output_dir))
@@ -0,0 +1,273 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# All rights reserved.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+# pyre-strict
+
+
+# This file contains the pass that schedules iDMA transfers between the memories
+# of the hierarchy, and a latency model to evaluate the resulting schedule.
+
+import collections
+import logging
+import operator
+from dataclasses import dataclass
+from typing import Optional
+
+# Import these for the cadence function signatures.
+import executorch.backends.cadence.aot.ops_registrations  # noqa: F401
+import torch
+import torch.fx
+from executorch.backends.cadence.aot.memory_planning import (
+    estimate_macs,
+    estimate_node_traffic,
+    estimate_read_factor,
+)
+from executorch.backends.cadence.aot.pass_utils import get_arg
+from executorch.backends.cadence.aot.utils import MemoryConfig
+from executorch.exir import memory
+from executorch.exir.dialects._ops import ops as exir_ops
+from executorch.exir.memory_planning import get_node_tensor_specs
+from executorch.exir.pass_base import PassBase, PassResult
+
+_IDMA_TRANSFERS = ("cadence::idma_copy", "cadence::idma_load", "cadence::idma_store")
+_IDMA_WAIT = "cadence::idma_wait"
+
+
+def _op_name(node: torch.fx.Node) -> Optional[str]:
+    schema = getattr(node.target, "_schema", None)
+    return schema.name if schema is not None else None
+
+
+def _is_compute_node(node: torch.fx.Node) -> bool:
+    return (
+        node.op == "call_function"
+        and node.target
+        not in (memory.alloc, memory.free, memory.view, operator.getitem)
+        and _op_name(node) not in (*_IDMA_TRANSFERS, _IDMA_WAIT)
+    )
+
+
+def _nbytes(node: torch.fx.Node) -> int:
+    if specs := get_node_tensor_specs(node):
+        return sum(spec.allocated_memory for spec in specs)
+    val = node.meta.get("val")
+    return val.numel() * val.element_size() if isinstance(val, torch.Tensor) else 0
+
+
+class InsertIdmaPrefetchPass(PassBase):
+    """
+    Stage the operands that matmul and conv kernels read repeatedly into fast
+    memory with asynchronous iDMA loads. These are the weights and graph
+    inputs, and with `stage_activations` also the outputs of other ops, for
+    hierarchies where activations do not fit in fast memory. A load is
+    issued `prefetch_distance` compute ops ahead of its consumer, which waits
+    for it, so that the transfer overlaps with the ops in between. With
+    `copy_out`, graph outputs are computed in fast memory and stored with
+    iDMA while the rest of the graph runs.
+
+    GenerateIdmaConstraints pins the staged buffers to memory 1, the fastest
+    memory, so they are planned before the other tensors. The buffers staged
+    at any point must fit in `fast_memory_fraction` of memory 1, which leaves
+    room for the buffers of the next ops being loaded while the current ones
+    are consumed (double buffering). Transfers alternate between
+    `num_channels` iDMA channels.
+    """
+
+    def __init__(
+        self,
+        memory_config: MemoryConfig,
+        prefetch_distance: int = 1,
+        min_reuse: float = 2.0,
+        fast_memory_fraction: float = 0.5,
+        copy_out: bool = True,
+        stage_activations: bool = False,
+        num_channels: int = 2,
+    ) -> None:
+        self.budget: int = int(memory_config.memory_sizes[0] * fast_memory_fraction)
+        self.prefetch_distance = prefetch_distance
+        self.min_reuse = min_reuse
+        self.copy_out = copy_out
+        self.stage_activations = stage_activations
+        self.num_channels = num_channels
+        # Intervals of compute op indices during which a buffer is staged in
+        # fast memory, and its size.
+        self.staged: list[tuple[int, int, int]] = []
+        self.num_transfers = 0
+
+    def _reserve(self, start: int, end: int, nbytes: int) -> bool:
+        """Reserve nbytes of fast memory from compute op start to end, if they fit."""
+        if nbytes == 0 or nbytes > self.budget:
+            return False
+        for i in range(start, end + 1):
+            live = sum(size for s, e, size in self.staged if s <= i <= e)
+            if live + nbytes > self.budget:
+                return False
+        self.staged.append((start, end, nbytes))
+        return True
+
+    def _transfer(
+        self, graph: torch.fx.Graph, op: torch._ops.OpOverload, src: torch.fx.Node
+    ) -> torch.fx.Node:
+        task_num = self.num_transfers
+        self.num_transfers += 1
+        transfer = graph.call_function(
+            op, args=(src, task_num, task_num % self.num_channels)
+        )
+        transfer.meta = {"val": src.meta["val"]}
+        return transfer
+
+    def _wait(self, graph: torch.fx.Graph, transfer: torch.fx.Node) -> torch.fx.Node:
+        wait = graph.call_function(
+            exir_ops.edge.cadence.idma_wait.default,
+            args=(transfer, transfer.args[1]),
+        )
+        wait.meta = {"val": transfer.meta["val"]}
+        return wait
+
+    def prefetch_operands(self, graph_module: torch.fx.GraphModule) -> int:
+        graph = graph_module.graph
+        position = {node: i for i, node in enumerate(graph.nodes)}
+        compute_nodes = [node for node in graph.nodes if _is_compute_node(node)]
+        compute_index = {node: i for i, node in enumerate(compute_nodes)}
+
+        num_staged = 0
+        for index, consumer in enumerate(compute_nodes):
+            for arg_index, src in enumerate(consumer.args):
+                if (
+                    # Already staged, e.g. for another arg of the same op
+                    src not in consumer.all_input_nodes
+                    or "val" not in src.meta
+                    or (src.op != "placeholder" and not self.stage_activations)
+                    or estimate_read_factor(consumer, arg_index) < self.min_reuse
+                ):
+                    continue
+                # Issue the load once src is available
+                issue = max(
+                    index - self.prefetch_distance, compute_index.get(src, -1) + 1
+                )
+                if not self._reserve(issue, index, _nbytes(src)):
+                    continue
+                issue_before = compute_nodes[issue]
+                if position[src] >= position[issue_before]:
+                    # src is produced by a node that is not a compute op, e.g.
+                    # a getitem, between the previous compute op and this one.
+                    issue_before = src.next
+                with graph.inserting_before(issue_before):
+                    load = self._transfer(
+                        graph, exir_ops.edge.cadence.idma_load.default, src
+                    )
+                with graph.inserting_before(consumer):
+                    wait = self._wait(graph, load)
+                consumer.replace_input_with(src, wait)
+                num_staged += 1
+        return num_staged
+
+    def copy_out_outputs(self, graph_module: torch.fx.GraphModule) -> int:
+        graph = graph_module.graph
+        output = graph.output_node()
+        compute_nodes = [node for node in graph.nodes if _is_compute_node(node)]
+        compute_index = {node: i for i, node in enumerate(compute_nodes)}
+
+        num_stored = 0
+        for src in dict.fromkeys(output.all_input_nodes):
+            index = compute_index.get(src)
+            # Only worth it if the store overlaps with later compute ops
+            if index is None or index + 1 >= len(compute_nodes):
+                continue
+            last_use = max(compute_index.get(user, index) for user in src.users)
+            if not self._reserve(index, last_use, _nbytes(src)):
+                continue
+            with graph.inserting_after(src):
+                store = self._transfer(
+                    graph, exir_ops.edge.cadence.idma_store.default, src
+                )
+            with graph.inserting_before(output):
+                wait = self._wait(graph, store)
+            output.replace_input_with(src, wait)
+            num_stored += 1
+        return num_stored
+
+    def call(self, graph_module: torch.fx.GraphModule) -> PassResult:
+        self.staged = []
+        num_staged = self.prefetch_operands(graph_module)
+        num_stored = self.copy_out_outputs(graph_module) if self.copy_out else 0
+        logging.debug(
+            f"Staged {num_staged} operands into fast memory, copying out {num_stored} outputs"
+        )
+        graph_module.recompile()
+        return PassResult(graph_module, num_staged + num_stored > 0)
+
+
+@dataclass
+class LatencyEstimate:
+    # Cycles of the whole graph
+    total_cycles: float
+    # Cycles spent in compute ops and issuing transfers
+    busy_cycles: float
+    # Cycles spent waiting for iDMA transfers
+    stall_cycles: float
+
+
+@dataclass
+class IdmaLatencyModel:
+    """
+    A simple model of a DSP with a memory hierarchy and an iDMA engine. A
+    compute op takes as long as its multiply-accumulates or its memory
+    accesses, whichever is longer. iDMA transfers run in the background, one
+    at a time per channel, and idma_wait stalls until its transfer is done.
+
+    Attributes:
+        memory_bytes_per_cycle: Bytes per cycle the core accesses in each
+            memory of the hierarchy, from memory 1.
+        default_bytes_per_cycle: Bytes per cycle the core accesses in tensors
+            that are not memory planned, e.g. constants.
+        macs_per_cycle: Multiply-accumulates (or elements, for ops other than
+            matmul and conv) per cycle.
+        dma_bytes_per_cycle: Bytes per cycle of an iDMA transfer.
+        dma_issue_cycles: Cycles the core spends issuing an iDMA transfer.
+    """
+
+    memory_bytes_per_cycle: list[float]
+    default_bytes_per_cycle: float
+    macs_per_cycle: float = 8.0
+    dma_bytes_per_cycle: float = 8.0
+    dma_issue_cycles: float = 32.0
+
+    def bytes_per_cycle(self, mem_id: Optional[int]) -> float:
+        if mem_id is None or not 1 <= mem_id <= len(self.memory_bytes_per_cycle):
+            return self.default_bytes_per_cycle
+        return self.memory_bytes_per_cycle[mem_id - 1]
+
+    def compute_cycles(self, node: torch.fx.Node) -> float:
+        memory_cycles = sum(
+            nbytes / self.bytes_per_cycle(spec.mem_id)
+            for spec, nbytes in estimate_node_traffic(node)
+        )
+        return max(estimate_macs(node) / self.macs_per_cycle, memory_cycles)
+
+    def simulate(self, graph_module: torch.fx.GraphModule) -> LatencyEstimate:
+        """Estimate the latency of a memory planned graph."""
+        now = busy = stall = 0.0
+        channel_free: dict[int, float] = collections.defaultdict(float)
+        task_done: dict[int, float] = {}
+        for node in graph_module.graph.nodes:
+            name = _op_name(node)
+            if name in _IDMA_TRANSFERS:
+                now += self.dma_issue_cycles
+                busy += self.dma_issue_cycles
+                channel = get_arg(node, "channel", int)
+                start = max(now, channel_free[channel])
+                channel_free[channel] = start + _nbytes(node) / self.dma_bytes_per_cycle
+                task_done[get_arg(node, "task_num", int)] = channel_free[channel]
+            elif name == _IDMA_WAIT:
+                done = task_done.get(get_arg(node, "task_num", int), now)
+                stall += max(0.0, done - now)
+                now = max(now, done)
+            elif _is_compute_node(node):
+                cycles = self.compute_cycles(node)
+                now += cycles
+                busy += cycles
+        return LatencyEstimate(total_cycles=now, busy_cycles=busy, stall_cycles=stall)
@@ -9,6 +9,8 @@
 import collections
 import itertools
 import logging
+import math
+import operator
 from typing import Callable, Iterable, Optional, Sequence, TypeAlias
 
 import torch
@@ -24,8 +26,12 @@ from executorch.backends.cadence.aot.utils import (
     MemoryPlanningAlgoFailure,
 )
 
-from executorch.exir import ExecutorchProgramManager
-from executorch.exir.memory_planning import collect_specs_from_nodes, Verifier
+from executorch.exir import ExecutorchProgramManager, memory
+from executorch.exir.memory_planning import (
+    collect_specs_from_nodes,
+    get_node_tensor_specs,
+    Verifier,
+)
 from executorch.exir.pass_base import PassBase
 from executorch.exir.pass_manager import PassManager
 from executorch.exir.passes import MemoryPlanningPass
@@ -33,6 +39,7 @@ from executorch.exir.tensor import TensorSpec
 from tabulate import tabulate
 from torch.export.exported_program import ExportGraphSignature
 from torch.fx.passes.infra.pass_base import PassResult
+from torch.utils import _pytree as pytree
 
 
 def collect_specs_from_graph_module(
@@ -188,6 +195,188 @@ class GreedyWithHeuristic(MemoryPlanningAlgo):
         )
 
 
+# Number of output rows/columns a matmul or conv kernel computes per pass over
+# its operands. Each operand element is read once per pass.
+KERNEL_OUTPUT_TILE = 16
+
+
+def _shape(node: torch.fx.Node) -> Optional[Sequence[int]]:
+    """The shape of the (first) tensor of node, from its spec or fake value."""
+    if specs := get_node_tensor_specs(node):
+        return specs[0].shape
+    val = node.meta.get("val")
+    if isinstance(val, (list, tuple)):
+        val = val[0] if val else None
+    return val.shape if isinstance(val, torch.Tensor) else None
+
+
+def _numel(node: torch.fx.Node) -> int:
+    shape = _shape(node)
+    return math.prod(shape) if shape is not None else 0
+
+
+def _matmul_macs(lhs_index: int) -> Callable[[torch.fx.Node], int]:
+    def macs(node: torch.fx.Node) -> int:
+        lhs = node.args[lhs_index]
+        assert isinstance(lhs, torch.fx.Node)
+        shape = _shape(lhs)
+        return _numel(node) * (shape[-1] if shape else 0)
+
+    return macs
+
+
+def _conv_macs(node: torch.fx.Node) -> int:
+    weight = node.args[1]
+    assert isinstance(weight, torch.fx.Node)
+    shape = _shape(weight)
+    if not shape:
+        return 0
+    # Every output element reads weight.numel() / out_channels inputs.
+    return _numel(node) * math.prod(shape[1:])
+
+
+# Kernels that read their operands more than once, by op name prefix: their
+# multiply-accumulate count, and the argument indices of the operands.
+_REUSING_KERNELS: list[tuple[str, Callable[[torch.fx.Node], int], tuple[int, ...]]] = [
+    ("aten::addmm", _matmul_macs(1), (1, 2)),
+    ("aten::bmm", _matmul_macs(0), (0, 1)),
+    ("aten::convolution", _conv_macs, (0, 1)),
+    ("aten::linear", _matmul_macs(0), (0, 1)),
+    ("aten::matmul", _matmul_macs(0), (0, 1)),
+    ("aten::mm", _matmul_macs(0), (0, 1)),
+    ("cadence::conv", _conv_macs, (0, 1)),
+    ("cadence::quantized_conv", _conv_macs, (0, 1)),
+    ("cadence::quantized_fully_connected", _matmul_macs(0), (0, 1)),
+    ("cadence::quantized_linear", _matmul_macs(0), (0, 1)),
+    ("cadence::quantized_matmul", _matmul_macs(0), (0, 2)),
+]
+
+
+def _reusing_kernel(
+    node: torch.fx.Node,
+) -> Optional[tuple[Callable[[torch.fx.Node], int], tuple[int, ...]]]:
+    schema = getattr(node.target, "_schema", None)
+    if schema is None:
+        return None
+    for prefix, macs_fn, operand_indices in _REUSING_KERNELS:
+        if schema.name.startswith(prefix):
+            return macs_fn, operand_indices
+    return None
+
+
+def estimate_macs(node: torch.fx.Node) -> int:
+    """
+    Multiply-accumulates of matmul and conv nodes, and the number of output
+    elements of other ops.
+    """
+    if (kernel := _reusing_kernel(node)) is not None:
+        return kernel[0](node)
+    return _numel(node)
+
+
+def estimate_read_factor(node: torch.fx.Node, arg_index: int) -> float:
+    """Estimated number of times node reads each element of its arg_index-th arg."""
+    kernel = _reusing_kernel(node)
+    if kernel is None or arg_index not in kernel[1]:
+        return 1.0
+    arg = node.args[arg_index]
+    assert isinstance(arg, torch.fx.Node)
+    numel = _numel(arg)
+    if numel == 0:
+        return 1.0
+    return max(1.0, kernel[0](node) / (numel * KERNEL_OUTPUT_TILE))
+
+
+def estimate_node_traffic(node: torch.fx.Node) -> list[tuple[TensorSpec, float]]:
+    """
+    Estimate the bytes node writes to and reads from the tensors it accesses.
+    Outputs are written once. Inputs are read once, except for the operands
+    of matmul and conv kernels (see `_REUSING_KERNELS`), which are read once
+    per KERNEL_OUTPUT_TILE output rows or channels.
+    """
+    if node.op != "call_function" or node.target in (
+        memory.alloc,
+        memory.free,
+        memory.view,
+        operator.getitem,
+    ):
+        return []
+    schema = getattr(node.target, "_schema", None)
+    out_args = (
+        {arg.name for arg in schema.arguments if arg.is_out}
+        if schema is not None
+        else set()
+    )
+    # Outputs, including the out args of out variants
+    accesses = [(spec, float(spec.nbytes())) for spec in get_node_tensor_specs(node)]
+    # Inputs
+    inputs = [(i, arg) for i, arg in enumerate(node.args)] + [
+        (-1, arg) for name, arg in node.kwargs.items() if name not in out_args
+    ]
+    for i, arg in inputs:
+        for input_node in pytree.tree_leaves(arg):
+            if not isinstance(input_node, torch.fx.Node):
+                continue
+            factor = estimate_read_factor(node, i) if i >= 0 else 1.0
+            for spec in get_node_tensor_specs(input_node):
+                accesses.append((spec, spec.nbytes() * factor))
+    return accesses
+
+
+def estimate_tensor_traffic(
+    graph_module: torch.fx.GraphModule,
+) -> dict[TensorSpec, int]:
+    """
+    Estimate the bytes all ops of the graph read from and write to each
+    tensor, see estimate_node_traffic.
+    """
+    traffic: dict[TensorSpec, float] = collections.defaultdict(float)
+    for node in graph_module.graph.nodes:
+        for spec, nbytes in estimate_node_traffic(node):
+            traffic[spec] += nbytes
+    return {spec: int(nbytes) for spec, nbytes in traffic.items()}
+
+
+class AccessFrequencyAwareGreedy(GreedyWithHeuristic):
+    """
+    Greedily place the tensors with the most estimated traffic per byte in the
+    fastest memory available, to maximize the bytes served from fast memory.
+    Offsets are found as in GreedyWithHeuristic.
+    """
+
+    def plan(
+        self,
+        specs: Iterable[TensorSpec],
+        graph_module: torch.fx.GraphModule,
+        graph_signature: ExportGraphSignature,
+        state: MemoryPlanningState,
+        placement_constraints: MemConstraints,
+        extra_padding: int = 0,
+    ) -> None:
+        """Plan memory allocation for the given tensor specs."""
+        traffic = estimate_tensor_traffic(graph_module)
+
+        # Iterate over the specs by decreasing traffic per allocated byte, and
+        # by decreasing size between equally accessed ones.
+        for spec in sorted(
+            specs,
+            key=lambda spec: (
+                traffic.get(spec, 0) / max(spec.allocated_memory, 1),
+                spec.allocated_memory,
+            ),
+            reverse=True,
+        ):
+            self.plan_spec(spec, state, placement_constraints)
+            if not state.is_placed(spec):
+                raise MemoryPlanningAlgoFailure(
+                    f"Cannot fit {spec} in any memory hierarchy for {self.memory_config}"
+                )
+
+        logging.debug(
+            f"access frequency aware greedy with hierarchy returns bufsizes: {state.bufsizes}"
+        )
+
+
 def find_peak_memory_usages_per_memory(
     graph_module: torch.fx.GraphModule,
     graph_signature: ExportGraphSignature,
@@ -364,6 +553,129 @@ def print_memory_planning_info(
     )
 
 
+def find_memory_traffic_per_memory(
+    graph_module: torch.fx.GraphModule,
+    num_memories: int,
+    traffic: Optional[dict[TensorSpec, int]] = None,
+) -> list[int]:
+    """
+    Given a GraphModule with a memory plan, estimate the bytes accessed in each
+    memory of the memory hierarchy, indexed from mem_id 1.
+    """
+    if traffic is None:
+        traffic = estimate_tensor_traffic(graph_module)
+    usages = [0] * num_memories
+    for spec, nbytes in traffic.items():
+        if spec.mem_id is not None and 1 <= spec.mem_id <= num_memories:
+            usages[spec.mem_id - 1] += nbytes
+    return usages
+
+
+def compare_memory_traffic(
+    graph_module: torch.fx.GraphModule,
+    graph_signature: Optional[ExportGraphSignature],
+    memory_config: MemoryConfig,
+    opt_level: int,
+    alloc_graph_input: bool,
+    alloc_graph_output: bool,
+    additional_constraint_gen_passes: Optional[Sequence[ConstraintsGenPass]] = None,
+) -> dict[str, Optional[list[int]]]:
+    """
+    Plan the graph with every CadenceMemoryPlanning algorithm, and estimate
+    the bytes each plan accesses in each memory. Algorithms that cannot plan
+    the graph map to None. The memory plan of the graph is left unchanged.
+    """
+    traffic = estimate_tensor_traffic(graph_module)
+    specs = list(
+        collect_specs_from_nodes(
+            graph_module.graph.nodes,
+            graph_signature,
+            do_assertion=False,
+            ignore_graph_input=not alloc_graph_input,
+            ignore_graph_output=not alloc_graph_output,
+        )
+    )
+    # Planning sets the placement of specs, and constraints may extend lifetimes
+    all_specs = set(specs) | set(traffic.keys())
+    saved = {
+        spec: (spec.mem_id, spec.mem_offset, list(spec.lifetime)) for spec in all_specs
+    }
+
+    num_memories = len(memory_config.memory_sizes)
+    results: dict[str, Optional[list[int]]] = {}
+    try:
+        for algo in CadenceMemoryPlanning.get_mem_algos(
+            memory_config,
+            opt_level,
+            alloc_graph_input,
+            alloc_graph_output,
+            additional_constraint_gen_passes,
+        ):
+            for spec, (_, _, lifetime) in saved.items():
+                spec.mem_id, spec.mem_offset = None, None
+                spec.lifetime = list(lifetime)
+            try:
+                algo(1, specs, graph_module, graph_signature)
+            except (MemoryError, MemoryPlanningAlgoFailure) as e:
+                logging.debug(f"{type(algo).__name__} failed: {e}")
+                results[type(algo).__name__] = None
+                continue
+            results[type(algo).__name__] = find_memory_traffic_per_memory(
+                graph_module, num_memories, traffic
+            )
+    finally:
+        for spec, (mem_id, mem_offset, lifetime) in saved.items():
+            spec.mem_id, spec.mem_offset, spec.lifetime = mem_id, mem_offset, lifetime
+    return results
+
+
+# Print a table with the estimated bytes accessed in each memory space by the
+# memory plan of every algorithm. Memory spaces are ordered from the fastest,
+# e.g. TCM, to the slowest, e.g. DRAM, whose traffic is the one to minimize.
+#
+# +----------------------------------+---------------+----------------+
+# | Memory Planning Algorithm        |   TCM (Bytes) |   DRAM (Bytes) |
+# +==================================+===============+================+
+# | PositionBasedGreedyWithHierarchy |         12288 |          86016 |
+# | GreedyWithHeuristic              |         12288 |          86016 |
+# | AccessFrequencyAwareGreedy       |         20480 |          77824 |
+# +----------------------------------+---------------+----------------+
+def print_memory_traffic_report(
+    executorch_prog: ExecutorchProgramManager,
+    memory_config: MemoryConfig,
+    opt_level: int,
+    alloc_graph_input: bool,
+    alloc_graph_output: bool,
+    log_level=logging.INFO,
+) -> None:
+    traffic_per_algo = compare_memory_traffic(
+        executorch_prog.exported_program().graph_module,
+        executorch_prog.exported_program().graph_signature,
+        memory_config,
+        opt_level,
+        alloc_graph_input,
+        alloc_graph_output,
+    )
+
+    memory_names = memory_config.memory_names
+    headers = [
+        "Memory Planning Algorithm",
+        *[
+            f"{(i + 1) if memory_names is None else memory_names[i]} (Bytes)"
+            for i in range(len(memory_config.memory_sizes))
+        ],
+    ]
+    table = [
+        [name, *(usages if usages is not None else ["failed"])]
+        for name, usages in traffic_per_algo.items()
+    ]
+    logging.log(
+        log_level,
+        "\nEstimated memory traffic\n"
+        + tabulate(table, headers=headers, tablefmt="outline"),
+    )
+
+
 class SimplifyIdmaOpsPass(PassBase):
     """Replace idma_load and idma_store with idma_copy."""
 
@@ -374,7 +686,6 @@ class SimplifyIdmaOpsPass(PassBase):
         ):
             modified = True
             node.target = torch.ops.cadence.idma_copy.out
-            node.args = (node.args[0], *node.args[2:])
 
         for node in graph_module.graph.find_nodes(
             op="call_function", target=torch.ops.cadence.idma_store.out
@@ -439,6 +750,13 @@ class CadenceMemoryPlanning:
                 alloc_graph_output=alloc_graph_output,
                 additional_constraint_gen_passes=additional_constraint_gen_passes,
             ),
+            AccessFrequencyAwareGreedy(
+                memory_config=memory_config,
+                opt_level=opt_level,
+                alloc_graph_input=alloc_graph_input,
+                alloc_graph_output=alloc_graph_output,
+                additional_constraint_gen_passes=additional_constraint_gen_passes,
+            ),
         ]
 
     def __call__(
@@ -6,9 +6,22 @@
 
 # pyre-strict
 
+import collections
+import logging
 from abc import abstractmethod
 from dataclasses import dataclass
-from typing import Callable, List, Optional, override, Set, Type, TypeVar, Union
+from typing import (
+    Callable,
+    Iterable,
+    List,
+    Optional,
+    override,
+    Sequence,
+    Set,
+    Type,
+    TypeVar,
+    Union,
+)
 
 import torch
 from beartype.door import die_if_unbearable
@@ -325,3 +338,212 @@ class RemoveOrReplacePassInterface(HierarchicalInplacePassInterface):
                     continue
                 changed |= self.maybe_remove_or_replace(node)
         return changed
+
+
+class _GraphChangeTracker:
+    """
+    Track the nodes created and erased in a graph module. The node hooks of
+    GraphModule are private, so if they are missing the changes are found by
+    comparing the nodes of the graph in `sync`, which is linear in its size.
+    """
+
+    use_hooks: bool = all(
+        hasattr(torch.fx.GraphModule, hook)
+        for hook in (
+            "_register_create_node_hook",
+            "_register_erase_node_hook",
+            "_unregister_create_node_hook",
+            "_unregister_erase_node_hook",
+        )
+    )
+
+    def __init__(self, graph_module: torch.fx.GraphModule) -> None:
+        self.graph_module = graph_module
+        self.created: list[Node] = []
+        self.erased: set[Node] = set()
+        self._nodes: set[Node] = set()
+
+    def __enter__(self) -> "_GraphChangeTracker":
+        if self.use_hooks:
+            self.graph_module._register_create_node_hook(self.created.append)
+            self.graph_module._register_erase_node_hook(self.erased.add)
+        else:
+            self._nodes = set(self.graph_module.graph.nodes)
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        if self.use_hooks:
+            self.graph_module._unregister_create_node_hook(self.created.append)
+            self.graph_module._unregister_erase_node_hook(self.erased.add)
+
+    def sync(self) -> None:
+        """Bring created and erased up to date with the graph."""
+        if self.use_hooks:
+            return
+        nodes = set(self.graph_module.graph.nodes)
+        self.created.extend(
+            n for n in self.graph_module.graph.nodes if n not in self._nodes
+        )
+        self.erased |= self._nodes - nodes
+        self._nodes = nodes
+
+
+class FixedPointRewritePass(ExportPass):
+    """
+    Run a group of passes until none of them modifies the graph.
+
+    The patterns of RemoveOrReplacePassInterface passes subscribe to their
+    targets, and a worklist drives them: every node is visited once, and after
+    a rewrite only the nodes around the rewritten ones are visited again,
+    instead of re-traversing and retracing the graph for each pass. Nodes that
+    lose their last user are erased on the way, so that patterns that depend
+    on the number of users see the graph as it would be after dead code
+    elimination. Patterns are tried in the order of the passes.
+
+    Patterns look at a few nodes around the node they match, e.g. mm -> view ->
+    add in FuseMMWithAdd, so a rewrite revisits the nodes up to `radius` edges
+    away from the nodes it changed.
+
+    The graph is only retraced at the end of a round, so `meta['val']` is not
+    updated by the rewrites in between: patterns may find it missing or stale
+    on the nodes created or modified earlier in the same round.
+
+    The other passes run in order once the worklist is empty, and the whole
+    group is repeated if any of them modified the graph, up to max_iterations
+    times.
+    """
+
+    def __init__(
+        self,
+        passes: Sequence[PassBase],
+        max_iterations: int = 10,
+        radius: int = 2,
+    ) -> None:
+        super().__init__()
+        self.radius = radius
+        self.patterns: dict[
+            torch.fx.node.Target, list[RemoveOrReplacePassInterface]
+        ] = collections.defaultdict(list)
+        self.other_passes: list[PassBase] = []
+        for p in passes:
+            if isinstance(p, RemoveOrReplacePassInterface):
+                for target in p.targets:
+                    self.patterns[target].append(p)
+            else:
+                self.other_passes.append(p)
+        self.max_iterations = max_iterations
+        # Statistics of the last call
+        self.num_visits = 0
+        self.num_rewrites = 0
+
+    def _apply_patterns(self, node: Node, changes: _GraphChangeTracker) -> list[Node]:
+        """
+        Apply the first pattern that rewrites node. Returns the nodes around the
+        rewrite, which need to be visited again.
+        """
+        for pattern in self.patterns.get(node.target, []):
+            neighbors = [*node.all_input_nodes, *node.users]
+            changes.created.clear()
+            num_erased = len(changes.erased)
+            rewritten = pattern.maybe_remove_or_replace(node)
+            changes.sync()
+            # Some patterns modify the graph without reporting it
+            if rewritten or changes.created or len(changes.erased) > num_erased:
+                self.num_rewrites += 1
+                return self._neighborhood(
+                    [
+                        n
+                        for n in [node, *neighbors, *changes.created]
+                        if n not in changes.erased
+                    ]
+                )
+        return []
+
+    def _neighborhood(self, nodes: list[Node]) -> list[Node]:
+        """The nodes up to `radius` edges away from nodes, including them."""
+        visited = dict.fromkeys(nodes)
+        frontier = nodes
+        for _ in range(self.radius):
+            frontier = [
+                n
+                for node in frontier
+                for n in [*node.all_input_nodes, *node.users]
+                if n not in visited
+            ]
+            visited.update(dict.fromkeys(frontier))
+        return list(visited)
+
+    def _rewrite_flat(self, graph_module: torch.fx.GraphModule) -> bool:
+        graph = graph_module.graph
+        worklist: collections.deque[Node] = collections.deque()
+        queued: set[Node] = set()
+
+        def push(nodes: Iterable[Node]) -> None:
+            for node in nodes:
+                if node.op == "call_function" and node not in queued:
+                    queued.add(node)
+                    worklist.append(node)
+
+        push(graph.nodes)
+        # Guard against patterns that keep rewriting each other's output
+        max_rewrites = self.num_rewrites + self.max_iterations * len(graph.nodes)
+        modified = False
+        with _GraphChangeTracker(graph_module) as changes:
+            while worklist and self.num_rewrites <= max_rewrites:
+                node = worklist.popleft()
+                queued.discard(node)
+                if node in changes.erased:
+                    continue
+                self.num_visits += 1
+                if len(node.users) == 0:
+                    if not node.is_impure():
+                        inputs = node.all_input_nodes
+                        graph.erase_node(node)
+                        changes.erased.add(node)
+                        modified = True
+                        push(self._neighborhood(inputs))
+                    continue
+                # The node, if it is still there, is visited again from the worklist
+                changed = self._apply_patterns(node, changes)
+                modified |= len(changed) > 0
+                push(changed)
+
+        if worklist:
+            logging.warning(
+                f"{type(self).__name__}: stopping after {self.num_rewrites} "
+                "rewrites without reaching a fixed point"
+            )
+        return modified
+
+    def call(self, graph_module: torch.fx.GraphModule) -> PassResult:
+        self.num_visits = 0
+        self.num_rewrites = 0
+        modified = False
+        for _ in range(self.max_iterations):
+            rewritten = False
+            for module in filter(
+                lambda m: isinstance(m, torch.fx.GraphModule), graph_module.modules()
+            ):
+                rewritten |= self._rewrite_flat(module)
+            if rewritten:
+                # Retrace once for all the rewrites, to update `meta['val']`
+                graph_module.graph.eliminate_dead_code()
+                graph_module.recompile()
+                graph_module = super().call(graph_module).graph_module
+
+            swept = False
+            for p in self.other_passes:
+                result = p(graph_module)
+                if result is not None and result.modified:
+                    graph_module = result.graph_module
+                    swept = True
+
+            modified |= rewritten or swept
+            if not swept:
+                break
+        else:
+            logging.warning(
+                f"{type(self).__name__}: no fixed point after {self.max_iterations} "
+                "iterations"
+            )
+        return PassResult(graph_module, modified)
@@ -6,6 +6,8 @@
 
 # pyre-strict
 
+import functools
+import itertools
 from typing import Any, Callable, cast, List, Optional, Type
 
 import torch
@@ -19,6 +21,7 @@ from executorch.backends.cadence.aot.fuse_ops import (
 from executorch.backends.cadence.aot.pass_utils import (
     CadencePassAttribute,
     create_cadence_pass_filter,
+    FixedPointRewritePass,
     register_cadence_pass,
 )
 
@@ -35,7 +38,7 @@ from executorch.backends.cadence.aot.replace_ops import (
 from executorch.backends.cadence.aot.simplify_ops import CadenceSimplifyOpsInGraph
 from executorch.backends.cadence.aot.type_dispatch import CompileTimeTypeDispatchPass
 from executorch.exir import EdgeProgramManager
-from executorch.exir.pass_base import ExportPass, PassResult
+from executorch.exir.pass_base import ExportPass, PassBase, PassResult
 from executorch.exir.pass_manager import PassManager, PassType
 from executorch.exir.passes import dead_code_elimination_pass
 from executorch.exir.passes.scalar_to_tensor_pass import ScalarToTensorPass
@@ -96,19 +99,61 @@ def get_passes_in_default_order() -> list[Type[ExportPass]]:
     return pytree.tree_flatten(passes)[0]
 
 
+# Pass groups that run to a fixed point with FixedPointRewritePass
+FIXED_POINT_PASS_GROUPS: list[list[Type[ExportPass]]] = [
+    CadenceReorderOpsInGraph.passes,
+    CadenceFuseOpsInGraph.passes,
+]
+
+
+def group_fixed_point_passes(
+    passes: list[Type[ExportPass]],
+) -> list[Callable[[], PassBase]]:
+    """
+    Replace the consecutive passes of each group in FIXED_POINT_PASS_GROUPS by
+    a single FixedPointRewritePass.
+    """
+
+    def group_index(p: Type[ExportPass]) -> Optional[int]:
+        return next(
+            (i for i, group in enumerate(FIXED_POINT_PASS_GROUPS) if p in group),
+            None,
+        )
+
+    grouped_passes: list[Callable[[], PassBase]] = []
+    for index, group in itertools.groupby(passes, key=group_index):
+        group_passes = list(group)
+        if index is None:
+            grouped_passes.extend(group_passes)
+        else:
+            grouped_passes.append(
+                functools.partial(FixedPointRewritePass, [p() for p in group_passes])
+            )
+    return grouped_passes
+
+
 def apply_exir_ops_passes(
     opt_level: int,
     edge_prog_manager: EdgeProgramManager,
+    fixed_point: bool = False,
 ) -> EdgeProgramManager:
+    """
+    Apply the Cadence passes enabled at opt_level. With fixed_point, the
+    reorder and fusion passes run until they no longer modify the graph.
+    """
     passes = get_passes_in_default_order()
     pass_filter = create_cadence_pass_filter(opt_level)
+    filtered_passes: list[Type[ExportPass]] = list(filter(pass_filter, passes))
+    cadence_pass_ctors: list[Callable[[], PassBase]] = (
+        group_fixed_point_passes(filtered_passes) if fixed_point else filtered_passes
+    )
     cadence_passes = [
         (
             lambda graph_module, filtered_pass=filtered_pass: filtered_pass()(
                 graph_module
             )
         )
-        for filtered_pass in list(filter(pass_filter, passes))
+        for filtered_pass in cadence_pass_ctors
     ]
     cadence_prog_manager = edge_prog_manager.transform(
         cast(
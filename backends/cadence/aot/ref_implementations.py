@@ -58,6 +58,81 @@ qdtype_map: dict[ScalarType, torch.dtype] = {
     ScalarType.QINT32: torch.qint32,
 }
 
+# float32 and float64 represent every integer of magnitude up to 2**24 and
+# 2**53 exactly
+_FLOAT32_EXACT_INT_LIMIT: int = 1 << 24
+_FLOAT64_EXACT_INT_LIMIT: int = 1 << 53
+
+
+def _max_abs(x: torch.Tensor, zero_point: torch.Tensor | int = 0) -> int:
+    """The largest magnitude of x - zero_point, without materializing it."""
+    if x.numel() == 0:
+        return 0
+    x_min, x_max = (int(v) for v in torch.aminmax(x))
+    if isinstance(zero_point, torch.Tensor):
+        zp_min, zp_max = (int(v) for v in torch.aminmax(zero_point))
+    else:
+        zp_min = zp_max = int(zero_point)
+    return max(abs(x_max - zp_min), abs(x_min - zp_max))
+
+
+def _accumulation_dtype(lhs_bound: int, rhs_bound: int, depth: int) -> torch.dtype:
+    """
+    The dtype in which the integer dot products of `depth` terms of a matmul or
+    conv are exact, like the integer accumulators of the kernels. float32 BLAS
+    is used whenever it is exact, then float64, which are much faster than
+    integer matmuls. int64 is only used for dot products beyond 2**53, e.g.
+    deep int32 layers.
+    """
+    bound = lhs_bound * rhs_bound * depth
+    if bound < _FLOAT32_EXACT_INT_LIMIT:
+        return torch.float32
+    if bound < _FLOAT64_EXACT_INT_LIMIT:
+        return torch.float64
+    return torch.int64
+
+
+def _exact_matmul(
+    lhs: torch.Tensor,
+    lhs_zero_point: torch.Tensor | int,
+    rhs: torch.Tensor,
+    rhs_zero_point: torch.Tensor | int,
+    rhs_transposed: bool = False,
+) -> torch.Tensor:
+    """
+    (lhs - lhs_zero_point) @ (rhs - rhs_zero_point) of integer tensors, exact
+    in float64. Where the dot products exceed float32, the depth is split into
+    chunks whose partial dot products are still exact in float32, which keeps
+    the matmuls in fast float32 BLAS for deep int8 layers. Dot products beyond
+    2**53, which only int32 inputs reach, are accumulated in int64 instead.
+    """
+    lhs_bound = _max_abs(lhs, lhs_zero_point)
+    rhs_bound = _max_abs(rhs, rhs_zero_point)
+    if lhs_bound * rhs_bound * lhs.shape[-1] >= _FLOAT64_EXACT_INT_LIMIT:
+        lhs = lhs.to(torch.int64) - lhs_zero_point
+        rhs = rhs.to(torch.int64) - rhs_zero_point
+        if rhs_transposed:
+            rhs = rhs.transpose(-1, -2)
+        return torch.matmul(lhs, rhs)
+    chunk = _FLOAT32_EXACT_INT_LIMIT // max(lhs_bound * rhs_bound, 1)
+    dtype = torch.float32
+    if chunk == 0 or max(_max_abs(lhs), _max_abs(rhs)) > _FLOAT32_EXACT_INT_LIMIT:
+        dtype = torch.float64
+    lhs = lhs.to(dtype) - lhs_zero_point
+    rhs = rhs.to(dtype) - rhs_zero_point
+    if rhs_transposed:
+        rhs = rhs.transpose(-1, -2)
+
+    depth = lhs.shape[-1]
+    if dtype == torch.float64 or chunk >= depth:
+        return torch.matmul(lhs, rhs).double()
+    out = torch.matmul(lhs[..., :chunk], rhs[..., :chunk, :]).double()
+    for start in range(chunk, depth, chunk):
+        out += torch.matmul(
+            lhs[..., start : start + chunk], rhs[..., start : start + chunk, :]
+        )
+    return out
+
 
 def quantize_per_tensor_common(
     input_tensor: torch.Tensor,
@@ -324,8 +399,9 @@ def quantized_add_per_tensor(
 
     # TODO(agrebenisan): This should be done in fixed point arithmetic, but to match the quantized_add_out.cpp
     # reference implementation, we'll do it in floating point.
-    dequant_X = X_scale * (X - X_zero_point)
-    dequant_Y = Y_scale * (Y - Y_zero_point)
+    # In int32, as X - X_zero_point can overflow the dtype of X
+    dequant_X = X_scale * (X.to(torch.int32) - X_zero_point)
+    dequant_Y = Y_scale * (Y.to(torch.int32) - Y_zero_point)
 
     # q_min/q_max are unused args
     return quantize_per_tensor(
@@ -441,13 +517,14 @@ def quantized_linear_common(
             f"Unsupported dtype to quantize to {dtype}. Supported dtypes must be one of {supported_dtypes}"
         )
 
-    out = torch.nn.functional.linear(
-        (src - in_zero_point).float(),
-        (weight - weight_zero_point).float(),
-        bias.float(),
+    out = (
+        _exact_matmul(
+            src, in_zero_point, weight, weight_zero_point, rhs_transposed=True
+        )
+        + bias
     )
     return quantize_per_tensor(
-        out,
+        out.float(),
         out_scale,
         out_zero_point,
         torch.iinfo(dtype).min,
@@ -613,12 +690,9 @@ def quantized_matmul(
 
     out_scale = 1.0 / (-out_multiplier * (1 / (1 << 31)) * (2**out_shift))
 
-    out = torch.matmul(
-        (X - X_zero_point).float(),
-        (Y - Y_zero_point).float(),
-    )
+    out = _exact_matmul(X, X_zero_point, Y, Y_zero_point)
     return quantize_per_tensor(
-        out,
+        out.float(),
         out_scale,
         out_zero_point,
         torch.iinfo(X.dtype).min,
@@ -797,11 +871,20 @@ def quantized_conv_per_tensor(
         - out_multiplier (int): Unused
         - out_shift (int): Unused
     """
+    # Each output is a dot product over a (C_in / groups) x kernel window
+    acc_dtype = _accumulation_dtype(
+        _max_abs(input_tensor, in_zero_point),
+        _max_abs(weight, weight_zero_point),
+        weight[0].numel(),
+    )
+    float_bias = bias * bias_scale
+    # The scaled bias isn't integral, so it is added after integer accumulation
+    conv_bias = float_bias.to(acc_dtype) if acc_dtype.is_floating_point else None
     if len(input_tensor.shape) == 3:
         float_out = torch.nn.functional.conv1d(
-            (input_tensor - in_zero_point).float(),
-            (weight - weight_zero_point).float(),
-            (bias * bias_scale).float(),
+            input_tensor.to(acc_dtype) - in_zero_point,
+            weight.to(acc_dtype) - weight_zero_point,
+            conv_bias,
             stride[-1],
             padding[-1],
             dilation[-1],
@@ -810,9 +893,9 @@ def quantized_conv_per_tensor(
 
     elif len(input_tensor.shape) == 4:
         float_out = torch.nn.functional.conv2d(
-            (input_tensor - in_zero_point).float(),
-            (weight - weight_zero_point).float(),
-            (bias * bias_scale).float(),
+            input_tensor.to(acc_dtype) - in_zero_point,
+            weight.to(acc_dtype) - weight_zero_point,
+            conv_bias,
             stride,
             padding,
             dilation,
@@ -820,9 +903,13 @@ def quantized_conv_per_tensor(
         )
     else:
         raise ValueError("Input tensor must be 3D or 4D")
+    if conv_bias is None:
+        float_out = float_out.double() + float_bias.double().reshape(
+            -1, *([1] * (float_out.dim() - 2))
+        )
 
     return quantize_per_tensor(
-        float_out,
+        float_out.float(),
         output_scale,
         output_zero_point,
         torch.iinfo(input_tensor.dtype).min,
@@ -1561,9 +1648,8 @@ def quantized_relu_common(
         raise ValueError(f"X dtype must be one of {supported_dtypes}. Got {X.dtype}")
 
     out_scale = 1.0 / (-out_multiplier * (1 / (1 << 31)) * (2**out_shift))
-    dequantized_X = torch.where(
-        X > X_zero_point, X - X_zero_point, torch.zeros_like(X)
-    ).to(torch.float32)
+    # In int32, as X - X_zero_point can overflow the dtype of X
+    dequantized_X = (X.to(torch.int32) - X_zero_point).clamp(min=0).to(torch.float32)
     out = quantize_per_tensor(
         dequantized_X,
         out_scale,
@@ -1871,47 +1957,44 @@ def im2row(
     pH, pW = padding
     sH, sW = stride
 
-    # Handle padding with zero point values
-    if in_zero_point is not None and (pH > 0 or pW > 0):
-        # Expand zero point to (N, 1, 1, 1) for broadcasting
-        in_zero_point = in_zero_point.expand(N)
-
-        # Pad input with the per-batch zero point values
-        input_tensor = torch.stack(
-            [
-                torch.nn.functional.pad(
-                    input_tensor[i],
-                    (pW, pW, pH, pH),
-                    mode="constant",
-                    value=in_zero_point[i].item(),
-                )
-                for i in range(len(input_tensor))
-            ]
-        )
-
-        padding = (0, 0)  # Already padded manually
-
-    # Use unfold to extract sliding local blocks
-    # Unfold: (N, C, H, W) -> (N, C, L, kH, kW), where L = number of sliding windows
-    # torch.nn.functional.unfold returns (N, C*kH*kW, L)
-    patches = torch.nn.functional.unfold(
-        input_tensor.float(),  # unfold not implemented for int
-        kernel_size=(kH, kW),
-        dilation=(dH, dW),
-        padding=padding,
-        stride=(sH, sW),
-    ).to(
-        input_tensor.dtype
-    )  # (N, C*kH*kW, L)
-
-    # Transpose to (N, L, C*kH*kW)
-    patches = patches.transpose(1, 2).contiguous()
-
-    # Reshape to (N*L, C*kH*kW)
-    patches = patches.view(N, -1, C * kH * kW)
+    if pH > 0 or pW > 0:
+        input_tensor = torch.nn.functional.pad(input_tensor, (pW, pW, pH, pH))
+        # Fill the border with the per-batch zero point values
+        if in_zero_point is not None:
+            border = torch.ones(
+                input_tensor.shape[-2:], dtype=torch.bool, device=input_tensor.device
+            )
+            border[pH : pH + H, pW : pW + W] = False
+            input_tensor = torch.where(
+                border,
+                in_zero_point.expand(N).view(N, 1, 1, 1).to(input_tensor.dtype),
+                input_tensor,
+            )
+        H, W = input_tensor.shape[-2:]
+
+    # Extract the sliding windows as a strided view of the input, which is
+    # exact for every dtype, unlike unfold that only supports float:
+    # (N, C, H, W) -> (N, out_h, out_w, C, kH, kW)
+    out_h = (H - dH * (kH - 1) - 1) // sH + 1
+    out_w = (W - dW * (kW - 1) - 1) // sW + 1
+    input_tensor = input_tensor.contiguous()
+    stride_n, stride_c, stride_h, stride_w = input_tensor.stride()
+    patches = input_tensor.as_strided(
+        (N, out_h, out_w, C, kH, kW),
+        (
+            stride_n,
+            stride_h * sH,
+            stride_w * sW,
+            stride_c,
+            stride_h * dH,
+            stride_w * dW,
+        ),
+    )
 
+    # Reshape to (N, L, C*kH*kW), where L = out_h * out_w is the number of
+    # sliding windows
     # If channel_last, output should be in NHWC patch order (but im2row is always row-major)
-    return patches
+    return patches.reshape(N, out_h * out_w, C * kH * kW)
 
 
 @impl_tracked(m, "im2row.per_tensor")
@@ -532,6 +532,10 @@ class SinkOpsCloserToUsePass(RemoveOrReplacePassInterface):
         if len(users) != 1:
             return False
 
+        # Already right before its user
+        if node.next is users[0]:
+            return False
+
         # Insert the dequant node just before its user
         with node.graph.inserting_before(users[0]):
             # Target is guaranteed to be a callable since it's from our targets list
@@ -602,10 +606,15 @@ class HoistOpsCloserToDefPass(RemoveOrReplacePassInterface):
 
         # If the node is quantize_per_channel, we need to hoist the scale
         # and zero_point tensors as well.
-        if (
+        is_per_channel = (
             node.target
             == exir_ops.edge.quantized_decomposed.quantize_per_channel.default
-        ):
+        )
+        # Already right after its def
+        if not is_per_channel and node.prev is insertion_point:
+            return False
+
+        if is_per_channel:
             scale, zero_point = args[1], args[2]
             if not isinstance(scale, torch.fx.Node) or not isinstance(
                 zero_point, torch.fx.Node
@@ -11,10 +11,12 @@ import copy
 import operator
 import unittest
 from typing import cast, Final, List, Tuple
+from unittest.mock import patch
 
 import executorch.backends.cadence.aot.ops_registrations  # noqa
 import torch
 from executorch.backends.cadence.aot.fuse_ops import (
+    CadenceFuseOpsInGraph,
     FuseBatchNormWithConv,
     FuseCascadedTransposeOrPermuteOps,
     FuseCascadedViewOps,
@@ -29,7 +31,17 @@ from executorch.backends.cadence.aot.fuse_ops import (
     HierarchicalCSEPass,
 )
 from executorch.backends.cadence.aot.graph_builder import GraphBuilder
-from executorch.backends.cadence.aot.pass_utils import count_node, op_counts_match
+from executorch.backends.cadence.aot.pass_utils import (
+    _GraphChangeTracker,
+    count_node,
+    FixedPointRewritePass,
+    op_counts_match,
+)
+from executorch.backends.cadence.aot.passes import (
+    FinalizePipeline,
+    group_fixed_point_passes,
+    InitializePipeline,
+)
 from executorch.backends.cadence.aot.typing_stubs import expand
 from executorch.exir.dialects._ops import ops as exir_ops
 from executorch.exir.dialects.edge._ops import EdgeOpOverload
@@ -1630,3 +1642,144 @@ class TestFuseQuantizedBatchNormWithConv(unittest.TestCase):
         # Verify fusion occurred: bn should be removed, conv remains
         self.assertEqual(count_node(gm, conv_op), 1)
         self.assertEqual(count_node(gm, bn_op), 0)
+
+
+class TestFixedPointRewritePass(TestFusionPassesBase):
+    def _build_mm_views_add_graph(self) -> torch.fx.GraphModule:
+        # mm -> view -> view -> add, which fuses into addmm -> view once the
+        # views are fused.
+        builder = GraphBuilder()
+        x = builder.placeholder("x", torch.randn(4, 3, dtype=torch.float32))
+        y = builder.placeholder("y", torch.randn(3, 6, dtype=torch.float32))
+        z = builder.placeholder("z", torch.randn(6, dtype=torch.float32))
+        mm = builder.call_operator(op=exir_ops.edge.aten.mm.default, args=(x, y))
+        view1 = builder.call_operator(
+            op=exir_ops.edge.aten.view_copy.default, args=(mm, [2, 2, 6])
+        )
+        view2 = builder.call_operator(
+            op=exir_ops.edge.aten.view_copy.default, args=(view1, [4, 6])
+        )
+        output = builder.call_operator(
+            op=exir_ops.edge.aten.add.Tensor, args=(view2, z)
+        )
+        builder.output([output])
+        return builder.get_graph_module()
+
+    def test_fuse_across_passes(self) -> None:
+        inputs = (
+            torch.randn(4, 3, dtype=torch.float32),
+            torch.randn(3, 6, dtype=torch.float32),
+            torch.randn(6, dtype=torch.float32),
+        )
+        # A single round of the passes, in order, only fuses the views.
+        graph_module = self._build_mm_views_add_graph()
+        for p in [FuseMMWithAdd(), FuseCascadedViewOps()]:
+            graph_module = cast(PassResult, p(graph_module)).graph_module
+        self.assertEqual(count_node(graph_module, exir_ops.edge.aten.addmm.default), 0)
+
+        graph_module = self._build_mm_views_add_graph()
+        gm_before = copy.deepcopy(graph_module)
+        p = FixedPointRewritePass([FuseMMWithAdd(), FuseCascadedViewOps()])
+        result = cast(PassResult, p(graph_module))
+        self.assertTrue(result.modified)
+        self.check_op_counts(
+            result.graph_module,
+            expected_op_counts={
+                exir_ops.edge.aten.addmm.default: 1,
+                exir_ops.edge.aten.mm.default: 0,
+                exir_ops.edge.aten.add.Tensor: 0,
+                exir_ops.edge.aten.view_copy.default: 1,
+            },
+        )
+        validate_numerics(
+            gm_before, result.graph_module, inputs, "FixedPointRewritePass"
+        )
+
+    def test_fuse_across_passes_without_node_hooks(self) -> None:
+        # The created and erased nodes are then found by comparing the graphs
+        inputs = (
+            torch.randn(4, 3, dtype=torch.float32),
+            torch.randn(3, 6, dtype=torch.float32),
+            torch.randn(6, dtype=torch.float32),
+        )
+        graph_module = self._build_mm_views_add_graph()
+        gm_before = copy.deepcopy(graph_module)
+        p = FixedPointRewritePass([FuseMMWithAdd(), FuseCascadedViewOps()])
+        with patch.object(_GraphChangeTracker, "use_hooks", False):
+            result = cast(PassResult, p(graph_module))
+        self.assertTrue(result.modified)
+        self.check_op_counts(
+            result.graph_module,
+            expected_op_counts={
+                exir_ops.edge.aten.addmm.default: 1,
+                exir_ops.edge.aten.mm.default: 0,
+                exir_ops.edge.aten.add.Tensor: 0,
+                exir_ops.edge.aten.view_copy.default: 1,
+            },
+        )
+        validate_numerics(
+            gm_before, result.graph_module, inputs, "FixedPointRewritePass"
+        )
+
+    def test_fixed_point_with_other_passes(self) -> None:
+        builder = GraphBuilder()
+        x_input = torch.randn(2, 3, 4, dtype=torch.float32)
+        x = builder.placeholder("x", x_input)
+        transpose1 = builder.call_operator(
+            op=exir_ops.edge.aten.transpose_copy.int, args=(x, 0, 1)
+        )
+        permute = builder.call_operator(
+            op=exir_ops.edge.aten.permute_copy.default, args=(transpose1, [2, 0, 1])
+        )
+        transpose2 = builder.call_operator(
+            op=exir_ops.edge.aten.transpose_copy.int, args=(permute, 1, 2)
+        )
+        view1 = builder.call_operator(
+            op=exir_ops.edge.aten.view_copy.default, args=(transpose2, [4, 6])
+        )
+        view2 = builder.call_operator(
+            op=exir_ops.edge.aten.view_copy.default, args=(view1, [24])
+        )
+        builder.output([view2])
+        original_graph = builder.get_graph_module()
+        gm_before = copy.deepcopy(original_graph)
+
+        p = FixedPointRewritePass(
+            [p() for p in CadenceFuseOpsInGraph.passes]  # pyre-ignore[29]
+        )
+        result = cast(PassResult, p(original_graph))
+        self.assertTrue(result.modified)
+        self.check_op_counts(
+            result.graph_module,
+            expected_op_counts={
+                exir_ops.edge.aten.transpose_copy.int: 0,
+                exir_ops.edge.aten.permute_copy.default: 1,
+                exir_ops.edge.aten.view_copy.default: 1,
+            },
+        )
+        validate_numerics(
+            gm_before, result.graph_module, (x_input,), "FixedPointRewritePass"
+        )
+
+        # Nothing left to rewrite
+        result = cast(PassResult, p(result.graph_module))
+        self.assertFalse(result.modified)
+        self.assertEqual(p.num_rewrites, 0)
+
+    def test_group_fixed_point_passes(self) -> None:
+        passes = [
+            InitializePipeline,
+            *CadenceFuseOpsInGraph.passes,
+            FinalizePipeline,
+            FuseFullThenReshapePass,
+        ]
+        grouped_passes = group_fixed_point_passes(passes)
+        self.assertEqual(len(grouped_passes), 4)
+        self.assertIs(grouped_passes[0], InitializePipeline)
+        self.assertIsInstance(grouped_passes[1](), FixedPointRewritePass)
+        self.assertIs(grouped_passes[2], FinalizePipeline)
+        # Only consecutive passes of a group are run together
+        driver = grouped_passes[3]()
+        self.assertIsInstance(driver, FixedPointRewritePass)
+        for patterns in driver.patterns.values():
+            self.assertEqual([type(p) for p in patterns], [FuseFullThenReshapePass])
@@ -0,0 +1,156 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# All rights reserved.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+# pyre-strict
+
+import executorch.backends.cadence.aot.ops_registrations  # noqa
+import torch
+from executorch.backends.cadence.aot.idma_scheduling import (
+    IdmaLatencyModel,
+    InsertIdmaPrefetchPass,
+)
+from executorch.backends.cadence.aot.memory_planning import CadenceMemoryPlanning
+from executorch.backends.cadence.aot.pass_utils import count_node
+from executorch.backends.cadence.aot.program_builder import ProgramBuilder
+from executorch.backends.cadence.aot.utils import MemoryConfig
+from executorch.exir import (
+    EdgeProgramManager,
+    ExecutorchBackendConfig,
+    ExecutorchProgramManager,
+)
+from executorch.exir.dialects._ops import ops as exir_ops
+from executorch.exir.passes import ToOutVarPass
+from later.unittest import TestCase
+
+FAST_MEMORY_SIZE = 64 * 1024
+
+
+class TestIdmaScheduling(TestCase):
+    def get_mlp_program(self) -> EdgeProgramManager:
+        """mm -> relu -> mm -> relu, with both the mm and the relu as outputs."""
+        builder = ProgramBuilder()
+        x = builder.placeholder("x", torch.randn(64, 64))
+        w1 = builder.placeholder("w1", torch.randn(64, 64))
+        w2 = builder.placeholder("w2", torch.randn(64, 64))
+        mm1 = builder.call_operator(exir_ops.edge.aten.mm.default, (x, w1))
+        relu1 = builder.call_operator(exir_ops.edge.aten.relu.default, (mm1,))
+        mm2 = builder.call_operator(exir_ops.edge.aten.mm.default, (relu1, w2))
+        relu2 = builder.call_operator(exir_ops.edge.aten.relu.default, (mm2,))
+        builder.output([mm2, relu2])
+        return builder.get_edge_program()
+
+    def get_memory_config(self) -> MemoryConfig:
+        return MemoryConfig(
+            memory_sizes=[FAST_MEMORY_SIZE, 0x1000000], memory_alignments=[16, 16]
+        )
+
+    def to_executorch(self, program: EdgeProgramManager) -> ExecutorchProgramManager:
+        return program.to_executorch(
+            ExecutorchBackendConfig(
+                memory_planning_pass=CadenceMemoryPlanning(
+                    self.get_memory_config(),
+                    opt_level=1,
+                    mem_algo=1,
+                    alloc_graph_input=False,
+                ),
+                to_out_var_pass=ToOutVarPass(),
+                emit_stacktrace=False,
+            )
+        )
+
+    def test_prefetch_weights(self) -> None:
+        program = self.get_mlp_program().transform(
+            [InsertIdmaPrefetchPass(self.get_memory_config(), copy_out=False)]
+        )
+        graph_module = program.exported_program().graph_module
+        self.assertEqual(
+            count_node(graph_module, exir_ops.edge.cadence.idma_load.default), 3
+        )
+        self.assertEqual(
+            count_node(graph_module, exir_ops.edge.cadence.idma_wait.default), 3
+        )
+
+        # w2 is loaded before relu1 runs, and waited for by the second mm
+        nodes = list(graph_module.graph.nodes)
+        mm2 = nodes[-3]
+        load_w2 = next(
+            node
+            for node in nodes
+            if node.target == exir_ops.edge.cadence.idma_load.default
+            and node.args[0].name == "w2"
+        )
+        relu1 = next(
+            node for node in nodes if node.target == exir_ops.edge.aten.relu.default
+        )
+        self.assertLess(nodes.index(load_w2), nodes.index(relu1))
+        self.assertEqual(mm2.args[1].target, exir_ops.edge.cadence.idma_wait.default)
+        self.assertEqual(mm2.args[1].args[0], load_w2)
+        # relu1 is an activation, left in place by default
+        self.assertEqual(mm2.args[0], relu1)
+
+    def test_fast_memory_budget(self) -> None:
+        # Every operand is 16 KiB, and at most half of memory 1 is staged.
+        program = self.get_mlp_program().transform(
+            [
+                InsertIdmaPrefetchPass(
+                    MemoryConfig(memory_sizes=[48 * 1024, 0x1000000]),
+                    copy_out=False,
+                )
+            ]
+        )
+        graph_module = program.exported_program().graph_module
+        # x for the first mm, and w2 once x and w1 are consumed
+        self.assertEqual(
+            count_node(graph_module, exir_ops.edge.cadence.idma_load.default), 2
+        )
+
+    def test_copy_out(self) -> None:
+        program = self.get_mlp_program().transform(
+            [InsertIdmaPrefetchPass(self.get_memory_config())]
+        )
+        graph_module = program.exported_program().graph_module
+        # mm2 is stored while relu2 runs, relu2 is the last op
+        store = next(
+            node
+            for node in graph_module.graph.nodes
+            if node.target == exir_ops.edge.cadence.idma_store.default
+        )
+        self.assertEqual(store.args[0].target, exir_ops.edge.aten.mm.default)
+        outputs = graph_module.graph.output_node().args[0]
+        self.assertEqual(outputs[0].target, exir_ops.edge.cadence.idma_wait.default)
+        self.assertEqual(outputs[0].args[0], store)
+        self.assertEqual(outputs[1].target, exir_ops.edge.aten.relu.default)
+
+    def test_simulated_latency(self) -> None:
+        model = IdmaLatencyModel(
+            memory_bytes_per_cycle=[16.0, 2.0], default_bytes_per_cycle=2.0
+        )
+        baseline = model.simulate(
+            self.to_executorch(self.get_mlp_program()).exported_program().graph_module
+        )
+        graph_module = (
+            self.to_executorch(
+                self.get_mlp_program().transform(
+                    [InsertIdmaPrefetchPass(self.get_memory_config())]
+                )
+            )
+            .exported_program()
+            .graph_module
+        )
+        prefetched = model.simulate(graph_module)
+
+        # Staged buffers are planned in fast memory, and copies keep their
+        # task numbers after SimplifyIdmaOpsPass.
+        copies = graph_module.graph.find_nodes(
+            op="call_function", target=torch.ops.cadence.idma_copy.out
+        )
+        self.assertEqual(len(copies), 4)
+        for task_num, copy in enumerate(copies):
+            self.assertEqual(copy.args[1], task_num)
+            self.assertEqual(copy.meta["spec"].mem_id, 1)
+
+        self.assertEqual(baseline.stall_cycles, 0)
+        self.assertLess(prefetched.total_cycles, baseline.total_cycles)
@@ -21,7 +21,11 @@ from executorch.backends.cadence.aot.memory_constraints import (
 )
 from executorch.backends.cadence.aot.memory_planning import (
     CadenceMemoryPlanning,
+    compare_memory_traffic,
+    estimate_tensor_traffic,
+    find_memory_traffic_per_memory,
     find_peak_memory_usage,
+    KERNEL_OUTPUT_TILE,
     PositionBasedGreedyWithHierarchy,
 )
 from executorch.backends.cadence.aot.memory_planning_algo import (
@@ -1121,7 +1125,7 @@ class TestMemTransform(unittest.TestCase):
                 if spec and spec.mem_offset:
                     self.assertEqual(spec.mem_offset % 37, 0)
 
-    @parameterized.expand([0, 1])
+    @parameterized.expand([0, 1, 2])
     def test_block_mem_id(self, mem_algo: int) -> None:
         builder = GraphBuilder()
         x = builder.placeholder("x", torch.randn(16))
@@ -1187,6 +1191,92 @@ class TestMemTransform(unittest.TestCase):
             self.assertNotIn(spec.mem_id, mul_scalar_block_mem_ids)
 
 
+class TestAccessFrequencyAwarePlanning(unittest.TestCase):
+    # x (1 KiB) is read by mm once per KERNEL_OUTPUT_TILE output columns, mm
+    # (4 KiB) is read twice by add, and only one of them fits in memory 1.
+    def get_mm_graph(self) -> GraphModule:
+        builder = GraphBuilder()
+        x = builder.placeholder("x", torch.randn(4, 64))
+        w = builder.placeholder("w", torch.randn(64, 256))
+        mm = builder.call_operator(op=torch.ops.aten.mm.default, args=(x, w))
+        add = builder.call_operator(op=torch.ops.aten.add.Tensor, args=(mm, mm))
+        builder.output([add])
+        return SpecPropPass().call(builder.get_graph_module()).graph_module
+
+    def get_placement(self, graph_module: GraphModule) -> list[tuple[int, int]]:
+        return [
+            (node.meta["spec"].mem_id, node.meta["spec"].mem_offset)
+            for node in graph_module.graph.nodes
+            if node.op != "output"
+        ]
+
+    def test_estimate_tensor_traffic(self) -> None:
+        graph_module = self.get_mm_graph()
+        x, w, mm, add, _ = graph_module.graph.nodes
+        traffic = estimate_tensor_traffic(graph_module)
+        self.assertEqual(
+            traffic[x.meta["spec"]], 4 * 64 * 4 * 256 // KERNEL_OUTPUT_TILE
+        )
+        # w is read once, not once per 16 output rows
+        self.assertEqual(traffic[w.meta["spec"]], 64 * 256 * 4)
+        # Written by mm, read twice by add
+        self.assertEqual(traffic[mm.meta["spec"]], 3 * 4 * 256 * 4)
+        self.assertEqual(traffic[add.meta["spec"]], 4 * 256 * 4)
+
+    @parameterized.expand([0, 1])
+    def test_less_slow_memory_traffic(self, size_ordered_algo: int) -> None:
+        memory_config = MemoryConfig([4096, 0x100000], memory_alignments=[16, 16])
+        traffic = {}
+        for mem_algo in (size_ordered_algo, 2):
+            graph_module = CadenceMemoryPlanning(
+                memory_config, opt_level=1, mem_algo=mem_algo
+            )(self.get_mm_graph()).graph_module
+            x, _, mm, _, _ = graph_module.graph.nodes
+            traffic[mem_algo] = find_memory_traffic_per_memory(graph_module, 2)
+            if mem_algo == 2:
+                self.assertEqual(x.meta["spec"].mem_id, 1)
+                self.assertEqual(mm.meta["spec"].mem_id, 2)
+            else:
+                self.assertEqual(x.meta["spec"].mem_id, 2)
+                self.assertEqual(mm.meta["spec"].mem_id, 1)
+        self.assertLess(traffic[2][1], traffic[size_ordered_algo][1])
+        self.assertEqual(sum(traffic[2]), sum(traffic[size_ordered_algo]))
+
+    def test_compare_memory_traffic(self) -> None:
+        memory_config = MemoryConfig([4096, 0x100000], memory_alignments=[16, 16])
+        graph_module = CadenceMemoryPlanning(memory_config, opt_level=1, mem_algo=0)(
+            self.get_mm_graph()
+        ).graph_module
+        placement = self.get_placement(graph_module)
+
+        results = compare_memory_traffic(
+            graph_module,
+            None,
+            memory_config,
+            opt_level=1,
+            alloc_graph_input=True,
+            alloc_graph_output=True,
+        )
+        self.assertEqual(
+            list(results),
+            [
+                "PositionBasedGreedyWithHierarchy",
+                "GreedyWithHeuristic",
+                "AccessFrequencyAwareGreedy",
+            ],
+        )
+        self.assertEqual(
+            results["PositionBasedGreedyWithHierarchy"],
+            find_memory_traffic_per_memory(graph_module, 2),
+        )
+        self.assertLess(
+            results["AccessFrequencyAwareGreedy"][1],
+            results["GreedyWithHeuristic"][1],
+        )
+        # The memory plan of the graph is left unchanged
+        self.assertEqual(self.get_placement(graph_module), placement)
+
+
 class TestConstraintsBase(unittest.TestCase):
     def get_view_then_add_graph(self) -> EdgeProgramManager:
         builder = ProgramBuilder()
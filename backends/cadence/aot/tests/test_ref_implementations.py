@@ -1451,6 +1451,103 @@ class TestRefImplementations(unittest.TestCase):
             f"Output values don't match expected in {name}. Got {output}, expected {expected_output}",
         )
 
+    def test_quantized_relu_per_tensor_does_not_overflow(self) -> None:
+        # X - X_zero_point overflows int8 for 100 - (-100)
+        X = torch.tensor([100, -100, -128], dtype=torch.int8)
+        output = torch.ops.cadence.quantized_relu.per_tensor(
+            X, -100, -128, -(1 << 30), 1
+        )
+        # relu(X - X_zero_point) + out_zero_point, as out_scale is 1
+        self.assertTrue(
+            torch.equal(output, torch.tensor([72, -128, -128], dtype=torch.int8))
+        )
+
+    def test_quantized_linear_large_accumulation(self) -> None:
+        # The dot products are above 2**24, which float32 accumulation rounds
+        torch.manual_seed(0)
+        src = torch.randint(-30000, 30000, (4, 256), dtype=torch.int32)
+        weight = torch.randint(-30000, 30000, (8, 256), dtype=torch.int32)
+        bias = torch.randint(-(1 << 20), 1 << 20, (8,), dtype=torch.int32)
+        # out_scale is 256
+        out_multiplier, out_shift = -(1 << 30), -7
+
+        output = torch.ops.cadence.quantized_linear.per_tensor(
+            src, weight, bias, 5, -7, out_multiplier, out_shift, 3, None
+        )
+        expected_output = torch.ops.quantized_decomposed.quantize_per_tensor(
+            ((src.long() - 5) @ (weight.long() + 7).T + bias.long()).float(),
+            256.0,
+            3,
+            torch.iinfo(torch.int32).min,
+            torch.iinfo(torch.int32).max,
+            torch.int32,
+        )
+        self.assertTrue(torch.equal(output, expected_output))
+
+        output = torch.ops.cadence.quantized_matmul(
+            src, 0, weight.T.contiguous(), 0, None, out_multiplier, out_shift, 3
+        )
+        expected_output = torch.ops.quantized_decomposed.quantize_per_tensor(
+            (src.long() @ weight.long().T).float(),
+            256.0,
+            3,
+            torch.iinfo(torch.int32).min,
+            torch.iinfo(torch.int32).max,
+            torch.int32,
+        )
+        self.assertTrue(torch.equal(output, expected_output))
+
+    def test_exact_matmul_beyond_float64(self) -> None:
+        # The dot products are above 2**53, which float64 accumulation rounds
+        torch.manual_seed(0)
+        lhs = torch.randint(-(1 << 26), 1 << 26, (4, 64), dtype=torch.int32)
+        rhs = torch.randint(-(1 << 26), 1 << 26, (8, 64), dtype=torch.int32)
+        output = executorch.backends.cadence.aot.ref_implementations._exact_matmul(
+            lhs, 3, rhs, -5, rhs_transposed=True
+        )
+        self.assertTrue(
+            torch.equal(output.long(), (lhs.long() - 3) @ (rhs.long() + 5).T)
+        )
+
+    def test_quantized_conv_beyond_float64(self) -> None:
+        # Accumulates in int64, and adds the scaled bias afterwards
+        torch.manual_seed(0)
+        input_tensor = torch.randint(
+            -(1 << 26), 1 << 26, (1, 64, 2, 2), dtype=torch.int32
+        )
+        weight = torch.randint(-(1 << 26), 1 << 26, (2, 64, 1, 1), dtype=torch.int32)
+        bias = torch.tensor([1, -1], dtype=torch.int32)
+        output_scale = float(1 << 30)
+
+        output = torch.ops.cadence.quantized_conv2d_nchw.per_tensor(
+            input_tensor,
+            weight,
+            bias,
+            [1, 1],
+            [0, 0],
+            [1, 1],
+            1,
+            0,
+            0,
+            0.5,
+            output_scale,
+            0,
+            0,
+            0,
+        )
+        expected_acc = torch.nn.functional.conv2d(
+            input_tensor.long(), weight.long()
+        ).double() + torch.tensor([0.5, -0.5], dtype=torch.float64).reshape(-1, 1, 1)
+        expected_output = torch.ops.cadence.quantize_per_tensor(
+            expected_acc.float(),
+            output_scale,
+            0,
+            torch.iinfo(torch.int32).min,
+            torch.iinfo(torch.int32).max,
+            torch.int32,
+        )
+        self.assertTrue(torch.equal(output, expected_output))
+
     def test_where_Scalar(self) -> None:
         input_tensor = torch.tensor([1, 2, 3, 4], dtype=torch.int8)
         out = torch.ops.cadence.where_Scalar(input_tensor > 2, 1.0, 0.0)
@@ -2380,6 +2477,50 @@ class TestRefImplementations(unittest.TestCase):
             f"im2row output mismatch in {name}: got {output}, expected {expected_output}",
         )
 
+    def test_im2row_matches_unfold(self) -> None:
+        # Per-batch zero points, with padding, dilation and stride
+        torch.manual_seed(0)
+        input_tensor = torch.randint(-128, 128, (3, 4, 9, 7), dtype=torch.int8)
+        in_zero_point = torch.tensor([-5, 0, 17], dtype=torch.int32)
+        output = torch.ops.cadence.im2row(
+            input_tensor, (3, 2), (2, 1), (2, 1), (2, 3), in_zero_point, False
+        )
+
+        expected_output = torch.cat(
+            [
+                torch.nn.functional.unfold(
+                    torch.nn.functional.pad(
+                        input_tensor[i : i + 1].float(),
+                        (1, 1, 2, 2),
+                        value=float(in_zero_point[i]),
+                    ),
+                    kernel_size=(3, 2),
+                    dilation=(2, 1),
+                    stride=(2, 3),
+                ).transpose(1, 2)
+                for i in range(3)
+            ]
+        ).to(torch.int8)
+        self.assertTrue(torch.equal(output, expected_output))
+
+    def test_im2row_int32_is_exact(self) -> None:
+        # Values above 2**24 are not representable in float32
+        input_tensor = torch.arange(1, 17, dtype=torch.int32).reshape(1, 1, 4, 4) + (
+            1 << 30
+        )
+        output = torch.ops.cadence.im2row.per_tensor(
+            input_tensor, (2, 2), (1, 1), (0, 0), (2, 2), 0, False
+        )
+        self.assertTrue(
+            torch.equal(
+                output - (1 << 30),
+                torch.tensor(
+                    [[[1, 2, 5, 6], [3, 4, 7, 8], [9, 10, 13, 14], [11, 12, 15, 16]]],
+                    dtype=torch.int32,
+                ),
+            )
+        )
+
     @expand(
         [
             (
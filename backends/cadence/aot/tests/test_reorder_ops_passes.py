@@ -187,6 +187,21 @@ class TestReorderPasses(unittest.TestCase):
             ),
         )
 
+    def test_sink_dequantize_already_before_use(self) -> None:
+        builder = GraphBuilder()
+        x = builder.placeholder("x", torch.randint(-128, 127, (4, 6), dtype=torch.int8))
+        dequantize = builder.call_operator(
+            op=exir_ops.edge.cadence.dequantize_per_tensor.default,
+            args=(x, 0.02, 0, -128, 127, torch.int8),
+        )
+        abs_1 = builder.call_operator(
+            op=exir_ops.edge.aten.abs.default, args=(dequantize,)
+        )
+        builder.output([abs_1])
+        original_graph = builder.get_graph_module()
+        result = cast(PassResult, SinkOpsCloserToUsePass()(original_graph))
+        self.assertFalse(result.modified)
+
     def test_advance_branched_quantize(self) -> None:
         builder = GraphBuilder()
         x = builder.placeholder("x", torch.randn(64, 3, dtype=torch.float32))
@@ -0,0 +1,105 @@
+# Copyright 2026 Arm Limited and/or its affiliates.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+"""
+Measure the throughput of CortexMSimulator on a small quantized CNN lowered to
+cortex_m ops, against the float eager model, and how far the simulated
+outputs are from the float ones.
+
+Usage:
+    python -m executorch.backends.cortex_m.ops.benchmark_simulator \
+        --num_samples 256 --num_workers 4
+"""
+
+import argparse
+import time
+
+import torch
+from executorch.backends.cortex_m.ops.simulator import CortexMSimulator
+from executorch.backends.cortex_m.passes.cortex_m_pass_manager import CortexMPassManager
+from executorch.backends.cortex_m.quantizer.quantizer import CortexMQuantizer
+from executorch.exir import EdgeCompileConfig, to_edge_transform_and_lower
+from torch.export import ExportedProgram
+from torchao.quantization.pt2e.quantize_pt2e import convert_pt2e, prepare_pt2e
+
+
+class ConvNet(torch.nn.Module):
+    def __init__(self) -> None:
+        super().__init__()
+        self.conv1 = torch.nn.Conv2d(3, 16, 3, stride=2, padding=1)
+        self.conv2 = torch.nn.Conv2d(16, 32, 3, stride=2, padding=1)
+        self.pool = torch.nn.AvgPool2d(2)
+        self.linear = torch.nn.Linear(32 * 4 * 4, 10)
+
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        x = torch.relu(self.conv1(x))
+        x = self.pool(torch.relu(self.conv2(x)))
+        return torch.softmax(self.linear(x.flatten(1)), dim=-1)
+
+
+def lower(
+    model: torch.nn.Module, calibration_samples: list[tuple[torch.Tensor, ...]]
+) -> ExportedProgram:
+    example_inputs = calibration_samples[0]
+    exported = torch.export.export(model, example_inputs).module()
+    prepared = prepare_pt2e(exported, CortexMQuantizer())
+    for sample in calibration_samples:
+        prepared(*sample)
+    quantized = convert_pt2e(prepared)
+
+    edge = to_edge_transform_and_lower(
+        torch.export.export(quantized, example_inputs),
+        compile_config=EdgeCompileConfig(
+            preserve_ops=[
+                torch.ops.aten.linear.default,
+                torch.ops.aten.hardsigmoid.default,
+                torch.ops.aten.hardsigmoid_.default,
+                torch.ops.aten.hardswish.default,
+                torch.ops.aten.hardswish_.default,
+            ],
+            _check_ir_validity=False,
+        ),
+    )
+    return CortexMPassManager(edge.exported_program()).transform()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num_samples", type=int, default=256)
+    parser.add_argument("--batch_size", type=int, default=1)
+    parser.add_argument("--num_workers", type=int, default=4)
+    args = parser.parse_args()
+
+    torch.manual_seed(0)
+    model = ConvNet().eval().to(memory_format=torch.channels_last)
+    samples = [
+        (torch.randn(args.batch_size, 3, 32, 32).to(memory_format=torch.channels_last),)
+        for _ in range(args.num_samples)
+    ]
+    simulator = CortexMSimulator(lower(model, samples[:16]), args.num_workers)
+
+    start = time.perf_counter()
+    simulated = simulator.run(samples)
+    simulated_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with torch.inference_mode():
+        expected = [model(*sample) for sample in samples]
+    eager_seconds = time.perf_counter() - start
+
+    max_error = max(
+        (actual - reference).abs().max().item()
+        for actual, reference in zip(simulated, expected)
+    )
+    print(
+        f"{args.num_samples} samples: simulator {simulated_seconds:.3f} s "
+        f"({args.num_samples / simulated_seconds:.1f} samples/s), "
+        f"eager {eager_seconds:.3f} s, ratio {simulated_seconds / eager_seconds:.2f}, "
+        f"max abs error {max_error:.4f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -5,18 +5,22 @@
 # This source code is licensed under the BSD-style license found in the
 # LICENSE file in the root directory of this source tree.
 
+import contextlib
+import contextvars
 import math
 from math import prod
-from typing import Sequence
+from typing import Callable, Iterator, Sequence
 
 import torch
 import torch.nn.functional as F
 from executorch.backends.cortex_m.passes.passes_utils import (
+    avg_pool2d_cmsis,
     dequantize_per_tensor_cmsis,
     is_channel_broadcast,
     quantize_per_tensor_cmsis,
     requantize_cmsis,
     SHIFT_INT8,
+    softmax_cmsis,
 )
 from executorch.backends.cortex_m.quantizer.quantization_configs import (
     CMSIS_SOFTMAX_SCALE,
@@ -32,6 +36,60 @@ lib = Library("cortex_m", "DEF")
 
 SOFTMAX_INPUT_INTEGER_BITS = 5
 
+# Largest integer below which float32 represents every integer exactly
+_FLOAT32_EXACT_LIMIT = 1 << 24
+
+# A context variable rather than a global, so that threads (and asyncio tasks)
+# only simulate bit exactly within their own context
+_bit_exact_simulation: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "cmsis_bit_exact_simulation", default=False
+)
+
+
+@contextlib.contextmanager
+def cmsis_bit_exact_simulation(enabled: bool = True) -> Iterator[None]:
+    """
+    Run softmax and quantized_avg_pool2d with the fixed-point arithmetic of
+    CMSIS-NN instead of their float reference, so that every cortex_m op
+    returns the same values as on the target. Only applies to the current
+    thread, other threads need to enter it or run in a copy of its context.
+    """
+    token = _bit_exact_simulation.set(enabled)
+    try:
+        yield
+    finally:
+        _bit_exact_simulation.reset(token)
+
+
+def _exact_accumulate(
+    op: Callable[..., torch.Tensor],
+    input: torch.Tensor,
+    weight: torch.Tensor,
+    depth: int,
+    **kwargs,
+) -> torch.Tensor:
+    """
+    Accumulate integer-valued tensors with op in float, which is faster than
+    integer kernels, and return the exact int32 result. float32 is used when
+    no partial sum can reach 2**24, float64 otherwise.
+    """
+    if input.numel() == 0 or weight.numel() == 0:
+        bound = 0
+    else:
+        bound = int(input.abs().max()) * int(weight.abs().max()) * depth
+    dtype = torch.float32 if bound < _FLOAT32_EXACT_LIMIT else torch.float64
+    return op(input.to(dtype), weight.to(dtype), **kwargs).to(torch.int32)
+
+
+def _requantize_per_channel(
+    acc: torch.Tensor, multipliers: torch.Tensor, shifts: torch.Tensor
+) -> torch.Tensor:
+    """Requantize an NCHW accumulator with per output channel parameters."""
+    return requantize_cmsis(
+        acc, multipliers.view(1, -1, 1, 1), shifts.view(1, -1, 1, 1)
+    )
+
+
 ###
 # dequantize_per_tensor
 ###
@@ -300,10 +358,11 @@ def quantized_batch_matmul_impl(
     output_shift: int,
 ) -> torch.Tensor:
     # Offsets are negated zero points (CMSIS-NN convention)
-    lhs_fp = lhs.to(torch.float32) + float(lhs_zero_point)
-    rhs_t_fp = rhs_transposed.to(torch.float32) + float(rhs_zero_point)
-    rhs_fp = rhs_t_fp.permute(0, 2, 1)
-    acc = torch.bmm(lhs_fp, rhs_fp).to(torch.int32)
+    lhs_int32 = lhs.to(torch.int32) + int(lhs_zero_point)
+    rhs_int32 = rhs_transposed.to(torch.int32) + int(rhs_zero_point)
+    acc = _exact_accumulate(
+        torch.bmm, lhs_int32, rhs_int32.permute(0, 2, 1), depth=lhs.shape[-1]
+    )
     result = requantize_cmsis(acc, output_multiplier, output_shift)
     return torch.clamp(result + output_zero_point, -128, 127).to(torch.int8)
 
@@ -509,7 +568,6 @@ def softmax_impl(
     input_shift: int,
     diff_min: int,
 ) -> torch.Tensor:
-    del diff_min  # not used in reference path
     if input.dtype != torch.int8:
         raise TypeError(
             f"cortex_m.softmax: expected int8 input tensor, got {input.dtype}"
@@ -519,6 +577,14 @@ def softmax_impl(
             f"cortex_m.softmax: expected output_zero_point {CMSIS_SOFTMAX_ZERO_POINT}, got {output_zero_point}"
         )
 
+    if _bit_exact_simulation.get():
+        # arm_softmax_s8 runs along the innermost dimension. The input zero
+        # point cancels out in the differences to the row maximum.
+        result = softmax_cmsis(
+            input.movedim(dim, -1), input_multiplier, input_shift, diff_min
+        )
+        return result.movedim(-1, dim).contiguous()
+
     real_multiplier = float(input_multiplier) / float(1 << 31)
     real_multiplier = math.ldexp(real_multiplier, input_shift)
     input_scale = real_multiplier / float(1 << (31 - SOFTMAX_INPUT_INTEGER_BITS))
@@ -753,26 +819,20 @@ def quantized_conv2d_impl(
     # Convert weights back to OIHW layout expected by torch.nn.functional.conv2d
     weight_oi_hw = weight_int32.permute(0, 3, 1, 2).contiguous()
 
-    conv_acc = F.conv2d(
+    conv_acc = _exact_accumulate(
+        F.conv2d,
         input_int32,
         weight_oi_hw,
-        bias_int32,
+        depth=weight_oi_hw[0].numel(),
         stride=tuple(stride),
         padding=tuple(padding),
         dilation=tuple(dilation),
         groups=groups,
-    )
-
-    result_channels = []
-    for output_channel_i in range(conv_acc.shape[1]):
-        result_channel = requantize_cmsis(
-            conv_acc[:, output_channel_i, :, :],
-            int(requantize_multipliers[output_channel_i]),
-            int(requantize_shifts[output_channel_i]),
-        )
-        result_channels.append(result_channel)
+    ) + bias_int32.view(1, -1, 1, 1)
 
-    result = torch.stack(result_channels, dim=1)
+    result = _requantize_per_channel(
+        conv_acc, requantize_multipliers, requantize_shifts
+    )
 
     result += output_offset
     result = torch.clamp(result, activation_min, activation_max)
@@ -898,26 +958,20 @@ def quantized_depthwise_conv2d_impl(
     weight_oi_hw = weight_int32.permute(3, 0, 1, 2).contiguous()
 
     # Depthwise convolution has groups == input_channels
-    conv_acc = F.conv2d(
+    conv_acc = _exact_accumulate(
+        F.conv2d,
         input_int32,
         weight_oi_hw,
-        bias_int32,
+        depth=weight_oi_hw[0].numel(),
         stride=tuple(stride),
         padding=tuple(padding),
         dilation=tuple(dilation),
         groups=groups,
-    )
-
-    result_channels = []
-    for output_channel_i in range(conv_acc.shape[1]):
-        result_channel = requantize_cmsis(
-            conv_acc[:, output_channel_i, :, :],
-            int(requantize_multipliers[output_channel_i]),
-            int(requantize_shifts[output_channel_i]),
-        )
-        result_channels.append(result_channel)
+    ) + bias_int32.view(1, -1, 1, 1)
 
-    result = torch.stack(result_channels, dim=1)
+    result = _requantize_per_channel(
+        conv_acc, requantize_multipliers, requantize_shifts
+    )
 
     result += output_offset
     result = torch.clamp(result, activation_min, activation_max)
@@ -1095,30 +1149,25 @@ def quantized_transpose_conv2d_impl(
     # F.conv_transpose2d expects IOHW (in_channels, out_channels, H, W)
     weight_iohw = weight_int32.permute(3, 0, 1, 2).contiguous()
 
-    # PyTorch doesn't support int32 for conv_transpose2d, so convert to float
-    # Perform transposed convolution with float tensors
-    conv_transpose_acc = F.conv_transpose2d(
-        input_int32.to(torch.float32),
-        weight_iohw.to(torch.float32),
-        bias_int32.to(torch.float32),
+    # PyTorch doesn't support int32 for conv_transpose2d, so accumulate in a
+    # float type wide enough to be exact. Each output sums at most every
+    # input channel of its group over the whole kernel.
+    conv_transpose_acc = _exact_accumulate(
+        F.conv_transpose2d,
+        input_int32,
+        weight_iohw,
+        depth=kernel_input_channels * weight_iohw[0, 0].numel(),
         stride=tuple(stride),
         padding=tuple(padding),
         output_padding=tuple(output_padding),
         dilation=tuple(dilation),
         groups=groups,
-    ).to(torch.int32)
+    ) + bias_int32.view(1, -1, 1, 1)
 
     # Apply per-channel requantization
-    result_channels = []
-    for output_channel_i in range(conv_transpose_acc.shape[1]):
-        result_channel = requantize_cmsis(
-            conv_transpose_acc[:, output_channel_i, :, :],
-            int(requantize_multipliers[output_channel_i]),
-            int(requantize_shifts[output_channel_i]),
-        )
-        result_channels.append(result_channel)
-
-    result = torch.stack(result_channels, dim=1)
+    result = _requantize_per_channel(
+        conv_transpose_acc, requantize_multipliers, requantize_shifts
+    )
     result += output_offset
     result = result.clamp(activation_min, activation_max)
 
@@ -1189,12 +1238,17 @@ def quantized_avg_pool2d_impl(
     multiplier: int,
     shift: int,
 ) -> torch.Tensor:
-    dequant_input = dequantize_per_tensor_cmsis(input, zero_point, multiplier, shift)
-
     kernel = _ensure_tuple2(kernel_size)
     stride_vals = _ensure_tuple2(stride)
     padding_vals = _ensure_tuple2(padding)
 
+    if _bit_exact_simulation.get():
+        # arm_avgpool_s8 averages the int8 values directly, the scale and
+        # zero point are the same on both sides.
+        return avg_pool2d_cmsis(input, kernel, stride_vals, padding_vals)
+
+    dequant_input = dequantize_per_tensor_cmsis(input, zero_point, multiplier, shift)
+
     # TODO: implement dilation != 1.
     result = F.avg_pool2d(
         dequant_input,
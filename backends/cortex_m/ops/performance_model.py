@@ -0,0 +1,339 @@
+# Copyright 2026 Arm Limited and/or its affiliates.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+"""
+Static estimates of the cycles, memory traffic and kernel code size of a
+program lowered with the CortexMPassManager, without running it on hardware.
+
+Basic usage:
+    estimate = estimate_program(edge_program_manager, core="cortex-m55")
+    print(estimate.format_report())
+
+Every op is modelled as the longer of its compute time, from its
+multiply-accumulates (MACs) and other element operations, and the time to
+move its tensors through memory, plus a fixed call overhead. The figures in
+CORE_MODELS and KERNEL_CODE_SIZES are rough effective numbers for the
+CMSIS-NN kernels. They are meant to compare lowering choices and catch
+regressions, and should be calibrated against FVP or board measurements
+before being read as absolute latencies.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from typing import Dict, List, NamedTuple, Optional, Union
+
+import torch
+from executorch.exir import EdgeProgramManager, ExecutorchProgramManager
+from tabulate import tabulate
+from torch.export import ExportedProgram
+from torch.fx import Node
+
+
+@dataclass(frozen=True)
+class CortexMCoreModel:
+    """
+    Throughput of a Cortex-M core running the cortex_m kernels.
+
+    Attributes:
+        name: Name of the core.
+        int8_macs_per_cycle: Effective MACs per cycle of the int8 kernels.
+        int16_macs_per_cycle: Effective MACs per cycle of the int16 kernels.
+        elements_per_cycle: int8 elements per cycle of the vectorized
+            elementwise, pooling and data movement kernels. Wider types
+            process proportionally fewer elements.
+        portable_elements_per_cycle: Elements per cycle of the scalar
+            portable kernels, for the ops that are not lowered to cortex_m.
+        bytes_per_cycle: Bytes per cycle the core reads or writes in the
+            memory holding the tensors.
+        call_overhead_cycles: Cycles of the runtime and kernel setup per op.
+        frequency_mhz: Typical clock frequency, to convert cycles to time.
+    """
+
+    name: str
+    int8_macs_per_cycle: float
+    int16_macs_per_cycle: float
+    elements_per_cycle: float
+    portable_elements_per_cycle: float
+    bytes_per_cycle: float
+    call_overhead_cycles: float
+    frequency_mhz: float
+
+
+CORE_MODELS: Dict[str, CortexMCoreModel] = {
+    # Dual-beat Helium (MVE)
+    "cortex-m55": CortexMCoreModel(
+        name="cortex-m55",
+        int8_macs_per_cycle=6.0,
+        int16_macs_per_cycle=3.0,
+        elements_per_cycle=8.0,
+        portable_elements_per_cycle=0.25,
+        bytes_per_cycle=4.0,
+        call_overhead_cycles=300.0,
+        frequency_mhz=400.0,
+    ),
+    # Dual-beat Helium with a wider memory system and a superscalar pipeline
+    "cortex-m85": CortexMCoreModel(
+        name="cortex-m85",
+        int8_macs_per_cycle=7.0,
+        int16_macs_per_cycle=3.5,
+        elements_per_cycle=10.0,
+        portable_elements_per_cycle=0.5,
+        bytes_per_cycle=8.0,
+        call_overhead_cycles=200.0,
+        frequency_mhz=480.0,
+    ),
+}
+
+# Approximate .text bytes of the CMSIS-NN kernels each cortex_m op links in,
+# including their operator wrappers, for Helium builds at -O2.
+KERNEL_CODE_SIZES: Dict[str, int] = {
+    "cortex_m::quantize_per_tensor": 600,
+    "cortex_m::dequantize_per_tensor": 600,
+    "cortex_m::quantized_add": 1400,
+    "cortex_m::quantized_mul": 1200,
+    "cortex_m::minimum": 500,
+    "cortex_m::maximum": 500,
+    "cortex_m::quantized_linear": 2600,
+    "cortex_m::quantized_batch_matmul": 2400,
+    "cortex_m::softmax": 1300,
+    "cortex_m::transpose": 900,
+    "cortex_m::pad": 700,
+    "cortex_m::quantized_conv2d": 4800,
+    "cortex_m::quantized_depthwise_conv2d": 4200,
+    "cortex_m::quantized_transpose_conv2d": 3800,
+    "cortex_m::quantized_avg_pool2d": 1100,
+    "cortex_m::quantized_max_pool2d": 1000,
+}
+
+# Code size of a portable kernel, for the ops that are not lowered to cortex_m
+PORTABLE_KERNEL_CODE_SIZE: int = 2000
+
+# Ops that only reinterpret the memory of their input
+_VIEW_OPS = {
+    "aten::_unsafe_view",
+    "aten::alias_copy",
+    "aten::squeeze_copy",
+    "aten::unsqueeze_copy",
+    "aten::view_copy",
+    "executorch_prim::et_view",
+}
+
+
+class OpEstimate(NamedTuple):
+    """
+    NamedTuple storing the estimate of a single node.
+    """
+
+    name: str
+    op: str
+    dtype: str
+    macs: int
+    bytes_accessed: int
+    cycles: float
+    code_size: int
+
+
+@dataclass
+class ProgramEstimate:
+    """
+    Estimates of all the ops of a program on a core. Kernels used by several
+    ops are only counted once in the code size.
+    """
+
+    core: CortexMCoreModel
+    ops: List[OpEstimate] = field(default_factory=list)
+    weight_bytes: int = 0
+
+    @property
+    def total_cycles(self) -> float:
+        return sum(op.cycles for op in self.ops)
+
+    @property
+    def total_macs(self) -> int:
+        return sum(op.macs for op in self.ops)
+
+    @property
+    def code_size(self) -> int:
+        return sum({op.op: op.code_size for op in self.ops}.values())
+
+    def latency_ms(self, frequency_mhz: Optional[float] = None) -> float:
+        frequency_mhz = frequency_mhz or self.core.frequency_mhz
+        return self.total_cycles / (frequency_mhz * 1e3)
+
+    def format_report(self) -> str:
+        """A table of the estimate of every op, followed by the totals."""
+        total_cycles = self.total_cycles or 1.0
+        rows = [
+            [
+                op.name,
+                op.op,
+                op.dtype,
+                op.macs,
+                op.bytes_accessed,
+                f"{op.cycles:.0f}",
+                f"{100 * op.cycles / total_cycles:.1f}",
+            ]
+            for op in self.ops
+        ]
+        table = tabulate(
+            rows,
+            headers=["NODE NAME", "OP", "DTYPE", "MACS", "BYTES", "CYCLES", "%"],
+            tablefmt="simple",
+        )
+        summary = (
+            f"{self.core.name}: {self.total_cycles:.0f} cycles "
+            f"({self.latency_ms():.3f} ms at {self.core.frequency_mhz:.0f} MHz), "
+            f"{self.total_macs} MACs, kernel code size {self.code_size} B, "
+            f"weights {self.weight_bytes} B"
+        )
+        return f"{table}\n{summary}"
+
+
+def _op_name(node: Node) -> Optional[str]:
+    schema = getattr(node.target, "_schema", None)
+    return schema.name if schema is not None else None
+
+
+def _tensor(value) -> Optional[torch.Tensor]:
+    if isinstance(value, Node):
+        value = value.meta.get("val")
+    return value if isinstance(value, torch.Tensor) else None
+
+
+def _nbytes(tensor: Optional[torch.Tensor]) -> int:
+    return tensor.numel() * tensor.element_size() if tensor is not None else 0
+
+
+def _count_macs_and_traffic(
+    name: str, args: tuple, output: torch.Tensor
+) -> tuple[int, int, int]:
+    """MACs, other element operations, and bytes accessed by a cortex_m op."""
+    inputs = [_tensor(arg) for arg in args]
+    input_bytes = sum(_nbytes(tensor) for tensor in inputs)
+    output_bytes = _nbytes(output)
+
+    if name == "cortex_m::quantized_conv2d":
+        # Weights are OHWI. Two output pixels are computed per pass over the
+        # weights, from an im2col buffer holding their input windows.
+        weight = inputs[1]
+        window = weight.shape[1] * weight.shape[2] * weight.shape[3]
+        pixels = output.numel() // output.shape[1]
+        traffic = (
+            _nbytes(weight) * math.ceil(pixels / 2)
+            + pixels * window * inputs[0].element_size()
+            + output_bytes
+        )
+        return output.numel() * window, 0, traffic
+    if name == "cortex_m::quantized_depthwise_conv2d":
+        # Weights are IHWO
+        weight = inputs[1]
+        kernel_area = weight.shape[1] * weight.shape[2]
+        return (
+            output.numel() * kernel_area,
+            0,
+            _nbytes(inputs[0]) * kernel_area + _nbytes(weight) + output_bytes,
+        )
+    if name == "cortex_m::quantized_transpose_conv2d":
+        # Weights are OHWI. Every input pixel is scattered over the kernel
+        # window of every output channel, accumulating in an int32 buffer.
+        weight = inputs[1]
+        macs = inputs[0].numel() * weight.shape[0] * weight.shape[1] * weight.shape[2]
+        accumulator_bytes = 2 * output.numel() * 4
+        return macs, 0, input_bytes + accumulator_bytes + output_bytes
+    if name == "cortex_m::quantized_linear":
+        # The weights are read once per row of the input
+        rows = output.numel() // output.shape[-1]
+        return (
+            output.numel() * inputs[0].shape[-1],
+            0,
+            _nbytes(inputs[0]) + _nbytes(inputs[1]) * rows + output_bytes,
+        )
+    if name == "cortex_m::quantized_batch_matmul":
+        lhs, rhs = inputs[0], inputs[2]
+        rows = lhs.shape[-2]
+        return (
+            output.numel() * lhs.shape[-1],
+            0,
+            _nbytes(lhs) + _nbytes(rhs) * rows + output_bytes,
+        )
+    if name in ("cortex_m::quantized_avg_pool2d", "cortex_m::quantized_max_pool2d"):
+        kernel_area = math.prod(args[1]) if len(args[1]) > 1 else args[1][0] ** 2
+        return 0, output.numel() * kernel_area, input_bytes + output_bytes
+    if name == "cortex_m::softmax":
+        # Max, exp and sum, then normalization
+        return 0, 3 * output.numel(), 2 * input_bytes + output_bytes
+    return 0, output.numel(), input_bytes + output_bytes
+
+
+def estimate_op(node: Node, core: CortexMCoreModel) -> Optional[OpEstimate]:
+    """
+    The estimate of a call_function node, or None for nodes that do not run
+    a kernel, such as views and memory planning ops.
+    """
+    name = _op_name(node)
+    if node.op != "call_function" or name is None or name in _VIEW_OPS:
+        return None
+    outputs = node.meta.get("val")
+    output = outputs[0] if isinstance(outputs, (list, tuple)) else outputs
+    if not isinstance(output, torch.Tensor):
+        return None
+
+    macs, elements, bytes_accessed = _count_macs_and_traffic(name, node.args, output)
+    input_tensor = _tensor(node.args[0]) if node.args else None
+    dtype = (input_tensor if input_tensor is not None else output).dtype
+
+    if name in KERNEL_CODE_SIZES:
+        element_size = torch.empty(0, dtype=dtype).element_size()
+        macs_per_cycle = (
+            core.int8_macs_per_cycle if element_size == 1 else core.int16_macs_per_cycle
+        )
+        elements_per_cycle = core.elements_per_cycle / element_size
+        code_size = KERNEL_CODE_SIZES[name]
+    else:
+        macs_per_cycle = core.portable_elements_per_cycle
+        elements_per_cycle = core.portable_elements_per_cycle
+        code_size = PORTABLE_KERNEL_CODE_SIZE
+
+    compute_cycles = macs / macs_per_cycle + elements / elements_per_cycle
+    memory_cycles = bytes_accessed / core.bytes_per_cycle
+    return OpEstimate(
+        name=node.name,
+        op=name,
+        dtype=str(dtype).removeprefix("torch."),
+        macs=macs,
+        bytes_accessed=bytes_accessed,
+        cycles=max(compute_cycles, memory_cycles) + core.call_overhead_cycles,
+        code_size=code_size,
+    )
+
+
+def estimate_program(
+    program: Union[ExportedProgram, EdgeProgramManager, ExecutorchProgramManager],
+    core: Union[str, CortexMCoreModel] = "cortex-m55",
+) -> ProgramEstimate:
+    """
+    Estimate every op of a lowered program, before or after to_executorch,
+    on a core of CORE_MODELS or a custom core model.
+    """
+    if isinstance(core, str):
+        if core not in CORE_MODELS:
+            raise ValueError(
+                f"Unknown core {core}, expected one of {sorted(CORE_MODELS)}"
+            )
+        core = CORE_MODELS[core]
+    if isinstance(program, (EdgeProgramManager, ExecutorchProgramManager)):
+        program = program.exported_program()
+
+    estimate = ProgramEstimate(core)
+    for node in program.graph_module.graph.nodes:
+        if (op_estimate := estimate_op(node, core)) is not None:
+            estimate.ops.append(op_estimate)
+    estimate.weight_bytes = sum(
+        _nbytes(tensor)
+        for tensor in (*program.state_dict.values(), *program.constants.values())
+        if isinstance(tensor, torch.Tensor)
+    )
+    return estimate
@@ -0,0 +1,64 @@
+# Copyright 2026 Arm Limited and/or its affiliates.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterable, Sequence
+
+import executorch.backends.cortex_m.ops.operators  # noqa: F401
+
+import torch
+from executorch.backends.cortex_m.ops.operators import cmsis_bit_exact_simulation
+from executorch.exir import EdgeProgramManager
+from torch.export import ExportedProgram
+
+
+class CortexMSimulator:
+    """
+    Run a program lowered to cortex_m ops on the host, with the integer
+    arithmetic of CMSIS-NN, to evaluate a quantized model on many samples
+    before running it on a board.
+
+    The reference implementations of the cortex_m ops are used, in the bit
+    exact mode of cmsis_bit_exact_simulation. Samples are run in parallel
+    with num_workers threads, the torch kernels release the GIL. Each sample
+    runs in a copy of the context of the caller.
+    """
+
+    def __init__(
+        self,
+        program: ExportedProgram | EdgeProgramManager,
+        num_workers: int = 0,
+    ) -> None:
+        if isinstance(program, EdgeProgramManager):
+            program = program.exported_program()
+        self.module = program.module()
+        self.num_workers = num_workers
+
+    def __call__(self, *inputs: torch.Tensor) -> Any:
+        with torch.inference_mode(), cmsis_bit_exact_simulation():
+            return self.module(*inputs)
+
+    def run(self, samples: Iterable[Sequence[torch.Tensor]]) -> list[Any]:
+        """The outputs of the program for every sample, in order."""
+        if self.num_workers <= 0:
+            return [self(*sample) for sample in samples]
+        # The simulation mode is a context variable, which worker threads
+        # don't inherit, so hand them the context it is set in
+        with cmsis_bit_exact_simulation():
+            context = contextvars.copy_context()
+        with ThreadPoolExecutor(self.num_workers) as executor:
+            return list(
+                executor.map(
+                    # A context can only be entered by one thread at a time
+                    lambda sample: context.copy().run(self._run_sample, sample),
+                    samples,
+                )
+            )
+
+    def _run_sample(self, sample: Sequence[torch.Tensor]) -> Any:
+        # inference_mode is thread local
+        with torch.inference_mode():
+            return self.module(*sample)
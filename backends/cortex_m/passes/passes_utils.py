@@ -8,6 +8,7 @@
 import math
 
 import torch
+import torch.nn.functional as F
 
 from executorch.exir.dialects._ops import ops as exir_ops
 
@@ -51,35 +52,188 @@ def quantize_per_tensor_cmsis(
 
 def requantize_cmsis(
     tensor: torch.Tensor,
-    multiplier: int,
-    shift: int,
+    multiplier: int | torch.Tensor,
+    shift: int | torch.Tensor,
 ) -> torch.Tensor:
-    """Simulate CMSIS-NN's arm_nn_requantize helper."""
+    """
+    Simulate CMSIS-NN's arm_nn_requantize helper. multiplier and shift are
+    either per-tensor ints, or per-channel tensors broadcasting with tensor.
+    """
 
     tensor_64 = tensor.to(torch.int64)
-    left_shift = max(shift, 0)
-    right_shift = max(-shift, 0)
+    if isinstance(multiplier, torch.Tensor):
+        multiplier = multiplier.to(torch.int64)
+    if isinstance(shift, torch.Tensor):
+        shift = shift.to(torch.int64)
+        left_shift = shift.clamp(min=0)
+        right_shift = (-shift).clamp(min=0)
+    else:
+        left_shift = max(shift, 0)
+        right_shift = max(-shift, 0)
 
     # Equivalent to val * (1 << LEFT_SHIFT(shift))
     value = tensor_64 << left_shift
 
     # arm_nn_doubling_high_mult_no_sat(value, multiplier)
-    product = value * int(multiplier)
+    product = value * multiplier
     product = product + (1 << 30)
     result = product >> 31
 
-    if right_shift:
-        remainder_mask = (1 << right_shift) - 1
-        remainder = torch.bitwise_and(result, remainder_mask)
-        result = result >> right_shift
-        threshold = remainder_mask >> 1
-        threshold_tensor = torch.full_like(result, threshold, dtype=torch.int64)
-        threshold_tensor = torch.where(
-            result < 0, threshold_tensor + 1, threshold_tensor
+    return _divide_by_power_of_two(result, right_shift).to(torch.int32)
+
+
+def _divide_by_power_of_two(
+    dividend: torch.Tensor, exponent: int | torch.Tensor
+) -> torch.Tensor:
+    """arm_nn_divide_by_power_of_two: a right shift rounding half away from zero."""
+    remainder_mask = (1 << exponent) - 1
+    remainder = torch.bitwise_and(dividend, remainder_mask)
+    result = dividend >> exponent
+    threshold = (remainder_mask >> 1) + (result < 0).to(torch.int64)
+    return result + (remainder > threshold).to(torch.int64)
+
+
+_INT32_MIN = torch.iinfo(torch.int32).min
+_INT32_MAX = torch.iinfo(torch.int32).max
+
+
+def _doubling_high_mult(m1: torch.Tensor | int, m2: torch.Tensor | int) -> torch.Tensor:
+    """arm_nn_doubling_high_mult: Q31 multiplication rounding half away from zero."""
+    m1 = torch.as_tensor(m1, dtype=torch.int64)
+    m2 = torch.as_tensor(m2, dtype=torch.int64)
+    rounding = torch.where((m1 < 0) ^ (m2 < 0), 1 - (1 << 30), 1 << 30)
+    result = torch.div(m1 * m2 + rounding, 1 << 31, rounding_mode="trunc")
+    return torch.where((m1 == _INT32_MIN) & (m2 == _INT32_MIN), _INT32_MAX, result)
+
+
+def _mult_by_power_of_two(value: torch.Tensor, exponent: int) -> torch.Tensor:
+    """arm_nn_mult_by_power_of_two: a saturating left shift."""
+    threshold = (1 << (31 - exponent)) - 1
+    result = (value << exponent).clamp(_INT32_MIN, _INT32_MAX)
+    result = torch.where(value > threshold, _INT32_MAX, result)
+    return torch.where(value < -threshold, _INT32_MIN, result)
+
+
+def _exp_on_negative_values(value: torch.Tensor) -> torch.Tensor:
+    """arm_nn_exp_on_negative_values: exp of Q5.26 values <= 0, in Q0.31."""
+    shift = 24
+    value_mod_minus_quarter = torch.bitwise_and(value, (1 << shift) - 1) - (1 << shift)
+    remainder = value_mod_minus_quarter - value
+    x = (value_mod_minus_quarter << 5) + (1 << 28)
+    x2 = _doubling_high_mult(x, x)
+    # Taylor expansion of exp around -1/8
+    result = 1895147668 + _doubling_high_mult(
+        1895147668,
+        x
+        + _divide_by_power_of_two(
+            _doubling_high_mult(
+                _divide_by_power_of_two(_doubling_high_mult(x2, x2), 2)
+                + _doubling_high_mult(x2, x),
+                715827883,
+            )
+            + x2,
+            1,
+        ),
+    )
+    # exp of the multiples of 1/4 in the remainder
+    for constant in (
+        1672461947,
+        1302514674,
+        790015084,
+        290630308,
+        39332535,
+        720401,
+        242,
+    ):
+        result = torch.where(
+            torch.bitwise_and(remainder, 1 << shift) != 0,
+            _doubling_high_mult(result, constant),
+            result,
+        )
+        shift += 1
+    return torch.where(value == 0, _INT32_MAX, result)
+
+
+def _one_over_one_plus_x_for_x_in_0_1(value: torch.Tensor) -> torch.Tensor:
+    """arm_nn_one_over_one_plus_x_for_x_in_0_1, by Newton-Raphson, in Q1.30."""
+    total = value + _INT32_MAX
+    half_denominator = torch.div(
+        total + torch.where(total >= 0, 1, -1), 2, rounding_mode="trunc"
+    )
+    x = 1515870810 + _doubling_high_mult(half_denominator, -1010580540)
+    one = 1 << 29
+    for _ in range(3):
+        x = x + _mult_by_power_of_two(
+            _doubling_high_mult(x, one - _doubling_high_mult(half_denominator, x)), 2
         )
-        result = result + torch.where(remainder > threshold_tensor, 1, 0)
+    return _mult_by_power_of_two(x, 1)
 
-    return result.to(torch.int32)
+
+def softmax_cmsis(
+    input: torch.Tensor, multiplier: int, shift: int, diff_min: int
+) -> torch.Tensor:
+    """
+    Simulate CMSIS-NN's arm_softmax_s8 along the last dimension, with its
+    fixed-point exp and reciprocal. Inputs below diff_min from the maximum of
+    their row map to -128.
+    """
+    # Sum of the exps in Q12.19
+    accum_bits = 12
+    diff = input.to(torch.int64) - input.amax(dim=-1, keepdim=True).to(torch.int64)
+    valid = diff >= diff_min
+    exp = _exp_on_negative_values(_doubling_high_mult(diff << shift, multiplier))
+    total = torch.where(valid, _divide_by_power_of_two(exp, accum_bits), 0).sum(
+        dim=-1, keepdim=True
+    )
+
+    # Count the leading zeros of the (positive) int32 sum
+    bit_length = (total >= (1 << torch.arange(32))).sum(dim=-1, keepdim=True)
+    headroom = 32 - bit_length
+    shifted_scale = _one_over_one_plus_x_for_x_in_0_1((total << headroom) - (1 << 31))
+    bits_over_unit = accum_bits - headroom + 23
+
+    result = _divide_by_power_of_two(
+        _doubling_high_mult(shifted_scale, exp), bits_over_unit
+    )
+    result = torch.where(valid, result - 128, -128)
+    return result.clamp(-128, 127).to(torch.int8)
+
+
+def avg_pool2d_cmsis(
+    input: torch.Tensor,
+    kernel_size: tuple[int, int],
+    stride: tuple[int, int],
+    padding: tuple[int, int],
+    activation_min: int = -128,
+    activation_max: int = 127,
+) -> torch.Tensor:
+    """
+    Simulate CMSIS-NN's arm_avgpool_s8: the sum of the int8 values within the
+    input divided by their count, rounding half away from zero.
+    """
+    ones = torch.ones_like(input[:1, :1], dtype=torch.float64)
+    # Sums of at most 255 * kernel area int8 values are exact in float64
+    total = F.avg_pool2d(
+        input.to(torch.float64),
+        kernel_size,
+        stride=stride,
+        padding=padding,
+        count_include_pad=True,
+        divisor_override=1,
+    ).to(torch.int64)
+    count = F.avg_pool2d(
+        ones,
+        kernel_size,
+        stride=stride,
+        padding=padding,
+        count_include_pad=True,
+        divisor_override=1,
+    ).to(torch.int64)
+    half = count // 2
+    result = torch.div(
+        torch.where(total > 0, total + half, total - half), count, rounding_mode="trunc"
+    )
+    return result.clamp(activation_min, activation_max).to(torch.int8)
 
 
 def extract_scalar_value(node_arg) -> float:
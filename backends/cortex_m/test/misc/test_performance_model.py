@@ -0,0 +1,62 @@
+# Copyright 2026 Arm Limited and/or its affiliates.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+import pytest
+import torch
+from executorch.backends.cortex_m.ops.performance_model import (
+    CORE_MODELS,
+    estimate_program,
+    KERNEL_CODE_SIZES,
+)
+from executorch.backends.cortex_m.test.tester import CortexMTester, ramp_tensor
+from executorch.backends.test.harness.stages import StageType
+
+
+class ConvLinear(torch.nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.conv1 = torch.nn.Conv2d(4, 8, 3, padding=1)
+        self.conv2 = torch.nn.Conv2d(8, 8, 3, padding=1)
+        self.linear = torch.nn.Linear(8 * 8 * 8, 10)
+
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        x = torch.relu(self.conv2(torch.relu(self.conv1(x))))
+        return self.linear(x.flatten(1))
+
+
+def _lowered_program():
+    inputs = (ramp_tensor(-1, 1, (1, 4, 8, 8)).to(memory_format=torch.channels_last),)
+    tester = CortexMTester(ConvLinear(), inputs)
+    tester.quantize().export().to_edge().run_passes()
+    return tester.get_artifact(StageType.RUN_PASSES)
+
+
+def test_estimate_program():
+    estimate = estimate_program(_lowered_program(), core="cortex-m55")
+
+    convs = [op for op in estimate.ops if op.op == "cortex_m::quantized_conv2d"]
+    assert [op.macs for op in convs] == [8 * 8 * 8 * 3 * 3 * 4, 8 * 8 * 8 * 3 * 3 * 8]
+    linears = [op for op in estimate.ops if op.op == "cortex_m::quantized_linear"]
+    assert [op.macs for op in linears] == [8 * 8 * 8 * 10]
+    assert all(op.dtype == "int8" for op in convs + linears)
+
+    # Both convs share their kernels
+    assert estimate.code_size == sum(
+        KERNEL_CODE_SIZES.get(name, 0) for name in {op.op for op in estimate.ops}
+    )
+    assert estimate.total_macs == sum(op.macs for op in convs + linears)
+    assert estimate.weight_bytes > 8 * 8 * 8 * 10
+    assert "cortex_m::quantized_conv2d" in estimate.format_report()
+
+
+def test_estimate_program_cores():
+    program = _lowered_program()
+    m55 = estimate_program(program, core="cortex-m55")
+    m85 = estimate_program(program, core=CORE_MODELS["cortex-m85"])
+    assert m85.total_cycles < m55.total_cycles
+    assert m85.latency_ms() < m55.latency_ms()
+
+    with pytest.raises(ValueError):
+        estimate_program(program, core="cortex-m0")
@@ -0,0 +1,90 @@
+# Copyright 2026 Arm Limited and/or its affiliates.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+import math
+from concurrent.futures import ThreadPoolExecutor
+
+import torch
+from executorch.backends.arm.test.common import parametrize
+from executorch.backends.cortex_m.ops import operators
+from executorch.backends.cortex_m.ops.operators import cmsis_bit_exact_simulation
+from executorch.backends.cortex_m.ops.simulator import CortexMSimulator
+from executorch.backends.cortex_m.passes.passes_utils import (
+    quantize_multiplier_aot,
+    requantize_cmsis,
+    softmax_cmsis,
+)
+from executorch.backends.cortex_m.test.tester import CortexMTester, ramp_tensor
+from executorch.backends.test.harness.stages import StageType
+
+
+class ConvPoolSoftmax(torch.nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.conv = torch.nn.Conv2d(4, 8, 3, padding=1)
+        self.pool = torch.nn.AvgPool2d(2)
+
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        x = self.pool(torch.relu(self.conv(x)))
+        return torch.softmax(x.flatten(1), dim=-1)
+
+
+def _softmax_params(scale: float) -> tuple[int, int, int]:
+    """Multiplier, shift and diff_min of arm_softmax_s8 for an input scale."""
+    multiplier, shift = quantize_multiplier_aot(scale * (1 << 26))
+    diff_min = -math.floor(31 * (1 << 26) / (1 << shift))
+    return int(multiplier), int(shift), diff_min
+
+
+@parametrize("scale", {"small": 0.02, "medium": 0.05, "large": 0.1})
+def test_softmax_cmsis_matches_float(scale):
+    torch.manual_seed(0)
+    input = torch.randint(-128, 128, (64, 10), dtype=torch.int8)
+    result = softmax_cmsis(input, *_softmax_params(scale))
+    expected = torch.round(torch.softmax(input.float() * scale, dim=-1) * 256) - 128
+    assert (result.float() - expected.clamp(-128, 127)).abs().max() <= 1
+
+
+def test_requantize_cmsis_per_channel():
+    torch.manual_seed(0)
+    acc = torch.randint(-(1 << 20), 1 << 20, (2, 3, 5, 5), dtype=torch.int32)
+    multipliers = torch.tensor([1 << 30, 1500000000, 1234567890], dtype=torch.int32)
+    shifts = torch.tensor([-3, 2, -10], dtype=torch.int32)
+    result = requantize_cmsis(
+        acc, multipliers.view(1, -1, 1, 1), shifts.view(1, -1, 1, 1)
+    )
+    for channel in range(3):
+        expected = requantize_cmsis(
+            acc[:, channel], int(multipliers[channel]), int(shifts[channel])
+        )
+        assert torch.equal(result[:, channel], expected)
+
+
+def test_simulator_matches_program():
+    inputs = (ramp_tensor(-1, 1, (1, 4, 8, 8)).to(memory_format=torch.channels_last),)
+    tester = CortexMTester(ConvPoolSoftmax(), inputs)
+    tester.quantize().export().to_edge().run_passes()
+    program = tester.get_artifact(StageType.RUN_PASSES)
+
+    samples = [
+        (torch.randn(1, 4, 8, 8).to(memory_format=torch.channels_last),)
+        for _ in range(8)
+    ]
+    module = program.exported_program().module()
+    with cmsis_bit_exact_simulation():
+        expected = [module(*sample) for sample in samples]
+
+    results = CortexMSimulator(program, num_workers=4).run(samples)
+    for result, reference in zip(results, expected):
+        assert torch.equal(result, reference)
+
+
+def test_bit_exact_simulation_is_thread_local():
+    with cmsis_bit_exact_simulation():
+        assert operators._bit_exact_simulation.get()
+        with ThreadPoolExecutor(1) as executor:
+            # Threads don't inherit the mode of the thread that started them
+            assert not executor.submit(operators._bit_exact_simulation.get).result()
+    assert not operators._bit_exact_simulation.get()
@@ -1,4 +1,4 @@
-# Copyright 2024-2025 NXP
+# Copyright 2024-2026 NXP
 #
 # This source code is licensed under the BSD-style license found in the
 # LICENSE file in the root directory of this source tree.
@@ -31,6 +31,7 @@ class ConversionConfig:
         self.ignore_opset_version: bool = False
 
         self.tflite_quantization_integrity_check: bool = True
+        self.deduplicate_static_buffers: bool = True
 
         if args is not None:
             for key, value in args.items():
@@ -6,6 +6,7 @@
 # See the LICENSE_MIT for more details.
 #
 
+import hashlib
 from copy import deepcopy
 from typing import List, Optional, Union
 
@@ -55,6 +56,11 @@ from executorch.backends.nxp.backend.neutron_operator_support import (
 from executorch.backends.nxp.backend.neutron_target_spec import NeutronTargetSpec
 
 
+def _raw_bytes(buffer: tflite_model.Buffer) -> np.ndarray:
+    """Return the data of 'buffer' as a flat array of bytes, the way it will be stored in the TFLite model."""
+    return np.ascontiguousarray(buffer.data).reshape(-1).view(np.uint8)
+
+
 class ModelBuilder:
     """
     Class encapsulates a TFLite object model defined in '/src/tflite_generator/'.
@@ -66,6 +72,9 @@ class ModelBuilder:
 
     _tensor_name_map: dict  # Mapping 'str' to 'tflT.Tensor'
 
+    # Mapping a requested tensor name to the next numeric suffix to try, when the name is already taken.
+    _tensor_name_suffix_map: dict[str, int]
+
     # Maps BuiltinOperator to a dict, mapping version to index. Operators of type 'BuiltinOperator.CUSTOM'
     # have their 'version' prepended with its name, for example "FlexErf_1".
     op_code_type_index_map: dict[BuiltinOperator, dict[Union[str, int], int]]
@@ -102,6 +111,7 @@ class ModelBuilder:
 
         self.op_code_type_index_map = {}
         self._tensor_name_map = {}
+        self._tensor_name_suffix_map = {}
         self._nchw_tensor_version = {}
         self._skipped_output_map = {}
         self._zeros_tensor_map = {}
@@ -483,6 +493,48 @@ class ModelBuilder:
             # It's safe to replace the buffer.
             t.tmp_buffer = empty_buffer
 
+    def _deduplicate_static_buffers(self):
+        """Make all static tensors with identical data share 1 `Buffer`, and remove the buffers which are no longer
+        used by any tensor. The first empty buffer is always kept at index 0, as required by the TFLite schema.
+        """
+        empty_buffer = self.get_first_empty_buffer()
+
+        # Mapping a hash of the buffer data to the buffers with that hash.
+        buffers_for_hash: dict[tuple, list[tflite_model.Buffer]] = {}
+        used_buffers = {empty_buffer}
+
+        for t in self.get_tensors().vector:
+            buffer = t.tmp_buffer
+            if buffer is None:
+                continue
+
+            if t.is_variable or not tensor_has_data(t):
+                used_buffers.add(buffer)
+                continue
+
+            data = _raw_bytes(buffer)
+            key = (
+                buffer.type,
+                buffer.data.dtype.str,
+                hashlib.blake2b(data, digest_size=16).digest(),
+            )
+            candidates = buffers_for_hash.setdefault(key, [])
+            for candidate in candidates:
+                if candidate is buffer or np.array_equal(_raw_bytes(candidate), data):
+                    # Identical data is already stored in `candidate`.
+                    t.tmp_buffer = candidate
+                    break
+            else:
+                candidates.append(buffer)
+                used_buffers.add(buffer)
+
+        buffers = [empty_buffer] + [
+            b
+            for b in self.get_buffers().vector
+            if b in used_buffers and b is not empty_buffer
+        ]
+        self.get_buffers().vector = buffers
+
     def finish(self) -> tflite_model.Model:
         """Finalize and optimize the converted TFLite model. Then return it.
 
@@ -504,11 +556,13 @@ class ModelBuilder:
         )
 
         self._keep_one_empty_buffer()
+        if self.conversion_config.deduplicate_static_buffers:
+            self._deduplicate_static_buffers()
 
         # Remove outputs, which are not produced by any node. Otherwise, there would be errors after inference.
-        operator_outputs = []
+        operator_outputs = set()
         for op in self.get_operators().vector:
-            operator_outputs.extend(op.tmp_outputs)
+            operator_outputs.update(op.tmp_outputs)
         graph_outputs = self.get_sub_graph().outputs.tmp_outputs.copy()
         for output in graph_outputs:
             if output not in operator_outputs:
@@ -732,12 +786,18 @@ class ModelBuilder:
     def _validate_new_tensor_name(self, name: str) -> str:
         """Take tensor name 'name' and make it unique in the model. Returns a unique tensor name."""
 
-        # Try adding numbers to the 'name' until it is unique
-        suffix = 0
-        new_name = name
+        if not self.tensor_exists(name):
+            return name
+
+        # Try adding numbers to the 'name' until it is unique. Names are never released, so the search can continue
+        #  from the last suffix used for this 'name'.
+        suffix = self._tensor_name_suffix_map.get(name, 0)
+        new_name = name + str(suffix)
         while self.tensor_exists(new_name):
-            new_name = name + str(suffix)
             suffix += 1
+            new_name = name + str(suffix)
+
+        self._tensor_name_suffix_map[name] = suffix + 1
 
         return new_name
 
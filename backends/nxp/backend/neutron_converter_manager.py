@@ -3,27 +3,62 @@
 # This source code is licensed under the BSD-style license found in the
 # LICENSE file in the root directory of this source tree.
 
+import hashlib
+import importlib
+import importlib.metadata
 import logging
 import multiprocessing
 import os
+import tempfile
 
-try:
-    from eiq_neutron_sdk import neutron_converter, neutron_library_utils
-except ImportError:
-    raise RuntimeError(
-        "eIQ Neutron SDK not found. To install it, run 'examples/nxp/setup.sh'."
-    )
+# Module of the Neutron converter of the eIQ Neutron SDK.
+NEUTRON_SDK_CONVERTER = "eiq_neutron_sdk.neutron_converter"
 
 
-def convert_unsafe(neutron_converter, tflite_model, cctx, queue):
+def _import_neutron_sdk_module(name: str):
+    """Import a module of the eIQ Neutron SDK, only once it is used, so that the backend can be imported without it."""
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        raise RuntimeError(
+            "eIQ Neutron SDK not found. To install it, run 'examples/nxp/setup.sh'."
+        )
+
+
+def _import_converter(converter: str):
+    if converter == NEUTRON_SDK_CONVERTER:
+        return _import_neutron_sdk_module(converter)
+    return importlib.import_module(converter)
+
+
+def _compilation_context(
+    converter,
+    target: str,
+    excluded_graph_passes: str,
+    fetch_constants_to_sram: bool,
+    dump_kernel_selection_code: bool,
+):
+    cctx = converter.CompilationContext()
+    cctx.targetOpts = converter.getNeutronTarget(target)
+    cctx.compilationOpts.minNumOpsPerGraph = 1
+    cctx.compilationOpts.excludeGraphPasses = excluded_graph_passes
+    cctx.compilationOpts.fetchConstantsToSRAM = fetch_constants_to_sram
+    cctx.compilationOpts.dumpKernelSelectionCode = dump_kernel_selection_code
+    return cctx
+
+
+def convert_unsafe(converter, tflite_model, compilation_options, queue):
     """
-    Run neutron_converter on given tflite_model with compilation context cctx.
-    This routine is supposed to run in a separate process.
+    Run the Neutron converter module named `converter` on given tflite_model, with the compilation context created
+    from compilation_options. This routine is supposed to run in a separate process. Only picklable arguments are
+    passed, so that it can be started with the spawn and forkserver start methods too.
     If properly finished, the output queue contains the converted model,
     otherwise the neutron_converter exits and the output queue is empty.
     """
-    model_converted = neutron_converter.convertModel(list(tflite_model), cctx)
-    queue.put(model_converted)
+    converter = _import_converter(converter)
+    cctx = _compilation_context(converter, *compilation_options)
+    model_converted = converter.convertModel(list(tflite_model), cctx)
+    queue.put(bytes(model_converted))
 
 
 class NeutronConverterManager:
@@ -32,11 +67,30 @@ class NeutronConverterManager:
     contains NeutronGraph nodes.
     """
 
+    # Graph passes of the Neutron converter which are not run on the models
+    EXCLUDED_GRAPH_PASSES = "HoistSliceAboveTranspose,MergeTranspose"
+
     def __init__(
         self,
         dump_kernel_selection_code: bool = False,
+        cache_dir: str | None = None,
+        converter: str = NEUTRON_SDK_CONVERTER,
+        mp_context: str | None = None,
     ):
+        """
+        :param dump_kernel_selection_code: Whether Neutron converter dumps kernel selection code.
+        :param cache_dir: Directory where converted models are cached, keyed by the hash of the TFLite model and
+                          the conversion options. Repeated conversions of the same partition are read from it.
+        :param converter: Name of the module with the interface of `eiq_neutron_sdk.neutron_converter` to run the
+                          conversion with. Defaults to the Neutron converter of the eIQ Neutron SDK.
+        :param mp_context: Start method of the process the conversion runs in, e.g. "spawn" or "forkserver". Use one
+                           of those when converting from several threads, as forking a multithreaded process is
+                           unsafe. Defaults to the start method of the platform.
+        """
         self.dump_kernel_selection_code = dump_kernel_selection_code
+        self.cache_dir = cache_dir
+        self.converter = converter
+        self.mp_context = mp_context
 
     @staticmethod
     def _rename_partition_kernel_selection_file(delegation_tag):
@@ -47,12 +101,16 @@ class NeutronConverterManager:
             logging.error("Failed to rename partition kernel selection file.")
 
     def get_converter(self):
-        return neutron_converter
+        return _import_converter(self.converter)
 
     def get_library_utils(self):
-        return neutron_library_utils
+        return _import_neutron_sdk_module("eiq_neutron_sdk.neutron_library_utils")
 
     def verify_target(self, target: str):
+        if self.converter != NEUTRON_SDK_CONVERTER:
+            # Only the Neutron converter crashes on invalid targets.
+            return
+        neutron_library_utils = self.get_library_utils()
         if not neutron_library_utils.isNeutronTarget(target):
             valid_targets = [
                 target.name for target in neutron_library_utils.getNeutronTargets()
@@ -61,6 +119,43 @@ class NeutronConverterManager:
                 f"Target `{target}` is not a valid target. Must be one of `{valid_targets}`."
             )
 
+    @staticmethod
+    def _sdk_version() -> str:
+        try:
+            return importlib.metadata.version("eiq-neutron-sdk")
+        except importlib.metadata.PackageNotFoundError:
+            return "unknown"
+
+    def cache_key(
+        self, tflite_model: bytes, target: str, fetch_constants_to_sram: bool
+    ) -> str:
+        """Hash of the TFLite model together with everything else that affects its conversion."""
+        options = (
+            f"{target};{fetch_constants_to_sram};{self.EXCLUDED_GRAPH_PASSES};"
+            f"{self.converter};{self._sdk_version()}"
+        )
+        digest = hashlib.sha256(bytes(tflite_model))
+        digest.update(options.encode())
+        return digest.hexdigest()
+
+    def _cache_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.neutron.tflite")
+
+    def _read_cache(self, key: str) -> bytes | None:
+        try:
+            with open(self._cache_path(key), "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _write_cache(self, key: str, model: bytes):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        # Write to a temporary file first, so concurrent exports never read a partially written model.
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir)
+        with os.fdopen(fd, "wb") as f:
+            f.write(model)
+        os.replace(tmp_path, self._cache_path(key))
+
     def convert(
         self,
         tflite_model: bytes,
@@ -82,25 +177,34 @@ class NeutronConverterManager:
         # Neutron converter crashes if we provide invalid target -> verify.
         self.verify_target(target)
 
-        cctx = neutron_converter.CompilationContext()
-        cctx.targetOpts = neutron_converter.getNeutronTarget(target)
-        cctx.compilationOpts.minNumOpsPerGraph = 1
-        cctx.compilationOpts.excludeGraphPasses = (
-            "HoistSliceAboveTranspose,MergeTranspose"
+        # The kernel selection code is a side effect of the conversion, so it is never read from the cache.
+        cache_key = None
+        if self.cache_dir is not None and not self.dump_kernel_selection_code:
+            cache_key = self.cache_key(tflite_model, target, fetch_constants_to_sram)
+            if (model_converted := self._read_cache(cache_key)) is not None:
+                logging.debug(
+                    f"Using cached Neutron model {cache_key} for partition {delegation_tag}"
+                )
+                return model_converted
+
+        compilation_options = (
+            target,
+            self.EXCLUDED_GRAPH_PASSES,
+            fetch_constants_to_sram,
+            self.dump_kernel_selection_code,
         )
-        cctx.compilationOpts.fetchConstantsToSRAM = fetch_constants_to_sram
-        cctx.compilationOpts.dumpKernelSelectionCode = self.dump_kernel_selection_code
 
         # Try to use multiprocessing for isolation, but fall back to direct execution
         # if the environment doesn't support it (e.g., in sandcastle/build environments)
         try:
+            context = multiprocessing.get_context(self.mp_context)
             logger = multiprocessing.log_to_stderr()
             logger.setLevel(logging.WARNING)
-            queue = multiprocessing.Manager().Queue()
+            queue = context.Manager().Queue()
 
-            process = multiprocessing.Process(
+            process = context.Process(
                 target=convert_unsafe,
-                args=(neutron_converter, tflite_model, cctx, queue),
+                args=(self.converter, tflite_model, compilation_options, queue),
             )
             process.start()
             process.join()  # waits until the subprocess is complete
@@ -118,8 +222,16 @@ class NeutronConverterManager:
             logging.warning(
                 f"Multiprocessing not available ({e}), running neutron converter directly"
             )
-            model_converted = neutron_converter.convertModel(list(tflite_model), cctx)
+            converter = self.get_converter()
+            model_converted = converter.convertModel(
+                list(tflite_model),
+                _compilation_context(converter, *compilation_options),
+            )
         if self.dump_kernel_selection_code:
             self._rename_partition_kernel_selection_file(delegation_tag)
 
-        return bytes(model_converted)
+        model_converted = bytes(model_converted)
+        if cache_key is not None:
+            self._write_cache(cache_key, model_converted)
+
+        return model_converted
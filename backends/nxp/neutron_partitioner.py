@@ -146,9 +146,7 @@ class QDQClusterRecognizer:
             qdq_cluster.append(n)
             if self.is_quant_node(n):
                 continue
-            consumers = [
-                ngn for ngn in list(node.graph.nodes) if n in ngn.all_input_nodes
-            ]
+            consumers = list(n.users)
             logging.debug(f"\t Users for node {n} are: {consumers}")
             output_nodes_to_quant_or_helper = [
                 (self.is_quant_node(i) or self.is_auxiliary_node(i)) for i in consumers
@@ -167,12 +165,16 @@ class QDQClusterRecognizer:
         """
         logging.debug(node)
         input_qdq_cluster = self.get_qdq_cluster_input_part(node)
+        if not input_qdq_cluster:
+            return []
+
         output_qdq_cluster = self.get_qdq_cluster_output_part(node)
-        if input_qdq_cluster and output_qdq_cluster:
-            return list(set(input_qdq_cluster).union(output_qdq_cluster))
-        else:
+        if not output_qdq_cluster:
             return []
 
+        # Keep the order of the nodes deterministic.
+        return list(dict.fromkeys(input_qdq_cluster + output_qdq_cluster))
+
     def tag_nodes(self, nodes: list[torch.fx.Node], cluster_name: str) -> None:
         """
         Tags a node and its related dequant and quant nodes with a specified cluster name
@@ -248,6 +250,10 @@ class NeutronSupportedOperators(OperatorSupportBase):
         self.parameters_mapping = parameters_mapping
         self.custom_delegation_options = custom_delegation_options
 
+        # The support of a compute node by its `NodeConverter` doesn't change during the partitioning, but it is
+        #  queried for the compute node and for every other node in its QDQ cluster, in every partitioning iteration.
+        self._converter_support: dict[torch.fx.Node, bool] = {}
+
     def _is_node_quantized(self, node: torch.fx.node.Node):
         return "cluster" in node.meta
 
@@ -278,17 +284,20 @@ class NeutronSupportedOperators(OperatorSupportBase):
             # There is no `NodeConverter` for this `node`.
             return False
 
-        # noinspection PyUnresolvedReferences
-        return (
-            self._is_node_call_function(node)
-            and self._is_node_quantized(node)
-            and node_converter.is_supported(
+        if not (self._is_node_call_function(node) and self._is_node_quantized(node)):
+            return False
+
+        if (is_supported := self._converter_support.get(node, None)) is None:
+            # noinspection PyUnresolvedReferences
+            is_supported = node_converter.is_supported(
                 node,
                 self.neutron_target_spec,
                 self.parameters_mapping,
                 self.custom_delegation_options,
             )
-        )
+            self._converter_support[node] = is_supported
+
+        return is_supported
 
     def _is_node_supported_non_compute(self, node: torch.fx.node.Node) -> bool:
         """
@@ -8,9 +8,16 @@
 # backends.
 #
 
+import contextlib
+import contextvars
 import logging
+import multiprocessing
+import os
 import struct
-from typing import final, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from typing import Dict, final, Iterator, List, Optional
 
 import numpy as np
 import torch
@@ -21,6 +28,7 @@ from executorch.backends.nxp.backend.edge_program_converter import (
 )
 from executorch.backends.nxp.backend.ir.conversion_config import ConversionConfig
 from executorch.backends.nxp.backend.neutron_converter_manager import (
+    NEUTRON_SDK_CONVERTER,
     NeutronConverterManager,
 )
 from executorch.backends.nxp.backend.neutron_target_spec import NeutronTargetSpec
@@ -156,90 +164,234 @@ def generate_neutron_compile_spec(
     )
 
 
-@final
-class NeutronBackend(BackendDetails):
+@dataclass(frozen=True)
+class _NeutronLoweringOptions:
+    num_compile_workers: int = 1
+    compile_cache_dir: Optional[str] = None
+    neutron_converter: str = NEUTRON_SDK_CONVERTER
 
-    @staticmethod
-    def preprocess(  # noqa C901
-        edge_program: ExportedProgram,
-        compile_spec: List[CompileSpec],
-    ) -> PreprocessResult:
-        logging.info("NeutronBackend::preprocess")
 
-        logging.debug(f"NeutronBackend preprocessing graph:\n{edge_program.graph}")
+# The compile spec is serialized into the program, so options which don't describe the program itself (like a
+#  machine-local cache directory) are passed to the NeutronBackend in a context variable instead.
+_lowering_options: contextvars.ContextVar[_NeutronLoweringOptions] = (
+    contextvars.ContextVar(
+        "neutron_lowering_options", default=_NeutronLoweringOptions()
+    )
+)
 
-        output_format = ""
-        compile_flags = []
-        binary = bytes()
-        target = ""
-        use_neutron_for_format_conversion = None
-        fetch_constants_to_sram = False
-        dump_kernel_selection_code = None
+
+@contextlib.contextmanager
+def neutron_lowering_options(
+    num_compile_workers: int = 1,
+    compile_cache_dir: Optional[str] = None,
+    neutron_converter: str = NEUTRON_SDK_CONVERTER,
+) -> Iterator[None]:
+    """
+    Set how the partitions delegated to Neutron are converted by the lowerings run in this context. Unlike the
+    compile spec, these options are not stored in the program.
+
+    Args:
+        num_compile_workers: Number of partitions converted by the Neutron Converter in parallel, each in its own
+                             process.
+        compile_cache_dir: Directory where the Neutron Converter outputs are cached, keyed by the hash of the
+                           converted partition and the compile spec. Repeated exports of the same model are then
+                           much faster.
+        neutron_converter: Name of the module the partitions are converted with. Defaults to the Neutron
+                           Converter of the eIQ Neutron SDK, other modules must implement its interface.
+    """
+    token = _lowering_options.set(
+        _NeutronLoweringOptions(
+            num_compile_workers, compile_cache_dir, neutron_converter
+        )
+    )
+    try:
+        yield
+    finally:
+        _lowering_options.reset(token)
+
+
+@dataclass
+class _NeutronPreprocessOptions:
+    output_format: str = ""
+    target: str = ""
+    use_neutron_for_format_conversion: Optional[bool] = None
+    fetch_constants_to_sram: bool = False
+    dump_kernel_selection_code: Optional[bool] = None
+
+    @staticmethod
+    def from_compile_spec(compile_spec: List[CompileSpec]):
+        options = _NeutronPreprocessOptions()
         for spec in compile_spec:
             if spec.key == "output_format":
-                output_format = spec.value.decode()
+                options.output_format = spec.value.decode()
             if spec.key == "target":
-                target = spec.value.decode()
-            if spec.key == "compile_flags":
-                compile_flags.append(spec.value.decode())
+                options.target = spec.value.decode()
             if spec.key == "use_neutron_for_format_conversion":
-                use_neutron_for_format_conversion = spec.value.decode() == "True"
+                options.use_neutron_for_format_conversion = (
+                    spec.value.decode() == "True"
+                )
             if spec.key == "fetch_constants_to_sram":
-                fetch_constants_to_sram = spec.value.decode() == "True"
+                options.fetch_constants_to_sram = spec.value.decode() == "True"
             if spec.key == "dump_kernel_selection_code":
-                dump_kernel_selection_code = spec.value.decode() == "True"
+                options.dump_kernel_selection_code = spec.value.decode() == "True"
 
         # Check that the output format is set in the compile spec
-        if not output_format:
+        if not options.output_format:
             raise RuntimeError("output format is required")
+        if options.output_format != "tflite":
+            raise RuntimeError(f"Unknown format {options.output_format}")
+        return options
+
 
+@dataclass
+class _ConvertedPartition:
+    delegation_tag: str
+    options: _NeutronPreprocessOptions
+    tflite_model: bytes
+    io_formats: dict
+
+
+@final
+class NeutronBackend(BackendDetails):
+
+    @staticmethod
+    def _convert_to_tflite(
+        edge_program: ExportedProgram, options: _NeutronPreprocessOptions
+    ) -> _ConvertedPartition:
+        logging.debug(f"NeutronBackend preprocessing graph:\n{edge_program.graph}")
         for node in edge_program.graph.nodes:
             if node.op == "call_function":
                 logging.debug(f"Operator to be processed: {node.target}")
 
-        # Serialize and return the program.
-        if output_format == "tflite":
-            # Some of the nodes do not have delegation_tag, find any node with delegation tag.
-            delegation_tag = None
-            for n in edge_program.graph.nodes:
-                if "delegation_tag" in n.meta.keys():
-                    delegation_tag = n.meta["delegation_tag"]
-                    break
-            assert delegation_tag is not None
-
-            # Convert the edge program to TFLite.
-            conversion_config = ConversionConfig(
-                {"use_neutron_for_format_conversion": use_neutron_for_format_conversion}
-                if use_neutron_for_format_conversion is not None
-                else {}
-            )
-            tflite_model, io_formats = EdgeProgramToIRConverter().convert_program(
-                edge_program,
-                neutron_target_spec=NeutronTargetSpec(target),
-                conversion_config=conversion_config,
-            )
+        # Some of the nodes do not have delegation_tag, find any node with delegation tag.
+        delegation_tag = None
+        for n in edge_program.graph.nodes:
+            if "delegation_tag" in n.meta.keys():
+                delegation_tag = n.meta["delegation_tag"]
+                break
+        assert delegation_tag is not None
+
+        # Convert the edge program to TFLite.
+        conversion_config = ConversionConfig(
+            {
+                "use_neutron_for_format_conversion": options.use_neutron_for_format_conversion
+            }
+            if options.use_neutron_for_format_conversion is not None
+            else {}
+        )
+        tflite_model, io_formats = EdgeProgramToIRConverter().convert_program(
+            edge_program,
+            neutron_target_spec=NeutronTargetSpec(options.target),
+            conversion_config=conversion_config,
+        )
+        return _ConvertedPartition(delegation_tag, options, tflite_model, io_formats)
 
-            neutron_model = NeutronConverterManager(dump_kernel_selection_code).convert(
-                tflite_model, target, delegation_tag, fetch_constants_to_sram
+    @staticmethod
+    def _convert_to_neutron(
+        partition: _ConvertedPartition,
+        lowering_options: _NeutronLoweringOptions,
+        mp_context: Optional[str] = None,
+    ) -> PreprocessResult:
+        options = partition.options
+        neutron_model = NeutronConverterManager(
+            options.dump_kernel_selection_code,
+            lowering_options.compile_cache_dir,
+            lowering_options.neutron_converter,
+            mp_context,
+        ).convert(
+            partition.tflite_model,
+            options.target,
+            partition.delegation_tag,
+            options.fetch_constants_to_sram,
+        )
+
+        # Dump the tflite file if logging level is enabled
+        if logging.root.isEnabledFor(logging.DEBUG):
+            logging.debug(
+                f"Serializing converted graph with tag {partition.delegation_tag} to {os.getcwd()}"
             )
+            with open(f"{partition.delegation_tag}_pure.et.tflite", "wb") as f:
+                f.write(bytes(partition.tflite_model))
+            with open(f"{partition.delegation_tag}_neutron.et.tflite", "wb") as f:
+                f.write(bytes(neutron_model))
 
-            # Dump the tflite file if logging level is enabled
-            if logging.root.isEnabledFor(logging.DEBUG):
-                import os
+        binary = PayloadComposer().get_binary_payload(
+            partition.io_formats, neutron_model
+        )
+        return PreprocessResult(processed_bytes=binary)
 
-                logging.debug(
-                    f"Serializing converted graph with tag {delegation_tag} to {os.getcwd()}"
-                )
-                with open(f"{delegation_tag}_pure.et.tflite", "wb") as f:
-                    f.write(bytes(tflite_model))
-                with open(f"{delegation_tag}_neutron.et.tflite", "wb") as f:
-                    f.write(bytes(neutron_model))
+    @staticmethod
+    def preprocess(
+        edge_program: ExportedProgram,
+        compile_spec: List[CompileSpec],
+    ) -> PreprocessResult:
+        logging.info("NeutronBackend::preprocess")
+
+        options = _NeutronPreprocessOptions.from_compile_spec(compile_spec)
+        return NeutronBackend._convert_to_neutron(
+            NeutronBackend._convert_to_tflite(edge_program, options),
+            _lowering_options.get(),
+        )
 
-            binary = PayloadComposer().get_binary_payload(io_formats, neutron_model)
+    @classmethod
+    def preprocess_multimethod(
+        cls,
+        edge_programs: Dict[str, List[ExportedProgram]],
+        compile_specs: Dict[str, List[List[CompileSpec]]],
+    ) -> Dict[str, List[PreprocessResult]]:
+        """
+        Convert all partitions to TFLite one after the other, then run the Neutron Converter on them in parallel
+        with the `num_compile_workers` of `neutron_lowering_options`. The partitions are independent and every conversion runs in its own
+        process, so they scale with the number of cores. The processes are not forked from the worker threads, as
+        forking a multithreaded process is unsafe.
+        """
+        logging.info("NeutronBackend::preprocess_multimethod")
+
+        partitions = []
+        for method_name, programs in edge_programs.items():
+            assert (
+                method_name in compile_specs
+            ), f"Error: missing compile specs for {method_name}"
+            for program, compile_spec in zip(
+                programs, compile_specs[method_name], strict=True
+            ):
+                options = _NeutronPreprocessOptions.from_compile_spec(compile_spec)
+                partitions.append(cls._convert_to_tflite(program, options))
+
+        # The worker threads don't inherit the context, so the lowering options are read here.
+        lowering_options = _lowering_options.get()
+        num_workers = lowering_options.num_compile_workers
+        # The kernel selection code is dumped to the same file by every conversion, before being renamed.
+        if num_workers <= 1 or any(
+            partition.options.dump_kernel_selection_code for partition in partitions
+        ):
+            results = [
+                cls._convert_to_neutron(partition, lowering_options)
+                for partition in partitions
+            ]
         else:
-            raise RuntimeError(f"Unknown format {output_format}")
+            mp_context = (
+                "forkserver"
+                if "forkserver" in multiprocessing.get_all_start_methods()
+                else "spawn"
+            )
+            with ThreadPoolExecutor(num_workers) as executor:
+                results = list(
+                    executor.map(
+                        partial(
+                            cls._convert_to_neutron,
+                            lowering_options=lowering_options,
+                            mp_context=mp_context,
+                        ),
+                        partitions,
+                    )
+                )
 
-        return PreprocessResult(processed_bytes=binary)
+        preprocess_results = {}
+        for method_name, programs in edge_programs.items():
+            preprocess_results[method_name] = results[: len(programs)]
+            results = results[len(programs) :]
+        return preprocess_results
 
 
 class PayloadComposer:
@@ -0,0 +1,123 @@
+# Copyright 2026 NXP
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+"""
+Measure how the time to build, finalize and serialize a TFLite model with the
+`ModelBuilder` scales with the number of operators, on synthetic chains of
+quantized `Add` operators with a static operand. The time per operator should
+stay roughly constant as the graph grows.
+
+Usage:
+    python -m executorch.backends.nxp.tests.benchmark_model_builder \
+        --num_ops 1000 2500 5000 10000
+"""
+
+import argparse
+import time
+
+import flatbuffers
+import numpy as np
+from executorch.backends.nxp.backend.ir.conversion_config import ConversionConfig
+from executorch.backends.nxp.backend.ir.converter.builder.model_builder import (
+    ModelBuilder,
+)
+from executorch.backends.nxp.backend.ir.lib.tflite.BuiltinOperator import (
+    BuiltinOperator,
+)
+from executorch.backends.nxp.backend.ir.lib.tflite.TensorType import TensorType
+from executorch.backends.nxp.backend.ir.tflite_generator import tflite_model
+from executorch.backends.nxp.backend.ir.tflite_generator.builtin_options import (
+    add_options,
+)
+from executorch.backends.nxp.backend.neutron_target_spec import NeutronTargetSpec
+
+
+def build_model(
+    num_ops: int,
+    num_distinct_constants: int,
+    neutron_target_spec: NeutronTargetSpec,
+    conversion_config: ConversionConfig,
+) -> ModelBuilder:
+    """Create a chain of `num_ops` `Add` operators, each adding one of `num_distinct_constants` static tensors."""
+    builder = ModelBuilder(
+        3, "Synthetic model", neutron_target_spec, {}, conversion_config
+    )
+    builder.build_empty_buffer()  # Sentinel buffer.
+
+    shape = [1, 16]
+
+    def _quantization() -> tflite_model.Quantization:
+        return tflite_model.Quantization(
+            scale=tflite_model.Scale([0.1]), zero_point=tflite_model.ZeroPoint([0])
+        )
+
+    x = builder.create_empty_tensor("x", TensorType.INT8, shape)
+    x.quantization = _quantization()
+    builder.get_sub_graph().inputs = tflite_model.SubGraphInputs()
+    builder.get_sub_graph().inputs.tmp_inputs.append(x)
+
+    for i in range(num_ops):
+        constant = np.full(shape, i % num_distinct_constants, np.int8)
+        # All tensors use the same names, so they get uniquified by the builder.
+        static = builder.create_tensor_for_data(constant, "constant")
+        static.quantization = _quantization()
+        y = builder.create_empty_tensor("x", TensorType.INT8, shape)
+        y.quantization = _quantization()
+
+        add = tflite_model.Operator(
+            builtin_options=add_options.Add(),
+            opcode_index=builder.op_code_index_for_op_type(BuiltinOperator.ADD),
+        )
+        add.tmp_inputs = [x, static]
+        add.tmp_outputs = [y]
+        builder.check_and_append_operator(add)
+        x = y
+
+    builder.get_sub_graph().outputs = tflite_model.SubGraphOutputs()
+    builder.get_sub_graph().outputs.tmp_outputs.append(x)
+
+    return builder
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--num_ops", type=int, nargs="+", default=[1000, 2500, 5000, 10000]
+    )
+    parser.add_argument("--num_distinct_constants", type=int, default=16)
+    parser.add_argument("--target", default="imxrt700")
+    args = parser.parse_args()
+
+    neutron_target_spec = NeutronTargetSpec(args.target)
+    conversion_config = ConversionConfig()
+
+    for num_ops in args.num_ops:
+        start = time.perf_counter()
+        builder = build_model(
+            num_ops, args.num_distinct_constants, neutron_target_spec, conversion_config
+        )
+        build_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        model = builder.finish()
+        finish_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        flatbuffers_builder = flatbuffers.Builder()
+        model.gen_tflite(flatbuffers_builder)
+        model_size = len(flatbuffers_builder.Output())
+        serialize_seconds = time.perf_counter() - start
+
+        total_seconds = build_seconds + finish_seconds + serialize_seconds
+        print(
+            f"{num_ops} ops: build {build_seconds:.3f} s, finish {finish_seconds:.3f} s, "
+            f"serialize {serialize_seconds:.3f} s, "
+            f"{total_seconds / num_ops * 1e6:.1f} us/op, "
+            f"{builder.buffers_size()} buffers, {model_size} bytes"
+        )
+
+
+if __name__ == "__main__":
+    main()
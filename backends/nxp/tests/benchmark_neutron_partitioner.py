@@ -0,0 +1,105 @@
+# Copyright 2026 NXP
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+"""
+Measure how the QDQ cluster recognition and the Neutron partitioning scale with
+the size of a quantized model, on chains of `Linear` + `ReLU` blocks. The time
+per node should stay roughly constant as the graph grows.
+
+Usage:
+    python -m executorch.backends.nxp.tests.benchmark_neutron_partitioner \
+        --num_blocks 100 200 400 800
+"""
+
+import argparse
+import time
+
+import torch
+from executorch import exir
+from executorch.backends.nxp.backend.neutron_target_spec import NeutronTargetSpec
+from executorch.backends.nxp.neutron_partitioner import (
+    NeutronPartitioner,
+    QDQClusterRecognizer,
+)
+from executorch.backends.nxp.nxp_backend import (
+    core_aten_ops_exception_list,
+    generate_neutron_compile_spec,
+)
+from executorch.backends.nxp.quantizer.neutron_quantizer import NeutronQuantizer
+from executorch.backends.nxp.quantizer.utils import calibrate_and_quantize
+from executorch.exir import EdgeCompileConfig
+from torch.export import ExportedProgram
+
+
+class LinearChain(torch.nn.Module):
+    def __init__(self, num_blocks: int, features: int = 32):
+        super().__init__()
+        self.linears = torch.nn.ModuleList(
+            torch.nn.Linear(features, features) for _ in range(num_blocks)
+        )
+
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        for linear in self.linears:
+            x = torch.relu(linear(x))
+        return x
+
+
+def quantized_edge_program(
+    num_blocks: int, neutron_target_spec: NeutronTargetSpec
+) -> ExportedProgram:
+    model = LinearChain(num_blocks).eval()
+    calibration_inputs = [(torch.randn(1, 32),) for _ in range(4)]
+    exported = torch.export.export(model, calibration_inputs[0], strict=True)
+    quantized = calibrate_and_quantize(
+        model=exported,
+        calibration_inputs=calibration_inputs,
+        quantizer=NeutronQuantizer(neutron_target_spec),
+    )
+    edge_program_manager = exir.to_edge(
+        torch.export.export(quantized, calibration_inputs[0], strict=True),
+        compile_config=EdgeCompileConfig(
+            _check_ir_validity=False,
+            _core_aten_ops_exception_list=core_aten_ops_exception_list,
+        ),
+    )
+    return edge_program_manager.exported_program()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--num_blocks", type=int, nargs="+", default=[100, 200, 400, 800]
+    )
+    parser.add_argument("--target", default="imxrt700")
+    args = parser.parse_args()
+
+    neutron_target_spec = NeutronTargetSpec(args.target)
+    compile_spec = generate_neutron_compile_spec(args.target)
+
+    for num_blocks in args.num_blocks:
+        exported_program = quantized_edge_program(num_blocks, neutron_target_spec)
+        num_nodes = len(exported_program.graph.nodes)
+
+        start = time.perf_counter()
+        QDQClusterRecognizer().tag_qdq_clusters(list(exported_program.graph.nodes))
+        clustering_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        result = NeutronPartitioner(compile_spec, neutron_target_spec).partition(
+            exported_program
+        )
+        partitioning_seconds = time.perf_counter() - start
+
+        print(
+            f"{num_blocks} blocks ({num_nodes} nodes): "
+            f"clustering {clustering_seconds:.3f} s, "
+            f"partitioning {partitioning_seconds:.3f} s, "
+            f"{partitioning_seconds / num_nodes * 1e6:.1f} us/node, "
+            f"{len(result.partition_tags)} partitions"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -17,6 +17,9 @@ from executorch import exir
 from executorch.backends.nxp.backend.custom_delegation_options import (
     CustomDelegationOptions,
 )
+from executorch.backends.nxp.backend.neutron_converter_manager import (
+    NEUTRON_SDK_CONVERTER,
+)
 from executorch.backends.nxp.backend.neutron_target_spec import NeutronTargetSpec
 from executorch.backends.nxp.edge_passes.neutron_edge_pass_manager import (
     NeutronEdgePassManager,
@@ -32,6 +35,7 @@ from executorch.backends.nxp.neutron_partitioner import NeutronPartitioner
 from executorch.backends.nxp.nxp_backend import (
     core_aten_ops_exception_list,
     generate_neutron_compile_spec,
+    neutron_lowering_options,
 )
 from executorch.backends.nxp.quantizer.neutron_quantizer import NeutronQuantizer
 from executorch.backends.nxp.quantizer.utils import calibrate_and_quantize
@@ -130,6 +134,9 @@ def to_quantized_edge_program(
     use_quant_state_dict: bool = True,
     fetch_constants_to_sram: bool = False,
     dump_kernel_selection_code: bool = False,
+    num_compile_workers: int = 1,
+    compile_cache_dir: str | None = None,
+    neutron_converter: str = NEUTRON_SDK_CONVERTER,
 ) -> EdgeProgramManager:
     _neutron_target_spec = NeutronTargetSpec(target)
     if get_quantizer_fn is None:
@@ -174,15 +181,18 @@ def to_quantized_edge_program(
         )
     ]
 
-    edge_program_manager = to_edge_transform_and_lower(
-        export(exir_program_aten__module_quant, example_input, strict=True),
-        transform_passes=NeutronEdgePassManager(),
-        partitioner=partitioners,
-        compile_config=EdgeCompileConfig(
-            _check_ir_validity=False,
-            _core_aten_ops_exception_list=core_aten_ops_exception_list,
-        ),
-    )
+    with neutron_lowering_options(
+        num_compile_workers, compile_cache_dir, neutron_converter
+    ):
+        edge_program_manager = to_edge_transform_and_lower(
+            export(exir_program_aten__module_quant, example_input, strict=True),
+            transform_passes=NeutronEdgePassManager(),
+            partitioner=partitioners,
+            compile_config=EdgeCompileConfig(
+                _check_ir_validity=False,
+                _core_aten_ops_exception_list=core_aten_ops_exception_list,
+            ),
+        )
 
     if remove_quant_io_ops:
         edge_program_manager = edge_program_manager.transform(
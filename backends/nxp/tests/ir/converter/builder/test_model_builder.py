@@ -0,0 +1,56 @@
+# Copyright 2026 NXP
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+import numpy as np
+import pytest
+
+from executorch.backends.nxp.backend.ir.conversion_config import ConversionConfig
+from executorch.backends.nxp.backend.ir.lib.tflite.TensorType import TensorType
+from executorch.backends.nxp.tests.benchmark_model_builder import build_model
+from executorch.backends.nxp.tests.executorch_pipeline import neutron_target_spec
+
+
+@pytest.mark.parametrize("deduplicate", [True, False])
+def test_model_builder__static_buffer_deduplication(deduplicate):
+    # The constants of the 5 `Add` operators alternate between 2 values.
+    builder = build_model(
+        5,
+        2,
+        neutron_target_spec,
+        ConversionConfig({"deduplicate_static_buffers": deduplicate}),
+    )
+    # The data of the first constant in another shape.
+    builder.create_tensor_for_data(np.zeros([4, 4], np.int8), "constant")
+    model = builder.finish()
+
+    tensors = model.sub_graphs.vector[0].tensors.vector
+    constant_buffers = [t.buffer for t in tensors if t.name.startswith("constant")]
+    if deduplicate:
+        # The sentinel empty buffer + 1 buffer for each distinct constant.
+        assert builder.buffers_size() == 3
+        assert constant_buffers == [1, 2, 1, 2, 1, 1]
+    else:
+        assert len(set(constant_buffers)) == len(constant_buffers) == 6
+
+    # The empty buffer stays first and is shared by all dynamic tensors.
+    assert builder.get_buffers().vector[0].data is None
+    assert all(t.buffer == 0 for t in tensors if t.name.startswith("x"))
+
+
+def test_model_builder__unique_tensor_names():
+    builder = build_model(3, 1, neutron_target_spec, ConversionConfig())
+
+    names = [t.name for t in builder.get_tensors().vector]
+    assert names == [
+        "x",
+        "constant",
+        "x0",
+        "constant0",
+        "x1",
+        "constant1",
+        "x2",
+    ]
+    assert builder.create_empty_tensor("x", TensorType.FLOAT32).name == "x3"
+    assert builder.create_empty_tensor("x3", TensorType.FLOAT32).name == "x30"
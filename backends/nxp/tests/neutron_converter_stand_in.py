@@ -0,0 +1,28 @@
+# Copyright 2026 NXP
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+"""
+Stand-in for `eiq_neutron_sdk.neutron_converter`, to test how conversions are run and cached without running the
+Neutron Converter. The "converted" model is the input model with a prefix. It is selected by passing the name of
+this module as the `neutron_converter` of the compile spec or of the `NeutronConverterManager`.
+"""
+
+from types import SimpleNamespace
+
+CONVERTED_MODEL_PREFIX = b"neutron:"
+
+
+class CompilationContext:
+    def __init__(self):
+        self.targetOpts = None
+        self.compilationOpts = SimpleNamespace()
+
+
+def getNeutronTarget(target: str):  # noqa N802
+    return target
+
+
+def convertModel(model: list[int], cctx: CompilationContext) -> list[int]:  # noqa N802
+    return list(CONVERTED_MODEL_PREFIX) + model
@@ -3,8 +3,18 @@
 # This source code is licensed under the BSD-style license found in the
 # LICENSE file in the root directory of this source tree.
 
+import os
+
+import torch
+from executorch.backends.nxp.backend.neutron_converter_manager import (
+    NeutronConverterManager,
+)
 from executorch.backends.nxp.tests.executorch_pipeline import to_quantized_edge_program
-from executorch.backends.nxp.tests.models import Conv2dModule, LinearSoftmaxModule
+from executorch.backends.nxp.tests.models import (
+    Conv2dModule,
+    Conv2dReLUMaxPoolModule,
+    LinearSoftmaxModule,
+)
 
 
 def test_neutron_backend__single_conv_model():
@@ -61,3 +71,56 @@ def test_neutron_backend__linear_softmax_model__payload_header_formatless():
     )  # Payload version is 0 or 1 depending on the Neutron Software
     assert all(byte == 0x0 for byte in payload[8:16])  # Aligned to 16 bytes
     assert payload[17] != 0x0  # Followed by non-zero content
+
+
+def test_neutron_backend__parallel_partition_conversion(mocker):
+    input_shape = (1, 3, 64, 64)
+    converter_spy = mocker.spy(NeutronConverterManager, "convert")
+
+    torch.manual_seed(0)
+    serial = to_quantized_edge_program(
+        Conv2dReLUMaxPoolModule(),
+        input_shape,
+        operators_not_to_delegate=["aten_relu_default"],
+    ).exported_program()
+    assert converter_spy.call_count == 2  # Two partitions.
+
+    torch.manual_seed(0)
+    parallel = to_quantized_edge_program(
+        Conv2dReLUMaxPoolModule(),
+        input_shape,
+        operators_not_to_delegate=["aten_relu_default"],
+        num_compile_workers=2,
+    ).exported_program()
+    assert converter_spy.call_count == 4
+
+    for name in ["lowered_module_0", "lowered_module_1"]:
+        assert (
+            getattr(parallel.graph_module, name).processed_bytes
+            == getattr(serial.graph_module, name).processed_bytes
+        )
+
+
+def test_neutron_backend__compile_cache(mocker, tmp_path):
+    # The conversion itself runs in a subprocess, so count the converted models written to the cache instead.
+    write_cache_spy = mocker.spy(NeutronConverterManager, "_write_cache")
+
+    def lower():
+        # Identical weights and calibration, so that the partitions are identical.
+        torch.manual_seed(0)
+        return to_quantized_edge_program(
+            Conv2dModule(bias=False),
+            (1, 4, 32, 32),
+            compile_cache_dir=str(tmp_path),
+        ).exported_program()
+
+    lowered_module = lower().graph_module.lowered_module_0
+    assert write_cache_spy.call_count == 1
+    assert len(os.listdir(tmp_path)) == 1
+    # The machine-local cache directory is not serialized into the program.
+    assert all(spec.key != "compile_cache_dir" for spec in lowered_module.compile_specs)
+
+    # The second export finds the converted partition in the cache.
+    cached_payload = lower().graph_module.lowered_module_0.processed_bytes
+    assert write_cache_spy.call_count == 1
+    assert cached_payload == lowered_module.processed_bytes
@@ -0,0 +1,70 @@
+# Copyright 2026 NXP
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+# Tests of how the Neutron conversions are run and cached, which don't need the eIQ Neutron SDK.
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from executorch.backends.nxp.backend.neutron_converter_manager import (
+    NeutronConverterManager,
+)
+from executorch.backends.nxp.tests import neutron_converter_stand_in
+
+STAND_IN = neutron_converter_stand_in.__name__
+
+
+def test_neutron_converter_manager__cache(tmp_path, monkeypatch):
+    tflite_model = bytes(range(64))
+
+    manager = NeutronConverterManager(cache_dir=str(tmp_path), converter=STAND_IN)
+    neutron_model = manager.convert(tflite_model, "imxrt700", "tag0")
+    assert neutron_model == neutron_converter_stand_in.CONVERTED_MODEL_PREFIX + bytes(
+        tflite_model
+    )
+    assert len(os.listdir(tmp_path)) == 1
+
+    # The same partition is read from the cache, also by another manager.
+    def convert_model(model, cctx):
+        raise AssertionError("The model should have been read from the cache.")
+
+    monkeypatch.setattr(neutron_converter_stand_in, "convertModel", convert_model)
+    cached_manager = NeutronConverterManager(
+        cache_dir=str(tmp_path), converter=STAND_IN
+    )
+    assert cached_manager.convert(tflite_model, "imxrt700", "tag1") == neutron_model
+
+    # Conversion options are a part of the key.
+    assert cached_manager.cache_key(
+        tflite_model, "imxrt700", True
+    ) != cached_manager.cache_key(tflite_model, "imxrt700", False)
+    # The failure is raised directly if the conversion could not run in a subprocess.
+    with pytest.raises((RuntimeError, AssertionError)):
+        cached_manager.convert(
+            tflite_model, "imxrt700", "tag2", fetch_constants_to_sram=True
+        )
+
+
+@pytest.mark.parametrize("mp_context", ["spawn", "forkserver"])
+def test_neutron_converter_manager__parallel_conversion(tmp_path, mp_context):
+    tflite_models = [bytes([i]) * 32 for i in range(8)]
+
+    def convert(i):
+        manager = NeutronConverterManager(
+            cache_dir=str(tmp_path), converter=STAND_IN, mp_context=mp_context
+        )
+        return manager.convert(tflite_models[i % 4], "imxrt700", f"tag{i}")
+
+    with ThreadPoolExecutor(4) as executor:
+        neutron_models = list(executor.map(convert, range(8)))
+
+    assert neutron_models == [
+        neutron_converter_stand_in.CONVERTED_MODEL_PREFIX + tflite_models[i % 4]
+        for i in range(8)
+    ]
+    # Every distinct partition is cached once.
+    assert len(os.listdir(tmp_path)) == 4
@@ -1,10 +1,17 @@
-# Copyright 2024 NXP
+# Copyright 2024-2026 NXP
 #
 # This source code is licensed under the BSD-style license found in the
 # LICENSE file in the root directory of this source tree.
 
+import torch
+
+from executorch.backends.nxp.neutron_partitioner import QDQClusterRecognizer
 from executorch.backends.nxp.tests.executorch_pipeline import to_quantized_edge_program
 from executorch.backends.nxp.tests.models import Conv2dModule
+from executorch.exir.dialects._ops import ops as exir_ops
+
+_quantize = exir_ops.edge.quantized_decomposed.quantize_per_tensor.default
+_dequantize = exir_ops.edge.quantized_decomposed.dequantize_per_tensor.default
 
 
 def test_conv2d_partitioner():
@@ -31,3 +38,40 @@ def test_conv2d_partitioner():
     assert dq_bias_node.meta["cluster"] == "aten_convolution_default_cluster"
     assert conv_node.meta["cluster"] == "aten_convolution_default_cluster"
     assert q_y_node.meta["cluster"] == "aten_convolution_default_cluster"
+
+
+def _q_dq_add_chain(num_blocks: int) -> torch.fx.Graph:
+    """Create a graph of `num_blocks` quantized additions `y = x + x`, where `x` is also used by a `view_copy`."""
+    graph = torch.fx.Graph()
+    x = graph.placeholder("x")
+    q_params = (0.1, 0, -128, 127, torch.int8)
+    x = graph.call_function(_quantize, (x, *q_params))
+    for _ in range(num_blocks):
+        dq = graph.call_function(_dequantize, (x, *q_params))
+        add = graph.call_function(exir_ops.edge.aten.add.Tensor, (dq, dq))
+        view = graph.call_function(exir_ops.edge.aten.view_copy.default, (add, [-1]))
+        graph.call_function(_quantize, (view, *q_params))
+        x = graph.call_function(_quantize, (add, *q_params))
+    graph.output(x)
+
+    return graph
+
+
+def test_qdq_clusters_of_shared_tensors():
+    graph = _q_dq_add_chain(3)
+    recognizer = QDQClusterRecognizer()
+    recognizer.tag_qdq_clusters(list(graph.nodes))
+
+    adds = [n for n in graph.nodes if n.target == exir_ops.edge.aten.add.Tensor]
+    assert len(recognizer.cluster_map) == len(adds)
+    for add in adds:
+        cluster = recognizer.cluster_map[f"{add.name}_cluster"]
+        assert cluster.compute_node == add
+
+        # The cluster consists of the `add`, its input `dequantize`, and all nodes up to the `quantize` nodes.
+        dq = add.args[0]
+        view = next(n for n in add.users if n.target != _quantize)
+        expected = [add, dq, *add.users, *view.users]
+        assert cluster.ops == list(dict.fromkeys(cluster.ops))
+        assert set(cluster.ops) == set(expected)
+        assert all(n.meta["cluster"] == f"{add.name}_cluster" for n in expected)
@@ -4,6 +4,7 @@
 # This source code is licensed under the BSD-style license found in the
 # LICENSE file in the root directory of this source tree.
 import types
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 
 import torch
@@ -15,6 +16,11 @@ from executorch.exir.pass_base import ExportPass, PassResult
 from torchao.quantization.pt2e import PerChannelMinMaxObserver
 
 
+# Upper bound on the elements of the fake-quantized weights and outputs of the
+# candidates evaluated at once, which keeps LLM-sized layers within memory.
+_MAX_BATCH_NUMEL = 1 << 22
+
+
 class SeqMseModule(torch.nn.Module):
     """
     Args:
@@ -28,6 +34,10 @@ class SeqMseModule(torch.nn.Module):
             parameter observer (specific for weight)
         num_candidates: int
             grids to search minimal mse loss
+        executor: Executor
+            runs the search in the background when given, so that the
+            searches of independent operators overlap with each other and
+            with the rest of the calibration
     """
 
     def __init__(
@@ -37,94 +47,155 @@ class SeqMseModule(torch.nn.Module):
         operator,
         observer,
         num_candidates,
+        executor=None,
     ):
         super().__init__()
         self.nominal_weight = nominal_weight
         self.nominal_bias = nominal_bias
         self.observer = observer
-        self.steps = torch.linspace(
-            1 / num_candidates, 1, steps=num_candidates
-        ).tolist()
+        self.steps = torch.linspace(1 / num_candidates, 1, steps=num_candidates)
         self.operator = self._make_operator(operator)
-        self.best_candidate_step = 1.0
+        self.executor = executor
+        self._best_candidate_step = 1.0
+        self._pending_search = None
+
+    @property
+    def best_candidate_step(self):
+        if self._pending_search is not None:
+            self._best_candidate_step = self._pending_search.result()
+            self._pending_search = None
+        return self._best_candidate_step
 
     def _make_operator(self, aten_op):
+        """
+        Make a function computing the operator for a batch of candidate
+        weights of shape (num_steps, *nominal_weight.shape) in a single
+        call, returning outputs of shape (num_steps, *nominal_output.shape).
+        """
+        out_channels = self.nominal_weight.shape[0]
         if aten_op.target == torch.ops.aten.conv2d.default:
             stride = [1, 1] if len(aten_op.args) < 4 else aten_op.args[3]
             padding = [0, 0] if len(aten_op.args) < 5 else aten_op.args[4]
             dilation = [1, 1] if len(aten_op.args) < 6 else aten_op.args[5]
             groups = 1 if len(aten_op.args) < 7 else aten_op.args[6]
-            has_bias = self.nominal_bias is not None
-            module = torch.nn.Conv2d(
-                in_channels=self.nominal_weight.shape[1]
-                * groups,  # equivalent to input_tensor.shape[1]
-                out_channels=self.nominal_weight.shape[0],
-                kernel_size=self.nominal_weight.shape[-2:],
-                stride=stride,
-                padding=padding,
-                dilation=dilation,
-                groups=groups,
-                bias=has_bias,
-            )
-            module.weight.data = self.nominal_weight
-            if has_bias:
-                module.bias.data = self.nominal_bias
-            return module
+
+            def conv2d(nominal_input, weights):
+                num_steps = weights.shape[0]
+                # Lay the candidates out inside each group, so that a single
+                # conv computes the output channels of every candidate.
+                weights = (
+                    weights.unflatten(1, (groups, -1)).transpose(0, 1).flatten(0, 2)
+                )
+                bias = None
+                if self.nominal_bias is not None:
+                    bias = (
+                        self.nominal_bias.view(groups, 1, -1)
+                        .expand(-1, num_steps, -1)
+                        .flatten()
+                    )
+                output = torch.nn.functional.conv2d(
+                    nominal_input, weights, bias, stride, padding, dilation, groups
+                )
+                return (
+                    output.unflatten(1, (groups, num_steps, -1))
+                    .movedim(2, 0)
+                    .flatten(2, 3)
+                )
+
+            return conv2d
+        elif aten_op.target == torch.ops.aten.linear.default:
+
+            def linear(nominal_input, weights):
+                num_steps = weights.shape[0]
+                bias = None
+                if self.nominal_bias is not None:
+                    bias = self.nominal_bias.repeat(num_steps)
+                output = torch.nn.functional.linear(
+                    nominal_input, weights.flatten(0, 1), bias
+                )
+                return output.unflatten(-1, (num_steps, out_channels)).movedim(-2, 0)
+
+            return linear
         else:
             raise NotImplementedError(f"target of {aten_op.target} is not implemented")
 
-    def _per_block_qdq(self, scale, zero_point):
+    def _per_block_qdq(self, scales, zero_point):
+        num_steps = scales.shape[0]
         return torchao.quantization.quant_primitives._fake_quantize_affine(
-            input=self.nominal_weight,
-            block_size=self.observer.block_size,
-            scale=scale,
-            zero_point=zero_point,
+            input=self.nominal_weight.expand(num_steps, *self.nominal_weight.shape),
+            block_size=(1, *self.observer.block_size),
+            scale=scales,
+            zero_point=zero_point.expand(scales.shape),
             quant_dtype=self.observer.dtype,
             quant_min=self.observer.quant_min,
             quant_max=self.observer.quant_max,
         )
 
-    def _per_channel_qdq(self, scale, zero_point):
+    def _per_channel_qdq(self, scales, zero_point):
+        num_steps = scales.shape[0]
+        # Candidates of every channel along axis 0
         return torch.fake_quantize_per_channel_affine(
-            input=self.nominal_weight,
-            scale=scale,
-            zero_point=zero_point,
+            input=self.nominal_weight.expand(
+                num_steps, *self.nominal_weight.shape
+            ).flatten(0, 1),
+            scale=scales.flatten(),
+            zero_point=zero_point.repeat(num_steps),
             axis=0,
             quant_min=self.observer.quant_min,
             quant_max=self.observer.quant_max,
-        )
+        ).unflatten(0, (num_steps, -1))
 
-    def _fake_quant(self, scale, zero_point):
+    def _fake_quant(self, scales, zero_point):
         dispatcher = {
             PerChannelMinMaxObserver: self._per_channel_qdq,
             PerBlockParamObserver: self._per_block_qdq,
         }
-        return dispatcher[type(self.observer)](scale, zero_point)
+        return dispatcher[type(self.observer)](scales, zero_point)
+
+    def _losses(self, nominal_input, nominal_output, scale, zero_point, steps):
+        """mse loss of the candidate scale * step of each step."""
+        scales = scale * steps.view(-1, *[1] * scale.dim())
+        outputs = self.operator(nominal_input, self._fake_quant(scales, zero_point))
+        return (outputs - nominal_output).square().flatten(1).mean(1)
 
+    @torch.no_grad()
     def _find_best_candidate(self, nominal_input, nominal_output):
-        # calculate current baseline
         scale, zero_point = self.observer.calculate_qparams()
         zero_point = zero_point.to(torch.int32)
-        self.operator.weight.data = self._fake_quant(scale, zero_point)
-        candidate, current_loss = (
+        batch_size = max(
             1,
-            torch.nn.functional.mse_loss(
-                self.operator(nominal_input), nominal_output
-            ).item(),
+            _MAX_BATCH_NUMEL // (self.nominal_weight.numel() + nominal_output.numel()),
+        )
+        # calculate current baseline
+        current_loss = self._losses(
+            nominal_input, nominal_output, scale, zero_point, torch.ones(1)
+        ).item()
+        losses = torch.cat(
+            [
+                self._losses(nominal_input, nominal_output, scale, zero_point, steps)
+                for steps in self.steps.split(batch_size)
+            ]
         )
-        for step in self.steps:
-            self.operator.weight.data = self._fake_quant(scale * step, zero_point)
-            loss = torch.nn.functional.mse_loss(
-                self.operator(nominal_input), nominal_output
-            ).item()
-            if loss < current_loss:
-                candidate, current_loss = step, loss
-        return candidate
+        # the first of the candidates with the minimal loss
+        best = int(torch.argmin(losses))
+        if losses[best].item() < current_loss:
+            return self.steps[best].item()
+        return 1
 
     def forward(self, nominal_input, nominal_output):
-        self.best_candidate_step = self._find_best_candidate(
-            nominal_input=nominal_input, nominal_output=nominal_output
-        )
+        nominal_input, nominal_output = nominal_input.detach(), nominal_output.detach()
+        if self.executor is None:
+            self._best_candidate_step = self._find_best_candidate(
+                nominal_input=nominal_input, nominal_output=nominal_output
+            )
+        else:
+            # Like the synchronous search, the last batch decides, so drop the
+            # search of the previous batch. It can't be cancelled once running.
+            if self._pending_search is not None:
+                self._pending_search.cancel()
+            self._pending_search = self.executor.submit(
+                self._find_best_candidate, nominal_input, nominal_output
+            )
 
 
 class InsertSeqMse(ExportPass):
@@ -132,11 +203,41 @@ class InsertSeqMse(ExportPass):
     Insert Seq Mse Observer to find the best quant config for certain node's weight.
     """
 
-    seq_mse_ops = {torch.ops.aten.conv2d.default}
+    seq_mse_ops = {torch.ops.aten.conv2d.default, torch.ops.aten.linear.default}
+    # Observers whose qparams SeqMseModule can fake-quantize with
+    seq_mse_observers = (PerChannelMinMaxObserver, PerBlockParamObserver)
 
-    def __init__(self, num_candidates=1000):
+    def __init__(self, num_candidates=1000, executor=None):
         super(InsertSeqMse, self).__init__()
         self.num_candidates = num_candidates
+        self.executor = executor
+
+    @staticmethod
+    def _get_parameter(graph_module, node):
+        """The parameter node reads, possibly through an observer, else None."""
+        if not isinstance(node, torch.fx.Node):
+            return None
+        if node.op == "call_module" and node.args:
+            node = node.args[0]
+        if not isinstance(node, torch.fx.Node) or node.op != "get_attr":
+            return None
+        try:
+            return graph_module.get_parameter(node.target).detach()
+        except AttributeError:
+            return None
+
+    def _get_weight_observer(self, graph_module, node):
+        """The observer of the weight of node, if SeqMSE supports it, else None."""
+        weight_node_obs = node.args[1]
+        if (
+            not isinstance(weight_node_obs, torch.fx.Node)
+            or weight_node_obs.op != "call_module"
+        ):
+            return None
+        observer = getattr(graph_module, weight_node_obs.target)
+        if type(observer) not in self.seq_mse_observers:
+            return None
+        return observer
 
     def _insert_seq_mse(
         self, graph_module: torch.fx.GraphModule
@@ -144,17 +245,19 @@ class InsertSeqMse(ExportPass):
         count = 0
         for node in graph_module.graph.nodes:
             if node.target in self.seq_mse_ops:
-                # extract observer
-                weight_node_obs = node.args[1]
-                observer = getattr(graph_module, weight_node_obs.name)
+                # extract observer, e.g. per-tensor weights are left as they are
+                observer = self._get_weight_observer(graph_module, node)
+                if observer is None:
+                    continue
                 # extract parameters
-                weight_node = weight_node_obs.args[0]
-                weight_tensor = graph_module.get_parameter(weight_node.target).detach()
+                weight_tensor = self._get_parameter(graph_module, node.args[1])
+                if weight_tensor is None:
+                    continue
                 bias_tensor = None
                 if len(node.args) > 2 and node.args[2] is not None:
-                    bias_tensor = graph_module.get_parameter(
-                        node.args[2].args[0].target
-                    ).detach()
+                    bias_tensor = self._get_parameter(graph_module, node.args[2])
+                    if bias_tensor is None:
+                        continue
 
                 with graph_module.graph.inserting_after(node):
                     seq_mse_mod = SeqMseModule(
@@ -163,6 +266,7 @@ class InsertSeqMse(ExportPass):
                         operator=node,
                         observer=observer,
                         num_candidates=self.num_candidates,
+                        executor=self.executor,
                     )
                     module_name = f"seq_mse_{count}"
                     count += 1
@@ -216,9 +320,17 @@ class RemoveSeqMse(ExportPass):
 
 
 @contextmanager
-def SeqMSE(prepared_gm, num_candidates):
-    prepared_gm = InsertSeqMse(num_candidates)(prepared_gm).graph_module
+def SeqMSE(prepared_gm, num_candidates, num_workers=0):
+    """
+    Search the weight ranges of the supported operators of prepared_gm while
+    calibrating within the context. With num_workers, the searches of
+    independent operators run on a thread pool of that size.
+    """
+    executor = ThreadPoolExecutor(num_workers) if num_workers > 0 else None
+    prepared_gm = InsertSeqMse(num_candidates, executor)(prepared_gm).graph_module
     try:
         yield
     finally:
         prepared_gm = RemoveSeqMse()(prepared_gm).graph_module
+        if executor is not None:
+            executor.shutdown()
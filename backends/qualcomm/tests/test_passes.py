@@ -1,4 +1,5 @@
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 
 import torch
 from executorch.backends.qualcomm._passes import (
@@ -7,9 +8,13 @@ from executorch.backends.qualcomm._passes import (
     InsertReshapeForReduceOps,
     RemoveRedundancy,
 )
+from executorch.backends.qualcomm._passes.seq_mse import SeqMSE, SeqMseModule
+from executorch.backends.qualcomm.quantizer.quantizer import QnnQuantizer, QuantDtype
 
 from executorch.exir import to_edge
 from executorch.exir.dialects._ops import ops as exir_ops
+from torchao.quantization.pt2e import PerChannelMinMaxObserver
+from torchao.quantization.pt2e.quantize_pt2e import convert_pt2e, prepare_pt2e
 
 
 class TestPasses(unittest.TestCase):
@@ -150,6 +155,113 @@ class TestPasses(unittest.TestCase):
                 f"Output {i} mismatch: got {out}, expected {ref}",
             )
 
+    def test_seq_mse_batched_search(self):
+        class Operator:
+            def __init__(self, target, args):
+                self.target, self.args = target, args
+
+        def per_candidate_search(module, operator, nominal_input, nominal_output):
+            # Evaluate the candidates one by one
+            scale, zero_point = module.observer.calculate_qparams()
+            zero_point = zero_point.to(torch.int32)
+
+            def loss(scale):
+                weight = module._fake_quant(scale.unsqueeze(0), zero_point)[0]
+                return torch.nn.functional.mse_loss(
+                    operator(nominal_input, weight), nominal_output
+                ).item()
+
+            candidate, current_loss = 1, loss(scale)
+            for step in module.steps.tolist():
+                step_loss = loss(scale * step)
+                if step_loss < current_loss:
+                    candidate, current_loss = step, step_loss
+            return candidate
+
+        torch.manual_seed(0)
+        conv_input = torch.randn(2, 8, 6, 6)
+        linear_input = torch.randn(3, 5, 32)
+        cases = [
+            (
+                torch.ops.aten.conv2d.default,
+                (None, None, None, [1, 1], [1, 1], [1, 1], 2),
+                torch.randn(6, 4, 3, 3),
+                conv_input,
+                lambda x, w: torch.nn.functional.conv2d(x, w, bias, 1, 1, 1, 2),
+            ),
+            (
+                torch.ops.aten.linear.default,
+                (None, None, None),
+                torch.randn(16, 32),
+                linear_input,
+                lambda x, w: torch.nn.functional.linear(x, w, bias),
+            ),
+        ]
+        for target, args, weight, nominal_input, operator in cases:
+            with self.subTest(target=target):
+                bias = torch.randn(weight.shape[0])
+                observer = PerChannelMinMaxObserver(
+                    ch_axis=0,
+                    dtype=torch.int8,
+                    quant_min=-7,
+                    quant_max=7,
+                    qscheme=torch.per_channel_symmetric,
+                )
+                observer(weight)
+                nominal_output = operator(nominal_input, weight)
+                module = SeqMseModule(
+                    weight, bias, Operator(target, args), observer, 50
+                )
+                module(nominal_input, nominal_output)
+                expected = per_candidate_search(
+                    module, operator, nominal_input, nominal_output
+                )
+                self.assertEqual(module.best_candidate_step, expected)
+
+                # Searching in the background finds the same candidate
+                with ThreadPoolExecutor(2) as executor:
+                    module = SeqMseModule(
+                        weight, bias, Operator(target, args), observer, 50, executor
+                    )
+                    module(nominal_input, nominal_output)
+                    self.assertEqual(module.best_candidate_step, expected)
+
+    def test_seq_mse_quantized_linear(self):
+        module = torch.nn.Sequential(
+            torch.nn.Linear(16, 8), torch.nn.ReLU(), torch.nn.Linear(8, 4)
+        ).eval()
+        sample_input = (torch.randn(2, 16),)
+
+        # Per-tensor weights by default, which SeqMSE leaves as they are
+        per_channel_quantizer = QnnQuantizer()
+        per_channel_quantizer.set_default_quant_config(
+            QuantDtype.use_8a8w, is_linear_per_channel=True
+        )
+        cases = [(QnnQuantizer(), 0), (per_channel_quantizer, 2)]
+        for quantizer, num_searches in cases:
+            for num_workers in [0, 2]:
+                with self.subTest(num_searches=num_searches, num_workers=num_workers):
+                    prepared = prepare_pt2e(
+                        torch.export.export(module, sample_input).module(), quantizer
+                    )
+                    with SeqMSE(prepared, 10, num_workers=num_workers):
+                        seq_mse_modules = [
+                            m for m in prepared.modules() if isinstance(m, SeqMseModule)
+                        ]
+                        self.assertEqual(len(seq_mse_modules), num_searches)
+                        for _ in range(3):
+                            prepared(torch.randn(2, 16))
+                    # The searches are removed from the graph again
+                    self.assertFalse(
+                        any(
+                            n.op == "call_module"
+                            and isinstance(getattr(prepared, n.target), SeqMseModule)
+                            for n in prepared.graph.nodes
+                        )
+                    )
+                    converted = convert_pt2e(prepared)
+                    self.assertEqual(converted(*sample_input).shape, (2, 4))
+
 
 if __name__ == "__main__":
     unittest.main()
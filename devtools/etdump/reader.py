@@ -0,0 +1,488 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# All rights reserved.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+# pyre-strict
+
+"""
+Direct reader for ETDump flatbuffers.
+
+Decodes the binary flatbuffer described by etdump_schema_flatcc.fbs straight
+into the dataclasses in schema_flatcc.py, without going through `flatc` and an
+intermediate JSON document. RunData blocks are decoded on demand, so callers
+that only need a subset of the runs (or want to process them one at a time)
+never materialize the whole ETDump in Python objects. Any changes made to the
+flatbuffer schema should accordingly be reflected here also.
+"""
+
+import mmap
+import struct
+from types import TracebackType
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Type, Union
+
+from executorch.devtools.etdump.schema_flatcc import (
+    AllocationEvent,
+    Allocator,
+    Bool,
+    DebugEvent,
+    Double,
+    ETDumpFlatCC,
+    Event,
+    Float,
+    Int,
+    ProfileEvent,
+    RunData,
+    ScalarType,
+    Tensor,
+    TensorList,
+    Value,
+    ValueType,
+)
+
+Buffer = Union[bytes, bytearray, memoryview, mmap.mmap]
+
+_U8 = struct.Struct("<B")
+_I8 = struct.Struct("<b")
+_U16 = struct.Struct("<H")
+_I32 = struct.Struct("<i")
+_U32 = struct.Struct("<I")
+_I64 = struct.Struct("<q")
+_U64 = struct.Struct("<Q")
+_F32 = struct.Struct("<f")
+_F64 = struct.Struct("<d")
+
+# Names of the ValueType enum entries, indexed by their value in the schema.
+_VALUE_TYPE_NAMES: Tuple[str, ...] = tuple(v.value for v in ValueType)
+
+# Field slots of each table, in declaration order of etdump_schema_flatcc.fbs.
+_TENSOR_SCALAR_TYPE, _TENSOR_SIZES, _TENSOR_STRIDES, _TENSOR_OFFSET = range(4)
+(
+    _VALUE_VAL,
+    _VALUE_TENSOR,
+    _VALUE_TENSOR_LIST,
+    _VALUE_INT,
+    _VALUE_FLOAT,
+    _VALUE_DOUBLE,
+    _VALUE_BOOL,
+    _VALUE_OUTPUT,
+) = range(8)
+(
+    _DEBUG_CHAIN_INDEX,
+    _DEBUG_INSTRUCTION_ID,
+    _DEBUG_ENTRY,
+    _DEBUG_DELEGATE_ID_INT,
+    _DEBUG_DELEGATE_ID_STR,
+    _DEBUG_NAME,
+) = range(6)
+_ALLOCATION_ALLOCATOR_ID, _ALLOCATION_SIZE = range(2)
+(
+    _PROFILE_NAME,
+    _PROFILE_CHAIN_INDEX,
+    _PROFILE_INSTRUCTION_ID,
+    _PROFILE_DELEGATE_ID_INT,
+    _PROFILE_DELEGATE_ID_STR,
+    _PROFILE_DELEGATE_METADATA,
+    _PROFILE_START_TIME,
+    _PROFILE_END_TIME,
+) = range(8)
+_EVENT_PROFILE, _EVENT_ALLOCATION, _EVENT_DEBUG = range(3)
+(
+    _RUN_DATA_NAME,
+    _RUN_DATA_BUNDLED_INPUT_INDEX,
+    _RUN_DATA_ALLOCATORS,
+    _RUN_DATA_EVENTS,
+) = range(4)
+_ETDUMP_VERSION, _ETDUMP_RUN_DATA = range(2)
+
+# Largest number of fields in any table of the schema. Decoded vtables are padded
+# to this length so that field lookups don't need bounds checks.
+_MAX_FIELDS = 8
+
+
+def _float32_to_py(value: float) -> float:
+    """
+    Returns the shortest decimal representation of a float32 value, matching the
+    value `flatc` prints when it converts the flatbuffer to JSON.
+    """
+    for precision in range(1, 10):
+        candidate = float(f"{value:.{precision}g}")
+        if _F32.unpack(_F32.pack(candidate))[0] == value:
+            return candidate
+    return value
+
+
+class _FlatbufferDecoder:
+    """
+    Minimal flatbuffer table accessor. Offsets in a flatbuffer are relative to
+    the position they are stored at, so the decoder only needs the underlying
+    buffer; the root offset is resolved by the caller.
+    """
+
+    def __init__(self, buf: Buffer) -> None:
+        self.buf = buf
+        # flatcc deduplicates vtables, so the millions of events in a large
+        # ETDump share a handful of them. Cache the decoded field offsets.
+        self._vtables: Dict[int, Tuple[int, ...]] = {}
+
+    def fields(self, table: int) -> Tuple[int, ...]:
+        vtable = table - _I32.unpack_from(self.buf, table)[0]
+        offsets = self._vtables.get(vtable)
+        if offsets is None:
+            vtable_size = _U16.unpack_from(self.buf, vtable)[0]
+            num_fields = (vtable_size - 4) // 2
+            offsets = struct.unpack_from(f"<{num_fields}H", self.buf, vtable + 4)
+            if num_fields < _MAX_FIELDS:
+                offsets += (0,) * (_MAX_FIELDS - num_fields)
+            self._vtables[vtable] = offsets
+        return offsets
+
+    def scalar(
+        self,
+        fmt: struct.Struct,
+        table: int,
+        fields: Tuple[int, ...],
+        slot: int,
+        default: Union[int, float],
+    ) -> Union[int, float]:
+        offset = fields[slot]
+        if offset == 0:
+            return default
+        return fmt.unpack_from(self.buf, table + offset)[0]
+
+    def indirect(self, table: int, fields: Tuple[int, ...], slot: int) -> Optional[int]:
+        offset = fields[slot]
+        if offset == 0:
+            return None
+        pos = table + offset
+        return pos + _U32.unpack_from(self.buf, pos)[0]
+
+    def string(self, table: int, fields: Tuple[int, ...], slot: int) -> Optional[str]:
+        pos = self.indirect(table, fields, slot)
+        if pos is None:
+            return None
+        length = _U32.unpack_from(self.buf, pos)[0]
+        return str(self.buf[pos + 4 : pos + 4 + length], "utf-8")
+
+    def vector(
+        self, table: int, fields: Tuple[int, ...], slot: int
+    ) -> Optional[Tuple[int, int]]:
+        """Returns the (start, length) of a vector field, or None if absent."""
+        pos = self.indirect(table, fields, slot)
+        if pos is None:
+            return None
+        return pos + 4, _U32.unpack_from(self.buf, pos)[0]
+
+    def table_vector(
+        self, table: int, fields: Tuple[int, ...], slot: int
+    ) -> Optional[List[int]]:
+        """Returns the positions of the tables in a vector of tables."""
+        vector = self.vector(table, fields, slot)
+        if vector is None:
+            return None
+        start, length = vector
+        offsets = struct.unpack_from(f"<{length}I", self.buf, start)
+        return [start + 4 * i + offset for i, offset in enumerate(offsets)]
+
+    def scalar_vector(
+        self, fmt: str, table: int, fields: Tuple[int, ...], slot: int
+    ) -> Optional[List[int]]:
+        vector = self.vector(table, fields, slot)
+        if vector is None:
+            return None
+        start, length = vector
+        return list(struct.unpack_from(f"<{length}{fmt}", self.buf, start))
+
+
+class ETDumpReader:
+    """
+    Reads an ETDump flatbuffer generated by the FlatCC based ETDump writer.
+
+    The reader works over any object supporting the buffer protocol, including
+    `mmap.mmap`, so large ETDumps don't need to be read into memory upfront.
+    Run data blocks are decoded lazily via `run_data()` / `iter_run_data()`;
+    `to_etdump()` decodes everything into an `ETDumpFlatCC` object.
+
+    Example:
+        with ETDumpReader.from_file("model.etdump") as reader:
+            for run_data in reader.iter_run_data():
+                ...
+    """
+
+    def __init__(self, data: Buffer, size_prefixed: bool = True) -> None:
+        self._decoder = _FlatbufferDecoder(data)
+        self._mmap: Optional[mmap.mmap] = None
+        base = 4 if size_prefixed else 0
+        if len(data) < base + 4:
+            raise ValueError(
+                f"Invalid ETDump: buffer of {len(data)} bytes is too small."
+            )
+        self._root: int = base + _U32.unpack_from(data, base)[0]
+        if self._root >= len(data):
+            raise ValueError(
+                f"Invalid ETDump: root table offset {self._root} is out of bounds."
+            )
+        self._root_fields: Tuple[int, ...] = self._decoder.fields(self._root)
+        self._run_data_tables: List[int] = (
+            self._decoder.table_vector(self._root, self._root_fields, _ETDUMP_RUN_DATA)
+            or []
+        )
+
+    @classmethod
+    def from_file(cls, path: str, size_prefixed: bool = True) -> "ETDumpReader":
+        """
+        Memory-maps the ETDump at `path`. The mapping is released by `close()`
+        or when the reader is used as a context manager.
+        """
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            reader = cls(mapped, size_prefixed)
+        except Exception:
+            mapped.close()
+            raise
+        reader._mmap = mapped
+        return reader
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self) -> "ETDumpReader":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    @property
+    def version(self) -> int:
+        return int(
+            self._decoder.scalar(
+                _U32, self._root, self._root_fields, _ETDUMP_VERSION, 0
+            )
+        )
+
+    def num_run_data(self) -> int:
+        return len(self._run_data_tables)
+
+    def run_data(self, index: int) -> RunData:
+        """Decodes a single run data block."""
+        return self._read_run_data(self._run_data_tables[index])
+
+    def iter_run_data(self) -> Iterator[RunData]:
+        """Decodes run data blocks one at a time."""
+        for table in self._run_data_tables:
+            yield self._read_run_data(table)
+
+    def to_etdump(self) -> ETDumpFlatCC:
+        return ETDumpFlatCC(
+            version=self.version,
+            run_data=list(self.iter_run_data()),
+        )
+
+    # Table decoders. Fields are read following the conventions of the JSON
+    # based deserializer: absent tables, strings and vectors become None,
+    # absent scalars take their schema default.
+
+    def _read_run_data(self, table: int) -> RunData:
+        d = self._decoder
+        fields = d.fields(table)
+        allocators = d.table_vector(table, fields, _RUN_DATA_ALLOCATORS)
+        events = d.table_vector(table, fields, _RUN_DATA_EVENTS)
+        return RunData(
+            name=d.string(table, fields, _RUN_DATA_NAME),  # pyre-ignore[6]
+            bundled_input_index=int(
+                d.scalar(_I32, table, fields, _RUN_DATA_BUNDLED_INPUT_INDEX, -1)
+            ),
+            allocators=(
+                [self._read_allocator(t) for t in allocators]
+                if allocators is not None
+                else None
+            ),
+            events=(
+                [self._read_event(t) for t in events] if events is not None else None
+            ),
+        )
+
+    def _read_allocator(self, table: int) -> Allocator:
+        fields = self._decoder.fields(table)
+        return Allocator(name=self._decoder.string(table, fields, 0))  # pyre-ignore[6]
+
+    def _read_event(self, table: int) -> Event:
+        d = self._decoder
+        fields = d.fields(table)
+        profile_event = d.indirect(table, fields, _EVENT_PROFILE)
+        allocation_event = d.indirect(table, fields, _EVENT_ALLOCATION)
+        debug_event = d.indirect(table, fields, _EVENT_DEBUG)
+        return Event(
+            profile_event=(
+                self._read_profile_event(profile_event)
+                if profile_event is not None
+                else None
+            ),
+            allocation_event=(
+                self._read_allocation_event(allocation_event)
+                if allocation_event is not None
+                else None
+            ),
+            debug_event=(
+                self._read_debug_event(debug_event) if debug_event is not None else None
+            ),
+        )
+
+    def _read_profile_event(self, table: int) -> ProfileEvent:
+        # Profile events make up the bulk of most ETDumps, so this decoder
+        # reads the fields inline rather than through the generic helpers.
+        d = self._decoder
+        buf = d.buf
+        fields = d.fields(table)
+        offset = fields[_PROFILE_DELEGATE_METADATA]
+        metadata = None
+        if offset != 0:
+            pos = table + offset
+            pos += _U32.unpack_from(buf, pos)[0]
+            length = _U32.unpack_from(buf, pos)[0]
+            metadata = bytes(buf[pos + 4 : pos + 4 + length])
+        offset = fields[_PROFILE_CHAIN_INDEX]
+        chain_index = _I32.unpack_from(buf, table + offset)[0] if offset else 0
+        offset = fields[_PROFILE_INSTRUCTION_ID]
+        instruction_id = _I32.unpack_from(buf, table + offset)[0] if offset else -1
+        offset = fields[_PROFILE_DELEGATE_ID_INT]
+        delegate_id_int = _I32.unpack_from(buf, table + offset)[0] if offset else -1
+        offset = fields[_PROFILE_START_TIME]
+        start_time = _U64.unpack_from(buf, table + offset)[0] if offset else 0
+        offset = fields[_PROFILE_END_TIME]
+        end_time = _U64.unpack_from(buf, table + offset)[0] if offset else 0
+        return ProfileEvent(
+            name=d.string(table, fields, _PROFILE_NAME),
+            chain_index=chain_index,
+            instruction_id=instruction_id,
+            delegate_debug_id_int=delegate_id_int,
+            delegate_debug_id_str=d.string(table, fields, _PROFILE_DELEGATE_ID_STR),
+            delegate_debug_metadata=metadata,
+            start_time=start_time,
+            end_time=end_time,
+        )
+
+    def _read_allocation_event(self, table: int) -> AllocationEvent:
+        d = self._decoder
+        fields = d.fields(table)
+        return AllocationEvent(
+            allocator_id=int(
+                d.scalar(_I32, table, fields, _ALLOCATION_ALLOCATOR_ID, 0)
+            ),
+            allocation_size=int(d.scalar(_U64, table, fields, _ALLOCATION_SIZE, 0)),
+        )
+
+    def _read_debug_event(self, table: int) -> DebugEvent:
+        d = self._decoder
+        fields = d.fields(table)
+        debug_entry = d.indirect(table, fields, _DEBUG_ENTRY)
+        return DebugEvent(
+            name=d.string(table, fields, _DEBUG_NAME),
+            chain_index=int(d.scalar(_U64, table, fields, _DEBUG_CHAIN_INDEX, 0)),
+            instruction_id=int(
+                d.scalar(_I32, table, fields, _DEBUG_INSTRUCTION_ID, -1)
+            ),
+            delegate_debug_id_int=int(
+                d.scalar(_I32, table, fields, _DEBUG_DELEGATE_ID_INT, -1)
+            ),
+            delegate_debug_id_str=d.string(table, fields, _DEBUG_DELEGATE_ID_STR),
+            debug_entry=(
+                self._read_value(debug_entry)  # pyre-ignore[6]
+                if debug_entry is not None
+                else None
+            ),
+        )
+
+    def _read_optional(
+        self,
+        table: int,
+        fields: Tuple[int, ...],
+        slot: int,
+        read: Callable[[int], object],
+    ) -> Optional[object]:
+        pos = self._decoder.indirect(table, fields, slot)
+        return read(pos) if pos is not None else None
+
+    def _read_value(self, table: int) -> Value:
+        d = self._decoder
+        fields = d.fields(table)
+        return Value(
+            val=_VALUE_TYPE_NAMES[int(d.scalar(_I8, table, fields, _VALUE_VAL, 0))],
+            tensor=self._read_optional(  # pyre-ignore[6]
+                table, fields, _VALUE_TENSOR, self._read_tensor
+            ),
+            tensor_list=self._read_optional(  # pyre-ignore[6]
+                table, fields, _VALUE_TENSOR_LIST, self._read_tensor_list
+            ),
+            int_value=self._read_optional(  # pyre-ignore[6]
+                table, fields, _VALUE_INT, self._read_int
+            ),
+            float_value=self._read_optional(  # pyre-ignore[6]
+                table, fields, _VALUE_FLOAT, self._read_float
+            ),
+            double_value=self._read_optional(  # pyre-ignore[6]
+                table, fields, _VALUE_DOUBLE, self._read_double
+            ),
+            bool_value=self._read_optional(  # pyre-ignore[6]
+                table, fields, _VALUE_BOOL, self._read_bool
+            ),
+            output=self._read_optional(  # pyre-ignore[6]
+                table, fields, _VALUE_OUTPUT, self._read_bool
+            ),
+        )
+
+    def _read_tensor(self, table: int) -> Tensor:
+        d = self._decoder
+        fields = d.fields(table)
+        return Tensor(
+            scalar_type=ScalarType(
+                int(d.scalar(_I8, table, fields, _TENSOR_SCALAR_TYPE, 0))
+            ),
+            sizes=d.scalar_vector("q", table, fields, _TENSOR_SIZES),  # pyre-ignore[6]
+            strides=d.scalar_vector(  # pyre-ignore[6]
+                "q", table, fields, _TENSOR_STRIDES
+            ),
+            offset=int(d.scalar(_I64, table, fields, _TENSOR_OFFSET, 0)),
+        )
+
+    def _read_tensor_list(self, table: int) -> TensorList:
+        fields = self._decoder.fields(table)
+        tensors = self._decoder.table_vector(table, fields, 0)
+        return TensorList(
+            tensors=(
+                [self._read_tensor(t) for t in tensors]  # pyre-ignore[6]
+                if tensors is not None
+                else None
+            )
+        )
+
+    def _read_int(self, table: int) -> Int:
+        fields = self._decoder.fields(table)
+        return Int(int_val=int(self._decoder.scalar(_I64, table, fields, 0, 0)))
+
+    def _read_bool(self, table: int) -> Bool:
+        fields = self._decoder.fields(table)
+        return Bool(bool_val=bool(self._decoder.scalar(_U8, table, fields, 0, 0)))
+
+    def _read_float(self, table: int) -> Float:
+        fields = self._decoder.fields(table)
+        return Float(
+            float_val=_float32_to_py(
+                float(self._decoder.scalar(_F32, table, fields, 0, 0.0))
+            )
+        )
+
+    def _read_double(self, table: int) -> Double:
+        fields = self._decoder.fields(table)
+        return Double(
+            double_val=float(self._decoder.scalar(_F64, table, fields, 0, 0.0))
+        )
@@ -13,6 +13,7 @@ import os
 import tempfile
 
 import executorch.devtools.etdump as etdump_package
+from executorch.devtools.etdump.reader import ETDumpReader
 from executorch.devtools.etdump.schema_flatcc import ETDumpFlatCC
 from executorch.exir._serialize._dataclass import _DataclassEncoder, _json_to_dataclass
 from executorch.exir._serialize._flatbuffer import _flatc_compile, _flatc_decompile
@@ -98,11 +99,23 @@ def deserialize_from_etdump_flatcc(
     """
     Given an etdump binary blob (constructed using the FlatCC schema) this function will deserialize
     it and return the FlatCC python object representation of etdump.
+    The flatbuffer is decoded directly in Python; use `ETDumpReader` to decode
+    run data blocks lazily instead.
     Args:
         data: Serialized etdump binary blob.
+        size_prefixed: Whether the blob starts with a 4 byte size prefix.
     Returns:
         Deserialized ETDump python object.
     """
-    return _deserialize_from_json_to_etdump_flatcc(
-        _convert_from_flatcc(data, size_prefixed)
-    )
+    return ETDumpReader(data, size_prefixed).to_etdump()
+
+
+def deserialize_from_etdump_flatcc_file(
+    path: str, size_prefixed: bool = True
+) -> ETDumpFlatCC:
+    """
+    Same as `deserialize_from_etdump_flatcc`, but memory-maps the etdump file at
+    `path` instead of reading it into memory first.
+    """
+    with ETDumpReader.from_file(path, size_prefixed) as reader:
+        return reader.to_etdump()
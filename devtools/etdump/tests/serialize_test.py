@@ -8,14 +8,20 @@
 
 import difflib
 import json
+import os
+import tempfile
 import unittest
 from pprint import pformat
 from typing import List
 
 import executorch.devtools.etdump.schema_flatcc as flatcc
 
+from executorch.devtools.etdump.reader import ETDumpReader
 from executorch.devtools.etdump.serialize import (
+    _convert_from_flatcc,
+    _deserialize_from_json_to_etdump_flatcc,
     deserialize_from_etdump_flatcc,
+    deserialize_from_etdump_flatcc_file,
     serialize_to_etdump_flatcc,
 )
 from executorch.exir._serialize._dataclass import _DataclassEncoder
@@ -140,3 +146,46 @@ class TestSerializeFlatCC(unittest.TestCase):
                 )
             ),
         )
+
+    def test_deserialize_matches_flatc_json(self) -> None:
+        program = get_sample_etdump_flatcc()
+        # Exercise a float32 value that isn't exactly representable.
+        program.run_data[0].events[3].debug_event.debug_entry.float_value = (
+            flatcc.Float(0.1)
+        )
+
+        flatcc_from_py = serialize_to_etdump_flatcc(program)
+        from_json = _deserialize_from_json_to_etdump_flatcc(
+            _convert_from_flatcc(flatcc_from_py, size_prefixed=False)
+        )
+        from_reader = deserialize_from_etdump_flatcc(
+            flatcc_from_py, size_prefixed=False
+        )
+        self.assertEqual(from_json, from_reader)
+
+    def test_reader_lazy_run_data(self) -> None:
+        program = get_sample_etdump_flatcc()
+        second_run = get_sample_etdump_flatcc().run_data[0]
+        second_run.name = "second_block"
+        second_run.events = second_run.events[:1]
+        program.run_data.append(second_run)
+
+        flatcc_from_py = serialize_to_etdump_flatcc(program)
+        reader = ETDumpReader(flatcc_from_py, size_prefixed=False)
+        self.assertEqual(reader.version, program.version)
+        self.assertEqual(reader.num_run_data(), 2)
+        self.assertEqual(reader.run_data(1), program.run_data[1])
+        self.assertEqual(list(reader.iter_run_data()), program.run_data)
+
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "sample.etdp")
+            with open(path, "wb") as f:
+                f.write(flatcc_from_py)
+            self.assertEqual(
+                deserialize_from_etdump_flatcc_file(path, size_prefixed=False),
+                program,
+            )
+
+    def test_reader_rejects_truncated_data(self) -> None:
+        with self.assertRaises(ValueError):
+            ETDumpReader(b"\x00\x00", size_prefixed=True)
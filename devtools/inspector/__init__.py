@@ -13,12 +13,26 @@ from executorch.devtools.inspector._inspector import (
     PerfData,
 )
 from executorch.devtools.inspector._inspector_utils import compare_results, TimeScale
+from executorch.devtools.inspector._perf_regression import (
+    bootstrap_relative_change,
+    collect_latency_samples,
+    detect_perf_regressions,
+    MultipleTestingCorrection,
+    RegressionScope,
+    RegressionStatus,
+)
 
 __all__ = [
     "Event",
     "EventBlock",
     "Inspector",
+    "MultipleTestingCorrection",
     "PerfData",
+    "RegressionScope",
+    "RegressionStatus",
+    "bootstrap_relative_change",
+    "collect_latency_samples",
     "compare_results",
+    "detect_perf_regressions",
     "TimeScale",
 ]
@@ -7,6 +7,7 @@
 # pyre-unsafe
 
 import dataclasses
+import json
 import logging
 import sys
 import warnings
@@ -70,7 +71,11 @@ from executorch.devtools.inspector._inspector_utils import (
 from executorch.devtools.inspector._intermediate_output_capturer import (
     IntermediateOutputCapturer,
 )
+from executorch.devtools.inspector._intermediate_output_spill import (
+    IntermediateOutputSpill,
+)
 from executorch.devtools.inspector.numerical_comparator import (
+    CosineSimilarityComparator,
     L1Comparator,
     MSEComparator,
     NumericalComparatorBase,
@@ -81,6 +86,9 @@ from executorch.exir import ExportedProgram
 
 log: logging.Logger = logging.getLogger(__name__)
 
+# Percentiles reported in PerfData
+PERCENTILES: Tuple[int, ...] = (10, 50, 90)
+
 
 # Signature of an InstructionEvent
 @dataclass(frozen=True, order=True)
@@ -244,7 +252,13 @@ class EventSignature:
                     ),
                     debug_event_signature=debug_signature,
                 ),
-                dataclasses.replace(instruction_event, profile_events=[profile_event]),
+                (
+                    dataclasses.replace(
+                        instruction_event, profile_events=[profile_event]
+                    )
+                    if len(profile_events) > 1
+                    else instruction_event
+                ),
             )
             for profile_event in profile_events
         ]
@@ -279,32 +293,110 @@ DelegateMetadata = TypedDict(
 
 @dataclass
 class PerfData:
-    def __init__(self, raw: List[float]):
-        self.raw: List[float] = raw
+    """
+    Performance data of an Event, one value per run.
+
+    The values are held in a NumPy array, which may be a view into the columnar
+    EventStore of an EventBlock. Percentiles can be precomputed for a whole
+    EventBlock at once and passed in via _percentiles.
+    """
+
+    def __init__(
+        self,
+        raw: Union[List[float], np.ndarray],
+        _percentiles: Optional[np.ndarray] = None,
+    ):
+        self._values: np.ndarray = np.asarray(raw, dtype=np.float64)
+        # p10, p50 and p90 of _values
+        self._percentiles: Optional[np.ndarray] = _percentiles
+
+    @property
+    def raw(self) -> List[float]:
+        return self._values.tolist()
+
+    @raw.setter
+    def raw(self, raw: Union[List[float], np.ndarray]) -> None:
+        self._values = np.asarray(raw, dtype=np.float64)
+        self._percentiles = None
+
+    @property
+    def values(self) -> np.ndarray:
+        """
+        The raw values as a NumPy array, without copying them into a list.
+        """
+        return self._values
+
+    def _get_percentiles(self) -> np.ndarray:
+        if self._percentiles is None:
+            self._percentiles = np.percentile(self._values, PERCENTILES)
+        return self._percentiles
 
     @property
     def p10(self) -> float:
-        return np.percentile(self.raw, 10)
+        return self._get_percentiles()[0]
 
     @property
     def p50(self) -> float:
-        return np.percentile(self.raw, 50)
+        return self._get_percentiles()[1]
 
     @property
     def p90(self) -> float:
-        return np.percentile(self.raw, 90)
+        return self._get_percentiles()[2]
 
     @property
     def avg(self) -> float:
-        return np.mean(self.raw)
+        return np.mean(self._values)
 
     @property
     def min(self) -> float:
-        return min(self.raw)
+        return np.min(self._values)
 
     @property
     def max(self) -> float:
-        return max(self.raw)
+        return np.max(self._values)
+
+
+@dataclass
+class EventStore:
+    """
+    Columnar storage of the profiling data of an EventBlock, with one row per run
+    and one column per Event of the block. Events of an EventBlock share their
+    signature across runs, so the profiling data of all runs forms dense matrices.
+
+    Args:
+        instruction_ids: Instruction id of each Event, -1 if unknown.
+        has_perf_data: Whether each Event has profiling data.
+        start_times: Raw start timestamps, 0 for Events without profiling data.
+        end_times: Raw end timestamps, 0 for Events without profiling data.
+        durations: Scaled durations, NaN for Events without profiling data.
+    """
+
+    instruction_ids: np.ndarray
+    has_perf_data: np.ndarray
+    start_times: np.ndarray
+    end_times: np.ndarray
+    durations: np.ndarray
+
+    @property
+    def num_runs(self) -> int:
+        return self.start_times.shape[0]
+
+    @property
+    def num_events(self) -> int:
+        return self.start_times.shape[1]
+
+    def percentiles(self, q: Sequence[float] = PERCENTILES) -> np.ndarray:
+        """
+        Returns the percentiles q of the durations of every Event with profiling
+        data, computed in one vectorized pass. The result has shape
+        (len(q), num_events) and is NaN for Events without profiling data.
+        """
+        result = np.full((len(q), self.num_events), np.nan)
+        if self.num_runs > 0 and self.has_perf_data.any():
+            result[:, self.has_perf_data] = np.percentile(
+                self.durations[:, self.has_perf_data], q, axis=0
+            )
+        return result
 
 
 @dataclass
@@ -433,53 +525,6 @@ class Event:
             "start_time": [self._start_time],
         }
 
-    @staticmethod
-    def _gen_from_inference_events(
-        signature: EventSignature,
-        events: List[InstructionEvent],
-        scale_factor: float = 1.0,
-        output_buffer: Optional[bytes] = None,
-        delegate_metadata_parser: Optional[
-            Callable[[List[str]], Dict[str, Any]]
-        ] = None,
-        delegate_time_scale_converter: Optional[
-            Callable[[Union[int, str], Union[int, float]], Union[int, float]]
-        ] = None,
-    ) -> "Event":
-        """
-        Given an EventSignature and a list of Events with that signature,
-        return an Event object matching the EventSignature, with perf_data
-        populated from the list of ProfileEvents and debug_data populated from
-        the list of DebugEvents.
-
-        An optional inverse scale factor can be provided to adjust the event timestamps
-        An optional buffer can be provided to inflate etdump references
-        An optional delegate_metadata_parser can be provided to parse the delegate metadata
-        """
-
-        profile_event_signature = signature.profile_event_signature
-        debug_event_signature = signature.debug_event_signature
-
-        # Event is gradually populated in this function
-        ret_event: Event = Event(
-            name="",
-            _instruction_id=signature.instruction_id,
-            _delegate_metadata_parser=delegate_metadata_parser,
-            _delegate_time_scale_converter=delegate_time_scale_converter,
-        )
-
-        # Populate fields from profile events
-        Event._populate_profiling_related_fields(
-            ret_event, profile_event_signature, events, scale_factor
-        )
-
-        # Populate fields from debug events
-        Event._populate_debugging_related_fields(
-            ret_event, debug_event_signature, events, output_buffer
-        )
-
-        return ret_event
-
     @staticmethod
     def _calculate_elapsed_time(start_time, end_time):
         # We're assuming if there's a wraparound in the time values, then
@@ -499,6 +544,31 @@ class Event:
             elapsed_time = end_time - start_time
         return elapsed_time
 
+    @staticmethod
+    def _calculate_elapsed_times(
+        start_times: np.ndarray, end_times: np.ndarray
+    ) -> np.ndarray:
+        """
+        Vectorized version of _calculate_elapsed_time over arrays of timestamps.
+        """
+        max_uint32 = 2**32 - 1
+        wrapped = start_times > end_times
+        if wrapped.any():
+            out_of_range = wrapped & (
+                (start_times > max_uint32) | (end_times > max_uint32)
+            )
+            if out_of_range.any():
+                index = int(np.argmax(out_of_range))
+                raise ValueError(
+                    f"Expected start_time ({start_times[index]}) and end_time ({end_times[index]}) to be less than {max_uint32} for cases where there is wrap-around of time values."
+                )
+            return np.where(
+                wrapped,
+                (max_uint32 - start_times) + end_times,
+                end_times - start_times,
+            ).astype(np.float64)
+        return (end_times - start_times).astype(np.float64)
+
     @staticmethod
     def _populate_event_signature_fields(
         ret_event: "Event",
@@ -539,84 +609,61 @@ class Event:
     def _populate_profiling_related_fields(
         ret_event: "Event",
         profile_event_signature: Optional[ProfileEventSignature],
-        events: List[InstructionEvent],
+        event_store: EventStore,
+        index: int,
+        delegate_debug_metadatas: Optional[List[Any]],
         scale_factor: float,
     ) -> None:
         """
-        Given a partially constructed Event, populate the fields related to
-        the profile events
+        Given a partially constructed Event, populate the fields related to the
+        profile events from column `index` of the event_store, and write the
+        scaled durations back into the store. perf_data is populated by the caller
+        once the durations of all Events in the store are known.
 
         Fields Updated:
             name
             delegate_debug_identifier
             is_delegated_op
-            perf_data
             delegate_debug_metadatas
         """
 
         # Fill out fields from profile event signature
         Event._populate_event_signature_fields(ret_event, profile_event_signature)
 
-        # Fill out fields from profile event
-        data = []
-        stime = []
-        delegate_debug_metadatas = []
-        for event in events:
-            if (profile_events := event.profile_events) is not None:
-                if len(profile_events) != 1:
-                    raise ValueError(
-                        f"Expected exactly one profile event per InstructionEvent when generating Inspector Event, but got {len(profile_events)}"
-                    )
-
-                profile_event = profile_events[0]
+        if not event_store.has_perf_data[index]:
+            return
 
-                # Scale factor should only be applied to non-delegated ops
-                if (
-                    ret_event.is_delegated_op
-                    and (convert_time_scale := ret_event._delegate_time_scale_converter)
-                    is not None
-                ):
-                    scaled_time = Event._calculate_elapsed_time(
-                        convert_time_scale(ret_event.name, profile_event.start_time),
-                        convert_time_scale(ret_event.name, profile_event.end_time),
-                    )
-                # If it's not a delegated op then we can just use the raw time values
-                # and then scale them according to the scale factor that was passed in.
-                elif not ret_event.is_delegated_op:
-                    scaled_time = (
-                        float(
-                            Event._calculate_elapsed_time(
-                                profile_event.start_time, profile_event.end_time
-                            )
-                        )
-                        / scale_factor
+        start_times = event_store.start_times[:, index]
+        end_times = event_store.end_times[:, index]
+        # Scale factor should only be applied to non-delegated ops
+        if (
+            ret_event.is_delegated_op
+            and (convert_time_scale := ret_event._delegate_time_scale_converter)
+            is not None
+        ):
+            durations = np.array(
+                [
+                    Event._calculate_elapsed_time(
+                        convert_time_scale(ret_event.name, start_time),
+                        convert_time_scale(ret_event.name, end_time),
                     )
-                # If there was no scale factor passed in just take a difference of the
-                # end and start times.
-                else:
-                    scaled_time = float(
-                        Event._calculate_elapsed_time(
-                            profile_event.start_time, profile_event.end_time
-                        )
+                    for start_time, end_time in zip(
+                        start_times.tolist(), end_times.tolist()
                     )
+                ],
+                dtype=np.float64,
+            )
+        elif not ret_event.is_delegated_op:
+            durations = (
+                Event._calculate_elapsed_times(start_times, end_times) / scale_factor
+            )
+        else:
+            durations = Event._calculate_elapsed_times(start_times, end_times)
 
-                data.append(scaled_time)
-                stime.append(profile_event.start_time)
-                delegate_debug_metadatas.append(
-                    profile_event.delegate_debug_metadata
-                    if profile_event.delegate_debug_metadata
-                    else ""
-                )
-
-        # Update fields
-        if len(data) > 0:
-            ret_event.perf_data = PerfData(data)
-        if any(delegate_debug_metadatas):
+        event_store.durations[:, index] = durations
+        if delegate_debug_metadatas is not None:
             ret_event._delegate_debug_metadatas = delegate_debug_metadatas
-
-        # add _start_time to the event
-        if len(stime) > 0:
-            ret_event._start_time = stime
+        ret_event._start_time = start_times.tolist()
 
     @staticmethod
     def _populate_debugging_related_fields(
@@ -700,6 +747,32 @@ class Event:
                         self.op_types += [node.op]
 
 
+def _events_to_dataframe(events: List[Event], units: str) -> pd.DataFrame:
+    """
+    Equivalent to concatenating Event.to_dataframe() of every event, but builds
+    the DataFrame column by column in one go.
+    """
+    records = [event.asdict(_units=units) for event in events]
+    if len(records) == 0:
+        return pd.DataFrame(
+            {key: [] for key in Event(name="").asdict(_units=units).keys()}
+        )
+    columns = {}
+    for key, first_value in records[0].items():
+        if isinstance(first_value, list):
+            # Event.asdict wraps non scalar values into single element lists
+            values = [record[key][0] for record in records]
+        else:
+            values = [record[key] for record in records]
+        # Match the dtype pd.concat produces when some rows hold None
+        columns[key] = (
+            pd.Series(values, dtype=object)
+            if any(value is None for value in values)
+            else values
+        )
+    return pd.DataFrame(columns)
+
+
 @dataclass
 class EventBlock:
     r"""
@@ -713,6 +786,8 @@ class EventBlock:
 
         bundled_input_idx: Index of the Bundled Input that this EventBlock corresponds to.
         run_output: Run output extracted from the encapsulated Events
+        event_store: Columnar profiling data of the events, one row per run. Only
+            populated for EventBlocks generated from an ETDump.
     """
 
     name: str
@@ -722,6 +797,9 @@ class EventBlock:
     bundled_input_index: Optional[int] = None
     run_output: Optional[ProgramOutput] = None
     reference_output: Optional[ProgramOutput] = None
+    event_store: Optional[EventStore] = dataclasses.field(
+        default=None, compare=False, repr=False
+    )
 
     def to_dataframe(
         self, include_units: bool = False, include_delegate_debug_data: bool = False
@@ -742,7 +820,7 @@ class EventBlock:
 
         units = " (" + self.target_time_scale.value + ")" if include_units else ""
 
-        df = pd.concat([e.to_dataframe(units) for e in self.events], ignore_index=True)
+        df = _events_to_dataframe(self.events, units)
         df.insert(
             0,
             "event_block_name",
@@ -775,6 +853,172 @@ class EventBlock:
 
         return df
 
+    def to_run_dataframe(self) -> pd.DataFrame:
+        """
+        Converts the profiling data of the EventBlock into a DataFrame with one
+        row per (run, event) pair, built directly from the columnar event_store.
+
+        Returns:
+            A pandas DataFrame with the columns run_index, event_index,
+            event_name, instruction_id, debug_handles, start_time, end_time and
+            duration. Only events with profiling data are included.
+        """
+        if (store := self.event_store) is None:
+            raise RuntimeError(
+                "EventBlock has no event store, it is only available for EventBlocks generated from an ETDump."
+            )
+        columns = np.flatnonzero(store.has_perf_data)
+        num_runs = store.num_runs
+        # Filled element-wise so that sequences of handles stay single objects
+        debug_handles = np.empty(len(columns), dtype=object)
+        for position, index in enumerate(columns):
+            debug_handles[position] = self.events[index].debug_handles
+        return pd.DataFrame(
+            {
+                "run_index": np.repeat(np.arange(num_runs), len(columns)),
+                "event_index": np.tile(columns, num_runs),
+                "event_name": np.tile(
+                    np.asarray([self.events[i].name for i in columns], dtype=object),
+                    num_runs,
+                ),
+                "instruction_id": np.tile(store.instruction_ids[columns], num_runs),
+                "debug_handles": np.tile(debug_handles, num_runs),
+                "start_time": store.start_times[:, columns].ravel(),
+                "end_time": store.end_times[:, columns].ravel(),
+                "duration": store.durations[:, columns].ravel(),
+            }
+        )
+
+    def _event_trace_times(
+        self, event: Event, start_time: float, duration: float
+    ) -> Tuple[float, float]:
+        """
+        Returns the (start, duration) in microseconds of one run of an Event.
+        """
+        if event.is_delegated_op:
+            if (convert_time_scale := event._delegate_time_scale_converter) is not None:
+                # The converter maps delegate ticks into the target time scale
+                start_time = convert_time_scale(event.name, start_time)
+                scale = self.target_time_scale
+            else:
+                # Delegate durations without a converter are kept in raw ticks
+                scale = self.source_time_scale
+            us_factor = calculate_time_scale_factor(scale, TimeScale.US)
+            return start_time / us_factor, duration / us_factor
+        return (
+            start_time
+            / calculate_time_scale_factor(self.source_time_scale, TimeScale.US),
+            duration
+            / calculate_time_scale_factor(self.target_time_scale, TimeScale.US),
+        )
+
+    @staticmethod
+    def _trace_event_args(
+        event: Event, include_stack_traces: bool
+    ) -> Tuple[Dict[str, Any], List[Any]]:
+        """
+        Returns the trace args shared by all runs of an Event, and the per-run
+        delegate debug metadata, both JSON serializable.
+        """
+        args: Dict[str, Any] = {}
+        if event.debug_handles is not None:
+            args["debug_handles"] = event.debug_handles
+        if event.op_types:
+            args["op_types"] = event.op_types
+        if event._instruction_id is not None:
+            args["instruction_id"] = event._instruction_id
+        if event.delegate_backend_name is not None:
+            args["delegate_backend_name"] = event.delegate_backend_name
+        if event.delegate_debug_identifier is not None:
+            args["delegate_debug_identifier"] = event.delegate_debug_identifier
+        if include_stack_traces and event.stack_traces:
+            args["stack_traces"] = event.stack_traces
+        run_metadatas: List[Any] = []
+        if event._delegate_debug_metadatas:
+            if event._delegate_metadata_parser is not None:
+                args["delegate_debug_metadatas"] = event.delegate_debug_metadatas
+            else:
+                # Raw metadata is usually bytes, which JSON can't hold
+                run_metadatas = [
+                    m.hex() if isinstance(m, (bytes, bytearray)) else m
+                    for m in event._delegate_debug_metadatas
+                ]
+        return args, run_metadatas
+
+    def to_trace_events(
+        self, pid: int = 0, include_stack_traces: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        Converts the profiling data of the EventBlock into Chrome trace events.
+
+        The EventBlock is one process and every run is a thread (track) of it.
+        Each run of an Event is a complete ("X") event, so delegated events nest
+        under the DELEGATE_CALL they were issued from.
+
+        Args:
+            pid: Process id of the EventBlock in the trace.
+            include_stack_traces: Whether to annotate events with the stack
+                traces of their ops from the ETRecord.
+
+        Returns:
+            A list of trace events, including the process and thread name metadata.
+        """
+        num_runs = max(
+            (
+                len(event.perf_data.values)
+                for event in self.events
+                if event.perf_data is not None and event._start_time is not None
+            ),
+            default=0,
+        )
+        trace_events: List[Dict[str, Any]] = [
+            {"name": "process_name", "ph": "M", "pid": pid, "args": {"name": self.name}}
+        ]
+        for run_index in range(num_runs):
+            trace_events.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": pid,
+                    "tid": run_index,
+                    "args": {"name": f"Run {run_index}"},
+                }
+            )
+
+        slices = []
+        for event in self.events:
+            if event.perf_data is None or event._start_time is None:
+                continue
+            args, run_metadatas = self._trace_event_args(event, include_stack_traces)
+            durations = event.perf_data.values
+            for run_index in range(len(durations)):
+                start, duration = self._event_trace_times(
+                    event,
+                    event._start_time[run_index],
+                    float(durations[run_index]),
+                )
+                run_args = args
+                if run_index < len(run_metadatas):
+                    run_args = dict(
+                        args, delegate_debug_metadata=run_metadatas[run_index]
+                    )
+                slices.append(
+                    {
+                        "name": event.name,
+                        "cat": "delegate" if event.is_delegated_op else "operator",
+                        "ph": "X",
+                        "ts": start,
+                        "dur": duration,
+                        "pid": pid,
+                        "tid": run_index,
+                        "args": run_args,
+                    }
+                )
+        # Parents must precede the children they enclose for the slices to nest
+        slices.sort(key=lambda e: (e["tid"], e["ts"], -e["dur"]))
+        trace_events.extend(slices)
+        return trace_events
+
     @staticmethod
     def _gen_from_etdump(
         etdump: ETDumpFlatCC,
@@ -801,16 +1045,26 @@ class EventBlock:
         """
 
         # Map each RunSignatures to instances of its constituent events.
-        #   The value of the map is a GroupedRunInstance which contains:
-        #   (1) a map from each EventSignature to InstructionEvents with the signature
-        #   (2) the run output for this RunSignature
+        #   The value of the map is a GroupedRunInstance which contains the
+        #   profiling data of every run with the RunSignature in columnar form,
+        #   the InstructionEvents of each EventSignature that carry debug events,
+        #   and the run output for this RunSignature
         @dataclass
         class GroupedRunInstances:
-            events: OrderedDict[EventSignature, List[InstructionEvent]]
-            run_output: ProgramOutput
+            # Per run arrays of start/end times, indexed by EventSignature position
+            start_times: List[np.ndarray] = dataclasses.field(default_factory=list)
+            end_times: List[np.ndarray] = dataclasses.field(default_factory=list)
+            # Per run mapping from EventSignature position to delegate debug metadata
+            delegate_debug_metadatas: List[Dict[int, Any]] = dataclasses.field(
+                default_factory=list
+            )
+            debug_events: Dict[int, List[InstructionEvent]] = dataclasses.field(
+                default_factory=lambda: defaultdict(list)
+            )
+            run_output: ProgramOutput = dataclasses.field(default_factory=list)
 
         run_groups: Mapping[RunSignature, GroupedRunInstances] = defaultdict(
-            lambda: GroupedRunInstances(OrderedDict(), [])
+            GroupedRunInstances
         )
 
         # Collect all the run data
@@ -849,18 +1103,33 @@ class EventBlock:
                 bundled_input_index=run.bundled_input_index,
             )
 
-            # Update the Run Groups, indexed on the RunSignature
-            run_signature_events: OrderedDict[
-                EventSignature, List[InstructionEvent]
-            ] = run_groups[run_signature].events
-            for event_signature, event in event_signatures.items():
-                run_signature_events.setdefault(event_signature, []).append(event)
+            # Update the Run Groups, indexed on the RunSignature. Only the
+            # timestamps of the profile events are kept, in columnar form.
+            group = run_groups[run_signature]
+            num_events = len(event_signatures)
+            start_times = np.zeros(num_events, dtype=np.uint64)
+            end_times = np.zeros(num_events, dtype=np.uint64)
+            delegate_debug_metadatas = {}
+            for index, event in enumerate(event_signatures.values()):
+                if (profile_events := event.profile_events) is not None:
+                    profile_event = profile_events[0]
+                    start_times[index] = profile_event.start_time
+                    end_times[index] = profile_event.end_time
+                    if profile_event.delegate_debug_metadata:
+                        delegate_debug_metadatas[index] = (
+                            profile_event.delegate_debug_metadata
+                        )
+                if event.debug_events is not None:
+                    group.debug_events[index].append(event)
+            group.start_times.append(start_times)
+            group.end_times.append(end_times)
+            group.delegate_debug_metadatas.append(delegate_debug_metadatas)
 
             # Populate (or Verify if already populated) Run Outputs
             run_outputs: ProgramOutput = EventBlock._collect_run_outputs(
                 run_events, output_buffer
             )
-            if len(existing_run_outputs := run_groups[run_signature].run_output) == 0:
+            if len(existing_run_outputs := group.run_output) == 0:
                 existing_run_outputs.extend(run_outputs)
             else:
                 verify_debug_data_equivalence(existing_run_outputs, run_outputs)
@@ -868,24 +1137,43 @@ class EventBlock:
         # Construct the EventBlocks
         event_blocks = []
         scale_factor = calculate_time_scale_factor(source_time_scale, target_time_scale)
-        for run_signature, grouped_run_instance in run_groups.items():
-            run_group: OrderedDict[EventSignature, List[InstructionEvent]] = (
-                grouped_run_instance.events
+        for run_signature, group in run_groups.items():
+            signatures: Tuple[EventSignature, ...] = run_signature.events or ()
+            num_events = len(signatures)
+            event_store = EventStore(
+                instruction_ids=np.asarray(
+                    [
+                        (
+                            signature.instruction_id
+                            if signature.instruction_id is not None
+                            else -1
+                        )
+                        for signature in signatures
+                    ],
+                    dtype=np.int64,
+                ),
+                has_perf_data=np.asarray(
+                    [
+                        signature.profile_event_signature is not None
+                        for signature in signatures
+                    ],
+                    dtype=bool,
+                ),
+                start_times=np.stack(group.start_times),
+                end_times=np.stack(group.end_times),
+                durations=np.full((len(group.start_times), num_events), np.nan),
+            )
+
+            events = EventBlock._gen_events_from_event_store(
+                signatures,
+                event_store,
+                group.delegate_debug_metadatas,
+                group.debug_events,
+                scale_factor,
+                output_buffer,
+                delegate_metadata_parser,
+                delegate_time_scale_converter,
             )
-            run_outputs: ProgramOutput = grouped_run_instance.run_output
-
-            # Construct the Events
-            events: List[Event] = [
-                Event._gen_from_inference_events(
-                    signature,
-                    instruction_events,
-                    scale_factor,
-                    output_buffer,
-                    delegate_metadata_parser,
-                    delegate_time_scale_converter,
-                )
-                for signature, instruction_events in run_group.items()
-            ]
 
             # Add the EventBlock to the return list
             event_blocks.append(
@@ -895,12 +1183,83 @@ class EventBlock:
                     source_time_scale=source_time_scale,
                     target_time_scale=target_time_scale,
                     bundled_input_index=run_signature.bundled_input_index,
-                    run_output=run_outputs,
+                    run_output=group.run_output,
+                    event_store=event_store,
                 )
             )
 
         return event_blocks
 
+    @staticmethod
+    def _gen_events_from_event_store(
+        signatures: Tuple[EventSignature, ...],
+        event_store: EventStore,
+        delegate_debug_metadatas: List[Dict[int, Any]],
+        debug_events: Dict[int, List[InstructionEvent]],
+        scale_factor: float,
+        output_buffer: Optional[bytes] = None,
+        delegate_metadata_parser: Optional[
+            Callable[[List[str]], Dict[str, Any]]
+        ] = None,
+        delegate_time_scale_converter: Optional[
+            Callable[[Union[int, str], Union[int, float]], Union[int, float]]
+        ] = None,
+    ) -> List[Event]:
+        """
+        Given the EventSignatures of a group of runs and their columnar
+        profiling data, return one Event per EventSignature. The durations in
+        event_store are populated along the way and the perf data of all Events
+        is aggregated in a single vectorized pass.
+
+        delegate_debug_metadatas holds, for each run, a mapping from the
+        EventSignature position to its delegate debug metadata, and debug_events
+        the InstructionEvents of each EventSignature that carry debug events.
+        """
+        events: List[Event] = []
+        for index, signature in enumerate(signatures):
+            ret_event: Event = Event(
+                name="",
+                _instruction_id=signature.instruction_id,
+                _delegate_metadata_parser=delegate_metadata_parser,
+                _delegate_time_scale_converter=delegate_time_scale_converter,
+            )
+            event_delegate_debug_metadatas = (
+                [
+                    run_metadatas.get(index, "")
+                    for run_metadatas in delegate_debug_metadatas
+                ]
+                if any(
+                    index in run_metadatas for run_metadatas in delegate_debug_metadatas
+                )
+                else None
+            )
+            Event._populate_profiling_related_fields(
+                ret_event,
+                signature.profile_event_signature,
+                event_store,
+                index,
+                event_delegate_debug_metadatas,
+                scale_factor,
+            )
+            Event._populate_debugging_related_fields(
+                ret_event,
+                signature.debug_event_signature,
+                debug_events.get(index, []),
+                output_buffer,
+            )
+            events.append(ret_event)
+
+        # Aggregate the perf data of all Events at once
+        percentiles = event_store.percentiles()
+        for index, event in enumerate(events):
+            if event_store.has_perf_data[index]:
+                event.perf_data = PerfData(
+                    event_store.durations[:, index],
+                    _percentiles=percentiles[:, index],
+                )
+
+        return events
+
     @staticmethod
     def _collect_run_outputs(
         events: List[flatcc.Event], output_buffer: Optional[bytes] = None
@@ -1259,20 +1618,23 @@ class Inspector:
     def _get_aot_intermediate_outputs_and_op_names(
         self,
         reference_graph_module: torch.fx.GraphModule,
-    ) -> Tuple[Dict[DebugHandle, Any], Dict[DebugHandle, List[str]]]:
+        spill: Optional[IntermediateOutputSpill] = None,
+    ) -> Tuple[Mapping[DebugHandle, Any], Dict[DebugHandle, List[str]]]:
         """
         Capture intermediate outputs and operator name mappings from the given graph module.
 
         Args:
             reference_graph_module: The resolved reference graph module to use.
+            spill: If set, the intermediate outputs are written to this spill file
+                instead of being kept in memory.
 
         Returns:
-            Tuple of (intermediate_outputs, debug_handle_to_op_names) dictionaries.
+            Tuple of (intermediate_outputs, debug_handle_to_op_names) mappings.
         """
         aot_debug_handle_to_op_name = get_aot_debug_handle_to_op_name_mapping(
             reference_graph_module
         )
-        capturer = IntermediateOutputCapturer(reference_graph_module)
+        capturer = IntermediateOutputCapturer(reference_graph_module, spill=spill)
         aot_intermediate_outputs = capturer.run_and_capture(
             self._etrecord._representative_inputs
         )
@@ -1500,6 +1862,41 @@ class Inspector:
         # TODO: implement
         return {}
 
+    def export_trace(
+        self, path: Optional[str] = None, include_stack_traces: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Exports the profiling data as a Chrome trace, which can be opened in
+        Perfetto (ui.perfetto.dev) or chrome://tracing.
+
+        Every EventBlock is a process with one track per run. Delegated events
+        nest under the DELEGATE_CALL that issued them, provided the delegate
+        timestamps are on the same clock as the runtime (or are converted to it
+        with the delegate_time_scale_converter). Events are annotated with their
+        debug handles and, when an ETRecord was provided, the stack traces of
+        their ops.
+
+        Args:
+            path: Optional file path to write the trace JSON to.
+            include_stack_traces: Whether to annotate events with stack traces (default true).
+                Disable to keep traces of long runs small.
+
+        Returns:
+            The trace as a dict in the Chrome trace event format.
+        """
+        trace_events = []
+        for pid, event_block in enumerate(self.event_blocks):
+            trace_events.extend(
+                event_block.to_trace_events(
+                    pid=pid, include_stack_traces=include_stack_traces
+                )
+            )
+        trace = {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+        if path is not None:
+            with open(path, "w") as f:
+                json.dump(trace, f)
+        return trace
+
     def write_tensorboard_artifact(self, path: str) -> None:
         """
         Write to the provided path, the artifacts required for visualization in TensorBoard
@@ -1530,11 +1927,39 @@ class Inspector:
             else self._etrecord.graph_map.get(graph)
         )
 
+    def _get_comparator(
+        self, distance: Union[str, NumericalComparatorBase]
+    ) -> NumericalComparatorBase:
+        """
+        Get the comparator for calculate_numeric_gap, either the given custom
+        comparator or a built-in one by metric name.
+        """
+        if isinstance(distance, NumericalComparatorBase):
+            comparator = distance
+            # Inject inspector if not already set
+            if comparator.inspector is None:
+                comparator.inspector = self
+            return comparator
+
+        metric = distance.strip().upper()
+        if metric == "MSE":
+            return MSEComparator(inspector=self)
+        elif metric == "L1":
+            return L1Comparator(inspector=self)
+        elif metric == "SNR":
+            return SNRComparator(inspector=self)
+        elif metric == "COSINE":
+            return CosineSimilarityComparator(inspector=self)
+        else:
+            raise ValueError(f"Unsupported distance metric {distance!r}")
+
     def calculate_numeric_gap(
         self,
         distance: Union[str, NumericalComparatorBase],
         disable_debug_handle_valdiation: bool = False,
         reference_graph: Optional[str] = None,
+        streaming: bool = False,
+        spill_dir: Optional[str] = None,
     ):
         """
         Compares logged intermediate outputs from the exported graph (in ETRecord)
@@ -1546,7 +1971,7 @@ class Inspector:
 
         Args:
             distance: The metrics the inspector will use for gap calculation. Can be either:
-                - A string: one of "MSE", "L1", or "SNR" for built-in comparators.
+                - A string: one of "MSE", "L1", "SNR" or "COSINE" for built-in comparators.
                 - A custom NumericalComparatorBase instance: allows you to define custom comparison
                   logic by subclassing NumericalComparatorBase and implementing the element_compare()
                   method. Custom comparators can also override the preprocessing() method to apply
@@ -1568,6 +1993,13 @@ class Inspector:
                 If None (default), automatically selects the best available graph:
                 - Uses "exported_program" if available and debug handle backpropagation succeeds.
                 - Falls back to "edge_dialect_exported_program" otherwise.
+            streaming: Bound the memory used for large models. The AOT intermediate outputs are
+                spilled to a memory-mapped file as they are captured instead of being kept in memory,
+                and handles are compared one at a time in capture order. The built-in comparators
+                reduce large tensors chunk by chunk, so their float64 temporaries stay bounded too.
+                The intermediate outputs in the returned DataFrame are views into the spill file.
+            spill_dir: Directory for the spill file when streaming. Defaults to the system temporary
+                directory.
 
         Returns:
             pd.DataFrame: A DataFrame listing corresponding operator intermediate outputs from both stages and their computed numerical gaps.
@@ -1579,52 +2011,53 @@ class Inspector:
             disable_debug_handle_valdiation,
         )
 
-        # Get intermediate outputs and op names from the resolved graph
-        aot_intermediate_outputs, aot_debug_handle_to_op_names = (
-            self._get_aot_intermediate_outputs_and_op_names(reference_graph_module)
-        )
-        if len(aot_intermediate_outputs) == 0 or len(aot_debug_handle_to_op_names) == 0:
-            raise ValueError(
-                "Missing etrecord or missing representative inputs within etrecord, both of which are required for calculating numerical gap"
+        # In streaming mode the AOT intermediate outputs are written to a spill file
+        # as they are captured, and read back lazily one debug handle at a time
+        spill = IntermediateOutputSpill(spill_dir) if streaming else None
+        try:
+            # Get intermediate outputs and op names from the resolved graph
+            aot_intermediate_outputs, aot_debug_handle_to_op_names = (
+                self._get_aot_intermediate_outputs_and_op_names(
+                    reference_graph_module, spill
+                )
             )
+            if (
+                len(aot_intermediate_outputs) == 0
+                or len(aot_debug_handle_to_op_names) == 0
+            ):
+                raise ValueError(
+                    "Missing etrecord or missing representative inputs within etrecord, both of which are required for calculating numerical gap"
+                )
 
-        # Get the stack trace mapping from the resolved graph
-        aot_debug_handle_to_stack_traces = self._get_aot_debug_handle_to_stack_traces(
-            reference_graph_module,
-            resolved_graph_name,
-        )
+            # Get the stack trace mapping from the resolved graph
+            aot_debug_handle_to_stack_traces = (
+                self._get_aot_debug_handle_to_stack_traces(
+                    reference_graph_module,
+                    resolved_graph_name,
+                )
+            )
 
-        # The runtime_op_names will be used later to map runtime debug_handle to op_name
-        runtime_intermediate_outputs, runtime_debug_handle_to_op_names = (
-            self._get_runtime_intermediate_outputs_and_op_names()
-        )
-        mapping = map_runtime_aot_intermediate_outputs(
-            aot_intermediate_outputs, runtime_intermediate_outputs
-        )
+            # The runtime_op_names will be used later to map runtime debug_handle to op_name
+            runtime_intermediate_outputs, runtime_debug_handle_to_op_names = (
+                self._get_runtime_intermediate_outputs_and_op_names()
+            )
+            mapping = map_runtime_aot_intermediate_outputs(
+                aot_intermediate_outputs, runtime_intermediate_outputs
+            )
 
-        # Get or create comparator
-        if isinstance(distance, NumericalComparatorBase):
-            comparator = distance
-            # Inject inspector if not already set
-            if comparator.inspector is None:
-                comparator.inspector = self
-        else:
-            metric = distance.strip().upper()
-            if metric == "MSE":
-                comparator = MSEComparator(inspector=self)
-            elif metric == "L1":
-                comparator = L1Comparator(inspector=self)
-            elif metric == "SNR":
-                comparator = SNRComparator(inspector=self)
-            else:
-                raise ValueError(f"Unsupported distance metric {distance!r}")
+            # Get or create comparator
+            comparator = self._get_comparator(distance)
 
-        # Delegate to comparator's compare method (includes preprocessing)
-        df = comparator.compare(
-            mapping,
-            aot_debug_handle_to_op_names,
-            runtime_debug_handle_to_op_names,
-        )
+            # Delegate to comparator's compare method (includes preprocessing)
+            df = comparator.compare(
+                mapping,
+                aot_debug_handle_to_op_names,
+                runtime_debug_handle_to_op_names,
+            )
+        finally:
+            # Tensors in the returned DataFrame keep their pages mapped
+            if spill is not None:
+                spill.close()
 
         # Add stacktraces column by looking up each row's debug handle
         # We need to map from aot_ops back to debug handles to get stack traces
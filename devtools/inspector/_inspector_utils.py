@@ -11,7 +11,19 @@ import sys
 from collections.abc import Sequence
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, IO, List, Mapping, Optional, Set, Tuple, TypeAlias, Union
+from typing import (
+    Any,
+    Dict,
+    IO,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    TypeAlias,
+    Union,
+)
 
 import executorch.devtools.etdump.schema_flatcc as flatcc
 
@@ -32,7 +44,10 @@ from executorch.devtools.etdump.schema_flatcc import (
     ValueType,
 )
 
-from executorch.devtools.etdump.serialize import deserialize_from_etdump_flatcc
+from executorch.devtools.etdump.serialize import (
+    deserialize_from_etdump_flatcc,
+    deserialize_from_etdump_flatcc_file,
+)
 from executorch.devtools.etrecord import ETRecord
 
 from executorch.exir.debug_handle_utils import (
@@ -67,6 +82,9 @@ EXCLUDED_EVENTS_WHEN_PRINTING = {"OPERATOR_CALL"}
 
 EXCLUDED_EVENTS_FOR_INTERMEDIATE_OUTPUT = {"OPERATOR_CALL"}
 
+# Number of elements converted to float64 at a time when comparing large tensors
+NUMERIC_GAP_CHUNK_NUMEL = 1 << 20
+
 
 class TimeScale(Enum):
     NS = "ns"
@@ -206,8 +224,10 @@ def _parse_tensor_value(
     if tensor.offset is None:
         raise ValueError("Tensor offset cannot be None")
 
+    # Slice through a memoryview so the tensor aliases the buffer instead of
+    # holding its own copy of the bytes
     return torch.frombuffer(
-        output_buffer[tensor.offset : tensor.offset + tensor_bytes_size],
+        memoryview(output_buffer)[tensor.offset : tensor.offset + tensor_bytes_size],
         dtype=torch_dtype,
     ).view(tensor.sizes)
 
@@ -361,8 +381,7 @@ def gen_etdump_object(
 ) -> ETDumpFlatCC:
     # Gen event blocks from etdump
     if etdump_data is None and etdump_path is not None:
-        with open(etdump_path, "rb") as buff:
-            etdump_data = buff.read()
+        return deserialize_from_etdump_flatcc_file(etdump_path)
 
     if etdump_data is None:
         raise ValueError(
@@ -676,7 +695,7 @@ def _combine_aot_overlapped_intermediate_outputs(
 
 
 def _create_debug_handle_overlap_graph(
-    aot_intermediate_outputs: Dict[DebugHandle, Any],
+    aot_intermediate_outputs: Mapping[DebugHandle, Any],
     runtime_intermediate_outputs: Dict[DebugHandle, Tuple[Any, int]],
 ) -> Tuple[List[NodeData], Dict[int, List[int]]]:
     """
@@ -914,7 +933,7 @@ def _process_single_runtime_output(
 
 
 def map_runtime_aot_intermediate_outputs(
-    aot_intermediate_outputs: Dict[DebugHandle, Any],
+    aot_intermediate_outputs: Mapping[DebugHandle, Any],
     runtime_intermediate_outputs: Dict[DebugHandle, Tuple[Any, int]],
 ) -> Dict[Tuple[DebugHandle, Any], Tuple[DebugHandle, Any]]:
     """
@@ -1017,6 +1036,38 @@ def convert_to_float_tensor(input_data: Any) -> torch.Tensor:
     return input_tensor
 
 
+def can_compare_in_chunks(
+    a: Any, b: Any, chunk_numel: int = NUMERIC_GAP_CHUNK_NUMEL
+) -> bool:
+    """
+    Whether a and b are same-shaped tensors large enough that comparing them
+    chunk by chunk, rather than converting them to float64 as a whole, pays off.
+    """
+    return (
+        isinstance(a, torch.Tensor)
+        and isinstance(b, torch.Tensor)
+        and a.shape == b.shape
+        and a.numel() > chunk_numel
+    )
+
+
+def iter_float_tensor_chunks(
+    a: torch.Tensor, b: torch.Tensor, chunk_numel: int = NUMERIC_GAP_CHUNK_NUMEL
+) -> Iterator[Tuple[torch.Tensor, torch.Tensor]]:
+    """
+    Yield aligned, flattened chunks of two same-shaped tensors, converted with
+    convert_to_float_tensor. Only one chunk of each tensor is converted at a
+    time, so the float64 temporaries stay bounded regardless of tensor size.
+    """
+    flat_a = a.detach().reshape(-1)
+    flat_b = b.detach().reshape(-1)
+    for start in range(0, flat_a.numel(), chunk_numel):
+        yield (
+            convert_to_float_tensor(flat_a[start : start + chunk_numel]),
+            convert_to_float_tensor(flat_b[start : start + chunk_numel]),
+        )
+
+
 def get_aot_debug_handle_to_op_name_mapping(
     graph_module: torch.fx.GraphModule,
 ) -> Dict[DebugHandle, List[str]]:
@@ -7,10 +7,13 @@
 # pyre-unsafe
 
 
-from typing import Any, Dict
+from typing import Any, Mapping, Optional
 
 import torch
 from executorch.devtools.inspector._inspector_utils import DebugHandle, NodeFilter
+from executorch.devtools.inspector._intermediate_output_spill import (
+    IntermediateOutputSpill,
+)
 from torch.fx import GraphModule
 from torch.fx.interpreter import Interpreter
 
@@ -21,16 +24,24 @@ class IntermediateOutputCapturer(Interpreter):
     Attributes:
         module (GraphModule): The graph module to capture outputs from.
         node_filters (List[NodeFilter]): A list of filters to apply to the nodes.
+        spill (Optional[IntermediateOutputSpill]): If set, captured outputs are
+            written to this spill file as soon as they are produced instead of
+            being cloned and kept in memory.
     """
 
-    def __init__(self, module: GraphModule):
+    def __init__(
+        self, module: GraphModule, spill: Optional[IntermediateOutputSpill] = None
+    ):
         super().__init__(module)
         self.node_filters = [
             NodeFilter("debug_handle", "call_function", exclude_ops=["getitem"])
         ]
+        self.spill = spill
 
     # Runs the graph module and captures the intermediate outputs.
-    def run_and_capture(self, *args, **kwargs) -> Dict[DebugHandle, Any]:
+    def run_and_capture(self, *args, **kwargs) -> Mapping[DebugHandle, Any]:
+        if self.spill is not None:
+            return self._run_and_spill(*args, **kwargs)
         captured_outputs = {}
 
         def capture_run_node(n: torch.fx.Node) -> Any:
@@ -60,3 +71,28 @@ class IntermediateOutputCapturer(Interpreter):
         self.run(*args, **kwargs)
         self.run_node = original_run_node
         return captured_outputs
+
+    # Runs the graph module and writes the intermediate outputs to the spill file.
+    # The interpreter frees values after their last use, so peak memory is bounded
+    # by the live activations rather than by all intermediate outputs.
+    def _run_and_spill(self, *args, **kwargs) -> IntermediateOutputSpill:
+        spill = self.spill
+        assert spill is not None
+
+        def spill_run_node(n: torch.fx.Node) -> Any:
+            result = super(IntermediateOutputCapturer, self).run_node(n)
+            if all(filter.matches(n) for filter in self.node_filters):
+                debug_handle = n.meta["debug_handle"]
+                key = (
+                    (debug_handle,)
+                    if isinstance(debug_handle, int)
+                    else tuple(debug_handle)
+                )
+                spill.add(key, result)
+            return result
+
+        original_run_node = self.run_node
+        self.run_node = spill_run_node
+        self.run(*args, **kwargs)
+        self.run_node = original_run_node
+        return spill
@@ -0,0 +1,131 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# All rights reserved.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+# pyre-unsafe
+
+import tempfile
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+import numpy as np
+import torch
+from executorch.devtools.inspector._inspector_utils import DebugHandle
+
+# Tensor data in the spill file is aligned so that any dtype can be viewed in place
+_ALIGNMENT = 64
+
+
+@dataclass(frozen=True)
+class _SpilledTensor:
+    offset: int
+    nbytes: int
+    dtype: torch.dtype
+    shape: Tuple[int, ...]
+
+
+class IntermediateOutputSpill(Mapping):
+    """
+    A read-only mapping from debug handle to intermediate output whose tensors
+    live in a temporary file instead of in memory.
+
+    Tensors are appended to the file as they are added, and are returned as
+    views into a memory map of the file. Pages are only read from disk when a
+    tensor is actually accessed, and can be evicted by the OS again afterwards,
+    so holding every intermediate output of a large model only costs the index.
+    Non-tensor values (scalars, None) are kept in memory as is.
+
+    The file is mapped copy-on-write, so modifying a returned tensor never writes
+    back to the spill file.
+    """
+
+    def __init__(self, spill_dir: Optional[str] = None) -> None:
+        """
+        Args:
+            spill_dir: Directory to create the spill file in. Defaults to the
+                system temporary directory. The file is removed on close.
+        """
+        self._file = tempfile.TemporaryFile(dir=spill_dir)
+        self._size = 0
+        self._index: Dict[DebugHandle, Any] = {}
+        self._buffer: Optional[np.memmap] = None
+
+    def add(self, debug_handle: DebugHandle, value: Any) -> None:
+        """
+        Spill `value`, a tensor, a list or tuple of tensors, or a non-tensor
+        value, under `debug_handle`.
+        """
+        if isinstance(value, torch.Tensor):
+            self._index[debug_handle] = self._write_tensor(value)
+        elif isinstance(value, (tuple, list)):
+            self._index[debug_handle] = [
+                self._write_tensor(v) if isinstance(v, torch.Tensor) else v
+                for v in value
+            ]
+        else:
+            self._index[debug_handle] = value
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the spill file in bytes."""
+        return self._size
+
+    def close(self) -> None:
+        """
+        Close and remove the spill file. Tensors that were already returned stay
+        valid for as long as they are referenced.
+        """
+        self._buffer = None
+        self._file.close()
+
+    def __enter__(self) -> "IntermediateOutputSpill":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __getitem__(self, debug_handle: DebugHandle) -> Any:
+        entry = self._index[debug_handle]
+        if isinstance(entry, _SpilledTensor):
+            return self._read_tensor(entry)
+        if isinstance(entry, list):
+            return [
+                self._read_tensor(e) if isinstance(e, _SpilledTensor) else e
+                for e in entry
+            ]
+        return entry
+
+    def __iter__(self) -> Iterator[DebugHandle]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def _write_tensor(self, tensor: torch.Tensor) -> _SpilledTensor:
+        tensor = tensor.detach().cpu().contiguous()
+        entry = _SpilledTensor(
+            offset=self._size,
+            nbytes=tensor.numel() * tensor.element_size(),
+            dtype=tensor.dtype,
+            shape=tuple(tensor.shape),
+        )
+        if entry.nbytes > 0:
+            self._file.seek(entry.offset)
+            self._file.write(tensor.reshape(-1).view(torch.uint8).numpy().data)
+            padded_size = -(-entry.nbytes // _ALIGNMENT) * _ALIGNMENT
+            self._file.write(b"\0" * (padded_size - entry.nbytes))
+            self._size += padded_size
+        return entry
+
+    def _read_tensor(self, entry: _SpilledTensor) -> torch.Tensor:
+        if entry.nbytes == 0:
+            return torch.empty(entry.shape, dtype=entry.dtype)
+        if self._buffer is None or self._buffer.size < self._size:
+            # Map the whole file, remapping if tensors were added since the last read
+            self._file.flush()
+            self._buffer = np.memmap(self._file, dtype=np.uint8, mode="c")
+        data = self._buffer[entry.offset : entry.offset + entry.nbytes]
+        return torch.from_numpy(data).view(entry.dtype).view(entry.shape)
@@ -0,0 +1,335 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# All rights reserved.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+# pyre-unsafe
+
+from collections import defaultdict
+from enum import Enum
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from executorch.devtools.inspector._inspector import EventBlock, Inspector
+
+# (event block name, scope, event name, debug handles, delegate backend name, occurrence)
+LatencyKey = Tuple[str, str, str, Optional[Tuple[int, ...]], Optional[str], int]
+
+
+class RegressionScope(Enum):
+    # A single profiling event, aligned across ETDumps by name and debug handles
+    OPERATOR = "operator"
+    # The summed latency of all events delegated to one backend in a run
+    DELEGATE = "delegate"
+
+
+class RegressionStatus(Enum):
+    REGRESSION = "regression"
+    IMPROVEMENT = "improvement"
+    UNCHANGED = "unchanged"
+    INSUFFICIENT_RUNS = "insufficient_runs"
+    MISSING_IN_BASELINE = "missing_in_baseline"
+    MISSING_IN_CANDIDATE = "missing_in_candidate"
+
+
+def _normalize_debug_handles(debug_handles) -> Optional[Tuple[int, ...]]:
+    if debug_handles is None:
+        return None
+    if isinstance(debug_handles, int):
+        return (debug_handles,)
+    return tuple(debug_handles)
+
+
+def _collect_event_block_samples(
+    event_block: EventBlock,
+) -> Dict[LatencyKey, np.ndarray]:
+    """
+    Collect the per-run latencies of every profiled Event in the EventBlock,
+    along with the per-run latency summed over each delegate backend.
+    """
+    samples: Dict[LatencyKey, np.ndarray] = {}
+    occurrences: Dict[Tuple, int] = defaultdict(int)
+    delegate_totals: Dict[str, np.ndarray] = {}
+    for event in event_block.events:
+        if event.perf_data is None:
+            continue
+        values = np.asarray(event.perf_data.raw, dtype=np.float64)
+        debug_handles = _normalize_debug_handles(event.debug_handles)
+        # The same op can run more than once in a block, tell those apart by
+        # the order they were executed in
+        op_key = (event.name, debug_handles, event.delegate_backend_name)
+        samples[
+            (
+                event_block.name,
+                RegressionScope.OPERATOR.value,
+                *op_key,
+                occurrences[op_key],
+            )
+        ] = values
+        occurrences[op_key] += 1
+
+        backend = event.delegate_backend_name
+        if event.is_delegated_op and backend is not None:
+            total = delegate_totals.get(backend)
+            if total is None:
+                delegate_totals[backend] = values.copy()
+            elif len(total) == len(values):
+                total += values
+
+    for backend, total in delegate_totals.items():
+        key = (
+            event_block.name,
+            RegressionScope.DELEGATE.value,
+            backend,
+            None,
+            backend,
+            0,
+        )
+        samples[key] = total
+    return samples
+
+
+def collect_latency_samples(
+    event_blocks: Iterable[EventBlock],
+) -> Dict[LatencyKey, np.ndarray]:
+    """
+    Collect per-run latency samples from EventBlocks, keyed so that the same op
+    can be matched up across ETDumps. Samples for the same key, e.g. from
+    multiple ETDumps of the same build, are pooled.
+
+    Args:
+        event_blocks: EventBlocks from one or more Inspectors of the same build.
+
+    Returns:
+        A dict mapping (event block name, scope, event name, debug handles,
+        delegate backend name, occurrence) to the per-run latencies, in the
+        target time scale of the Inspectors.
+    """
+    pooled: Dict[LatencyKey, List[np.ndarray]] = defaultdict(list)
+    for event_block in event_blocks:
+        for key, values in _collect_event_block_samples(event_block).items():
+            pooled[key].append(values)
+    return {key: np.concatenate(values) for key, values in pooled.items()}
+
+
+class MultipleTestingCorrection(Enum):
+    # Holm-Bonferroni step-down procedure, controls the family-wise error rate
+    HOLM = "holm"
+    # Bonferroni correction, more conservative than Holm
+    BONFERRONI = "bonferroni"
+    # Test every event at the given confidence level on its own
+    NONE = "none"
+
+
+def _bootstrap_changes(
+    baseline: np.ndarray,
+    candidate: np.ndarray,
+    num_bootstrap: int,
+    rng: np.random.Generator,
+) -> Tuple[float, np.ndarray]:
+    """
+    Returns the relative change in median latency from baseline to candidate,
+    and its bootstrap distribution.
+    """
+    baseline_medians = np.median(
+        rng.choice(baseline, size=(num_bootstrap, len(baseline))), axis=1
+    )
+    candidate_medians = np.median(
+        rng.choice(candidate, size=(num_bootstrap, len(candidate))), axis=1
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        relative_change = np.median(candidate) / np.median(baseline) - 1
+        bootstrap_changes = candidate_medians / baseline_medians - 1
+    return float(relative_change), bootstrap_changes
+
+
+def bootstrap_relative_change(
+    baseline: np.ndarray,
+    candidate: np.ndarray,
+    num_bootstrap: int = 1000,
+    confidence: float = 0.95,
+    rng: Optional[np.random.Generator] = None,
+) -> Tuple[float, float, float]:
+    """
+    Estimate the relative change in median latency from baseline to candidate,
+    with a percentile bootstrap confidence interval. Both sample sets are
+    resampled independently, so they don't need to have the same size.
+
+    Returns:
+        A tuple of (relative change, CI lower bound, CI upper bound), where a
+        relative change of 0.1 means the candidate is 10% slower.
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+    relative_change, bootstrap_changes = _bootstrap_changes(
+        baseline, candidate, num_bootstrap, rng
+    )
+    alpha = (1 - confidence) / 2
+    ci_low, ci_high = np.nanquantile(bootstrap_changes, [alpha, 1 - alpha])
+    return relative_change, float(ci_low), float(ci_high)
+
+
+def _bootstrap_p_value(
+    bootstrap_changes: np.ndarray, min_relative_change: float
+) -> Tuple[float, RegressionStatus]:
+    """
+    Two-sided bootstrap p-value of the relative change lying within
+    [-min_relative_change, min_relative_change], along with the direction of
+    the change. An event whose p-value is below 1 - confidence has its whole
+    percentile confidence interval outside of that band.
+    """
+    bootstrap_changes = bootstrap_changes[~np.isnan(bootstrap_changes)]
+    if len(bootstrap_changes) == 0:
+        return 1.0, RegressionStatus.UNCHANGED
+    not_slower = np.mean(bootstrap_changes <= min_relative_change)
+    not_faster = np.mean(bootstrap_changes >= -min_relative_change)
+    if not_slower <= not_faster:
+        return min(1.0, 2 * float(not_slower)), RegressionStatus.REGRESSION
+    return min(1.0, 2 * float(not_faster)), RegressionStatus.IMPROVEMENT
+
+
+def _significant(
+    p_values: Sequence[float],
+    alpha: float,
+    correction: MultipleTestingCorrection,
+) -> List[bool]:
+    """
+    Returns which of the p_values are significant at the family-wise error rate
+    alpha, under the given multiple testing correction.
+    """
+    num_tests = len(p_values)
+    if correction == MultipleTestingCorrection.NONE:
+        return [p_value < alpha for p_value in p_values]
+    if correction == MultipleTestingCorrection.BONFERRONI:
+        return [p_value < alpha / num_tests for p_value in p_values]
+    significant = [False] * num_tests
+    for rank, index in enumerate(np.argsort(p_values, kind="stable")):
+        if p_values[index] >= alpha / (num_tests - rank):
+            break
+        significant[index] = True
+    return significant
+
+
+def detect_perf_regressions(
+    baseline: Sequence[Inspector],
+    candidate: Sequence[Inspector],
+    num_bootstrap: int = 1000,
+    confidence: float = 0.95,
+    min_relative_change: float = 0.0,
+    min_runs: int = 5,
+    seed: Optional[int] = 0,
+    correction: Union[MultipleTestingCorrection, str] = MultipleTestingCorrection.HOLM,
+) -> pd.DataFrame:
+    """
+    Compare the per-op and per-delegate latencies of two builds and report
+    statistically significant changes.
+
+    Events are aligned across ETDumps by event block name, event name, debug
+    handles and delegate backend. Runs from multiple ETDumps of the same build
+    are pooled. For every aligned event the relative change in median latency is
+    estimated with a bootstrap confidence interval, and the event is reported as
+    a regression (or improvement) only if the change lies above
+    `min_relative_change` (or below `-min_relative_change`) with the given
+    confidence.
+
+    A model has many events, so testing each of them at the confidence level on
+    its own would report some unchanged events as regressions by chance. The
+    confidence is therefore held for all tested events together, with the Holm
+    correction by default. The bootstrap p-values are resolved to
+    1 / num_bootstrap, so for models with many events increase num_bootstrap
+    until that is well below (1 - confidence) / number of events.
+
+    Args:
+        baseline: Inspectors of the ETDumps of the baseline build.
+        candidate: Inspectors of the ETDumps of the candidate build. Use the same
+            target time scale as for the baseline.
+        num_bootstrap: Number of bootstrap resamples.
+        confidence: Confidence level of the interval, e.g. 0.95.
+        min_relative_change: Smallest relative change considered meaningful,
+            e.g. 0.05 to ignore changes below 5%.
+        min_runs: Events with fewer runs than this in either build are reported
+            as insufficient_runs rather than tested.
+        seed: Seed for the bootstrap, for reproducible reports. None to not seed.
+        correction: Correction for testing many events at once, one of "holm",
+            "bonferroni" or "none".
+
+    Returns:
+        pd.DataFrame: One row per aligned event, with the columns event_block_name,
+            scope, event_name, debug_handles, delegate_backend_name,
+            baseline_runs, candidate_runs, baseline_p50, candidate_p50,
+            relative_change, ci_low, ci_high, p_value and status. ci_low and
+            ci_high are the uncorrected confidence interval of the event.
+    """
+    correction = MultipleTestingCorrection(correction)
+    baseline_samples = collect_latency_samples(
+        event_block for inspector in baseline for event_block in inspector.event_blocks
+    )
+    candidate_samples = collect_latency_samples(
+        event_block for inspector in candidate for event_block in inspector.event_blocks
+    )
+    rng = np.random.default_rng(seed)
+
+    rows = []
+    # Indices of the tested rows, with their p-values and direction of change
+    tested: List[Tuple[int, float, RegressionStatus]] = []
+    keys = list(baseline_samples) + [
+        key for key in candidate_samples if key not in baseline_samples
+    ]
+    for key in keys:
+        block_name, scope, event_name, debug_handles, backend, _ = key
+        baseline_values = baseline_samples.get(key)
+        candidate_values = candidate_samples.get(key)
+        row = {
+            "event_block_name": block_name,
+            "scope": scope,
+            "event_name": event_name,
+            "debug_handles": debug_handles,
+            "delegate_backend_name": backend,
+            "baseline_runs": 0 if baseline_values is None else len(baseline_values),
+            "candidate_runs": (
+                0 if candidate_values is None else len(candidate_values)
+            ),
+            "baseline_p50": None,
+            "candidate_p50": None,
+            "relative_change": None,
+            "ci_low": None,
+            "ci_high": None,
+            "p_value": None,
+        }
+        if baseline_values is None:
+            row["status"] = RegressionStatus.MISSING_IN_BASELINE.value
+        elif candidate_values is None:
+            row["status"] = RegressionStatus.MISSING_IN_CANDIDATE.value
+        else:
+            row["baseline_p50"] = float(np.median(baseline_values))
+            row["candidate_p50"] = float(np.median(candidate_values))
+            if min(len(baseline_values), len(candidate_values)) < min_runs:
+                row["status"] = RegressionStatus.INSUFFICIENT_RUNS.value
+            else:
+                relative_change, bootstrap_changes = _bootstrap_changes(
+                    baseline_values, candidate_values, num_bootstrap, rng
+                )
+                alpha = (1 - confidence) / 2
+                ci_low, ci_high = np.nanquantile(bootstrap_changes, [alpha, 1 - alpha])
+                p_value, direction = _bootstrap_p_value(
+                    bootstrap_changes, min_relative_change
+                )
+                row["relative_change"] = relative_change
+                row["ci_low"] = float(ci_low)
+                row["ci_high"] = float(ci_high)
+                row["p_value"] = p_value
+                row["status"] = RegressionStatus.UNCHANGED.value
+                tested.append((len(rows), p_value, direction))
+        rows.append(row)
+
+    significant = _significant(
+        [p_value for _, p_value, _ in tested], 1 - confidence, correction
+    )
+    for (index, _, direction), is_significant in zip(tested, significant):
+        if is_significant:
+            rows[index]["status"] = direction.value
+
+    return pd.DataFrame(rows)
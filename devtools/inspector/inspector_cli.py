@@ -7,16 +7,75 @@
 # pyre-unsafe
 
 import argparse
+import sys
+from typing import List, Optional
 
 from executorch.devtools import Inspector
-from executorch.devtools.inspector import compare_results, TimeScale
+from executorch.devtools.inspector import (
+    compare_results,
+    detect_perf_regressions,
+    MultipleTestingCorrection,
+    RegressionStatus,
+    TimeScale,
+)
+from executorch.devtools.inspector._inspector_utils import display_or_print_df
+
+
+def _create_inspectors(
+    etdump_paths: List[str], etrecord_path: Optional[str], args: argparse.Namespace
+) -> List[Inspector]:
+    return [
+        Inspector(
+            etdump_path=etdump_path,
+            etrecord=etrecord_path,
+            source_time_scale=TimeScale(args.source_time_scale),
+            target_time_scale=TimeScale(args.target_time_scale),
+        )
+        for etdump_path in etdump_paths
+    ]
+
+
+def _report_perf_regressions(args: argparse.Namespace) -> None:
+    df = detect_perf_regressions(
+        baseline=_create_inspectors(
+            args.baseline_etdump_path, args.baseline_etrecord_path, args
+        ),
+        candidate=_create_inspectors(
+            args.candidate_etdump_path, args.candidate_etrecord_path, args
+        ),
+        num_bootstrap=args.num_bootstrap,
+        confidence=args.confidence,
+        min_relative_change=args.min_relative_change,
+        min_runs=args.min_runs,
+        correction=args.correction,
+    )
+    if args.tsv_path:
+        df.to_csv(args.tsv_path, sep="\t")
+
+    if len(df) == 0:
+        print("No profiling events found.")
+        return
+
+    changed = df[
+        df["status"].isin(
+            [RegressionStatus.REGRESSION.value, RegressionStatus.IMPROVEMENT.value]
+        )
+    ].sort_values("relative_change", ascending=False)
+    print(df["status"].value_counts().to_string())
+    display_or_print_df(changed)
+
+    if (
+        args.fail_on_regression
+        and (changed["status"] == RegressionStatus.REGRESSION.value).any()
+    ):
+        sys.exit(1)
 
 
 def main() -> None:
     parser = argparse.ArgumentParser()
     parser.add_argument(
         "--etdump_path",
-        required=True,
+        required=False,
         help="Provide an ETDump file path.",
     )
     parser.add_argument(
@@ -50,8 +109,82 @@ def main() -> None:
     )
     parser.add_argument("--compare_results", action="store_true")
 
+    regression = parser.add_argument_group(
+        "perf regression",
+        "Report per-op and per-delegate latency changes between two builds, "
+        "instead of inspecting a single ETDump.",
+    )
+    regression.add_argument(
+        "--baseline_etdump_path",
+        nargs="+",
+        help="Provide one or more ETDump file paths of the baseline build.",
+    )
+    regression.add_argument(
+        "--candidate_etdump_path",
+        nargs="+",
+        help="Provide one or more ETDump file paths of the candidate build.",
+    )
+    regression.add_argument(
+        "--baseline_etrecord_path",
+        required=False,
+        help="Provide an optional ETRecord file path of the baseline build.",
+    )
+    regression.add_argument(
+        "--candidate_etrecord_path",
+        required=False,
+        help="Provide an optional ETRecord file path of the candidate build.",
+    )
+    regression.add_argument(
+        "--num_bootstrap",
+        type=int,
+        default=1000,
+        help="Number of bootstrap resamples.",
+    )
+    regression.add_argument(
+        "--confidence",
+        type=float,
+        default=0.95,
+        help="Confidence level, held for all events together.",
+    )
+    regression.add_argument(
+        "--correction",
+        type=str,
+        choices=[c.value for c in MultipleTestingCorrection],
+        default=MultipleTestingCorrection.HOLM.value,
+        help="Correction for testing many events at once.",
+    )
+    regression.add_argument(
+        "--min_relative_change",
+        type=float,
+        default=0.0,
+        help="Smallest relative change to report, e.g. 0.05 for 5%%.",
+    )
+    regression.add_argument(
+        "--min_runs",
+        type=int,
+        default=5,
+        help="Minimum number of runs per build for an event to be tested.",
+    )
+    regression.add_argument(
+        "--fail_on_regression",
+        action="store_true",
+        help="Exit with a non-zero status if any regression is found.",
+    )
+
     args = parser.parse_args()
 
+    if args.baseline_etdump_path or args.candidate_etdump_path:
+        if not (args.baseline_etdump_path and args.candidate_etdump_path):
+            parser.error(
+                "--baseline_etdump_path and --candidate_etdump_path must be given together."
+            )
+        _report_perf_regressions(args)
+        return
+    if args.etdump_path is None:
+        parser.error(
+            "--etdump_path is required, unless comparing a baseline and a candidate."
+        )
+
     inspector = Inspector(
         etdump_path=args.etdump_path,
         etrecord=args.etrecord_path,
@@ -7,6 +7,9 @@
 
 # Re-export DebugHandle from _inspector_utils for convenience
 from executorch.devtools.inspector._inspector_utils import DebugHandle
+from executorch.devtools.inspector.numerical_comparator.cosine_numerical_comparator import (
+    CosineSimilarityComparator,
+)
 from executorch.devtools.inspector.numerical_comparator.l1_numerical_comparator import (
     L1Comparator,
 )
@@ -26,6 +29,7 @@ from executorch.devtools.inspector.numerical_comparator.snr_numerical_comparator
 
 
 __all__ = [
+    "CosineSimilarityComparator",
     "DebugHandle",
     "IntermediateOutputMapping",
     "L1Comparator",
@@ -0,0 +1,62 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# All rights reserved.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+
+from typing import Any, Optional, TYPE_CHECKING
+
+import torch
+from executorch.devtools.inspector._inspector_utils import (
+    can_compare_in_chunks,
+    convert_to_float_tensor,
+    iter_float_tensor_chunks,
+)
+from executorch.devtools.inspector.numerical_comparator.numerical_comparator_base import (
+    NumericalComparatorBase,
+)
+
+if TYPE_CHECKING:
+    from executorch.devtools.inspector._inspector import Inspector
+
+
+class CosineSimilarityComparator(NumericalComparatorBase):
+    """Cosine similarity comparator for numerical discrepancy detection.
+
+    Unlike the distance based comparators, higher values indicate better
+    agreement: 1.0 means the outputs point in the same direction.
+    """
+
+    def __init__(self, inspector: Optional["Inspector"] = None) -> None:
+        super().__init__(inspector)
+
+    def element_compare(self, a: Any, b: Any) -> float:
+        """
+        Compare the cosine similarity between two inputs, treated as flat vectors
+        Formula: cos = sum(a * b) / (sqrt(sum(a^2)) * sqrt(sum(b^2)))
+        """
+
+        if can_compare_in_chunks(a, b):
+            chunks = iter_float_tensor_chunks(a, b)
+        else:
+            t_a = convert_to_float_tensor(a)
+            t_b = convert_to_float_tensor(b)
+            if t_a.shape != t_b.shape:
+                raise ValueError(
+                    f"Error computing cosine similarity between tensors: shape mismatch {t_a.shape} vs {t_b.shape}"
+                )
+            chunks = iter([(t_a.reshape(-1), t_b.reshape(-1))])
+
+        dot_product = torch.zeros((), dtype=torch.float64)
+        squared_norm_a = torch.zeros((), dtype=torch.float64)
+        squared_norm_b = torch.zeros((), dtype=torch.float64)
+        for c_a, c_b in chunks:
+            dot_product += torch.sum(c_a * c_b)
+            squared_norm_a += torch.sum(torch.pow(c_a, 2))
+            squared_norm_b += torch.sum(torch.pow(c_b, 2))
+
+        similarity = dot_product / (
+            torch.sqrt(squared_norm_a) * torch.sqrt(squared_norm_b)
+        )
+        return similarity.item()
@@ -7,7 +7,11 @@
 from typing import Any, Optional, TYPE_CHECKING
 
 import torch
-from executorch.devtools.inspector._inspector_utils import convert_to_float_tensor
+from executorch.devtools.inspector._inspector_utils import (
+    can_compare_in_chunks,
+    convert_to_float_tensor,
+    iter_float_tensor_chunks,
+)
 from executorch.devtools.inspector.numerical_comparator.numerical_comparator_base import (
     NumericalComparatorBase,
 )
@@ -25,6 +29,12 @@ class MSEComparator(NumericalComparatorBase):
     def element_compare(self, a: Any, b: Any) -> float:
         """Compare mean squared difference between two outputs."""
 
+        if can_compare_in_chunks(a, b):
+            squared_error = 0.0
+            for c_a, c_b in iter_float_tensor_chunks(a, b):
+                squared_error += float(torch.sum(torch.square(c_a - c_b)))
+            return squared_error / a.numel()
+
         t_a = convert_to_float_tensor(a)
         t_b = convert_to_float_tensor(b)
 
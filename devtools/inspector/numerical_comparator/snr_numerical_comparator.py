@@ -8,7 +8,11 @@
 from typing import Any, Optional, TYPE_CHECKING
 
 import torch
-from executorch.devtools.inspector._inspector_utils import convert_to_float_tensor
+from executorch.devtools.inspector._inspector_utils import (
+    can_compare_in_chunks,
+    convert_to_float_tensor,
+    iter_float_tensor_chunks,
+)
 from executorch.devtools.inspector.numerical_comparator.numerical_comparator_base import (
     NumericalComparatorBase,
 )
@@ -29,6 +33,18 @@ class SNRComparator(NumericalComparatorBase):
         Formula: SNR = 10 * log10(original_power / error_power)
         """
 
+        if can_compare_in_chunks(a, b):
+            original_energy = 0.0
+            error_energy = 0.0
+            for c_a, c_b in iter_float_tensor_chunks(a, b):
+                original_energy += float(torch.sum(torch.pow(c_a, 2)))
+                error_energy += float(torch.sum(torch.pow(c_a - c_b, 2)))
+            original_power = torch.tensor(
+                original_energy / a.numel(), dtype=torch.float64
+            )
+            error_power = torch.tensor(error_energy / a.numel(), dtype=torch.float64)
+            return (10 * torch.log10(original_power / error_power)).item()
+
         t_a = convert_to_float_tensor(a)
         t_b = convert_to_float_tensor(b)
 
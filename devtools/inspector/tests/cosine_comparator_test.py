@@ -0,0 +1,72 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# All rights reserved.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+import math
+import unittest
+
+import torch
+
+from executorch.devtools.inspector._inspector_utils import NUMERIC_GAP_CHUNK_NUMEL
+from executorch.devtools.inspector.numerical_comparator import (
+    CosineSimilarityComparator,
+)
+
+
+class TestCosineSimilarityComparator(unittest.TestCase):
+    cosine_comparator = CosineSimilarityComparator()
+
+    def test_identical_tensors(self):
+        a = torch.tensor([[10, 4], [3, 4]])
+        b = torch.tensor([[10, 4], [3, 4]])
+        result = self.cosine_comparator.element_compare(a, b)
+        self.assertAlmostEqual(result, 1.0)
+
+    def test_opposite_tensors(self):
+        a = torch.tensor([1.0, -2.0, 3.0])
+        b = -a
+        result = self.cosine_comparator.element_compare(a, b)
+        self.assertAlmostEqual(result, -1.0)
+
+    def test_orthogonal_tensors(self):
+        a = torch.tensor([1.0, 0.0])
+        b = torch.tensor([0.0, 5.0])
+        result = self.cosine_comparator.element_compare(a, b)
+        self.assertAlmostEqual(result, 0.0)
+
+    def test_scalar(self):
+        a = 10
+        b = 2
+        result = self.cosine_comparator.element_compare(a, b)
+        self.assertAlmostEqual(result, 1.0)
+
+    def test_zero_tensor(self):
+        a = torch.zeros(3)
+        b = torch.tensor([1.0, 2.0, 3.0])
+        result = self.cosine_comparator.element_compare(a, b)
+        self.assertTrue(math.isnan(result))
+
+    def test_shape_mismatch_raises_exception(self):
+        a = torch.tensor([0, 2, -1])
+        b = torch.tensor([1, 1, -3, 4])
+        with self.assertRaises(ValueError):
+            self.cosine_comparator.element_compare(a, b)
+
+    def test_2D_tensors(self):
+        # dot = 4 + 18 + 18 + 20 = 60, |a|^2 = 16 + 81 + 36 + 16 = 149, |b|^2 = 1 + 4 + 9 + 25 = 39
+        a = torch.tensor([[4, 9], [6, 4]])
+        b = torch.tensor([[1, 2], [3, 5]])
+        expected = 60 / math.sqrt(149 * 39)
+        result = self.cosine_comparator.element_compare(a, b)
+        self.assertAlmostEqual(result, expected)
+
+    def test_large_tensors_compared_in_chunks(self):
+        a = torch.randn(NUMERIC_GAP_CHUNK_NUMEL * 2 + 3, dtype=torch.float32)
+        b = a + torch.randn_like(a) * 0.1
+        expected = torch.nn.functional.cosine_similarity(
+            a.double(), b.double(), dim=0
+        ).item()
+        result = self.cosine_comparator.element_compare(a, b)
+        self.assertAlmostEqual(result, expected)
@@ -5,6 +5,7 @@
 # LICENSE file in the root directory of this source tree.
 
 # pyre-strict
+import json
 import unittest
 from typing import List, Optional, Tuple, Union
 
@@ -14,10 +15,15 @@ from executorch.devtools.inspector import Event, EventBlock, PerfData
 from executorch.devtools.inspector._inspector import (
     DelegateMetadata,
     EventSignature,
-    InstructionEvent,
-    InstructionEventSignature,
     ProfileEventSignature,
 )
+from executorch.devtools.inspector._inspector_utils import (
+    calculate_time_scale_factor,
+    TimeScale,
+)
+from executorch.devtools.inspector.tests.inspector_test_utils import (
+    gen_event_from_profile_events,
+)
 
 
 class TestEventBlock(unittest.TestCase):
@@ -445,7 +451,7 @@ class TestEventBlock(unittest.TestCase):
             instruction_id: int,
             delegate_debug_id_int: Optional[int] = None,
             delegate_debug_id_str: Optional[str] = None,
-            scale_factor: int = 1000,
+            target_time_scale: TimeScale = TimeScale.US,
         ) -> None:
             """
             Helper function for testing that the provided ProfileEvent fields are
@@ -493,18 +499,12 @@ class TestEventBlock(unittest.TestCase):
                 )
                 for index, time in enumerate(durations)
             ]
-            instruction_events = [
-                InstructionEvent(
-                    signature=InstructionEventSignature(
-                        instruction_id=instruction_id, chain_index=0
-                    ),
-                    profile_events=[profile_event],
-                )
-                for profile_event in profile_events
-            ]
-            event = Event._gen_from_inference_events(
-                event_signature, instruction_events, scale_factor=scale_factor
+            event = gen_event_from_profile_events(
+                profile_events,
+                source_time_scale=TimeScale.NS,
+                target_time_scale=target_time_scale,
             )
+            scale_factor = calculate_time_scale_factor(TimeScale.NS, target_time_scale)
 
             is_delegated = delegate_debug_id is not None
             expected_event = Event(
@@ -553,7 +553,7 @@ class TestEventBlock(unittest.TestCase):
 
         # Manipulating the scale factor
         _test_profile_event_generation(
-            "delegate", 1, None, "identifier", scale_factor=10000
+            "delegate", 1, None, "identifier", target_time_scale=TimeScale.MS
         )
 
     def test_gen_resolve_debug_handles(self) -> None:
@@ -565,22 +565,7 @@ class TestEventBlock(unittest.TestCase):
             """
             Helper function to generate an Event given a set of ProfileEvents
             """
-            profile_event = events[0]
-            profile_signature = ProfileEventSignature._gen_from_event(profile_event)
-            event_signature = EventSignature(
-                profile_event.instruction_id, profile_signature
-            )
-            instruction_events = [
-                InstructionEvent(
-                    signature=InstructionEventSignature(
-                        instruction_id=profile_event.instruction_id,
-                        chain_index=profile_event.chain_index,
-                    ),
-                    profile_events=[event],
-                )
-                for event in events
-            ]
-            return Event._gen_from_inference_events(event_signature, instruction_events)
+            return gen_event_from_profile_events(events)
 
         # Create Test Data
 
@@ -655,3 +640,138 @@ class TestEventBlock(unittest.TestCase):
                 self.assertEqual(
                     event.debug_handles, handle_map[str(event._instruction_id)]
                 )
+
+    def test_gen_from_etdump_event_store(self) -> None:
+        """
+        Test that EventBlocks generated from an ETDump are backed by a columnar
+        EventStore, and that the aggregated perf data matches the raw values
+        """
+        etdump: ETDumpFlatCC = TestEventBlock._get_sample_etdump_flatcc()
+        blocks: List[EventBlock] = EventBlock._gen_from_etdump(etdump)
+
+        block_a = next(block for block in blocks if block.name == "signature_a")
+        store = block_a.event_store
+        assert store is not None
+        self.assertEqual((store.num_runs, store.num_events), (2, 1))
+        self.assertEqual(store.instruction_ids.tolist(), [1])
+        self.assertEqual(store.start_times[:, 0].tolist(), [0, 2])
+        self.assertEqual(store.end_times[:, 0].tolist(), [1, 4])
+
+        # Delegated events without a time scale converter keep the raw durations
+        perf_data = block_a.events[0].perf_data
+        assert perf_data is not None
+        self.assertEqual(perf_data.raw, [1.0, 2.0])
+        self.assertEqual(perf_data.p10, PerfData([1.0, 2.0]).p10)
+        self.assertEqual(perf_data.p50, 1.5)
+        self.assertEqual(perf_data.p90, PerfData([1.0, 2.0]).p90)
+        self.assertEqual(block_a.events[0].start_time, [0, 2])
+
+        df = block_a.to_run_dataframe()
+        self.assertEqual(len(df), 2)
+        self.assertEqual(df["run_index"].tolist(), [0, 1])
+        self.assertEqual(df["instruction_id"].tolist(), [1, 1])
+        self.assertEqual(df["duration"].tolist(), [1.0, 2.0])
+
+        # EventBlocks that are not generated from an ETDump have no store
+        with self.assertRaises(RuntimeError):
+            EventBlock(name="no_store").to_run_dataframe()
+
+    def test_event_block_to_dataframe_mixed_perf_data(self) -> None:
+        """
+        Test that EventBlock.to_dataframe handles Events with and without perf data
+        """
+        etdump: ETDumpFlatCC = (
+            TestEventBlock._get_sample_etdump_flatcc_profiling_and_debugging()
+        )
+        blocks: List[EventBlock] = EventBlock._gen_from_etdump(etdump)
+        events = blocks[1].events + [Event(name="no_perf_data")]
+        df = EventBlock(name="mixed", events=events).to_dataframe()
+
+        self.assertEqual(len(df), 3)
+        self.assertEqual(df["event_name"].tolist()[-1], "no_perf_data")
+        self.assertIsNone(df["p50"].tolist()[-1])
+        self.assertEqual(len(df["raw"].tolist()[0]), 1)
+
+    def test_event_block_to_trace_events(self) -> None:
+        """
+        Test that EventBlock.to_trace_events emits one track per run, converts
+        times to microseconds and orders delegated events after their parent
+        """
+        delegate_call = Event(
+            name="DELEGATE_CALL",
+            perf_data=PerfData([0.002, 0.001]),
+            is_delegated_op=False,
+            _instruction_id=0,
+            _start_time=[1000, 5000],
+        )
+        delegated = Event(
+            name="conv",
+            perf_data=PerfData([500, 300]),
+            debug_handles=(3, 4),
+            is_delegated_op=True,
+            delegate_backend_name="backend",
+            delegate_debug_identifier=7,
+            stack_traces={"conv": "model.py:10"},
+            _delegate_debug_metadatas=["a", "b"],
+            _start_time=[1000, 5100],
+        )
+        block = EventBlock(name="Execute", events=[delegated, delegate_call])
+
+        trace_events = block.to_trace_events(pid=2)
+        metadata = [e for e in trace_events if e["ph"] == "M"]
+        slices = [e for e in trace_events if e["ph"] == "X"]
+
+        self.assertEqual(
+            [e["args"]["name"] for e in metadata], ["Execute", "Run 0", "Run 1"]
+        )
+        self.assertTrue(all(e["pid"] == 2 for e in trace_events))
+        self.assertEqual(
+            [(e["name"], e["tid"], e["ts"], e["dur"]) for e in slices],
+            [
+                ("DELEGATE_CALL", 0, 1.0, 2.0),
+                ("conv", 0, 1.0, 0.5),
+                ("DELEGATE_CALL", 1, 5.0, 1.0),
+                ("conv", 1, 5.1, 0.3),
+            ],
+        )
+        conv_args = slices[1]["args"]
+        self.assertEqual(conv_args["debug_handles"], (3, 4))
+        self.assertEqual(conv_args["delegate_backend_name"], "backend")
+        self.assertEqual(conv_args["delegate_debug_identifier"], 7)
+        self.assertEqual(conv_args["stack_traces"], {"conv": "model.py:10"})
+        self.assertEqual(conv_args["delegate_debug_metadata"], "a")
+        self.assertEqual(slices[0]["cat"], "operator")
+        self.assertEqual(slices[1]["cat"], "delegate")
+
+        trace_events = block.to_trace_events(include_stack_traces=False)
+        self.assertTrue(all("stack_traces" not in e["args"] for e in trace_events))
+
+    def test_event_block_to_trace_events_bytes_metadata(self) -> None:
+        """
+        Test that EventBlock.to_trace_events emits JSON serializable delegate
+        debug metadata, parsed if a parser is available and hex encoded otherwise
+        """
+        delegated = Event(
+            name="conv",
+            perf_data=PerfData([500, 300]),
+            is_delegated_op=True,
+            delegate_backend_name="backend",
+            _delegate_debug_metadatas=[b"\x00\x01", b"\xff"],
+            _start_time=[1000, 5100],
+        )
+        block = EventBlock(name="Execute", events=[delegated])
+
+        slices = [e for e in block.to_trace_events() if e["ph"] == "X"]
+        self.assertEqual(
+            [e["args"]["delegate_debug_metadata"] for e in slices], ["0001", "ff"]
+        )
+        json.dumps(slices)
+
+        delegated._delegate_metadata_parser = lambda metadatas: {
+            "sizes": [len(m) for m in metadatas]
+        }
+        slices = [e for e in block.to_trace_events() if e["ph"] == "X"]
+        for e in slices:
+            self.assertNotIn("delegate_debug_metadata", e["args"])
+            self.assertEqual(e["args"]["delegate_debug_metadatas"], {"sizes": [2, 1]})
+        json.dumps(slices)
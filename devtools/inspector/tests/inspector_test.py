@@ -7,6 +7,7 @@
 # pyre-unsafe
 
 import copy
+import json
 import os
 import random
 import statistics
@@ -43,12 +44,12 @@ from executorch.devtools.inspector._inspector import (
     flatcc,
     InstructionEvent,
     InstructionEventSignature,
-    ProfileEventSignature,
     TimeScale,
 )
 from executorch.devtools.inspector.tests.inspector_test_utils import (
     check_if_debug_handle_to_op_names_match,
     check_if_intermediate_outputs_match,
+    gen_event_from_profile_events,
     model_registry,
 )
 from executorch.exir import (
@@ -188,6 +189,68 @@ class TestInspector(unittest.TestCase):
             with redirect_stdout(None):
                 inspector_instance.print_data_tabular()
 
+    def test_inspector_export_trace(self):
+        # Create a context manager to patch functions called by Inspector.__init__
+        with patch.object(
+            _inspector, "parse_etrecord", return_value=None
+        ), patch.object(
+            _inspector, "gen_etdump_object", return_value=None
+        ), patch.object(
+            EventBlock, "_gen_from_etdump"
+        ), patch.object(
+            _inspector, "gen_graphs_from_etrecord"
+        ):
+            inspector_instance = Inspector(
+                etdump_path=ETDUMP_PATH,
+                etrecord=ETRECORD_PATH,
+            )
+            inspector_instance.event_blocks = [
+                EventBlock(
+                    name="Init",
+                    events=[
+                        Event(
+                            name="Method::init",
+                            perf_data=PerfData([0.5]),
+                            _start_time=[0],
+                        )
+                    ],
+                ),
+                EventBlock(
+                    name=EVENT_BLOCK_NAME,
+                    events=[
+                        Event(
+                            name="op_0",
+                            perf_data=PerfData([0.001, 0.002]),
+                            debug_handles=1,
+                            stack_traces={"op_0": "model.py:1"},
+                            _start_time=[1000000, 2000000],
+                        ),
+                        # Events without profiling data are not part of the trace
+                        Event(name="op_1"),
+                    ],
+                ),
+            ]
+
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                trace_path = os.path.join(tmp_dir, "trace.json")
+                trace = inspector_instance.export_trace(trace_path)
+                with open(trace_path) as f:
+                    self.assertEqual(json.load(f), json.loads(json.dumps(trace)))
+
+            slices = [e for e in trace["traceEvents"] if e["ph"] == "X"]
+            self.assertEqual(
+                [(e["name"], e["pid"], e["tid"], e["ts"], e["dur"]) for e in slices],
+                [
+                    ("Method::init", 0, 0, 0.0, 500.0),
+                    ("op_0", 1, 0, 1000.0, 1.0),
+                    ("op_0", 1, 1, 2000.0, 2.0),
+                ],
+            )
+            self.assertEqual(
+                slices[1]["args"],
+                {"debug_handles": 1, "stack_traces": {"op_0": "model.py:1"}},
+            )
+
     def test_inspector_associate_with_op_graph_nodes_single_debug_handle(self):
         # Test on an event with a single debug handle
         debug_handle = 111
@@ -287,41 +350,24 @@ class TestInspector(unittest.TestCase):
         def time_scale_converter(event_name, time):
             return time / 10
 
-        event = Event(
-            name="",
-            _delegate_metadata_parser=None,
-            _delegate_time_scale_converter=None,
-        )
-        event_signature = ProfileEventSignature(
-            name="",
-            instruction_id=0,
-            delegate_id_str="test_event",
-        )
-        instruction_events = [
-            InstructionEvent(
-                signature=InstructionEventSignature(0, 0),
-                profile_events=[
-                    ProfileEvent(
-                        name="test_event",
-                        chain_index=0,
-                        instruction_id=0,
-                        delegate_debug_id_int=None,
-                        delegate_debug_id_str="test_event_delegated",
-                        start_time=100,
-                        end_time=200,
-                        delegate_debug_metadata=None,
-                    )
-                ],
+        profile_events = [
+            ProfileEvent(
+                name="test_event",
+                chain_index=0,
+                instruction_id=0,
+                delegate_debug_id_int=-1,
+                delegate_debug_id_str="test_event_delegated",
+                start_time=100,
+                end_time=200,
+                delegate_debug_metadata=None,
             )
         ]
-        Event._populate_profiling_related_fields(
-            event, event_signature, instruction_events, 1
-        )
+        event = gen_event_from_profile_events(profile_events)
         # Value of the perf data before scaling is done.
         self.assertEqual(event.perf_data.raw[0], 100)
-        event._delegate_time_scale_converter = time_scale_converter
-        Event._populate_profiling_related_fields(
-            event, event_signature, instruction_events, 1
+        event = gen_event_from_profile_events(
+            profile_events,
+            delegate_time_scale_converter=time_scale_converter,
         )
         # Value of the perf data after scaling is done. 200/10 - 100/10.
         self.assertEqual(event.perf_data.raw[0], 10)
@@ -721,7 +767,7 @@ class TestInspector(unittest.TestCase):
                 )
             )
             inspector_instance._get_aot_intermediate_outputs_and_op_names = (
-                lambda reference_graph_module: (
+                lambda reference_graph_module, spill=None: (
                     aot_intermediate_outputs,
                     aot_debug_handle_to_op_name,
                 )
@@ -812,7 +858,7 @@ class TestInspector(unittest.TestCase):
                 )
             )
             inspector_instance._get_aot_intermediate_outputs_and_op_names = (
-                lambda reference_graph_module: (
+                lambda reference_graph_module, spill=None: (
                     aot_intermediate_outputs,
                     aot_debug_handle_to_op_name,
                 )
@@ -897,7 +943,7 @@ class TestInspector(unittest.TestCase):
                 )
             )
             inspector_instance._get_aot_intermediate_outputs_and_op_names = (
-                lambda reference_graph_module: (
+                lambda reference_graph_module, spill=None: (
                     aot_intermediate_outputs,
                     aot_debug_handle_to_op_name,
                 )
@@ -1038,7 +1084,7 @@ class TestInspector(unittest.TestCase):
                 )
             )
             inspector_instance._get_aot_intermediate_outputs_and_op_names = (
-                lambda reference_graph_module: (
+                lambda reference_graph_module, spill=None: (
                     aot_intermediate_outputs,
                     aot_debug_handle_to_op_name,
                 )
@@ -1215,7 +1261,7 @@ class TestInspector(unittest.TestCase):
                 )
             )
             inspector_instance._get_aot_intermediate_outputs_and_op_names = (
-                lambda reference_graph_module: (
+                lambda reference_graph_module, spill=None: (
                     aot_intermediate_outputs,
                     aot_debug_handle_to_op_name,
                 )
@@ -1475,7 +1521,7 @@ class TestInspector(unittest.TestCase):
                 )
             )
             inspector_instance._get_aot_intermediate_outputs_and_op_names = (
-                lambda reference_graph_module: (
+                lambda reference_graph_module, spill=None: (
                     aot_intermediate_outputs,
                     aot_debug_handle_to_op_name,
                 )
@@ -1496,6 +1542,81 @@ class TestInspector(unittest.TestCase):
             self.assertIsInstance(df, pd.DataFrame)
             self.assertEqual(len(df), 1)
 
+    def test_calculate_numeric_gap_streaming(self):
+        """Test calculate_numeric_gap spills the AOT intermediate outputs when streaming."""
+        with patch.object(
+            _inspector, "parse_etrecord", return_value=None
+        ), patch.object(
+            _inspector, "gen_etdump_object", return_value=None
+        ), patch.object(
+            EventBlock, "_gen_from_etdump"
+        ), patch.object(
+            _inspector, "gen_graphs_from_etrecord"
+        ):
+            inspector_instance = Inspector(
+                etdump_path=ETDUMP_PATH,
+                etrecord=ETRECORD_PATH,
+            )
+
+            aot_intermediate_outputs = {
+                (0,): torch.tensor([1.0, 2.0, 3.0]),
+                (1,): torch.tensor([4.0, 5.0, 6.0]),
+            }
+            runtime_intermediate_outputs = {
+                (0,): ([torch.tensor([2.0, 1.0, 4.0])], 1),
+                (1,): ([torch.tensor([3.0, 6.0, 5.0])], 1),
+            }
+            aot_debug_handle_to_op_name = {(0,): "op_0", (1,): "op_1"}
+            runtime_debug_handle_to_op_name = {(0,): "op_0", (1,): "op_1"}
+
+            spills = []
+
+            def get_aot_intermediate_outputs_and_op_names(
+                reference_graph_module, spill
+            ):
+                spills.append(spill)
+                for debug_handle, output in aot_intermediate_outputs.items():
+                    spill.add(debug_handle, output)
+                return spill, aot_debug_handle_to_op_name
+
+            inspector_instance._resolve_reference_graph = (
+                lambda ref_graph=None, disable_validation=False: (
+                    MagicMock(),
+                    "exported_program",
+                )
+            )
+            inspector_instance._get_aot_intermediate_outputs_and_op_names = (
+                get_aot_intermediate_outputs_and_op_names
+            )
+            inspector_instance._get_runtime_intermediate_outputs_and_op_names = (
+                lambda: (runtime_intermediate_outputs, runtime_debug_handle_to_op_name)
+            )
+            inspector_instance._get_aot_debug_handle_to_stack_traces = (
+                lambda reference_graph_module, resolved_graph_name: {}
+            )
+
+            with tempfile.TemporaryDirectory() as spill_dir:
+                df = inspector_instance.calculate_numeric_gap(
+                    distance="COSINE", streaming=True, spill_dir=spill_dir
+                )
+
+            self.assertEqual(len(spills), 1)
+            self.assertEqual(len(df), 2)
+            for i, row in df.iterrows():
+                key = (i,)
+                # The spilled outputs stay readable after the spill file is closed
+                self.assertTrue(
+                    torch.equal(
+                        row["aot_intermediate_output"], aot_intermediate_outputs[key]
+                    )
+                )
+                expected = torch.nn.functional.cosine_similarity(
+                    aot_intermediate_outputs[key].double(),
+                    runtime_intermediate_outputs[key][0][0].double(),
+                    dim=0,
+                ).item()
+                self.assertAlmostEqual(row["gap"][0], expected)
+
     @unittest.skipIf(sys.platform.startswith("win"), "Skipping on Windows")
     def test_transformer_block_xnnpack_numeric_gap_within_tolerance(self):
         """
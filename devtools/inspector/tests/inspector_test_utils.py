@@ -6,9 +6,14 @@
 
 # pyre-unsafe
 
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import executorch.devtools.etdump.schema_flatcc as flatcc
 import torch
 import torch.nn as nn
 import torch.nn.functional as F
+from executorch.devtools.inspector._inspector import Event, EventBlock
+from executorch.devtools.inspector._inspector_utils import TimeScale
 
 from executorch.exir.debug_handle_utils import UNSET_DEBUG_HANDLE
 
@@ -187,3 +192,45 @@ def check_if_debug_handle_to_op_names_match(
         if actual_op_name != expected_op_name:
             return False
     return True
+
+
+def gen_event_from_profile_events(
+    profile_events: List[flatcc.ProfileEvent],
+    source_time_scale: TimeScale = TimeScale.NS,
+    target_time_scale: TimeScale = TimeScale.NS,
+    delegate_metadata_parser: Optional[Callable[[List[str]], Dict[str, Any]]] = None,
+    delegate_time_scale_converter: Optional[
+        Callable[[Union[int, str], Union[int, float]], Union[int, float]]
+    ] = None,
+) -> Event:
+    """
+    Generates the Event of a ProfileEvent recorded once per run, with
+    EventBlock._gen_from_etdump on an ETDump holding one RunData per run.
+    """
+    etdump = flatcc.ETDumpFlatCC(
+        version=0,
+        run_data=[
+            flatcc.RunData(
+                name="signature",
+                bundled_input_index=-1,
+                allocators=[],
+                events=[
+                    flatcc.Event(
+                        allocation_event=None,
+                        debug_event=None,
+                        profile_event=profile_event,
+                    )
+                ],
+            )
+            for profile_event in profile_events
+        ],
+    )
+    (event_block,) = EventBlock._gen_from_etdump(
+        etdump,
+        source_time_scale=source_time_scale,
+        target_time_scale=target_time_scale,
+        delegate_metadata_parser=delegate_metadata_parser,
+        delegate_time_scale_converter=delegate_time_scale_converter,
+    )
+    (event,) = event_block.events
+    return event
@@ -0,0 +1,103 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# All rights reserved.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+# pyre-unsafe
+
+import tempfile
+import unittest
+
+import torch
+
+from executorch.devtools.inspector._intermediate_output_capturer import (
+    IntermediateOutputCapturer,
+)
+from executorch.devtools.inspector._intermediate_output_spill import (
+    IntermediateOutputSpill,
+)
+from executorch.devtools.inspector.tests.inspector_test_utils import (
+    check_if_intermediate_outputs_match,
+    model_registry,
+)
+from torch.export import export
+
+
+class TestIntermediateOutputSpill(unittest.TestCase):
+    def _assert_output_equal(self, actual, expected):
+        if isinstance(expected, torch.Tensor):
+            self.assertIsInstance(actual, torch.Tensor)
+            self.assertEqual(actual.dtype, expected.dtype)
+            self.assertEqual(actual.shape, expected.shape)
+            self.assertTrue(torch.equal(actual, expected))
+        elif isinstance(expected, list):
+            self.assertEqual(len(actual), len(expected))
+            for a, e in zip(actual, expected):
+                self._assert_output_equal(a, e)
+        else:
+            self.assertEqual(actual, expected)
+
+    def test_round_trip(self):
+        outputs = {
+            (1,): torch.randn(3, 4),
+            (2,): torch.arange(10, dtype=torch.int64),
+            (3,): torch.tensor([True, False, True]),
+            (4,): torch.randn(5, dtype=torch.bfloat16),
+            (5,): torch.tensor(2.5),
+            (6,): torch.empty(0, 3),
+            (7, 8): [torch.randn(2, 2), torch.ones(3, dtype=torch.float16), None],
+            (9,): 3,
+            (10,): None,
+        }
+        with tempfile.TemporaryDirectory() as spill_dir:
+            with IntermediateOutputSpill(spill_dir) as spill:
+                for debug_handle, output in outputs.items():
+                    spill.add(debug_handle, output)
+
+                self.assertEqual(list(spill.keys()), list(outputs.keys()))
+                self.assertEqual(len(spill), len(outputs))
+                self.assertGreater(spill.nbytes, 0)
+                for debug_handle, output in outputs.items():
+                    self._assert_output_equal(spill[debug_handle], output)
+
+    def test_non_contiguous_tensor(self):
+        tensor = torch.arange(12, dtype=torch.float32).reshape(3, 4).t()
+        with IntermediateOutputSpill() as spill:
+            spill.add((1,), tensor)
+            self.assertTrue(torch.equal(spill[(1,)], tensor))
+
+    def test_add_after_read(self):
+        with IntermediateOutputSpill() as spill:
+            spill.add((1,), torch.ones(4))
+            self.assertTrue(torch.equal(spill[(1,)], torch.ones(4)))
+            spill.add((2,), torch.zeros(8))
+            self.assertTrue(torch.equal(spill[(1,)], torch.ones(4)))
+            self.assertTrue(torch.equal(spill[(2,)], torch.zeros(8)))
+
+    def test_tensors_valid_after_close(self):
+        spill = IntermediateOutputSpill()
+        spill.add((1,), torch.arange(6, dtype=torch.float32))
+        tensor = spill[(1,)]
+        spill.close()
+        self.assertTrue(torch.equal(tensor, torch.arange(6, dtype=torch.float32)))
+
+    def test_capturer_with_spill(self):
+        for model_name, model_cls in model_registry.items():
+            with self.subTest(model=model_name):
+                model = model_cls()
+                input_tensor = model.get_input()
+                ep = export(model, (input_tensor,))
+
+                expected = IntermediateOutputCapturer(ep.module()).run_and_capture(
+                    input_tensor
+                )
+                with IntermediateOutputSpill() as spill:
+                    captured = IntermediateOutputCapturer(
+                        ep.module(), spill=spill
+                    ).run_and_capture(input_tensor)
+                    self.assertIs(captured, spill)
+                    self.assertEqual(list(captured.keys()), list(expected.keys()))
+                    self.assertTrue(
+                        check_if_intermediate_outputs_match(dict(captured), expected)
+                    )
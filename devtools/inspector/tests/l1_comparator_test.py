@@ -8,6 +8,7 @@ import unittest
 
 import torch
 
+from executorch.devtools.inspector._inspector_utils import NUMERIC_GAP_CHUNK_NUMEL
 from executorch.devtools.inspector.numerical_comparator import L1Comparator
 
 
@@ -47,3 +48,10 @@ class TestL1Comparator(unittest.TestCase):
         expected = 14.0
         result = self.l1_comparator.element_compare(a, b)
         self.assertAlmostEqual(result, expected)
+
+    def test_large_tensors_compared_in_chunks(self):
+        a = torch.randint(-4, 4, (NUMERIC_GAP_CHUNK_NUMEL * 2 + 3,))
+        b = torch.randint(-4, 4, (NUMERIC_GAP_CHUNK_NUMEL * 2 + 3,))
+        expected = float(torch.abs(a - b).sum())
+        result = self.l1_comparator.element_compare(a, b)
+        self.assertAlmostEqual(result, expected)
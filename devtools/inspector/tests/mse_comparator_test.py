@@ -8,6 +8,7 @@ import unittest
 
 import torch
 
+from executorch.devtools.inspector._inspector_utils import NUMERIC_GAP_CHUNK_NUMEL
 from executorch.devtools.inspector.numerical_comparator import MSEComparator
 
 
@@ -47,3 +48,10 @@ class TestMSEComparator(unittest.TestCase):
         expected = (9.0 + 49.0 + 9.0 + 36.0) / 4.0
         result = self.mse_comparator.element_compare(a, b)
         self.assertAlmostEqual(result, expected)
+
+    def test_large_tensors_compared_in_chunks(self):
+        a = torch.randn(NUMERIC_GAP_CHUNK_NUMEL * 2 + 3, dtype=torch.float32)
+        b = a + torch.randn_like(a) * 0.1
+        expected = torch.mean(torch.square(a.double() - b.double())).item()
+        result = self.mse_comparator.element_compare(a, b)
+        self.assertAlmostEqual(result, expected)
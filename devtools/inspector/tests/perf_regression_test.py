@@ -0,0 +1,217 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# All rights reserved.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+# pyre-unsafe
+
+import unittest
+from typing import List, Optional
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from executorch.devtools.inspector import (
+    bootstrap_relative_change,
+    collect_latency_samples,
+    detect_perf_regressions,
+    Event,
+    EventBlock,
+    MultipleTestingCorrection,
+    PerfData,
+    RegressionScope,
+    RegressionStatus,
+)
+
+
+def _event(
+    name: str,
+    latencies: List[float],
+    debug_handles: Optional[int] = None,
+    delegate_backend_name: Optional[str] = None,
+) -> Event:
+    return Event(
+        name=name,
+        perf_data=PerfData(latencies),
+        debug_handles=debug_handles,
+        is_delegated_op=delegate_backend_name is not None,
+        delegate_backend_name=delegate_backend_name,
+    )
+
+
+def _inspector(events: List[Event]) -> MagicMock:
+    return MagicMock(event_blocks=[EventBlock(name="Execute", events=events)])
+
+
+class TestPerfRegression(unittest.TestCase):
+    def setUp(self) -> None:
+        self.rng = np.random.default_rng(0)
+
+    def _latencies(self, mean: float, runs: int = 50) -> List[float]:
+        return list(mean + self.rng.normal(0, mean * 0.01, runs))
+
+    def test_collect_latency_samples(self):
+        event_blocks = [
+            EventBlock(
+                name="Execute",
+                events=[
+                    _event("op", [1.0, 2.0], debug_handles=1),
+                    _event("op", [3.0, 4.0], debug_handles=1),
+                    _event(
+                        "delegated",
+                        [1.0, 1.0],
+                        debug_handles=2,
+                        delegate_backend_name="backend",
+                    ),
+                    _event(
+                        "delegated",
+                        [2.0, 3.0],
+                        debug_handles=3,
+                        delegate_backend_name="backend",
+                    ),
+                    Event(name="no_perf_data"),
+                ],
+            ),
+            EventBlock(name="Execute", events=[_event("op", [5.0], debug_handles=1)]),
+        ]
+        samples = collect_latency_samples(event_blocks)
+
+        operator = RegressionScope.OPERATOR.value
+        # Repeated ops are told apart by occurrence, runs of the same op are pooled
+        self.assertEqual(
+            samples[("Execute", operator, "op", (1,), None, 0)].tolist(),
+            [1.0, 2.0, 5.0],
+        )
+        self.assertEqual(
+            samples[("Execute", operator, "op", (1,), None, 1)].tolist(), [3.0, 4.0]
+        )
+        # Delegated events are also summed per run for each backend
+        self.assertEqual(
+            samples[
+                (
+                    "Execute",
+                    RegressionScope.DELEGATE.value,
+                    "backend",
+                    None,
+                    "backend",
+                    0,
+                )
+            ].tolist(),
+            [3.0, 4.0],
+        )
+        self.assertEqual(len(samples), 5)
+
+    def test_bootstrap_relative_change(self):
+        baseline = np.array(self._latencies(10.0))
+        candidate = baseline * 1.2
+        relative_change, ci_low, ci_high = bootstrap_relative_change(
+            baseline, candidate, rng=np.random.default_rng(0)
+        )
+        self.assertAlmostEqual(relative_change, 0.2)
+        self.assertLessEqual(ci_low, relative_change)
+        self.assertGreaterEqual(ci_high, relative_change)
+        self.assertGreater(ci_low, 0.1)
+
+    def test_detect_perf_regressions(self):
+        baseline = _inspector(
+            [
+                _event("slower", self._latencies(10.0), debug_handles=1),
+                _event("faster", self._latencies(10.0), debug_handles=2),
+                _event("same", self._latencies(10.0), debug_handles=3),
+                _event("few_runs", [1.0, 2.0], debug_handles=4),
+                _event("removed", self._latencies(10.0), debug_handles=5),
+                _event(
+                    "delegated",
+                    self._latencies(5.0),
+                    debug_handles=6,
+                    delegate_backend_name="backend",
+                ),
+            ]
+        )
+        candidate = _inspector(
+            [
+                _event("slower", self._latencies(12.0), debug_handles=1),
+                _event("faster", self._latencies(8.0), debug_handles=2),
+                _event("same", self._latencies(10.0), debug_handles=3),
+                _event("few_runs", [1.0, 2.0], debug_handles=4),
+                _event("added", self._latencies(10.0), debug_handles=7),
+                _event(
+                    "delegated",
+                    self._latencies(6.0),
+                    debug_handles=6,
+                    delegate_backend_name="backend",
+                ),
+            ]
+        )
+        df = detect_perf_regressions([baseline], [candidate], min_relative_change=0.05)
+        statuses = {(row.scope, row.event_name): row.status for row in df.itertuples()}
+
+        operator = RegressionScope.OPERATOR.value
+        self.assertEqual(
+            statuses,
+            {
+                (operator, "slower"): RegressionStatus.REGRESSION.value,
+                (operator, "faster"): RegressionStatus.IMPROVEMENT.value,
+                (operator, "same"): RegressionStatus.UNCHANGED.value,
+                (operator, "few_runs"): RegressionStatus.INSUFFICIENT_RUNS.value,
+                (operator, "removed"): RegressionStatus.MISSING_IN_CANDIDATE.value,
+                (operator, "delegated"): RegressionStatus.REGRESSION.value,
+                (operator, "added"): RegressionStatus.MISSING_IN_BASELINE.value,
+                (
+                    RegressionScope.DELEGATE.value,
+                    "backend",
+                ): RegressionStatus.REGRESSION.value,
+            },
+        )
+        slower = df[df["event_name"] == "slower"].iloc[0]
+        self.assertAlmostEqual(slower["relative_change"], 0.2, delta=0.02)
+        self.assertEqual(slower["baseline_runs"], 50)
+        self.assertEqual(slower["debug_handles"], (1,))
+
+    def test_detect_perf_regressions_pools_etdumps(self):
+        baseline = [
+            _inspector([_event("op", self._latencies(10.0, runs=3))]) for _ in range(2)
+        ]
+        candidate = [
+            _inspector([_event("op", self._latencies(10.0, runs=3))]) for _ in range(2)
+        ]
+        df = detect_perf_regressions(baseline, candidate, min_runs=5)
+        self.assertEqual(len(df), 1)
+        self.assertEqual(df["baseline_runs"].tolist(), [6])
+        self.assertEqual(df["candidate_runs"].tolist(), [6])
+        self.assertNotEqual(
+            df["status"].tolist(), [RegressionStatus.INSUFFICIENT_RUNS.value]
+        )
+
+    def test_detect_perf_regressions_corrects_for_multiple_events(self):
+        num_events = 200
+        baseline = _inspector(
+            [
+                _event(f"op_{i}", self._latencies(10.0), debug_handles=i)
+                for i in range(num_events)
+            ]
+        )
+        candidate = _inspector(
+            [
+                _event(f"op_{i}", self._latencies(10.0), debug_handles=i)
+                for i in range(num_events)
+            ]
+        )
+
+        uncorrected = detect_perf_regressions(
+            [baseline], [candidate], correction=MultipleTestingCorrection.NONE
+        )
+        self.assertGreater(
+            (uncorrected["status"] != RegressionStatus.UNCHANGED.value).sum(), 0
+        )
+
+        for correction in (
+            MultipleTestingCorrection.HOLM,
+            MultipleTestingCorrection.BONFERRONI,
+        ):
+            df = detect_perf_regressions([baseline], [candidate], correction=correction)
+            self.assertEqual(
+                df["status"].tolist(), [RegressionStatus.UNCHANGED.value] * num_events
+            )
+            self.assertTrue(((df["p_value"] >= 0) & (df["p_value"] <= 1)).all())
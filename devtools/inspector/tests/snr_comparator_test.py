@@ -9,6 +9,7 @@ import unittest
 
 import torch
 
+from executorch.devtools.inspector._inspector_utils import NUMERIC_GAP_CHUNK_NUMEL
 from executorch.devtools.inspector.numerical_comparator import SNRComparator
 
 
@@ -50,3 +51,12 @@ class TestSNRComparator(unittest.TestCase):
         expected = 10 * math.log10(37.25 / 17.0)
         result = self.snr_comparator.element_compare(a, b)
         self.assertAlmostEqual(result, expected)
+
+    def test_large_tensors_compared_in_chunks(self):
+        a = torch.randn(NUMERIC_GAP_CHUNK_NUMEL * 2 + 3, dtype=torch.float32)
+        b = a + torch.randn_like(a) * 0.1
+        original_power = torch.mean(torch.pow(a.double(), 2))
+        error_power = torch.mean(torch.pow(a.double() - b.double(), 2))
+        expected = (10 * torch.log10(original_power / error_power)).item()
+        result = self.snr_comparator.element_compare(a, b)
+        self.assertAlmostEqual(result, expected)
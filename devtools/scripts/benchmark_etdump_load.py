@@ -0,0 +1,158 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# All rights reserved.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+import argparse
+import os
+import resource
+import tempfile
+import time
+
+import executorch.devtools.etdump.schema_flatcc as flatcc
+from executorch.devtools.etdump.reader import ETDumpReader
+from executorch.devtools.etdump.serialize import (
+    _convert_from_flatcc,
+    _deserialize_from_json_to_etdump_flatcc,
+    serialize_to_etdump_flatcc,
+)
+
+
+def generate_etdump(num_runs, num_events):
+    """
+    Generate a synthetic ETDump with `num_runs` run data blocks of `num_events`
+    operator profiling events each. Serialization goes through flatc.
+
+    Returns:
+        The serialized (non size-prefixed) ETDump.
+    """
+    events = [
+        flatcc.Event(
+            profile_event=flatcc.ProfileEvent(
+                name=f"native_call_op_{i % 64}.out",
+                chain_index=0,
+                instruction_id=i,
+                delegate_debug_id_int=-1,
+                delegate_debug_id_str="",
+                delegate_debug_metadata=None,
+                start_time=10 * i,
+                end_time=10 * i + 7,
+            ),
+            allocation_event=None,
+            debug_event=None,
+        )
+        for i in range(num_events)
+    ]
+    etdump = flatcc.ETDumpFlatCC(
+        version=0,
+        run_data=[
+            flatcc.RunData(
+                name=f"run_{run}",
+                bundled_input_index=-1,
+                allocators=[],
+                events=events,
+            )
+            for run in range(num_runs)
+        ],
+    )
+    return serialize_to_etdump_flatcc(etdump)
+
+
+def _time(fn):
+    start = time.perf_counter()
+    num_events = fn()
+    return time.perf_counter() - start, num_events
+
+
+def _count_events(etdump):
+    return sum(len(run_data.events or []) for run_data in etdump.run_data)
+
+
+def benchmark(etdump_path, size_prefixed, compare_flatc):
+    """
+    Time loading the ETDump at `etdump_path` with the direct reader, both fully
+    and streaming one run data block at a time, and optionally with the
+    flatc + JSON based deserializer.
+    """
+    size_mb = os.path.getsize(etdump_path) / 2**20
+    print(f"ETDump: {etdump_path} ({size_mb:.1f} MB)")
+
+    def load_reader():
+        with ETDumpReader.from_file(etdump_path, size_prefixed) as reader:
+            return _count_events(reader.to_etdump())
+
+    def load_streaming():
+        num_events = 0
+        with ETDumpReader.from_file(etdump_path, size_prefixed) as reader:
+            for run_data in reader.iter_run_data():
+                num_events += len(run_data.events or [])
+        return num_events
+
+    def load_flatc():
+        with open(etdump_path, "rb") as f:
+            data = f.read()
+        return _count_events(
+            _deserialize_from_json_to_etdump_flatcc(
+                _convert_from_flatcc(data, size_prefixed)
+            )
+        )
+
+    loaders = [("reader", load_reader), ("reader (streaming)", load_streaming)]
+    if compare_flatc:
+        loaders.append(("flatc + json", load_flatc))
+
+    for name, loader in loaders:
+        seconds, num_events = _time(loader)
+        print(f"{name:>20}: {seconds:8.3f} s, {num_events / seconds:12.0f} events/s")
+    peak_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"Peak RSS: {peak_rss_mb:.1f} MB")
+
+
+def main():
+    """
+    Benchmark ETDump load time.
+
+    Usage:
+        python benchmark_etdump_load.py --etdump_path="model.etdump"
+        python benchmark_etdump_load.py --num_runs=100 --num_events=10000 --compare_flatc
+    """
+    parser = argparse.ArgumentParser(description="Benchmark ETDump load time")
+    parser.add_argument(
+        "--etdump_path",
+        type=str,
+        default=None,
+        help="Path to a size prefixed etdump file. If unset a synthetic ETDump is generated.",
+    )
+    parser.add_argument(
+        "--num_runs",
+        type=int,
+        default=100,
+        help="Number of run data blocks in the synthetic ETDump",
+    )
+    parser.add_argument(
+        "--num_events",
+        type=int,
+        default=10000,
+        help="Number of profiling events per run in the synthetic ETDump",
+    )
+    parser.add_argument(
+        "--compare_flatc",
+        action="store_true",
+        help="Also time the flatc + JSON based deserializer",
+    )
+    args = parser.parse_args()
+
+    if args.etdump_path is not None:
+        benchmark(args.etdump_path, True, args.compare_flatc)
+        return
+
+    with tempfile.TemporaryDirectory() as d:
+        etdump_path = os.path.join(d, "synthetic.etdp")
+        with open(etdump_path, "wb") as f:
+            f.write(generate_etdump(args.num_runs, args.num_events))
+        benchmark(etdump_path, False, args.compare_flatc)
+
+
+if __name__ == "__main__":
+    main()
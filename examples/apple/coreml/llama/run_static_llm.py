@@ -14,6 +14,9 @@ Usage:
         --tokenizer $HOME/models/llama1b/tokenizer.model \
         --prompt "Once upon a time" \
         --max_new_tokens 100
+
+Add --draft_model and --draft_params to decode speculatively with a smaller
+draft model exported the same way.
 """
 
 import argparse
@@ -26,7 +29,10 @@ import torch.utils._pytree as pytree
 
 from executorch.examples.models.llama.model_args import ModelArgs
 from executorch.examples.models.llama.runner.generation import next_token
-from executorch.examples.models.llama.static_attention import StaticAttentionIOManager
+from executorch.examples.models.llama.static_attention import (
+    SpeculativeDecodingStats,
+    StaticAttentionIOManager,
+)
 from executorch.runtime import Runtime
 from pytorch_tokenizers import get_tokenizer
 
@@ -85,6 +91,58 @@ def create_pte_wrapper(
     return wrapper
 
 
+def load_model(pte_path: str, params_path: str, input_len: int, cache_len: int):
+    """
+    Load an exported static attention model, returning its
+    StaticAttentionIOManager and a callable wrapping the PTE.
+    """
+    # Load model params
+    with open(params_path, "r") as f:
+        params = json.loads(f.read())
+
+    # Create model args
+    model_args = ModelArgs(
+        max_context_len=cache_len + input_len,
+        generate_full_logits=True,
+        **params,
+    )
+    model_args.attention_type = "static_mha"
+
+    print(f"Model config: {model_args.n_layers} layers, dim={model_args.dim}")
+    print(f"Input length: {input_len}, Cache length: {cache_len}")
+
+    # Create StaticAttentionIOManager
+    mgr = StaticAttentionIOManager(
+        model_args,
+        input_len=input_len,
+        cache_lens=cache_len,
+        batch_size=1,
+        dtype=torch.float16,
+        style="smart_mask",  # Use smart_mask to match C++ StaticTransformerRunner
+        mask_val=float("-inf"),
+    )
+
+    # Load PTE model
+    print(f"Loading model from {pte_path}...")
+    runtime = Runtime.get()
+    program = runtime.load_program(pte_path)
+    method = program.load_method("forward")
+
+    metadata = method.metadata
+    print(
+        f"Method metadata: num_inputs={metadata.num_inputs()}, num_outputs={metadata.num_outputs()}"
+    )
+
+    # Get cache keys in insertion order (NOT sorted alphabetically!)
+    # Pytree preserves dict insertion order in Python 3.7+
+    # The caches are created in layer order (0, 1, 2, ..., n_layers-1)
+    k_cache_keys = list(mgr.k_caches.keys())
+    v_cache_keys = list(mgr.v_caches.keys())
+
+    # Create wrapper function that adapts PTE to eager interface
+    return mgr, create_pte_wrapper(method, k_cache_keys, v_cache_keys)
+
+
 def main():
     parser = argparse.ArgumentParser(description="Run static attention Llama model")
 
@@ -172,57 +230,54 @@ def main():
         help="Number of verification branches for lookahead decoding",
     )
 
+    parser.add_argument(
+        "--draft_model",
+        type=str,
+        default=None,
+        help="Path to a smaller exported .pte model proposing tokens for speculative decoding",
+    )
+    parser.add_argument(
+        "--draft_params",
+        type=str,
+        default=None,
+        help="Path to params.json of the draft model",
+    )
+    parser.add_argument(
+        "--draft_input_len",
+        type=int,
+        default=None,
+        help="Input sequence length of the draft model (defaults to --input_len)",
+    )
+    parser.add_argument(
+        "--draft_cache_len",
+        type=int,
+        default=None,
+        help="Cache length of the draft model (defaults to --cache_len)",
+    )
+    parser.add_argument(
+        "--num_draft_tokens",
+        type=int,
+        default=4,
+        help="Number of tokens the draft model proposes per verification",
+    )
+
     args = parser.parse_args()
 
     # Load tokenizer
     tokenizer = get_tokenizer(args.tokenizer, args.tokenizer_config)
     stop_tokens = get_stop_tokens(tokenizer)
 
-    # Load model params
-    with open(args.params, "r") as f:
-        params = json.loads(f.read())
-
-    # Create model args
-    model_args = ModelArgs(
-        max_context_len=args.cache_len + args.input_len,
-        generate_full_logits=True,
-        **params,
-    )
-    model_args.attention_type = "static_mha"
-
-    print(f"Model config: {model_args.n_layers} layers, dim={model_args.dim}")
-    print(f"Input length: {args.input_len}, Cache length: {args.cache_len}")
-
-    # Create StaticAttentionIOManager
-    mgr = StaticAttentionIOManager(
-        model_args,
-        input_len=args.input_len,
-        cache_lens=args.cache_len,
-        batch_size=1,
-        dtype=torch.float16,
-        style="smart_mask",  # Use smart_mask to match C++ StaticTransformerRunner
-        mask_val=float("-inf"),
-    )
-
-    # Load PTE model
-    print(f"Loading model from {args.model}...")
-    runtime = Runtime.get()
-    program = runtime.load_program(args.model)
-    method = program.load_method("forward")
-
-    metadata = method.metadata
-    print(
-        f"Method metadata: num_inputs={metadata.num_inputs()}, num_outputs={metadata.num_outputs()}"
-    )
-
-    # Get cache keys in insertion order (NOT sorted alphabetically!)
-    # Pytree preserves dict insertion order in Python 3.7+
-    # The caches are created in layer order (0, 1, 2, ..., n_layers-1)
-    k_cache_keys = list(mgr.k_caches.keys())
-    v_cache_keys = list(mgr.v_caches.keys())
-
-    # Create wrapper function that adapts PTE to eager interface
-    model_fn = create_pte_wrapper(method, k_cache_keys, v_cache_keys)
+    mgr, model_fn = load_model(args.model, args.params, args.input_len, args.cache_len)
+    draft_mgr = None
+    if args.draft_model:
+        if not args.draft_params:
+            parser.error("--draft_params is required with --draft_model")
+        draft_mgr, draft_model_fn = load_model(
+            args.draft_model,
+            args.draft_params,
+            args.draft_input_len or args.input_len,
+            args.draft_cache_len or args.cache_len,
+        )
 
     # Encode prompt
     prompt_tokens = tokenizer.encode(args.prompt, bos=True, eos=False)
@@ -237,6 +292,9 @@ def main():
     print("Prefilling...", end=" ", flush=True)
     start_time = time.time()
     logits = mgr.prefill(model_fn, prompt_tokens)
+    if draft_mgr is not None:
+        draft_mgr.reset()
+        draft_mgr.prefill(draft_model_fn, prompt_tokens)
     prefill_time = time.time() - start_time
     print(f"done in {prefill_time:.2f}s")
 
@@ -249,7 +307,22 @@ def main():
 
     decode_start = time.time()
 
-    if args.lookahead:
+    speculative_stats = None
+    if draft_mgr is not None:
+        # Use speculative decoding with the draft model
+        print(f"\n[Using speculative decoding: draft_tokens={args.num_draft_tokens}]")
+        speculative_stats = SpeculativeDecodingStats()
+        generated_tokens = mgr.speculative_decode(
+            model_fn,
+            first_token,
+            n=args.max_new_tokens - 1,  # -1 because first_token counts
+            draft_model=draft_model_fn,
+            draft_mgr=draft_mgr,
+            num_draft_tokens=args.num_draft_tokens,
+            stop_tokens=stop_tokens,
+            stats=speculative_stats,
+        )
+    elif args.lookahead:
         # Use lookahead (speculative) decoding
         print(
             f"\n[Using lookahead decoding: ngram={args.ngram_size}, window={args.window_size}, verifications={args.n_verifications}]"
@@ -287,6 +360,12 @@ def main():
     print(
         f"Decode: {total_generated} tokens in {decode_time:.2f}s ({tokens_per_sec:.2f} tok/s)"
     )
+    if speculative_stats is not None:
+        print(
+            f"Speculative decoding: {speculative_stats.acceptance_rate:.1%} of"
+            f" {speculative_stats.num_draft_tokens} draft tokens accepted,"
+            f" {speculative_stats.tokens_per_target_forward:.2f} tokens per target inference"
+        )
 
 
 if __name__ == "__main__":
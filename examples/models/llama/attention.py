@@ -107,6 +107,18 @@ class KVCache(nn.Module):
 
             return k_out, v_out
 
+    def snapshot(self, num_tokens: int) -> Tuple[torch.Tensor, torch.Tensor]:
+        # Copy of the first num_tokens positions, for prompt prefix caching
+        return (
+            self.k_cache[:, :, :num_tokens].clone(),
+            self.v_cache[:, :, :num_tokens].clone(),
+        )
+
+    def restore(self, snapshot: Tuple[torch.Tensor, torch.Tensor]) -> None:
+        k, v = snapshot
+        self.k_cache[:, :, : k.size(2)] = k
+        self.v_cache[:, :, : v.size(2)] = v
+
 
 class SDPA(nn.Module):
     def __init__(
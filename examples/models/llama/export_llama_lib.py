@@ -300,8 +300,21 @@ def build_args_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--calibration_data",
         type=str,
+        nargs="+",
         default="Once upon a time",
-        help="Calibration prompts from users",
+        help="Calibration prompts from users, calibrated one after another",
+    )
+    parser.add_argument(
+        "--quantize_num_threads",
+        type=int,
+        default=None,
+        help="Number of layers to quantize concurrently with --quantization_mode",
+    )
+    parser.add_argument(
+        "--calibration_num_workers",
+        type=int,
+        default=1,
+        help="Number of processes to shard the calibration prompts over",
     )
     parser.add_argument(
         "-t",
@@ -606,6 +619,16 @@ def build_args_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="If true, stops right after torch.export() and saves the exported model.",
     )
+    parser.add_argument(
+        "--export_cache_dir",
+        default=None,
+        help="Directory to cache torch.export() results in. Re-exporting an unchanged model with the same inputs loads the cached program.",
+    )
+    parser.add_argument(
+        "--export_cache_hash_weights",
+        action="store_true",
+        help="Key the export cache on the contents of the weights instead of the path, size and modification time of the checkpoint.",
+    )
     return parser
 
 
@@ -760,6 +783,7 @@ def _prepare_for_llama_export(llm_config: LlmConfig) -> LLMEdgeManager:
             calibration_tasks=llm_config.quantization.calibration_tasks,
             calibration_limit=llm_config.quantization.calibration_limit,
             calibration_seq_length=llm_config.quantization.calibration_seq_length,
+            quantize_num_threads=llm_config.quantization.num_threads,
             expand_rope_table=llm_config.model.expand_rope_table,
             use_custom_sdpa_with_attention_mask=getattr(
                 llm_config.model, "use_custom_sdpa_with_attention_mask", False
@@ -1506,6 +1530,21 @@ def _load_llama_model_metadata(
     return metadata
 
 
+def _export_cache_checkpoints(llm_config: LlmConfig) -> Optional[List[str]]:
+    """
+    The files the weights are loaded from, or None if the weights are randomly
+    initialized or downloaded, in which case the export cache hashes them.
+    """
+    if not llm_config.base.checkpoint:
+        return None
+    checkpoints = [llm_config.base.checkpoint]
+    if llm_config.base.params:
+        checkpoints.append(llm_config.base.params)
+    if llm_config.base.lora_config:
+        checkpoints.append(llm_config.base.lora_config.adapter_checkpoint)
+    return checkpoints
+
+
 def _load_llama_model(llm_config: LlmConfig) -> "LLMEdgeManager":
     """
     A helper util that builds a Llama2 model. It returns a LLMEdgeManager that
@@ -1555,8 +1594,17 @@ def _load_llama_model(llm_config: LlmConfig) -> "LLMEdgeManager":
         calibration_limit=llm_config.quantization.calibration_limit,
         calibration_seq_length=llm_config.quantization.calibration_seq_length,
         calibration_data=llm_config.quantization.calibration_data,
+        calibration_num_workers=llm_config.quantization.calibration_num_workers,
         tokenizer_path=llm_config.base.tokenizer_path,
         save_exported_program=llm_config.export.export_only,
+        export_cache_dir=llm_config.export.export_cache_dir,
+        export_cache_checkpoints=_export_cache_checkpoints(llm_config),
+        export_cache_hash_weights=llm_config.export.export_cache_hash_weights,
+        export_cache_config={
+            "model": llm_config.model,
+            "quantization": llm_config.quantization,
+            "backend": llm_config.backend,
+        },
         verbose=llm_config.debug.verbose,
         metadata=_load_llama_model_metadata(
             llm_config.model.use_kv_cache,
@@ -1593,6 +1641,7 @@ def _get_source_transforms(  # noqa
     calibration_tasks: Optional[List[str]] = None,
     calibration_limit: Optional[int] = None,
     calibration_seq_length: Optional[int] = None,
+    quantize_num_threads: Optional[int] = None,
     expand_rope_table: bool = False,
     use_custom_sdpa_with_attention_mask: bool = False,
     use_sdpa_with_kv_cache: bool = False,
@@ -1629,6 +1678,7 @@ def _get_source_transforms(  # noqa
         use_spin_quant: Type of spin quant to use ("cuda" or "native").
         embedding_quantize: Type of embedding quantization.
         quantization_mode: Type of quantization mode.
+        quantize_num_threads: Number of layers quantized concurrently.
         expand_rope_table: Whether to expand rope table.
         use_custom_sdpa_with_attention_mask: Whether to use custom SDPA with attention mask.
         use_sdpa_with_kv_cache: Whether to use SDPA with KV cache.
@@ -1718,6 +1768,7 @@ def _get_source_transforms(  # noqa
                 calibration_limit=calibration_limit,
                 calibration_seq_length=calibration_seq_length,
                 quantize_with_hqq=quantize_with_hqq,
+                num_threads=quantize_num_threads,
             )
         )
 
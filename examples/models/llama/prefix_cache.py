@@ -0,0 +1,155 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# All rights reserved.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+"""
+Prompt prefix caching for LLM prefill.
+
+Chat workloads resend the same system prompt (and the previous turns) with
+every request. A PrefixCache keeps snapshots of the KV cache state after
+prefilling token prefixes, so that a later prompt sharing a prefix can restore
+the snapshot and only prefill the remaining tokens.
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+import torch
+import torch.nn as nn
+import torch.utils._pytree as pytree
+
+
+def snapshot_nbytes(snapshot: Any) -> int:
+    """
+    Number of bytes of tensor data held by a snapshot, counting tensors that
+    share storage once.
+    """
+    storages = {}
+    for leaf in pytree.tree_leaves(snapshot):
+        if isinstance(leaf, torch.Tensor):
+            storage = leaf.untyped_storage()
+            storages[storage.data_ptr()] = storage.nbytes()
+    return sum(storages.values())
+
+
+class PrefixCache:
+    """
+    An LRU cache of KV cache snapshots keyed by the token prefix they were
+    computed from, bounded by the total bytes of the snapshots.
+
+    Snapshots are taken at multiples of `block_size` tokens while prefilling, and
+    at the end of every prompt. Prompts that only share part of a block with a
+    cached prompt (e.g. the same system prompt with a different user message)
+    can still reuse all full blocks of the shared part.
+    """
+
+    def __init__(self, max_bytes: int, block_size: int = 64):
+        """
+        Args:
+            max_bytes: Byte budget of all snapshots. The least recently used
+                snapshots are evicted to stay within it.
+            block_size: Number of tokens between snapshots of a long prompt.
+        """
+        if block_size < 1:
+            raise ValueError(f"block_size must be at least 1, got {block_size}")
+        self.max_bytes = max_bytes
+        self.block_size = block_size
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple[int, ...], Tuple[Any, int]]" = OrderedDict()
+        # Number of entries per prefix length, to only probe lengths that exist
+        self._lengths: Dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, tokens: Sequence[int]) -> bool:
+        return tuple(tokens) in self._entries
+
+    def lookup(self, tokens: Sequence[int]) -> Tuple[int, Optional[Any]]:
+        """
+        Find the snapshot of the longest cached prefix of `tokens`. At least one
+        token is always left to prefill, so that there are logits to sample the
+        next token from.
+
+        Returns:
+            The length of the prefix and its snapshot, or (0, None) on a miss.
+        """
+        tokens = tuple(tokens)
+        for length in sorted(self._lengths, reverse=True):
+            if length >= len(tokens):
+                continue
+            key = tokens[:length]
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return length, entry[0]
+        self.misses += 1
+        return 0, None
+
+    def insert(self, tokens: Sequence[int], snapshot: Any) -> None:
+        """
+        Cache the snapshot of the KV cache state after prefilling `tokens`,
+        evicting least recently used snapshots to stay within the byte budget.
+        Snapshots larger than the whole budget are not cached.
+        """
+        key = tuple(tokens)
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            return
+        nbytes = snapshot_nbytes(snapshot)
+        if nbytes > self.max_bytes:
+            return
+        while self.nbytes + nbytes > self.max_bytes:
+            self._evict()
+        self._entries[key] = (snapshot, nbytes)
+        self._lengths[len(key)] = self._lengths.get(len(key), 0) + 1
+        self.nbytes += nbytes
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._lengths.clear()
+        self.nbytes = 0
+
+    def _evict(self) -> None:
+        key, (_, nbytes) = self._entries.popitem(last=False)
+        self.nbytes -= nbytes
+        self._lengths[len(key)] -= 1
+        if self._lengths[len(key)] == 0:
+            del self._lengths[len(key)]
+
+
+def snapshot_kv_caches(model: nn.Module, num_tokens: int) -> Dict[str, Any]:
+    """
+    Snapshot the first `num_tokens` positions of every KV cache module in a
+    model that keeps its KV caches as mutable buffers.
+    """
+    snapshot = {}
+    for name, module in model.named_modules():
+        if not hasattr(module, "k_cache"):
+            continue
+        if getattr(module, "is_ring_buffer", False):
+            # Positions wrap around the ring buffer, so its first num_tokens
+            # slots don't hold the first num_tokens positions
+            raise ValueError(
+                f"KV cache {name} ({type(module).__name__}) is a ring buffer, which can't be snapshotted."
+            )
+        if not hasattr(module, "snapshot"):
+            raise NotImplementedError(
+                f"KV cache {name} ({type(module).__name__}) does not support snapshots."
+            )
+        snapshot[name] = module.snapshot(num_tokens)
+    return snapshot
+
+
+def restore_kv_caches(model: nn.Module, snapshot: Dict[str, Any]) -> None:
+    """
+    Restore a snapshot taken with snapshot_kv_caches into the model.
+    """
+    modules = dict(model.named_modules())
+    for name, module_snapshot in snapshot.items():
+        modules[name].restore(module_snapshot)
@@ -0,0 +1,90 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# All rights reserved.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+"""
+Measure the time to first token of prompts that share a system prompt, with
+and without a prompt prefix cache, using a small randomly initialized static
+attention model.
+
+Usage:
+    python benchmark_prefix_cache.py --system_prompt_len 448 --user_prompt_len 32
+"""
+
+import argparse
+import statistics
+import time
+
+import torch
+
+from executorch.examples.models.llama.prefix_cache import PrefixCache
+from executorch.examples.models.llama.runner.benchmark_serving import build_model
+from executorch.examples.models.llama.static_attention import StaticAttentionIOManager
+
+
+def time_to_first_token(mgr, model, prompt, prefix_cache):
+    mgr.reset()
+    start = time.perf_counter()
+    logits = mgr.prefill(model, prompt, prefix_cache=prefix_cache)
+    logits.reshape(-1, logits.size(-1))[-1].argmax().item()
+    return time.perf_counter() - start
+
+
+def benchmark(model, config, args):
+    """
+    Prefill `args.num_prompts` prompts made of the same system prompt and a
+    random user prompt, and print the median time to first token.
+    """
+    system_prompt = torch.randint(config.vocab_size, (args.system_prompt_len,))
+    prompts = [
+        system_prompt.tolist()
+        + torch.randint(config.vocab_size, (args.user_prompt_len,)).tolist()
+        for _ in range(args.num_prompts)
+    ]
+    mgr = StaticAttentionIOManager(config, args.input_len, args.cache_len)
+    prefix_cache = PrefixCache(
+        max_bytes=args.prefix_cache_mb * 2**20, block_size=args.block_size
+    )
+
+    print(f"{'prefix cache':>12} {'p50 TTFT (ms)':>14} {'first TTFT (ms)':>16}")
+    for cache in (None, prefix_cache):
+        with torch.no_grad():
+            ttfts = [time_to_first_token(mgr, model, p, cache) for p in prompts]
+        print(
+            f"{'on' if cache else 'off':>12} {statistics.median(ttfts) * 1000:>14.2f} "
+            f"{ttfts[0] * 1000:>16.2f}"
+        )
+    print(
+        f"Prefix cache: {len(prefix_cache)} entries, "
+        f"{prefix_cache.nbytes / 2**20:.1f} MB, {prefix_cache.hits} hits, "
+        f"{prefix_cache.misses} misses"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark time to first token with a prompt prefix cache"
+    )
+    parser.add_argument("--num_prompts", type=int, default=16)
+    parser.add_argument("--system_prompt_len", type=int, default=448)
+    parser.add_argument("--user_prompt_len", type=int, default=32)
+    parser.add_argument("--block_size", type=int, default=64)
+    parser.add_argument("--prefix_cache_mb", type=int, default=256)
+    parser.add_argument("--input_len", type=int, default=64)
+    parser.add_argument("--cache_len", type=int, default=960)
+    parser.add_argument("--dim", type=int, default=256)
+    parser.add_argument("--n_heads", type=int, default=8)
+    parser.add_argument("--n_kv_heads", type=int, default=4)
+    parser.add_argument("--n_layers", type=int, default=4)
+    parser.add_argument("--vocab_size", type=int, default=512)
+    parser.add_argument("--max_seq_len", type=int, default=1024)
+    args = parser.parse_args()
+
+    model, config = build_model(args)
+    benchmark(model, config, args)
+
+
+if __name__ == "__main__":
+    main()
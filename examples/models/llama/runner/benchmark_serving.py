@@ -0,0 +1,167 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# All rights reserved.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+"""
+Benchmark the throughput of ServingEngine against the number of concurrent
+requests, using a small randomly initialized static attention model.
+
+Usage:
+    python benchmark_serving.py --concurrency 1 2 4 8
+    python benchmark_serving.py --pte --concurrency 1 4
+"""
+
+import argparse
+import asyncio
+import copy
+import time
+
+import torch
+import torch.utils._pytree as pytree
+
+from executorch.examples.models.llama.llama_transformer import construct_transformer
+from executorch.examples.models.llama.model_args import ModelArgs
+from executorch.examples.models.llama.runner.serving import ServingEngine
+from executorch.examples.models.llama.static_attention import (
+    StaticAttentionIOManager,
+    transform_attention_mha_to_static_attention,
+)
+
+
+def build_model(args):
+    """
+    Build a small static attention model with random weights.
+
+    Returns:
+        The model and its config.
+    """
+    torch.manual_seed(0)
+    config = ModelArgs(
+        dim=args.dim,
+        n_heads=args.n_heads,
+        n_kv_heads=args.n_kv_heads,
+        max_seq_len=args.max_seq_len,
+        n_layers=args.n_layers,
+        vocab_size=args.vocab_size,
+    )
+    model = transform_attention_mha_to_static_attention(
+        construct_transformer(config).eval(),
+        split_mha=True,
+        inplace=False,
+        use_hf_rope=True,
+    ).eval()
+    config = copy.copy(config)
+    config.attention_type = "static"
+    config.use_hf_rope = True
+    return model, config
+
+
+def export_to_pte(model, config, input_len, cache_len):
+    """
+    Export the model to a PTE program, load it through the runtime and wrap
+    its forward method so it can be called like the eager model.
+    """
+    from executorch.exir import to_edge_transform_and_lower
+    from executorch.runtime import Runtime
+
+    mgr = StaticAttentionIOManager(config, input_len, cache_len)
+    example_inputs = (
+        torch.zeros(1, input_len, dtype=torch.int32),
+        {
+            "masks": mgr.masks,
+            "freqs_cos_override": mgr.freqs_cos[:input_len],
+            "freqs_sin_override": mgr.freqs_sin[:input_len],
+            "in_cache_state": (mgr.k_caches, mgr.v_caches),
+            "last_valid_token_pos": torch.tensor([input_len - 1], dtype=torch.long),
+        },
+    )
+    with torch.no_grad():
+        exported = torch.export.export(model, example_inputs)
+    pte = to_edge_transform_and_lower(exported).to_executorch()
+    method = Runtime.get().load_program(pte.buffer).load_method("forward")
+    k_cache_keys = list(mgr.k_caches.keys())
+    v_cache_keys = list(mgr.v_caches.keys())
+
+    def forward(tokens, options):
+        outputs = method.execute(pytree.tree_flatten((tokens, options))[0])
+        # Logits, then the k cache updates, then the v cache updates
+        k_updates = outputs[1 : 1 + len(k_cache_keys)]
+        v_updates = outputs[1 + len(k_cache_keys) :]
+        return outputs[0], {
+            "out_cache_state": (
+                dict(zip(k_cache_keys, k_updates)),
+                dict(zip(v_cache_keys, v_updates)),
+            )
+        }
+
+    return forward
+
+
+async def _serve(engine, prompts, max_new_tokens):
+    async def collect(prompt):
+        return [token async for token in engine.generate(prompt, max_new_tokens)]
+
+    return await asyncio.gather(*(collect(prompt) for prompt in prompts))
+
+
+def benchmark(model, config, args):
+    """
+    Serve `args.num_requests` requests with every concurrency in
+    `args.concurrency` and print the generation throughput.
+    """
+    prompts = [
+        torch.randint(config.vocab_size, (args.prompt_len,)).tolist()
+        for _ in range(args.num_requests)
+    ]
+    print(f"{'concurrency':>12} {'seconds':>10} {'tokens/s':>10}")
+    for num_slots in args.concurrency:
+        engine = ServingEngine(
+            model, config, args.input_len, args.cache_len, num_slots=num_slots
+        )
+        start = time.perf_counter()
+        with torch.no_grad():
+            outputs = asyncio.run(_serve(engine, prompts, args.max_new_tokens))
+        seconds = time.perf_counter() - start
+        num_tokens = sum(len(output) for output in outputs)
+        print(f"{num_slots:>12} {seconds:>10.3f} {num_tokens / seconds:>10.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark continuous batching throughput"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        nargs="+",
+        default=[1, 2, 4, 8],
+        help="Numbers of concurrent requests (slots) to benchmark",
+    )
+    parser.add_argument("--num_requests", type=int, default=16)
+    parser.add_argument("--prompt_len", type=int, default=32)
+    parser.add_argument("--max_new_tokens", type=int, default=32)
+    parser.add_argument("--input_len", type=int, default=16)
+    parser.add_argument("--cache_len", type=int, default=112)
+    parser.add_argument("--dim", type=int, default=256)
+    parser.add_argument("--n_heads", type=int, default=8)
+    parser.add_argument("--n_kv_heads", type=int, default=4)
+    parser.add_argument("--n_layers", type=int, default=4)
+    parser.add_argument("--vocab_size", type=int, default=512)
+    parser.add_argument("--max_seq_len", type=int, default=128)
+    parser.add_argument(
+        "--pte",
+        action="store_true",
+        help="Export the model and serve it through the ExecuTorch runtime instead of eager",
+    )
+    args = parser.parse_args()
+
+    model, config = build_model(args)
+    if args.pte:
+        model = export_to_pte(model, config, args.input_len, args.cache_len)
+    benchmark(model, config, args)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,13 +6,18 @@
 
 import argparse
 import json
-from typing import Optional, Type
+from typing import Any, Dict, Optional, Type
 
 import torch
 from executorch.examples.models.llama.export_llama_lib import (
     _prepare_for_llama_export,
     build_args_parser as _build_args_parser,
 )
+from executorch.examples.models.llama.prefix_cache import (
+    PrefixCache,
+    restore_kv_caches,
+    snapshot_kv_caches,
+)
 from executorch.examples.models.llama.runner.generation import LlamaRunner
 from executorch.extension.llm.export.builder import LLMEdgeManager
 
@@ -29,6 +34,7 @@ class EagerLlamaRunner(LlamaRunner):
         llm_config: LlmConfig,
         tokenizer_config_path: Optional[str] = None,
         use_attention_sink: bool = False,
+        prefix_cache: Optional[PrefixCache] = None,
     ):
         with open(llm_config.base.params, "r") as f:
             params = json.loads(f.read())
@@ -40,6 +46,7 @@ class EagerLlamaRunner(LlamaRunner):
             use_kv_cache=llm_config.model.use_kv_cache,
             vocab_size=params["vocab_size"],
             device="cuda" if torch.cuda.is_available() else "cpu",
+            prefix_cache=prefix_cache,
         )
         manager: LLMEdgeManager = _prepare_for_llama_export(llm_config)
         self.model = manager.model.eval().to(device=self.device)
@@ -51,6 +58,12 @@ class EagerLlamaRunner(LlamaRunner):
     ) -> torch.Tensor:
         return self.model.forward(tokens, {"input_pos": input_pos})
 
+    def snapshot_kv_cache(self, num_tokens: int) -> Dict[str, Any]:
+        return snapshot_kv_caches(self.model, num_tokens)
+
+    def restore_kv_cache(self, snapshot: Dict[str, Any]) -> None:
+        restore_kv_caches(self.model, snapshot)
+
 
 def build_args_parser() -> argparse.ArgumentParser:
     parser = _build_args_parser()
@@ -6,9 +6,10 @@
 
 import time
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Any, List, Optional, Tuple
 
 import torch
+from executorch.examples.models.llama.prefix_cache import PrefixCache
 
 from pytorch_tokenizers import get_tokenizer
 
@@ -57,6 +58,7 @@ class LlamaRunner(ABC):
         use_kv_cache: bool,
         vocab_size: int,
         device: str = "cpu",
+        prefix_cache: Optional[PrefixCache] = None,
     ):
         """
         Constructor.
@@ -68,12 +70,16 @@ class LlamaRunner(ABC):
             use_kv_cache: whether to use a KV cache.
             vocab_size: number of items in the vocab.
             device: device to run the runner on.
+            prefix_cache: cache of KV cache snapshots of prompt prefixes, to skip
+                prefilling prefixes shared with earlier prompts. Requires a KV cache
+                and a runner that implements snapshot_kv_cache and restore_kv_cache.
         """
         self.max_seq_len = max_seq_len
         self.max_batch_size = max_batch_size
         self.use_kv_cache = use_kv_cache
         self.tokenizer = get_tokenizer(tokenizer_path, tokenizer_config_path)
         self.device = device
+        self.prefix_cache = prefix_cache if use_kv_cache else None
         # For some models like qwen, mismatch is acceptable: https://github.com/QwenLM/Qwen2.5/issues/466#issuecomment-2146759706
         if vocab_size != self.tokenizer.n_words:
             print(
@@ -88,6 +94,67 @@ class LlamaRunner(ABC):
     ) -> torch.Tensor:
         pass
 
+    def snapshot_kv_cache(self, num_tokens: int) -> Any:
+        """
+        Capture the first num_tokens positions of the KV cache, for the prefix cache.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support prompt prefix caching."
+        )
+
+    def restore_kv_cache(self, snapshot: Any) -> None:
+        """
+        Restore a snapshot taken with snapshot_kv_cache.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support prompt prefix caching."
+        )
+
+    def _prefill(
+        self, prompt_tokens: List[int], pos_base: int
+    ) -> Tuple[torch.Tensor, int]:
+        """
+        Prefill the prompt, reusing the longest cached prefix if there is a
+        prefix cache.
+
+        Returns:
+            The logits and the number of prompt tokens restored from the cache.
+        """
+        if self.prefix_cache is None or pos_base != 0:
+            logits = self.forward(
+                tokens=torch.tensor(
+                    [prompt_tokens], dtype=torch.long, device=self.device
+                ),
+                input_pos=(
+                    torch.tensor([pos_base], dtype=torch.long, device=self.device)
+                    if self.use_kv_cache
+                    else None
+                ),
+            )
+            return logits, 0
+
+        start, snapshot = self.prefix_cache.lookup(prompt_tokens)
+        if snapshot is not None:
+            self.restore_kv_cache(snapshot)
+        num_cached = start
+        # Prefill up to every multiple of the block size, so that prompts that
+        # only share part of this one can reuse the shared blocks
+        block_size = self.prefix_cache.block_size
+        while start < len(prompt_tokens):
+            end = min((start // block_size + 1) * block_size, len(prompt_tokens))
+            logits = self.forward(
+                tokens=torch.tensor(
+                    [prompt_tokens[start:end]], dtype=torch.long, device=self.device
+                ),
+                input_pos=torch.tensor([start], dtype=torch.long, device=self.device),
+            )
+            if prompt_tokens[:end] not in self.prefix_cache:
+                self.prefix_cache.insert(
+                    prompt_tokens[:end], self.snapshot_kv_cache(end)
+                )
+            start = end
+        return logits, num_cached
+
     def generate(  # noqa: C901
         self,
         prompt_tokens: List[int],
@@ -99,14 +166,7 @@ class LlamaRunner(ABC):
     ) -> List[int]:
         # Prefill
         prefill_start = time.time()
-        logits = self.forward(
-            tokens=torch.tensor([prompt_tokens], dtype=torch.long, device=self.device),
-            input_pos=(
-                torch.tensor([pos_base], dtype=torch.long, device=self.device)
-                if self.use_kv_cache
-                else None
-            ),
-        )
+        logits, num_cached = self._prefill(prompt_tokens, pos_base)
         prefill_time = time.time() - prefill_start
 
         current_token = next_token(logits, temperature, top_p)
@@ -146,6 +206,8 @@ class LlamaRunner(ABC):
 
         generate_time = time.time() - generate_start
         print(f"Prefill time: {prefill_time}")
+        if self.prefix_cache is not None:
+            print(f"Prompt tokens reused from the prefix cache: {num_cached}")
         print(f"Generation tok/s: {len(tokens) / generate_time}")
 
         return tokens if echo else tokens[len(prompt_tokens) :]
@@ -0,0 +1,250 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# All rights reserved.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+"""
+Continuous batching for static attention LLMs.
+
+A ServingEngine serves many concurrent generation requests with one loaded
+model. Every request is assigned a slot, which owns the KV caches, masks and
+position of that request in a StaticAttentionIOManager, so any number of
+requests can be in flight while the model itself stays stateless. Each engine
+step runs one prefill chunk or one decode token for every active slot, so new
+requests start prefilling as soon as a slot frees up instead of waiting for
+the whole batch to finish.
+
+The model is anything with the calling convention of a static attention
+transformer, e.g. the eager model or an exported PTE method wrapped with
+create_pte_wrapper from examples/apple/coreml/llama/run_static_llm.py.
+"""
+
+import asyncio
+import itertools
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Deque, List, Optional, Sequence
+
+import torch
+
+from executorch.examples.models.llama.model_args import ModelArgs
+from executorch.examples.models.llama.runner.generation import next_token
+from executorch.examples.models.llama.static_attention import StaticAttentionIOManager
+
+
+@dataclass
+class GenerationRequest:
+    prompt_tokens: List[int]
+    max_new_tokens: int
+    temperature: float = 0.0
+    top_p: float = 0.9
+    stop_tokens: Sequence[int] = ()
+    # Called with every generated token, and with None once the request is done
+    on_token: Optional[Callable[[Optional[int]], None]] = None
+    request_id: int = -1
+    generated_tokens: List[int] = field(default_factory=list)
+    finished: bool = False
+    error: Optional[BaseException] = None
+
+
+class _Slot:
+    def __init__(self, mgr: StaticAttentionIOManager):
+        self.mgr = mgr
+        self.request: Optional[GenerationRequest] = None
+        # Number of prompt tokens already prefilled
+        self.prefill_pos = 0
+
+    def assign(self, request: GenerationRequest) -> None:
+        self.mgr.reset()
+        self.request = request
+        self.prefill_pos = 0
+
+    @property
+    def prefilling(self) -> bool:
+        return self.prefill_pos < len(self.request.prompt_tokens)
+
+
+class ServingEngine:
+    def __init__(
+        self,
+        model: Callable[..., Any],
+        config: ModelArgs,
+        input_len: int,
+        cache_len: int,
+        num_slots: int,
+        dtype: torch.dtype = torch.float32,
+        style: str = "shift_pointer",
+        max_prefill_chunks_per_step: Optional[int] = None,
+    ):
+        """
+        Constructor.
+
+        Args:
+            model: static attention model, eager or a wrapped PTE method.
+            config: model config, with the static attention type the model uses.
+            input_len: number of tokens the model takes per forward.
+            cache_len: KV cache length per layer.
+            num_slots: maximum number of requests in flight.
+            dtype: dtype of the KV caches and masks.
+            style: KV cache update style, "shift_pointer" or "smart_mask".
+            max_prefill_chunks_per_step: bounds how many slots prefill in one
+                step, so that long prompts don't stall decoding of the other
+                requests. None to prefill every slot that needs it.
+        """
+        if num_slots < 1:
+            raise ValueError(f"num_slots must be at least 1, got {num_slots}")
+        self.model = model
+        self.input_len = input_len
+        self.max_prefill_chunks_per_step = max_prefill_chunks_per_step
+        self.slots = [
+            _Slot(
+                StaticAttentionIOManager(
+                    config, input_len, cache_len, dtype=dtype, style=style
+                )
+            )
+            for _ in range(num_slots)
+        ]
+        # Rotary embeddings are precomputed for a fixed context length
+        self.max_seq_len = self.slots[0].mgr.freqs_cos.size(0) - input_len + 1
+        self.waiting: Deque[GenerationRequest] = deque()
+        self._request_ids = itertools.count()
+        self._loop_task: Optional[asyncio.Task] = None
+
+    def submit(self, request: GenerationRequest) -> GenerationRequest:
+        """
+        Queue a request. It is admitted into the next free slot by step().
+        """
+        if not request.prompt_tokens:
+            raise ValueError("The prompt must contain at least one token.")
+        if request.max_new_tokens < 1:
+            raise ValueError("max_new_tokens must be at least 1.")
+        seq_len = len(request.prompt_tokens) + request.max_new_tokens
+        if seq_len > self.max_seq_len:
+            raise ValueError(
+                f"Prompt and new tokens ({seq_len}) exceed the maximum sequence length {self.max_seq_len}."
+            )
+        request.request_id = next(self._request_ids)
+        self.waiting.append(request)
+        return request
+
+    @property
+    def num_active(self) -> int:
+        return sum(slot.request is not None for slot in self.slots)
+
+    def has_work(self) -> bool:
+        return len(self.waiting) > 0 or self.num_active > 0
+
+    def step(self) -> List[GenerationRequest]:
+        """
+        Admit waiting requests into free slots, then advance every active
+        request by one prefill chunk or one generated token.
+
+        Returns:
+            The requests that finished in this step.
+        """
+        for slot in self.slots:
+            if slot.request is None and self.waiting:
+                slot.assign(self.waiting.popleft())
+
+        finished = []
+        prefill_budget = self.max_prefill_chunks_per_step
+        for slot in self.slots:
+            request = slot.request
+            if request is None:
+                continue
+            if slot.prefilling:
+                if prefill_budget is not None:
+                    if prefill_budget == 0:
+                        continue
+                    prefill_budget -= 1
+                chunk = request.prompt_tokens[
+                    slot.prefill_pos : slot.prefill_pos + self.input_len
+                ]
+                logits = slot.mgr.prefill(self.model, chunk)
+                slot.prefill_pos += len(chunk)
+                if slot.prefilling:
+                    continue
+            else:
+                logits = slot.mgr.prefill(self.model, request.generated_tokens[-1:])
+
+            if logits.dim() == 3:
+                logits = logits[:, -1, :]
+            token = next_token(logits, request.temperature, request.top_p)
+            request.generated_tokens.append(token)
+            if request.on_token is not None:
+                request.on_token(token)
+            if (
+                len(request.generated_tokens) >= request.max_new_tokens
+                or token in request.stop_tokens
+            ):
+                self._finish(slot)
+                finished.append(request)
+        return finished
+
+    def run_until_complete(self) -> None:
+        """
+        Step until every submitted request is finished.
+        """
+        while self.has_work():
+            self.step()
+
+    def _finish(self, slot: _Slot) -> None:
+        request = slot.request
+        request.finished = True
+        slot.request = None
+        if request.on_token is not None:
+            request.on_token(None)
+
+    async def generate(
+        self,
+        prompt_tokens: List[int],
+        max_new_tokens: int,
+        temperature: float = 0.0,
+        top_p: float = 0.9,
+        stop_tokens: Sequence[int] = (),
+    ) -> AsyncIterator[int]:
+        """
+        Generate tokens for a prompt, interleaved with every other request that
+        is being served, yielding each token as soon as it is sampled.
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        request = self.submit(
+            GenerationRequest(
+                prompt_tokens=prompt_tokens,
+                max_new_tokens=max_new_tokens,
+                temperature=temperature,
+                top_p=top_p,
+                stop_tokens=stop_tokens,
+                on_token=queue.put_nowait,
+            )
+        )
+        # The engine loop only runs while there are requests to serve
+        if self._loop_task is None or self._loop_task.done():
+            self._loop_task = asyncio.get_running_loop().create_task(self._run())
+        while True:
+            token = await queue.get()
+            if token is None:
+                break
+            yield token
+        if request.error is not None:
+            raise request.error
+
+    async def _run(self) -> None:
+        try:
+            while self.has_work():
+                self.step()
+                # Let consumers pick up the new tokens and new requests come in
+                await asyncio.sleep(0)
+        except Exception as e:
+            # Fail every request in flight rather than leaving its consumer waiting
+            requests = [slot.request for slot in self.slots if slot.request]
+            requests.extend(self.waiting)
+            self.waiting.clear()
+            for slot in self.slots:
+                slot.request = None
+            for request in requests:
+                request.error = e
+                request.finished = True
+                if request.on_token is not None:
+                    request.on_token(None)
@@ -8,7 +8,7 @@
 # https://arxiv.org/abs/2309.17453 for more details about Attention Sink.
 
 import types
-from typing import Optional
+from typing import Optional, Tuple
 
 import torch
 
@@ -133,6 +133,13 @@ class KVCacheWithAttentionSink(KVCache):
         self.eviction_batch_size = eviction_batch_size
         self.position_shift = 0
 
+    def snapshot(self, num_tokens: int) -> Tuple[torch.Tensor, torch.Tensor]:
+        # Evictions shift cached tokens and re-rotate their keys
+        raise NotImplementedError("Attention sink KV caches do not support snapshots.")
+
+    def restore(self, snapshot: Tuple[torch.Tensor, torch.Tensor]) -> None:
+        raise NotImplementedError("Attention sink KV caches do not support snapshots.")
+
     def evict_tokens(self, input_pos: torch.Tensor, seq_len: int) -> int:
         """
         Evict old tokens from the cache to make rooms for new tokens.
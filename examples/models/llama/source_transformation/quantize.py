@@ -15,6 +15,7 @@ import torch.nn as nn
 import torch.nn.functional as F
 
 from executorch.extension.llm.export.builder import DType
+from executorch.extension.llm.export.quantize import parallel_quantize_
 
 
 def quantize(  # noqa C901
@@ -35,6 +36,7 @@ def quantize(  # noqa C901
     tokenizer_path: Optional[Path] = None,
     verbose: bool = False,
     quantize_with_hqq: bool = True,
+    num_threads: Optional[int] = None,
 ) -> torch.nn.Module:
     """
     Quantizes a model by converting all weights to int8.
@@ -46,6 +48,8 @@ def quantize(  # noqa C901
             Also the dtype of the rest of the non-quantized compoents of the model.
         checkpoint_dtype: The dtype of the checkpoint, this arg exists since it is more accurate to
             quantize the weight in its original dtype.
+        num_threads: Number of layers quantized concurrently by the torchao modes, one by one
+            by default.
 
     Returns:
         A quantized model.
@@ -103,16 +107,13 @@ def quantize(  # noqa C901
         bitwidth = int(matches[0][0])
 
         from torchao.quantization.granularity import PerAxis, PerGroup
-        from torchao.quantization.quant_api import (
-            Int8DynamicActivationIntxWeightConfig,
-            quantize_,
-        )
+        from torchao.quantization.quant_api import Int8DynamicActivationIntxWeightConfig
         from torchao.utils import unwrap_tensor_subclass
 
         with torch.no_grad():
             # Computation dtype is fixed to fp32 in the implementation of quantize_, so
             # no way to decouple checkpoint and computation dtype.
-            quantize_(
+            parallel_quantize_(
                 model,
                 Int8DynamicActivationIntxWeightConfig(
                     weight_dtype=getattr(torch, f"int{bitwidth}"),
@@ -126,6 +127,7 @@ def quantize(  # noqa C901
                         "hqq_scale_only" if quantize_with_hqq else "affine"
                     ),
                 ),
+                num_threads=num_threads,
             )
             model = unwrap_tensor_subclass(model)
         if verbose:
@@ -136,10 +138,7 @@ def quantize(  # noqa C901
             # TODO: Default value for group size for 8da4w. Need this here for refactor, will clean this up.
             group_size = 128
 
-        from torchao.quantization import (
-            Int8DynamicActivationIntxWeightConfig,
-            quantize_,
-        )
+        from torchao.quantization import Int8DynamicActivationIntxWeightConfig
         from torchao.quantization.granularity import PerAxis, PerGroup
         from torchao.utils import unwrap_tensor_subclass
 
@@ -170,7 +169,7 @@ def quantize(  # noqa C901
             ) and has_shape_compatible_with_group_size
 
         weight_dtype = torch.int4 if qmode == "8da4w" else torch.int8
-        quantize_(
+        parallel_quantize_(
             model,
             Int8DynamicActivationIntxWeightConfig(
                 # pyre-ignore[16]
@@ -184,6 +183,7 @@ def quantize(  # noqa C901
                 ),
             ),
             filter_fn=filter_fn,
+            num_threads=num_threads,
         )
         # TODO: deal with checkpoint / computation dtype decoupling.
 
@@ -192,7 +192,7 @@ def quantize(  # noqa C901
         return model
     elif qmode == "4w":
         from torchao.quantization.granularity import PerGroup
-        from torchao.quantization.quant_api import IntxWeightOnlyConfig, quantize_
+        from torchao.quantization.quant_api import IntxWeightOnlyConfig
         from torchao.utils import unwrap_tensor_subclass
 
         q_group_size = 256 if group_size is None else group_size
@@ -205,7 +205,7 @@ def quantize(  # noqa C901
                 "hqq_scale_only" if quantize_with_hqq else "affine"
             ),
         )
-        quantize_(model, q_config)
+        parallel_quantize_(model, q_config, num_threads=num_threads)
         model = unwrap_tensor_subclass(model)
 
         return model
@@ -855,6 +855,7 @@ def get_quant_weight_transform(
     calibration_limit: Optional[int] = None,
     calibration_seq_length: Optional[int] = None,
     quantize_with_hqq: bool = True,
+    num_threads: Optional[int] = None,
 ):
     return partial(
         quantize,
@@ -868,6 +869,7 @@ def get_quant_weight_transform(
         calibration_seq_length=calibration_seq_length,
         tokenizer_path=(Path(path) if (path := tokenizer_path) is not None else None),
         quantize_with_hqq=quantize_with_hqq,
+        num_threads=num_threads,
     )
 
 
@@ -2,6 +2,7 @@ import copy
 import logging
 from abc import ABC, abstractmethod
 from collections import defaultdict, deque
+from dataclasses import dataclass
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import torch
@@ -14,6 +15,7 @@ from executorch.examples.models.llama.attention import (
     register_attention,
 )
 from executorch.examples.models.llama.model_args import ModelArgs
+from executorch.examples.models.llama.prefix_cache import PrefixCache
 from executorch.examples.models.llama.rope import Rope
 
 
@@ -219,6 +221,30 @@ class StaticAttentionMask:
         self.unmasked_len += new_unmasked_len
 
 
+@dataclass
+class SpeculativeDecodingStats:
+    """Counters of a StaticAttentionIOManager.speculative_decode call."""
+
+    num_generated_tokens: int = 0
+    num_target_forwards: int = 0
+    num_draft_forwards: int = 0
+    num_draft_tokens: int = 0
+    num_accepted_tokens: int = 0
+
+    @property
+    def acceptance_rate(self) -> float:
+        """Fraction of the proposed draft tokens that the target model accepted."""
+        if self.num_draft_tokens == 0:
+            return 0.0
+        return self.num_accepted_tokens / self.num_draft_tokens
+
+    @property
+    def tokens_per_target_forward(self) -> float:
+        if self.num_target_forwards == 0:
+            return 0.0
+        return self.num_generated_tokens / self.num_target_forwards
+
+
 class StaticAttentionIOManager:
     class NGramCache:
         def __init__(self, max_size):
@@ -400,11 +426,47 @@ class StaticAttentionIOManager:
         for mask in self._masks.values():
             mask.reset()
 
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Capture the current KV cache state so it can be restored later. Cache
+        updates always produce new tensors rather than writing into the old
+        ones, so the snapshot shares the cache tensors instead of copying them.
+        """
+        return {
+            "k_caches": dict(self.k_caches),
+            "v_caches": dict(self.v_caches),
+            "pos": self.pos,
+            "cache_full": self.cache_full,
+            "unmasked_lens": {
+                cache_len: mask.unmasked_len for cache_len, mask in self._masks.items()
+            },
+        }
+
+    def restore(self, snapshot: Dict[str, Any]):
+        self.k_caches = dict(snapshot["k_caches"])
+        self.v_caches = dict(snapshot["v_caches"])
+        self.pos = snapshot["pos"]
+        self.cache_full = snapshot["cache_full"]
+        for cache_len, mask in self._masks.items():
+            mask.reset()
+            mask.unmask(snapshot["unmasked_lens"][cache_len])
+
     def prefill(
         self,
         model: Callable[..., Any],
         tokens: Union[List[int], torch.Tensor],
+        prefix_cache: Optional[PrefixCache] = None,
     ) -> torch.Tensor:
+        """
+        Prefill the KV caches with the given tokens.
+
+        If a prefix cache is given and prefilling starts from position 0, the
+        state after the longest cached prefix of the tokens is restored and only
+        the rest of the tokens are run through the model. The state after every
+        `prefix_cache.block_size` tokens and after the last token is added to
+        the cache. With full logits, only the logits of the tokens that were run
+        are returned.
+        """
         if self.cache_full:
             raise RuntimeError("KV cache is full.")
 
@@ -419,21 +481,61 @@ class StaticAttentionIOManager:
         if isinstance(tokens, list):
             tokens = torch.tensor([tokens], dtype=torch.int32)
 
+        if prefix_cache is not None and self.pos == 0:
+            start = self._restore_longest_prefix(tokens, prefix_cache)
+        else:
+            prefix_cache = None
+            start = 0
+
         logits = None
         all_logits = None
-        for i in range(0, tokens.size(1), self.input_len):
-            logits = self._run_once(model, tokens[:, i : i + self.input_len])[0]
+        for i, j in self._prefill_chunks(start, tokens.size(1), prefix_cache):
+            logits = self._run_once(model, tokens[:, i:j])[0]
             if self.generate_full_logits:
                 if all_logits is None:
                     all_logits = logits
                 else:
                     all_logits = torch.cat([all_logits, logits], dim=1)
+            if prefix_cache is not None:
+                self._cache_prefix(tokens, j, prefix_cache)
 
         if self.generate_full_logits:
-            return all_logits[:, : tokens.size(1), :]
+            return all_logits[:, : tokens.size(1) - start, :]
 
         return logits
 
+    def _restore_longest_prefix(
+        self, tokens: torch.Tensor, prefix_cache: PrefixCache
+    ) -> int:
+        if tokens.size(0) != 1:
+            raise ValueError("Prefix caching requires a batch size of 1.")
+        start, snapshot = prefix_cache.lookup(tokens[0].tolist())
+        if snapshot is not None:
+            self.restore(snapshot)
+        return start
+
+    def _cache_prefix(
+        self, tokens: torch.Tensor, end: int, prefix_cache: PrefixCache
+    ) -> None:
+        # Snapshot at block boundaries and at the end of the prompt
+        if end % prefix_cache.block_size != 0 and end != tokens.size(1):
+            return
+        prefix = tokens[0, :end].tolist()
+        if prefix not in prefix_cache:
+            prefix_cache.insert(prefix, self.snapshot())
+
+    def _prefill_chunks(self, start, end, prefix_cache):
+        # Chunks of at most input_len tokens. With a prefix cache, chunks don't
+        # cross block boundaries so that the state there can be snapshotted.
+        i = start
+        while i < end:
+            j = min(i + self.input_len, end)
+            if prefix_cache is not None:
+                block_size = prefix_cache.block_size
+                j = min(j, (i // block_size + 1) * block_size)
+            yield i, j
+            i = j
+
     def decode(
         self,
         model: Callable[..., Any],
@@ -593,6 +695,136 @@ class StaticAttentionIOManager:
         )
         return new_tokens
 
+    def speculative_decode(
+        self,
+        model: Callable[..., Any],
+        init_token: int,
+        n: int,
+        draft_model: Callable[..., Any],
+        draft_mgr: "StaticAttentionIOManager",
+        num_draft_tokens: int,
+        stop_tokens: Optional[List[int]] = None,
+        stats: Optional[SpeculativeDecodingStats] = None,
+    ):
+        """
+        Decode with a smaller draft model proposing `num_draft_tokens` tokens at
+        a time, which the target model verifies in a single forward.
+
+        The draft model is run with its own `draft_mgr`, which must be at the
+        same position as this one, i.e. both have prefilled the same prompt.
+        Only greedy decoding is supported, so the output is the same as decode()
+        with the target model. The KV cache updates of the accepted tokens are
+        committed on both sides, and the draft caches are rolled back past the
+        rejected tokens using snapshots.
+        """
+        self._check_speculative_decode_args(draft_mgr, num_draft_tokens)
+        for mgr in (self, draft_mgr):
+            for mask in mgr._masks.values():
+                mask.set_input_mask(
+                    torch.triu(
+                        torch.full((1, mgr.input_len, mgr.input_len), mgr.mask_val),
+                        diagonal=1,
+                    )
+                )
+
+        stop_tokens = stop_tokens or []
+        stats = stats if stats is not None else SpeculativeDecodingStats()
+        new_tokens = [init_token]
+        # Tokens that are not in the draft KV caches yet
+        draft_pending = [init_token]
+        while len(new_tokens) < n + 1:
+            remaining = n + 1 - len(new_tokens)
+            k = min(num_draft_tokens, remaining)
+            drafts, draft_snapshots = draft_mgr._propose(draft_model, draft_pending, k)
+            stats.num_draft_forwards += k
+            stats.num_draft_tokens += k
+
+            y, attn_updates = self._run_once(
+                model, [new_tokens[-1]] + drafts, non_padded_len=1
+            )
+            stats.num_target_forwards += 1
+            y = y[0, : k + 1].argmax(dim=-1).tolist()
+            n_accepted = 0
+            while n_accepted < k and drafts[n_accepted] == y[n_accepted]:
+                n_accepted += 1
+            stats.num_accepted_tokens += n_accepted
+
+            accepted = y[: n_accepted + 1][:remaining]
+            for i, token in enumerate(accepted):
+                if token in stop_tokens:
+                    accepted = accepted[: i + 1]
+                    break
+            new_tokens.extend(accepted)
+            logger.debug(
+                f"{self.pos}: drafts = {drafts}, accepted = {n_accepted}, new = {accepted}"
+            )
+
+            # The first input token was committed by _run_once, commit the
+            # accepted draft tokens before the last new token.
+            if len(accepted) > 1:
+                self._update_states(
+                    attn_updates, update_pos=1, update_len=len(accepted) - 1
+                )
+            if len(accepted) <= k:
+                draft_mgr.restore(draft_snapshots[len(accepted)])
+                draft_pending = [accepted[-1]]
+            else:
+                # All drafts were accepted, the last one is not in the draft
+                # caches yet.
+                draft_pending = [drafts[-1], accepted[-1]]
+
+            if new_tokens[-1] in stop_tokens:
+                break
+
+        if len(draft_pending) > 1:
+            draft_mgr._run_once(draft_model, draft_pending[:-1])
+            stats.num_draft_forwards += 1
+
+        stats.num_generated_tokens += len(new_tokens) - 1
+        logger.info(
+            f"Generated {len(new_tokens) - 1} tokens with"
+            f" {stats.num_target_forwards} target inference(s), draft acceptance"
+            f" rate {stats.acceptance_rate:.2f}."
+        )
+        return new_tokens
+
+    def _check_speculative_decode_args(
+        self, draft_mgr: "StaticAttentionIOManager", num_draft_tokens: int
+    ):
+        if self.cache_full or draft_mgr.cache_full:
+            raise RuntimeError("KV cache is full.")
+        if not self.generate_full_logits:
+            raise RuntimeError("Speculative decoding requires full logits.")
+        if num_draft_tokens < 1 or num_draft_tokens + 1 > self.input_len:
+            raise RuntimeError(
+                "Speculative decoding setting not compatible with input length."
+                f" input_len = {self.input_len},"
+                f" num_draft_tokens = {num_draft_tokens}"
+            )
+        if draft_mgr.input_len < 2:
+            raise RuntimeError("Draft input length must be at least 2.")
+        if draft_mgr.pos != self.pos:
+            raise ValueError(
+                f"Draft position {draft_mgr.pos} does not match target position {self.pos}."
+            )
+
+    def _propose(
+        self, model: Callable[..., Any], pending: List[int], k: int
+    ) -> Tuple[List[int], List[Dict[str, Any]]]:
+        # Greedily propose k tokens. snapshots[i] is the state with the pending
+        # tokens and the first i - 1 proposed tokens in the KV caches.
+        drafts = []
+        snapshots = [None]
+        tokens = pending
+        for _ in range(k):
+            y = self._run_once(model, tokens)[0]
+            if self.generate_full_logits:
+                y = y[:, len(tokens) - 1, ...]
+            drafts.append(y.argmax().item())
+            snapshots.append(self.snapshot())
+            tokens = drafts[-1:]
+        return drafts, snapshots
+
     def _run_once(
         self,
         model: Callable[..., Any],
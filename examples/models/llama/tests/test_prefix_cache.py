@@ -0,0 +1,136 @@
+import copy
+import unittest
+
+import torch
+from executorch.examples.models.llama.attention import RingKVCache
+from executorch.examples.models.llama.llama_transformer import construct_transformer
+from executorch.examples.models.llama.model_args import ModelArgs
+from executorch.examples.models.llama.prefix_cache import (
+    PrefixCache,
+    restore_kv_caches,
+    snapshot_kv_caches,
+)
+from executorch.examples.models.llama.static_attention import (
+    StaticAttentionIOManager,
+    transform_attention_mha_to_static_attention,
+)
+
+
+class PrefixCacheTest(unittest.TestCase):
+    def setUp(self):
+        torch.manual_seed(42)
+
+    def test_lookup_longest_prefix(self):
+        cache = PrefixCache(max_bytes=1 << 20)
+        cache.insert([1, 2], {"t": torch.zeros(4)})
+        cache.insert([1, 2, 3, 4], {"t": torch.ones(4)})
+        length, snapshot = cache.lookup([1, 2, 3, 4, 5])
+        self.assertEqual(length, 4)
+        self.assertTrue(torch.equal(snapshot["t"], torch.ones(4)))
+        self.assertEqual(cache.lookup([1, 2, 3])[0], 2)
+        # At least one token is left to prefill
+        self.assertEqual(cache.lookup([1, 2])[0], 0)
+        self.assertEqual(cache.lookup([2, 1, 3])[0], 0)
+        self.assertEqual((cache.hits, cache.misses), (2, 2))
+
+    def test_lru_eviction_within_budget(self):
+        cache = PrefixCache(max_bytes=3 * 64)
+        for i in range(3):
+            cache.insert([i], torch.zeros(16))
+        self.assertEqual(cache.nbytes, 3 * 64)
+        # Touch [0] so that [1] is the least recently used
+        cache.lookup([0, 5])
+        cache.insert([3], torch.zeros(16))
+        self.assertIn([0], cache)
+        self.assertNotIn([1], cache)
+        self.assertEqual(len(cache), 3)
+        self.assertEqual(cache.nbytes, 3 * 64)
+        # Too large to ever fit
+        cache.insert([4], torch.zeros(64))
+        self.assertNotIn([4], cache)
+
+    def _get_static_model(self, config):
+        model = transform_attention_mha_to_static_attention(
+            construct_transformer(config).eval(),
+            split_mha=True,
+            inplace=False,
+            use_hf_rope=True,
+        ).eval()
+        config = copy.copy(config)
+        config.attention_type = "static"
+        config.use_hf_rope = True
+        return model, config
+
+    def test_static_attention_prefill(self):
+        config = ModelArgs(
+            dim=64,
+            n_heads=4,
+            n_kv_heads=2,
+            max_seq_len=64,
+            n_layers=2,
+            vocab_size=128,
+        )
+        model, config = self._get_static_model(config)
+        input_len = 8
+        cache_len = config.max_seq_len - input_len
+        system_prompt = torch.randint(config.vocab_size, (21,)).tolist()
+        prompts = [
+            system_prompt + torch.randint(config.vocab_size, (n,)).tolist()
+            for n in (5, 9)
+        ]
+
+        prefix_cache = PrefixCache(max_bytes=1 << 24, block_size=8)
+        ref_mgr = StaticAttentionIOManager(config, input_len, cache_len)
+        mgr = StaticAttentionIOManager(config, input_len, cache_len)
+        with torch.no_grad():
+            for prompt in prompts:
+                ref_mgr.reset()
+                mgr.reset()
+                ref_logits = ref_mgr.prefill(model, prompt)
+                logits = mgr.prefill(model, prompt, prefix_cache=prefix_cache)
+                self.assertTrue(torch.allclose(ref_logits, logits, atol=1e-5))
+                next_token = logits.argmax().item()
+                self.assertEqual(
+                    mgr.decode(model, next_token, 8),
+                    ref_mgr.decode(model, next_token, 8),
+                )
+
+        # The second prompt reused the full blocks of the shared system prompt
+        self.assertEqual(prefix_cache.hits, 1)
+        self.assertIn(system_prompt[:16], prefix_cache)
+        self.assertIn(prompts[1], prefix_cache)
+
+    def test_mutable_buffer_kv_caches(self):
+        config = ModelArgs(
+            dim=64,
+            n_heads=4,
+            n_kv_heads=2,
+            max_seq_len=32,
+            n_layers=2,
+            vocab_size=128,
+            use_kv_cache=True,
+            enable_dynamic_shape=True,
+        )
+        model = construct_transformer(config).eval()
+        prompt = torch.randint(config.vocab_size, (1, 12))
+
+        def forward(tokens, start_pos):
+            return model(tokens, {"input_pos": torch.tensor([start_pos])})[0]
+
+        with torch.no_grad():
+            forward(prompt[:, :8], 0)
+            snapshot = snapshot_kv_caches(model, 8)
+            ref_logits = forward(prompt[:, 8:], 8)
+
+            # Clobber the caches with a different prompt, then restore
+            forward(torch.randint(config.vocab_size, (1, 12)), 0)
+            restore_kv_caches(model, snapshot)
+            logits = forward(prompt[:, 8:], 8)
+        self.assertTrue(torch.allclose(ref_logits, logits))
+
+    def test_ring_buffer_kv_cache_is_rejected(self):
+        model = torch.nn.ModuleDict(
+            {"kv_cache": RingKVCache(1, 8, 2, 4, enable_dynamic_shape=True)}
+        )
+        with self.assertRaisesRegex(ValueError, "ring buffer"):
+            snapshot_kv_caches(model, 4)
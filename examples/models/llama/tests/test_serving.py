@@ -0,0 +1,120 @@
+import asyncio
+import copy
+import unittest
+
+import torch
+from executorch.examples.models.llama.llama_transformer import construct_transformer
+from executorch.examples.models.llama.model_args import ModelArgs
+from executorch.examples.models.llama.runner.serving import (
+    GenerationRequest,
+    ServingEngine,
+)
+from executorch.examples.models.llama.static_attention import (
+    StaticAttentionIOManager,
+    transform_attention_mha_to_static_attention,
+)
+
+
+class ServingEngineTest(unittest.TestCase):
+    def setUp(self):
+        torch.manual_seed(42)
+        config = ModelArgs(
+            dim=64,
+            n_heads=4,
+            n_kv_heads=2,
+            max_seq_len=64,
+            n_layers=2,
+            vocab_size=128,
+        )
+        self.model = transform_attention_mha_to_static_attention(
+            construct_transformer(config).eval(),
+            split_mha=True,
+            inplace=False,
+            use_hf_rope=True,
+        ).eval()
+        self.config = copy.copy(config)
+        self.config.attention_type = "static"
+        self.config.use_hf_rope = True
+        self.input_len = 8
+        self.cache_len = config.max_seq_len - self.input_len
+
+    def _generate_sequentially(self, prompt, max_new_tokens):
+        mgr = StaticAttentionIOManager(self.config, self.input_len, self.cache_len)
+        first_token = mgr.prefill(self.model, prompt).argmax().item()
+        return mgr.decode(self.model, first_token, max_new_tokens - 1)
+
+    def _make_prompts(self, lengths):
+        return [torch.randint(self.config.vocab_size, (n,)).tolist() for n in lengths]
+
+    def test_interleaved_matches_sequential(self):
+        prompts = self._make_prompts([3, 8, 19, 1, 12])
+        max_new_tokens = [10, 4, 7, 12, 5]
+        engine = ServingEngine(
+            self.model,
+            self.config,
+            self.input_len,
+            self.cache_len,
+            num_slots=2,
+            max_prefill_chunks_per_step=1,
+        )
+        requests = [
+            engine.submit(GenerationRequest(prompt_tokens=p, max_new_tokens=n))
+            for p, n in zip(prompts, max_new_tokens)
+        ]
+        with torch.no_grad():
+            engine.run_until_complete()
+            for request, prompt, n in zip(requests, prompts, max_new_tokens):
+                self.assertTrue(request.finished)
+                self.assertEqual(
+                    request.generated_tokens, self._generate_sequentially(prompt, n)
+                )
+        self.assertFalse(engine.has_work())
+
+    def test_stop_tokens(self):
+        (prompt,) = self._make_prompts([5])
+        with torch.no_grad():
+            expected = self._generate_sequentially(prompt, 8)
+            engine = ServingEngine(
+                self.model, self.config, self.input_len, self.cache_len, num_slots=1
+            )
+            request = engine.submit(
+                GenerationRequest(
+                    prompt_tokens=prompt,
+                    max_new_tokens=8,
+                    stop_tokens=[expected[2]],
+                )
+            )
+            engine.run_until_complete()
+        self.assertEqual(
+            request.generated_tokens, expected[: expected.index(expected[2]) + 1]
+        )
+
+    def test_generate_streams_concurrent_requests(self):
+        prompts = self._make_prompts([4, 11, 6])
+        engine = ServingEngine(
+            self.model, self.config, self.input_len, self.cache_len, num_slots=2
+        )
+
+        async def collect(prompt):
+            return [token async for token in engine.generate(prompt, 6)]
+
+        async def serve():
+            return await asyncio.gather(*(collect(p) for p in prompts))
+
+        with torch.no_grad():
+            outputs = asyncio.run(serve())
+            for prompt, output in zip(prompts, outputs):
+                self.assertEqual(output, self._generate_sequentially(prompt, 6))
+
+    def test_rejects_too_long_requests(self):
+        engine = ServingEngine(
+            self.model, self.config, self.input_len, self.cache_len, num_slots=1
+        )
+        with self.assertRaises(ValueError):
+            engine.submit(
+                GenerationRequest(
+                    prompt_tokens=[1] * 10, max_new_tokens=engine.max_seq_len
+                )
+            )
+        with self.assertRaises(ValueError):
+            engine.submit(GenerationRequest(prompt_tokens=[], max_new_tokens=1))
@@ -9,6 +9,7 @@ from executorch.examples.models.llama.llama_transformer import construct_transfo
 from executorch.examples.models.llama.model_args import ModelArgs
 from executorch.examples.models.llama.rope import Rope
 from executorch.examples.models.llama.static_attention import (
+    SpeculativeDecodingStats,
     StaticAttention,
     StaticAttentionIOManager,
     StaticAttentionMask,
@@ -306,6 +307,61 @@ class StaticAttentionTest(unittest.TestCase):
             )
             self.assertEqual(lookahead_output[: len(ref_output)], ref_output)
 
+    def test_speculative_decode(self):
+        config = ModelArgs(
+            dim=64,
+            n_heads=4,
+            n_kv_heads=2,
+            max_seq_len=128,
+            n_layers=4,
+            vocab_size=128,
+            generate_full_logits=True,
+        )
+        _, static_transformer, static_config = self._get_test_transformers(config)
+        draft_config = copy.copy(config)
+        draft_config.n_layers = 1
+        draft_config.generate_full_logits = False
+        _, draft_transformer, draft_config = self._get_test_transformers(draft_config)
+
+        input_len = 8
+        cache_len = static_config.max_seq_len - input_len
+        prefill_input = torch.randint(static_config.vocab_size, (20,)).tolist()
+        ref_mgr = StaticAttentionIOManager(static_config, input_len, cache_len)
+        next_tok = ref_mgr.prefill(static_transformer, prefill_input)[0][-1]
+        next_tok = next_tok.argmax().item()
+        ref_output = ref_mgr.decode(static_transformer, next_tok, 50)
+
+        def test(draft_model, draft_config, num_draft_tokens):
+            mgr = StaticAttentionIOManager(static_config, input_len, cache_len)
+            draft_mgr = StaticAttentionIOManager(draft_config, input_len, cache_len)
+            mgr.prefill(static_transformer, prefill_input)
+            draft_mgr.prefill(draft_model, prefill_input)
+            stats = SpeculativeDecodingStats()
+            output = mgr.speculative_decode(
+                static_transformer,
+                next_tok,
+                50,
+                draft_model=draft_model,
+                draft_mgr=draft_mgr,
+                num_draft_tokens=num_draft_tokens,
+                stats=stats,
+            )
+            self.assertEqual(output, ref_output)
+            self.assertEqual(stats.num_generated_tokens, 50)
+            self.assertEqual(mgr.pos, ref_mgr.pos)
+            self.assertEqual(draft_mgr.pos, mgr.pos)
+            return stats
+
+        # A draft identical to the target only gets its tokens accepted if its
+        # caches are rolled back and committed correctly.
+        stats = test(static_transformer, static_config, 4)
+        self.assertEqual(stats.acceptance_rate, 1.0)
+        self.assertEqual(stats.num_target_forwards, 10)
+
+        stats = test(draft_transformer, draft_config, 3)
+        self.assertLess(stats.acceptance_rate, 1.0)
+        self.assertGreaterEqual(stats.num_target_forwards, 13)
+
     def test_batched_export_with_backprop(self):
         config = ModelArgs(
             dim=64,
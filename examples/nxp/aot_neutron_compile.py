@@ -28,6 +28,7 @@ from executorch.backends.nxp.neutron_partitioner import NeutronPartitioner
 from executorch.backends.nxp.nxp_backend import (
     core_aten_ops_exception_list,
     generate_neutron_compile_spec,
+    neutron_lowering_options,
 )
 from executorch.backends.nxp.quantizer.neutron_quantizer import NeutronQuantizer
 from executorch.backends.nxp.quantizer.utils import calibrate_and_quantize
@@ -226,6 +227,19 @@ if __name__ == "__main__":  # noqa C901
         "the working directory. This file can be used for reduction of Neutron Firmware size in the built app."
         "See `docs/source/backends/nxp/nxp-kernel-selection.md` for details.",
     )
+    parser.add_argument(
+        "--num_compile_workers",
+        required=False,
+        default=1,
+        type=int,
+        help="Number of delegated partitions converted by Neutron Converter in parallel.",
+    )
+    parser.add_argument(
+        "--compile_cache_dir",
+        required=False,
+        default=None,
+        help="Directory where the Neutron Converter outputs are cached, to speed up repeated exports of a model.",
+    )
     parser.add_argument(
         "--use_random_dataset",
         required=False,
@@ -336,14 +350,18 @@ if __name__ == "__main__":  # noqa C901
         else []
     )
 
-    edge_program_manager = to_edge_transform_and_lower(
-        export(module, example_inputs, strict=True),
-        transform_passes=NeutronEdgePassManager(),
-        partitioner=partitioners,
-        compile_config=EdgeCompileConfig(
-            _core_aten_ops_exception_list=core_aten_ops_exception_list,
-        ),
-    )
+    with neutron_lowering_options(
+        num_compile_workers=args.num_compile_workers,
+        compile_cache_dir=args.compile_cache_dir,
+    ):
+        edge_program_manager = to_edge_transform_and_lower(
+            export(module, example_inputs, strict=True),
+            transform_passes=NeutronEdgePassManager(),
+            partitioner=partitioners,
+            compile_config=EdgeCompileConfig(
+                _core_aten_ops_exception_list=core_aten_ops_exception_list,
+            ),
+        )
 
     if args.remove_quant_io_ops:
         edge_program_manager = edge_program_manager.transform(
@@ -16,9 +16,9 @@ class Cord:
     `bytes` or `bytearray` object.
     """
 
-    def __init__(self, data: Optional[Union[bytes, "Cord"]] = None) -> None:
+    def __init__(self, data: Optional[Union[bytes, memoryview, "Cord"]] = None) -> None:
         """Initialize Cord data structure."""
-        self._buffers: List[bytes] = []
+        self._buffers: List[Union[bytes, memoryview]] = []
         self._byte_size: int = 0
 
         if data is not None:
@@ -32,16 +32,25 @@ class Cord:
         """Return the contents of the Cord as a single `bytes` object."""
         return b"".join(self._buffers)
 
-    def append(self, data: Union[bytes, "Cord"]) -> None:
-        """Append a bytes or Cord to the current Cord."""
+    def append(self, data: Union[bytes, memoryview, "Cord"]) -> None:
+        """Append a bytes, memoryview or Cord to the current Cord.
+
+        A memoryview is referenced, not copied, so e.g. a slice of a memory-mapped
+        file is only read when the Cord is written out.
+        """
         if isinstance(data, bytes):
             self._buffers.append(data)
             self._byte_size += len(data)
+        elif isinstance(data, memoryview):
+            self._buffers.append(data)
+            self._byte_size += data.nbytes
         elif isinstance(data, Cord):
             self._buffers.extend(data._buffers)
             self._byte_size += len(data)
         else:
-            raise TypeError(f"Can only append bytes or Cords, received {type(data)}")
+            raise TypeError(
+                f"Can only append bytes, memoryviews or Cords, received {type(data)}"
+            )
 
     def write_to_file(self, outfile: io.BufferedIOBase) -> None:
         """Write the Cord to a file."""
@@ -61,3 +61,20 @@ class TestCord(unittest.TestCase):
         outfile = io.BytesIO()
         cord.write_to_file(outfile)
         self.assertEqual(b"HelloWorld", outfile.getvalue())
+
+    def test_cord_append_memoryview(self) -> None:
+        data = bytearray(b"HelloWorld")
+        view = memoryview(data)[5:]
+
+        cord = Cord(b"Hello")
+        cord.append(view)
+        self.assertEqual(10, len(cord))
+
+        # Confirm that the memoryview is referenced, not copied.
+        self.assertIs(cord._buffers[1], view)
+        data[5:] = b"There"
+        self.assertEqual(b"HelloThere", bytes(cord))
+
+        outfile = io.BytesIO()
+        cord.write_to_file(outfile)
+        self.assertEqual(b"HelloThere", outfile.getvalue())
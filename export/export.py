@@ -61,6 +61,7 @@ def export(
     constant_methods: Optional[Union[Dict[str, Callable]]] = None,
     artifact_dir: Optional[str] = None,
     generate_etrecord: bool = False,
+    export_cache_dir: Optional[str] = None,
 ) -> "ExportSession":
     """
     Create and configure an ExportSession with the given parameters.
@@ -85,6 +86,8 @@ def export(
         constant_methods: Optional dictionary of constant methods
         artifact_dir: Optional directory to store artifacts
         generate_etrecord: Optional flag to generate an etrecord
+        export_cache_dir: Optional directory to cache torch.export results in,
+                          reused when the model and inputs are unchanged
 
     Returns:
         A configured ExportSession instance with the export process completed if requested
@@ -98,6 +101,7 @@ def export(
         constant_methods=constant_methods,
         artifact_dir=artifact_dir,
         generate_etrecord=generate_etrecord,
+        export_cache_dir=export_cache_dir,
     )
     session.export()
 
@@ -141,6 +145,7 @@ class ExportSession:
         constant_methods: Optional[Union[Dict[str, Callable]]] = None,
         artifact_dir: Optional[str] = None,
         generate_etrecord: Optional[bool] = False,
+        export_cache_dir: Optional[str] = None,
     ) -> None:
         """
         Initialize the ExportSession with model, inputs, and recipe.
@@ -162,6 +167,8 @@ class ExportSession:
             constant_methods: Optional dictionary of constant methods
             artifact_dir: Optional directory to store artifacts
             generate_etrecord: Optional flag to generate an etrecord
+            export_cache_dir: Optional directory to cache torch.export results in,
+                              reused when the model and inputs are unchanged
         """
         # Load model from file if string path provided
         if isinstance(model, str):
@@ -230,6 +237,7 @@ class ExportSession:
             "session_name": name,
             "artifact_dir": artifact_dir,
             "generate_etrecord": generate_etrecord,
+            "export_cache_dir": export_cache_dir,
         }
 
         self._stage_to_artifacts: Dict[StageType, PipelineArtifact] = {}
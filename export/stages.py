@@ -19,6 +19,7 @@ from executorch.exir.pass_manager import PassManager
 from executorch.exir.program import to_edge, to_edge_transform_and_lower
 from executorch.export.recipe import LoweringRecipe, QuantizationRecipe
 from executorch.export.types import StageType
+from executorch.extension.export_util.export_cache import ExportCache
 from torch import nn
 from torch._export.pass_base import PassType
 from torchao.quantization import quantize_
@@ -49,6 +50,23 @@ class PipelineArtifact:
         return PipelineArtifact(data=new_data, context=self.context.copy())
 
 
+def _export(
+    artifact: PipelineArtifact, model: nn.Module, args: Any, **kwargs: Any
+) -> ExportedProgram:
+    """
+    torch.export.export, reusing the result of a previous run from the
+    export_cache_dir of the session, if any.
+    """
+    cache_dir = artifact.get_context("export_cache_dir")
+    if not cache_dir:
+        return torch.export.export(model, args, **kwargs)
+    cache = ExportCache(cache_dir)
+    return cache.get_or_export(
+        cache.key(model, args, extra=kwargs),
+        lambda: torch.export.export(model, args, **kwargs),
+    )
+
+
 class Stage(ABC):
     """
     Interface for a Stage in the ExecuTorch export pipeline.
@@ -147,7 +165,8 @@ class TorchExportStage(Stage):
                 method_dynamic_shapes = dynamic_shapes.get(method_name)
 
                 # Export the model
-                exported_programs[method_name] = torch.export.export(
+                exported_programs[method_name] = _export(
+                    artifact,
                     model,
                     example_inputs[method_name][0],
                     dynamic_shapes=method_dynamic_shapes,
@@ -432,7 +451,7 @@ class QuantizeStage(Stage):
                 )
 
             inputs = example_inputs[method_name][0]
-            captured_graph = torch.export.export(model, inputs, strict=True).module()
+            captured_graph = _export(artifact, model, inputs, strict=True).module()
 
             quantizer = self._get_quantizer_for_prepare_pt2e(
                 self._quantization_recipe.quantizers  # pyre-ignore
@@ -190,6 +190,7 @@ class TestExportSessionCoreFlow(unittest.TestCase):
             "session_name",
             "artifact_dir",
             "generate_etrecord",
+            "export_cache_dir",
         }
         self.assertEqual(set(session._run_context.keys()), expected_context_keys)
         self.assertEqual(session._run_context["session_name"], "test_session")
@@ -6,6 +6,8 @@
 
 # pyre-strict
 
+import os
+import tempfile
 import unittest
 from unittest.mock import Mock, patch
 
@@ -22,6 +24,7 @@ from executorch.export.stages import (
     ToEdgeStage,
     TorchExportStage,
 )
+from executorch.extension.export_util.export_cache import ExportCache
 from torch.export import ExportedProgram
 from torchao.quantization.pt2e.quantizer import Quantizer as TorchAOPT2EQuantizer
 
@@ -160,6 +163,107 @@ class TestTorchExportStage(unittest.TestCase):
         )
 
 
+class TestExportCache(unittest.TestCase):
+    def setUp(self) -> None:
+        torch.manual_seed(0)
+        self.model = SimpleTestModel()
+        self.example_inputs = [(torch.randn(2, 10),)]
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.context = {
+            "example_inputs": {"forward": self.example_inputs},
+            "dynamic_shapes": {},
+            "export_cache_dir": self.tmpdir.name,
+        }
+
+    def tearDown(self) -> None:
+        self.tmpdir.cleanup()
+
+    def _run_export_stage(self) -> ExportedProgram:
+        stage = TorchExportStage()
+        stage.run(PipelineArtifact(data={"forward": self.model}, context=self.context))
+        return stage.get_artifacts().data["forward"]
+
+    def test_export_stage_reuses_cached_program(self) -> None:
+        exported_program = self._run_export_stage()
+        self.assertEqual(len(os.listdir(self.tmpdir.name)), 1)
+
+        with patch("torch.export.export") as mock_torch_export:
+            cached_program = self._run_export_stage()
+        mock_torch_export.assert_not_called()
+        torch.testing.assert_close(
+            cached_program.module()(*self.example_inputs[0]),
+            exported_program.module()(*self.example_inputs[0]),
+        )
+
+        # Changed weights are exported again
+        with torch.no_grad():
+            self.model.linear.weight.add_(1.0)
+        self._run_export_stage()
+        self.assertEqual(len(os.listdir(self.tmpdir.name)), 2)
+
+    def test_key(self) -> None:
+        cache = ExportCache(self.tmpdir.name)
+        inputs = self.example_inputs[0]
+        key = cache.key(self.model, inputs)
+        self.assertEqual(key, cache.key(self.model, inputs))
+        torch.manual_seed(0)
+        self.assertEqual(key, cache.key(SimpleTestModel(), inputs))
+        self.assertNotEqual(key, cache.key(self.model, (torch.randn(3, 10),)))
+        self.assertNotEqual(
+            key,
+            cache.key(
+                self.model,
+                inputs,
+                dynamic_shapes=({0: torch.export.Dim("batch", max=8)},),
+            ),
+        )
+        self.assertNotEqual(key, cache.key(self.model, inputs, extra={"strict": False}))
+
+        torch.manual_seed(1)
+        self.assertNotEqual(key, cache.key(SimpleTestModel(), inputs))
+
+    def test_key_with_checkpoints(self) -> None:
+        inputs = self.example_inputs[0]
+        checkpoint = os.path.join(self.tmpdir.name, "model.pth")
+        torch.save(self.model.state_dict(), checkpoint)
+
+        cache = ExportCache(self.tmpdir.name)
+        key = cache.key(self.model, inputs, checkpoints=[checkpoint])
+        self.assertEqual(key, cache.key(self.model, inputs, checkpoints=[checkpoint]))
+        self.assertNotEqual(key, cache.key(self.model, inputs))
+
+        # The weights are identified by the checkpoint, not by their contents
+        with torch.no_grad():
+            self.model.linear.weight.add_(1.0)
+        self.assertEqual(key, cache.key(self.model, inputs, checkpoints=[checkpoint]))
+
+        # Rewriting the checkpoint changes its size or modification time
+        torch.save(self.model.state_dict(), checkpoint)
+        os.utime(checkpoint, ns=(0, 0))
+        self.assertNotEqual(
+            key, cache.key(self.model, inputs, checkpoints=[checkpoint])
+        )
+
+        # Opt in to hashing the contents of the weights
+        hashing_cache = ExportCache(self.tmpdir.name, hash_weights=True)
+        self.assertEqual(
+            hashing_cache.key(self.model, inputs, checkpoints=[checkpoint]),
+            hashing_cache.key(self.model, inputs),
+        )
+
+    def test_unreadable_cache_entry(self) -> None:
+        cache = ExportCache(self.tmpdir.name)
+        key = cache.key(self.model, self.example_inputs[0])
+        with open(cache.path(key), "w") as f:
+            f.write("not an exported program")
+        self.assertIsNone(cache.load(key))
+        exported_program = cache.get_or_export(
+            key, lambda: torch.export.export(self.model, self.example_inputs[0])
+        )
+        self.assertIsNotNone(cache.load(key))
+        self.assertIsInstance(exported_program, ExportedProgram)
+
+
 class TestEdgeTransformAndLowerStage(unittest.TestCase):
     def setUp(self) -> None:
         self.mock_exported_program = Mock(spec=ExportedProgram)
@@ -0,0 +1,266 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# All rights reserved.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+"""
+On-disk cache of torch.export results.
+
+Exporting a large model is often the slowest step of lowering it, and
+sweeping quantizers or partitioners re-exports the same model every time.
+ExportCache stores ExportedPrograms with torch.export.save, keyed by a hash of:
+
+- the source files of the model's module classes (or the generated code of
+  GraphModules),
+- the model structure, and the plain config attributes of its modules,
+- the names, types and shapes of its parameters and buffers,
+- the path, size and modification time of the checkpoints the weights were
+  loaded from, or the contents of the weights if no checkpoint is given or
+  hash_weights is set,
+- the example inputs, dynamic shapes and export options, including source
+  transforms, which are identified by their name, bound arguments and closure
+  variables,
+- the torch version.
+
+Hashing the contents of the weights reads every byte of them, which takes
+long for large models, so prefer passing the checkpoints.
+
+Code reached from other files, e.g. helper functions, is not part of the key.
+Pass it through `extra` if it changes between runs, or clear the cache.
+"""
+
+import dataclasses
+import enum
+import functools
+import hashlib
+import inspect
+import logging
+import os
+import sys
+import tempfile
+from typing import Any, Callable, Dict, Optional, Sequence
+
+import torch
+from torch.export import ExportedProgram
+
+_PRIMITIVES = (bool, int, float, str, type(None), torch.dtype, torch.device)
+
+
+def _update_tensor(
+    hasher: "hashlib._Hash", tensor: torch.Tensor, contents: bool = True
+) -> None:
+    hasher.update(
+        f"{type(tensor).__name__}{tensor.dtype}{tuple(tensor.shape)}".encode()
+    )
+    if hasattr(tensor, "__tensor_flatten__"):
+        # Tensor subclasses, e.g. quantized weights
+        attrs, ctx = tensor.__tensor_flatten__()
+        hasher.update(repr(ctx).encode())
+        for attr in attrs:
+            _update_tensor(hasher, getattr(tensor, attr), contents)
+        return
+    if tensor.is_meta or not contents:
+        return
+    data = tensor.detach().cpu().contiguous().reshape(-1)
+    if data.numel() > 0:
+        hasher.update(data.view(torch.uint8).numpy().data)
+
+
+def _update_callable(hasher: "hashlib._Hash", fn: Callable[..., Any]) -> None:
+    """Hash a function, e.g. a source transform, with the values it is bound to."""
+    if isinstance(fn, functools.partial):
+        _update_callable(hasher, fn.func)
+        _update_value(hasher, fn.args)
+        _update_value(hasher, fn.keywords)
+        return
+    hasher.update(f"{fn.__module__}.{fn.__qualname__}".encode())
+    for cell in getattr(fn, "__closure__", None) or ():
+        try:
+            value = cell.cell_contents
+        except ValueError:
+            continue
+        if inspect.isroutine(value):
+            # Only by name, so that recursive closures terminate
+            hasher.update(f"{value.__module__}.{value.__qualname__}".encode())
+        else:
+            _update_value(hasher, value)
+
+
+def _update_value(hasher: "hashlib._Hash", value: Any) -> None:
+    """Hash example inputs, dynamic shapes and options."""
+    if isinstance(value, torch.Tensor):
+        _update_tensor(hasher, value)
+    elif isinstance(value, functools.partial) or inspect.isroutine(value):
+        _update_callable(hasher, value)
+    elif isinstance(value, dict):
+        hasher.update(b"{")
+        for k, v in value.items():
+            _update_value(hasher, k)
+            _update_value(hasher, v)
+        hasher.update(b"}")
+    elif isinstance(value, (list, tuple)):
+        hasher.update(f"{type(value).__name__}[".encode())
+        for v in value:
+            _update_value(hasher, v)
+        hasher.update(b"]")
+    else:
+        hasher.update(repr(value).encode())
+    hasher.update(b";")
+
+
+def _config_value(value: Any) -> Optional[str]:
+    """A stable description of a module attribute, None if it has none."""
+    if isinstance(value, _PRIMITIVES) or isinstance(value, enum.Enum):
+        return repr(value)
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return repr(value)
+    if isinstance(value, (list, tuple)):
+        items = [_config_value(v) for v in value]
+        return None if None in items else f"[{','.join(items)}]"  # pyre-ignore
+    return None
+
+
+def _source(cls: type, sources: Dict[str, str]) -> str:
+    module_name = cls.__module__
+    if module_name not in sources:
+        try:
+            sources[module_name] = inspect.getsource(sys.modules[module_name])
+        except (KeyError, OSError, TypeError):
+            sources[module_name] = module_name
+    return sources[module_name]
+
+
+def _update_checkpoint(hasher: "hashlib._Hash", path: str) -> None:
+    """Hash the path, size and modification time of a checkpoint file or directory."""
+    path = os.path.abspath(path)
+    if os.path.isdir(path):
+        files = sorted(
+            os.path.join(root, name)
+            for root, _, names in os.walk(path)
+            for name in names
+        )
+    else:
+        files = [path]
+    for file in files:
+        try:
+            stat = os.stat(file)
+        except OSError:
+            hasher.update(f"{file}:missing;".encode())
+            continue
+        hasher.update(f"{file}:{stat.st_size}:{stat.st_mtime_ns};".encode())
+
+
+def _update_module(
+    hasher: "hashlib._Hash", model: torch.nn.Module, weight_contents: bool
+) -> None:
+    sources: Dict[str, str] = {}
+    for name, module in model.named_modules(remove_duplicate=False):
+        cls = type(module)
+        hasher.update(f"{name}:{cls.__module__}.{cls.__qualname__}".encode())
+        if isinstance(module, torch.fx.GraphModule):
+            hasher.update(module.code.encode())
+        else:
+            _source(cls, sources)
+        for attr, value in sorted(vars(module).items()):
+            if attr.startswith("_"):
+                continue
+            description = _config_value(value)
+            if description is not None:
+                hasher.update(f"{attr}={description}".encode())
+    for module_name, source in sorted(sources.items()):
+        hasher.update(f"{module_name}\n{source}".encode())
+
+    for name, tensor in [
+        *model.named_parameters(remove_duplicate=False),
+        *model.named_buffers(remove_duplicate=False),
+    ]:
+        hasher.update(name.encode())
+        _update_tensor(hasher, tensor, weight_contents)
+
+
+class ExportCache:
+    """
+    A directory of exported programs, keyed by the model and export arguments.
+
+    Example:
+        cache = ExportCache("/tmp/export_cache")
+        key = cache.key(model, example_inputs, dynamic_shapes=dynamic_shapes)
+        exported_program = cache.get_or_export(
+            key, lambda: torch.export.export(model, example_inputs)
+        )
+    """
+
+    def __init__(self, cache_dir: str, hash_weights: bool = False) -> None:
+        """
+        hash_weights keys the cache on the contents of the weights even when
+        the checkpoints they were loaded from are known.
+        """
+        self.cache_dir = cache_dir
+        self.hash_weights = hash_weights
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def key(
+        self,
+        model: torch.nn.Module,
+        args: Any,
+        kwargs: Optional[Dict[str, Any]] = None,
+        dynamic_shapes: Any = None,
+        extra: Any = None,
+        checkpoints: Optional[Sequence[str]] = None,
+    ) -> str:
+        """
+        The cache key of exporting model with the given arguments. extra holds
+        anything else the export depends on, e.g. options and transforms.
+        checkpoints are the files or directories the weights of model were
+        loaded from. Weights are identified by their contents if none are given.
+        """
+        checkpoints = [c for c in checkpoints or [] if c]
+        weight_contents = self.hash_weights or not checkpoints
+        hasher = hashlib.sha256()
+        hasher.update(torch.__version__.encode())
+        _update_module(hasher, model, weight_contents)
+        if not weight_contents:
+            for checkpoint in checkpoints:
+                _update_checkpoint(hasher, checkpoint)
+        for value in (args, kwargs, dynamic_shapes, extra):
+            _update_value(hasher, value)
+        return hasher.hexdigest()
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.pt2")
+
+    def load(self, key: str) -> Optional[ExportedProgram]:
+        path = self.path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            return torch.export.load(path)
+        except Exception as e:
+            logging.warning(f"Ignoring unreadable cached export {path}: {e}")
+            return None
+
+    def save(self, key: str, exported_program: ExportedProgram) -> None:
+        """Save atomically, so that concurrent runs never see partial files."""
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".pt2.tmp")
+        os.close(fd)
+        try:
+            torch.export.save(exported_program, tmp_path)
+            os.replace(tmp_path, self.path(key))
+        except Exception as e:
+            # Not every program can be serialized, e.g. with custom objects
+            logging.warning(f"Could not cache exported program: {e}")
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def get_or_export(
+        self, key: str, export_fn: Callable[[], ExportedProgram]
+    ) -> ExportedProgram:
+        exported_program = self.load(key)
+        if exported_program is not None:
+            logging.info(f"Loaded cached export {self.path(key)}")
+            return exported_program
+        exported_program = export_fn()
+        self.save(key, exported_program)
+        return exported_program
@@ -0,0 +1,178 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# All rights reserved.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+"""
+Registry of the GGUF model architectures that can be converted to the
+ExecuTorch Llama transformer (examples/models/llama/llama_transformer.py).
+
+Each architecture maps GGUF tensor names to the Llama transformer's parameter
+names, and GGUF metadata to the model params (see ModelArgs), e.g.
+
+    register_architecture(
+        GGUFArchitecture(
+            name="my_arch",
+            tensor_names={**LLAMA_TENSOR_NAMES, "blk.{}.extra.weight": None},
+            params=lambda metadata: {**llama_params(metadata), "use_hf_rope": True},
+        )
+    )
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+# GGUF tensor name -> Llama transformer parameter name. "{}" is the layer id.
+# Tensors mapped to None are skipped.
+LLAMA_TENSOR_NAMES: Dict[str, Optional[str]] = {
+    "token_embd.weight": "tok_embeddings.weight",
+    "output_norm.weight": "norm.weight",
+    "output.weight": "output.weight",
+    # Precomputed llama3 RoPE scaling factors, recomputed by the model
+    "rope_freqs.weight": None,
+    "blk.{}.attn_q.weight": "layers.{}.attention.wq.weight",
+    "blk.{}.attn_k.weight": "layers.{}.attention.wk.weight",
+    "blk.{}.attn_v.weight": "layers.{}.attention.wv.weight",
+    "blk.{}.attn_output.weight": "layers.{}.attention.wo.weight",
+    "blk.{}.attn_norm.weight": "layers.{}.attention_norm.weight",
+    "blk.{}.ffn_norm.weight": "layers.{}.ffn_norm.weight",
+    "blk.{}.ffn_gate.weight": "layers.{}.feed_forward.w1.weight",
+    "blk.{}.ffn_down.weight": "layers.{}.feed_forward.w2.weight",
+    "blk.{}.ffn_up.weight": "layers.{}.feed_forward.w3.weight",
+}
+
+_QKV_BIAS_TENSOR_NAMES: Dict[str, Optional[str]] = {
+    "blk.{}.attn_q.bias": "layers.{}.attention.wq.bias",
+    "blk.{}.attn_k.bias": "layers.{}.attention.wk.bias",
+    "blk.{}.attn_v.bias": "layers.{}.attention.wv.bias",
+}
+
+_QK_NORM_TENSOR_NAMES: Dict[str, Optional[str]] = {
+    "blk.{}.attn_q_norm.weight": "layers.{}.attention.q_norm_fn.weight",
+    "blk.{}.attn_k_norm.weight": "layers.{}.attention.k_norm_fn.weight",
+}
+
+_LAYER_ID = re.compile(r"\.(\d+)\.")
+
+
+@dataclass
+class GGUFArchitecture:
+    """
+    Attributes:
+        name: The GGUF `general.architecture`.
+        tensor_names: GGUF tensor name -> Llama transformer parameter name, with
+            "{}" standing for the layer id. Tensors mapped to None are skipped.
+        params: Builds the model params (ModelArgs fields) from GGUF metadata.
+        tied_embeddings: Whether the output projection reuses the token
+            embeddings when the GGUF file has no output tensor.
+    """
+
+    name: str
+    tensor_names: Dict[str, Optional[str]]
+    params: Callable[[Dict[str, Any]], Dict[str, Any]]
+    tied_embeddings: bool = True
+
+    def map_tensor_name(self, gguf_name: str) -> Optional[str]:
+        match = _LAYER_ID.search(gguf_name)
+        if match is None:
+            pattern, layer_id = gguf_name, None
+        else:
+            pattern = gguf_name[: match.start()] + ".{}." + gguf_name[match.end() :]
+            layer_id = match.group(1)
+        if pattern not in self.tensor_names:
+            raise KeyError(f"Unknown tensor {gguf_name} for architecture {self.name}.")
+        name = self.tensor_names[pattern]
+        if name is None or layer_id is None:
+            return name
+        return name.format(layer_id)
+
+
+_ARCHITECTURES: Dict[str, GGUFArchitecture] = {}
+
+
+def register_architecture(architecture: GGUFArchitecture) -> None:
+    _ARCHITECTURES[architecture.name] = architecture
+
+
+def get_architecture(name: str) -> GGUFArchitecture:
+    if name not in _ARCHITECTURES:
+        raise NotImplementedError(
+            f"Unsupported architecture {name}. Supported architectures: "
+            f"{', '.join(supported_architectures())}."
+        )
+    return _ARCHITECTURES[name]
+
+
+def supported_architectures() -> List[str]:
+    return sorted(_ARCHITECTURES)
+
+
+def llama_params(metadata: Dict[str, Any]) -> Dict[str, Any]:
+    """Model params shared by all Llama-like architectures."""
+    arch = metadata["general.architecture"]
+    params = {
+        "dim": metadata[f"{arch}.embedding_length"],
+        "n_layers": metadata[f"{arch}.block_count"],
+        "n_heads": metadata[f"{arch}.attention.head_count"],
+        "n_kv_heads": metadata.get(
+            f"{arch}.attention.head_count_kv",
+            metadata[f"{arch}.attention.head_count"],
+        ),
+        "hidden_dim": metadata[f"{arch}.feed_forward_length"],
+        "norm_eps": metadata[f"{arch}.attention.layer_norm_rms_epsilon"],
+        # default value from llama2 model definition
+        "rope_theta": metadata.get(f"{arch}.rope.freq_base", 1e4),
+        "vocab_size": metadata.get(
+            f"{arch}.vocab_size", len(metadata.get("tokenizer.ggml.tokens", []))
+        ),
+    }
+    if f"{arch}.attention.key_length" in metadata:
+        params["head_dim"] = metadata[f"{arch}.attention.key_length"]
+    return params
+
+
+# llama.cpp permutes the query and key projections of Llama models to
+# interleaved RoPE, which is the llama_transformer default.
+register_architecture(
+    GGUFArchitecture(
+        name="llama",
+        tensor_names=LLAMA_TENSOR_NAMES,
+        params=llama_params,
+    )
+)
+
+register_architecture(
+    GGUFArchitecture(
+        name="mistral",
+        tensor_names=LLAMA_TENSOR_NAMES,
+        params=llama_params,
+    )
+)
+
+# Qwen models keep the HuggingFace (NeoX) RoPE layout.
+register_architecture(
+    GGUFArchitecture(
+        name="qwen2",
+        tensor_names={**LLAMA_TENSOR_NAMES, **_QKV_BIAS_TENSOR_NAMES},
+        params=lambda metadata: {
+            **llama_params(metadata),
+            "use_hf_rope": True,
+            "attention_qkv_bias": True,
+        },
+    )
+)
+
+register_architecture(
+    GGUFArchitecture(
+        name="qwen3",
+        tensor_names={**LLAMA_TENSOR_NAMES, **_QK_NORM_TENSOR_NAMES},
+        params=lambda metadata: {
+            **llama_params(metadata),
+            "use_hf_rope": True,
+            "use_qk_norm": True,
+            "qk_norm_before_rope": True,
+        },
+    )
+)
@@ -8,6 +8,7 @@ import argparse
 
 from executorch.extension.gguf_util.converter import convert_to_pte
 from executorch.extension.gguf_util.load_gguf import load_file
+from executorch.extension.gguf_util.streaming_converter import convert_to_ptd
 
 
 def save_pte_program(_, pte_file) -> None:
@@ -27,8 +28,24 @@ def main() -> None:
         type=str,
         help="The path to save the PTE file.",
     )
+    parser.add_argument(
+        "--ptd_file",
+        type=str,
+        help="Convert the weights only, streaming them to this .ptd file.",
+    )
+    parser.add_argument(
+        "--params_file",
+        type=str,
+        help="With --ptd_file, the path to save the model params as JSON.",
+    )
     args = parser.parse_args()
 
+    if args.ptd_file:
+        # Memory-mapped conversion, one tensor at a time, so that models larger
+        # than the available memory can be converted.
+        convert_to_ptd(args.gguf_file, args.ptd_file, args.params_file)
+        return
+
     # Step 1: Load the GGUF file
     gguf_model_args, gguf_weights = load_file(args.gguf_file)
 
@@ -0,0 +1,232 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# All rights reserved.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+"""
+A minimal, memory-mapped GGUF reader.
+
+Only the metadata and the tensor infos are parsed up front. Tensor data is
+returned as NumPy views of the memory-mapped file, so nothing is read from disk
+until it is accessed, and pages can be released again once a tensor has been
+converted.
+
+See https://github.com/ggerganov/ggml/blob/master/docs/gguf.md for the format.
+"""
+
+import mmap
+import struct
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Any, Callable, Dict, List, Tuple
+
+import numpy as np
+
+GGUF_MAGIC = b"GGUF"
+GGUF_DEFAULT_ALIGNMENT = 32
+
+
+class GGMLType(IntEnum):
+    F32 = 0
+    F16 = 1
+    Q4_0 = 2
+    Q4_1 = 3
+    Q5_0 = 6
+    Q5_1 = 7
+    Q8_0 = 8
+    Q8_1 = 9
+    Q2_K = 10
+    Q3_K = 11
+    Q4_K = 12
+    Q5_K = 13
+    Q6_K = 14
+    Q8_K = 15
+    BF16 = 30
+
+
+# (elements per block, bytes per block) of the types whose size is known
+GGML_BLOCK_SIZES: Dict[GGMLType, Tuple[int, int]] = {
+    GGMLType.F32: (1, 4),
+    GGMLType.F16: (1, 2),
+    GGMLType.BF16: (1, 2),
+    GGMLType.Q4_0: (32, 2 + 16),
+    GGMLType.Q8_0: (32, 2 + 32),
+}
+
+
+@dataclass
+class GGUFTensorInfo:
+    name: str
+    # Shape in PyTorch order, i.e. the reverse of the GGUF dimensions
+    shape: Tuple[int, ...]
+    ggml_type: int
+    # Offset of the data from the start of the file
+    offset: int
+
+    @property
+    def n_elements(self) -> int:
+        return int(np.prod(self.shape, dtype=np.int64))
+
+    @property
+    def n_bytes(self) -> int:
+        if self.ggml_type not in GGML_BLOCK_SIZES:
+            raise NotImplementedError(
+                f"Unsupported GGML type {self.ggml_type} of tensor {self.name}"
+            )
+        block_size, type_size = GGML_BLOCK_SIZES[GGMLType(self.ggml_type)]
+        return self.n_elements // block_size * type_size
+
+
+# struct formats of the scalar GGUF value types
+_SCALAR_FORMATS = {
+    0: "<B",  # UINT8
+    1: "<b",  # INT8
+    2: "<H",  # UINT16
+    3: "<h",  # INT16
+    4: "<I",  # UINT32
+    5: "<i",  # INT32
+    6: "<f",  # FLOAT32
+    7: "<?",  # BOOL
+    10: "<Q",  # UINT64
+    11: "<q",  # INT64
+    12: "<d",  # FLOAT64
+}
+_STRING = 8
+_ARRAY = 9
+
+
+class _Parser:
+    def __init__(self, buffer: mmap.mmap):
+        self.buffer = buffer
+        self.offset = 0
+
+    def unpack(self, fmt: str) -> Any:
+        (value,) = struct.unpack_from(fmt, self.buffer, self.offset)
+        self.offset += struct.calcsize(fmt)
+        return value
+
+    def string(self) -> str:
+        length = self.unpack("<Q")
+        value = self.buffer[self.offset : self.offset + length]
+        self.offset += length
+        return value.decode("utf-8", errors="replace")
+
+    def value(self, value_type: int) -> Any:
+        if value_type == _STRING:
+            return self.string()
+        if value_type == _ARRAY:
+            item_type = self.unpack("<I")
+            count = self.unpack("<Q")
+            if item_type in _SCALAR_FORMATS and item_type != 7:
+                # Numeric arrays (e.g. token scores) are read in one go
+                dtype = np.dtype(_SCALAR_FORMATS[item_type])
+                array = np.frombuffer(
+                    self.buffer, dtype=dtype, count=count, offset=self.offset
+                ).copy()
+                self.offset += count * dtype.itemsize
+                return array.tolist()
+            read: Callable[[], Any] = lambda: self.value(item_type)  # noqa: E731
+            return [read() for _ in range(count)]
+        if value_type not in _SCALAR_FORMATS:
+            raise ValueError(f"Unknown GGUF value type {value_type}")
+        return self.unpack(_SCALAR_FORMATS[value_type])
+
+
+class GGUFFile:
+    """
+    A memory-mapped GGUF file. Use as a context manager, or call close().
+
+    Attributes:
+        metadata: The key-value metadata of the file.
+        tensors: The tensor infos, in file order.
+    """
+
+    def __init__(self, path: str):
+        self._file = open(path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._file.close()
+            raise
+        self.metadata: Dict[str, Any] = {}
+        self.tensors: List[GGUFTensorInfo] = []
+        try:
+            self._parse()
+        except Exception:
+            self.close()
+            raise
+
+    def _parse(self) -> None:
+        parser = _Parser(self._mmap)
+        if parser.buffer[:4] != GGUF_MAGIC:
+            raise ValueError("Not a GGUF file")
+        parser.offset = 4
+        version = parser.unpack("<I")
+        if version not in (2, 3):
+            raise NotImplementedError(f"Unsupported GGUF version {version}")
+        tensor_count = parser.unpack("<Q")
+        kv_count = parser.unpack("<Q")
+
+        for _ in range(kv_count):
+            key = parser.string()
+            self.metadata[key] = parser.value(parser.unpack("<I"))
+
+        infos = []
+        for _ in range(tensor_count):
+            name = parser.string()
+            n_dims = parser.unpack("<I")
+            dims = [parser.unpack("<Q") for _ in range(n_dims)]
+            ggml_type = parser.unpack("<I")
+            offset = parser.unpack("<Q")
+            infos.append((name, tuple(reversed(dims)), ggml_type, offset))
+
+        alignment = self.metadata.get("general.alignment", GGUF_DEFAULT_ALIGNMENT)
+        data_offset = -(-parser.offset // alignment) * alignment
+        self.tensors = [
+            GGUFTensorInfo(name, shape, ggml_type, data_offset + offset)
+            for name, shape, ggml_type, offset in infos
+        ]
+
+    @property
+    def architecture(self) -> str:
+        return self.metadata["general.architecture"]
+
+    def tensor_bytes(self, info: GGUFTensorInfo) -> memoryview:
+        """The raw data of a tensor, without copying it."""
+        return memoryview(self._mmap)[info.offset : info.offset + info.n_bytes]
+
+    def tensor_data(self, info: GGUFTensorInfo) -> np.ndarray:
+        """
+        The data of a tensor as a view of the file: typed for unquantized
+        tensors, raw uint8 blocks for quantized ones.
+        """
+        dtypes = {GGMLType.F32: np.float32, GGMLType.F16: np.float16}
+        dtype = dtypes.get(info.ggml_type, np.uint8)
+        return np.frombuffer(self.tensor_bytes(info), dtype=dtype)
+
+    def release(self, offset: int, length: int) -> None:
+        """
+        Drop the pages of a byte range of the file from this process' memory.
+        They are read from disk again if accessed later.
+        """
+        release_pages(self._mmap, offset, length)
+
+    def close(self) -> None:
+        if not self._mmap.closed:
+            self._mmap.close()
+        self._file.close()
+
+    def __enter__(self) -> "GGUFFile":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+def release_pages(buffer: mmap.mmap, offset: int, length: int) -> None:
+    """Drop the pages of a byte range of a file-backed mmap from memory."""
+    if not hasattr(mmap, "MADV_DONTNEED") or length <= 0:
+        return
+    start = offset // mmap.PAGESIZE * mmap.PAGESIZE
+    buffer.madvise(mmap.MADV_DONTNEED, start, offset + length - start)
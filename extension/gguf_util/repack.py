@@ -0,0 +1,67 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# All rights reserved.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+"""
+Repacking of GGML quantized blocks into the ExecuTorch groupwise quantized
+layouts, with a group size of 32 (the GGML block size):
+
+- Q8_0 -> int8 weight [rows, cols] and float16 scales [rows, cols / 32], as
+  used by WeightOnlyInt8Linear and QuantizedGroupEmbedding.
+- Q4_0 -> packed 4-bit weight, uint8 [rows, cols / 2] holding two values
+  shifted to [0, 15] per byte (even column in the high nibble), and float16
+  scales [rows, cols / 32], as used by QuantizedGroupEmbedding and
+  embedding_4bit.
+
+The dequantized value is scale * q for Q8_0, and scale * (q - 8) for the
+stored 4-bit q.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+QK = 32
+Q4_0_BLOCK_BYTES = 2 + QK // 2
+Q8_0_BLOCK_BYTES = 2 + QK
+
+
+def _blocks(raw: np.ndarray, block_bytes: int) -> Tuple[np.ndarray, np.ndarray]:
+    blocks = raw.reshape(-1, block_bytes)
+    scales = blocks[:, :2].copy().view(np.float16).reshape(-1)
+    return blocks[:, 2:], scales
+
+
+def repack_q8_0(raw: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Repack raw Q8_0 blocks (uint8) into flat int8 values and float16 scales,
+    one per 32 values.
+    """
+    qs, scales = _blocks(raw, Q8_0_BLOCK_BYTES)
+    return qs.view(np.int8).reshape(-1), scales
+
+
+def repack_q4_0(raw: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Repack raw Q4_0 blocks (uint8) into packed 4-bit values (two per byte,
+    even index in the high nibble) and float16 scales, one per 32 values.
+    """
+    qs, scales = _blocks(raw, Q4_0_BLOCK_BYTES)
+    # GGML stores value j of a block in the low nibble of byte j, and value
+    # j + 16 in the high nibble.
+    values = np.concatenate([qs & 0x0F, qs >> 4], axis=1)
+    packed = (values[:, 0::2] << 4) | values[:, 1::2]
+    return packed.reshape(-1), scales
+
+
+def dequantize_q8_0(raw: np.ndarray) -> np.ndarray:
+    qs, scales = repack_q8_0(raw)
+    return (qs.reshape(-1, QK) * scales[:, None].astype(np.float32)).reshape(-1)
+
+
+def dequantize_q4_0(raw: np.ndarray) -> np.ndarray:
+    packed, scales = repack_q4_0(raw)
+    values = np.stack([packed >> 4, packed & 0x0F], axis=-1).astype(np.int8) - 8
+    return (values.reshape(-1, QK) * scales[:, None].astype(np.float32)).reshape(-1)
@@ -0,0 +1,303 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# All rights reserved.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+"""
+Streaming conversion of GGUF weights to an ExecuTorch .ptd file.
+
+The GGUF file is memory-mapped and converted one tensor at a time, in chunks,
+so that peak memory does not depend on the model size:
+
+- F32, F16 and BF16 tensors are not copied at all. The .ptd segments are views
+  of the memory-mapped GGUF file.
+- Q8_0 and Q4_0 tensors are repacked chunk by chunk (see repack.py) into a
+  scratch file next to the output, which is memory-mapped again for writing.
+- Pages of either mapping are dropped from memory once they have been used.
+
+The named data keys are the parameter names of the ExecuTorch Llama
+transformer. Quantized weights are stored as `<module>.weight` and
+`<module>.scales`. The model params are returned, and can be written out as a
+params.json for exporting the matching program.
+"""
+
+import json
+import mmap
+import os
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Tuple
+
+from executorch.exir._serialize.data_serializer import DataEntry, DataPayload
+from executorch.exir.scalar_type import ScalarType
+from executorch.exir.tensor_layout import TensorLayout
+from executorch.extension.flat_tensor.serialize.serialize import (
+    FlatTensorConfig,
+    FlatTensorSerializer,
+)
+from executorch.extension.gguf_util.architectures import (
+    get_architecture,
+    GGUFArchitecture,
+)
+from executorch.extension.gguf_util.gguf_file import (
+    GGMLType,
+    GGUFFile,
+    GGUFTensorInfo,
+    release_pages,
+)
+from executorch.extension.gguf_util.repack import (
+    Q4_0_BLOCK_BYTES,
+    Q8_0_BLOCK_BYTES,
+    QK,
+    repack_q4_0,
+    repack_q8_0,
+)
+
+_UNQUANTIZED_TYPES = {
+    GGMLType.F32: ScalarType.FLOAT,
+    GGMLType.F16: ScalarType.HALF,
+    GGMLType.BF16: ScalarType.BFLOAT16,
+}
+
+# ggml type -> (repack function, bytes per block, packed weight bytes per
+# block, weight scalar type)
+_QUANTIZED_TYPES = {
+    GGMLType.Q8_0: (repack_q8_0, Q8_0_BLOCK_BYTES, QK, ScalarType.CHAR),
+    GGMLType.Q4_0: (repack_q4_0, Q4_0_BLOCK_BYTES, QK // 2, ScalarType.BYTE),
+}
+
+
+@dataclass
+class _Output:
+    key: str
+    layout: TensorLayout
+    nbytes: int
+    # Offset in the scratch file, or None for data read straight from the
+    # GGUF file
+    scratch_offset: Optional[int] = None
+
+
+@dataclass
+class _TensorPlan:
+    info: GGUFTensorInfo
+    outputs: List[_Output]
+
+
+def _layout(scalar_type: ScalarType, shape: Tuple[int, ...]) -> TensorLayout:
+    return TensorLayout(scalar_type, list(shape), list(range(len(shape))))
+
+
+def _plan_tensor(info: GGUFTensorInfo, key: str) -> List[_Output]:
+    if info.ggml_type in _UNQUANTIZED_TYPES:
+        scalar_type = _UNQUANTIZED_TYPES[GGMLType(info.ggml_type)]
+        return [_Output(key, _layout(scalar_type, info.shape), info.n_bytes)]
+    if info.ggml_type not in _QUANTIZED_TYPES:
+        supported = [t.name for t in (*_UNQUANTIZED_TYPES, *_QUANTIZED_TYPES)]
+        type_name = (
+            GGMLType(info.ggml_type).name
+            if info.ggml_type in GGMLType._value2member_map_
+            else info.ggml_type
+        )
+        raise NotImplementedError(
+            f"Tensor {info.name} has unsupported GGML type {type_name}. "
+            f"Supported types: {', '.join(supported)}."
+        )
+    _, _, weight_bytes_per_block, scalar_type = _QUANTIZED_TYPES[
+        GGMLType(info.ggml_type)
+    ]
+    *rows, cols = info.shape
+    n_blocks = info.n_elements // QK
+    packed_cols = cols * weight_bytes_per_block // QK
+    module = key[: -len(".weight")] if key.endswith(".weight") else key
+    return [
+        _Output(
+            key,
+            _layout(scalar_type, (*rows, packed_cols)),
+            n_blocks * weight_bytes_per_block,
+        ),
+        _Output(
+            f"{module}.scales",
+            _layout(ScalarType.HALF, (*rows, cols // QK)),
+            n_blocks * 2,
+        ),
+    ]
+
+
+def _plan(gguf: GGUFFile, arch: GGUFArchitecture) -> Tuple[List[_TensorPlan], int]:
+    """Map every tensor to its outputs, and lay out the scratch file."""
+    plans = []
+    scratch_size = 0
+    for info in gguf.tensors:
+        key = arch.map_tensor_name(info.name)
+        if key is None:
+            continue
+        outputs = _plan_tensor(info, key)
+        if info.ggml_type in _QUANTIZED_TYPES:
+            for output in outputs:
+                # Page aligned, so that pages can be released per output
+                scratch_size = -(-scratch_size // mmap.PAGESIZE) * mmap.PAGESIZE
+                output.scratch_offset = scratch_size
+                scratch_size += output.nbytes
+        plans.append(_TensorPlan(info, outputs))
+    return plans, scratch_size
+
+
+def _repack_to_scratch(
+    gguf: GGUFFile, plan: _TensorPlan, scratch: BinaryIO, chunk_bytes: int
+) -> None:
+    repack, block_bytes, weight_bytes_per_block, _ = _QUANTIZED_TYPES[
+        GGMLType(plan.info.ggml_type)
+    ]
+    weight, scales = plan.outputs
+    raw = gguf.tensor_data(plan.info)
+    n_blocks = raw.size // block_bytes
+    blocks_per_chunk = max(1, chunk_bytes // block_bytes)
+    for start in range(0, n_blocks, blocks_per_chunk):
+        end = min(start + blocks_per_chunk, n_blocks)
+        packed, chunk_scales = repack(raw[start * block_bytes : end * block_bytes])
+        scratch.seek(weight.scratch_offset + start * weight_bytes_per_block)
+        scratch.write(packed.tobytes())
+        scratch.seek(scales.scratch_offset + start * 2)
+        scratch.write(chunk_scales.tobytes())
+        gguf.release(
+            plan.info.offset + start * block_bytes, (end - start) * block_bytes
+        )
+    del raw
+
+
+class _PageReleasingWriter:
+    """
+    Writes the serialized .ptd, dropping the pages of the memory-mapped
+    segments from memory as they are written out.
+    """
+
+    def __init__(
+        self,
+        outfile: BinaryIO,
+        releases: Dict[int, Callable[[int, int], None]],
+        chunk_bytes: int,
+    ):
+        self._outfile = outfile
+        # id of a segment buffer -> releases (offset, length) of its pages
+        self._releases = releases
+        self._chunk_bytes = chunk_bytes
+
+    def write(self, data) -> None:
+        release = self._releases.get(id(data))
+        if release is None:
+            self._outfile.write(data)
+            return
+        for start in range(0, data.nbytes, self._chunk_bytes):
+            length = min(self._chunk_bytes, data.nbytes - start)
+            with data[start : start + length] as chunk:
+                self._outfile.write(chunk)
+            release(start, length)
+
+
+def _releaser(
+    release: Callable[[int, int], None], base: int
+) -> Callable[[int, int], None]:
+    return lambda offset, length: release(base + offset, length)
+
+
+def convert_to_ptd(
+    gguf_file: str,
+    ptd_file: str,
+    params_file: Optional[str] = None,
+    chunk_bytes: int = 16 * 1024 * 1024,
+    config: Optional[FlatTensorConfig] = None,
+) -> Dict[str, Any]:
+    """Convert the weights of a GGUF model into a .ptd file.
+
+    Args:
+        gguf_file: The GGUF file to convert.
+        ptd_file: The .ptd file to write.
+        params_file: If given, the model params are written to it as JSON.
+        chunk_bytes: Size of the GGUF data repacked at a time, which bounds the
+            memory used by the conversion.
+        config: Serialization config of the .ptd file.
+
+    Returns:
+        The model params, ModelArgs fields of the ExecuTorch Llama transformer.
+    """
+    with GGUFFile(gguf_file) as gguf:
+        arch = get_architecture(gguf.architecture)
+        plans, scratch_size = _plan(gguf, arch)
+        scratch_file = ptd_file + ".scratch"
+        try:
+            with open(scratch_file, "w+b") as scratch:
+                scratch.truncate(scratch_size)
+                for plan in plans:
+                    if plan.info.ggml_type in _QUANTIZED_TYPES:
+                        _repack_to_scratch(gguf, plan, scratch, chunk_bytes)
+                scratch.flush()
+                scratch_mmap = (
+                    mmap.mmap(scratch.fileno(), 0, access=mmap.ACCESS_READ)
+                    if scratch_size > 0
+                    else None
+                )
+                try:
+                    _serialize(
+                        gguf, scratch_mmap, plans, arch, ptd_file, config, chunk_bytes
+                    )
+                finally:
+                    if scratch_mmap is not None:
+                        scratch_mmap.close()
+        finally:
+            if os.path.exists(scratch_file):
+                os.remove(scratch_file)
+
+        params = arch.params(gguf.metadata)
+
+    if params_file is not None:
+        with open(params_file, "w") as f:
+            json.dump(params, f, indent=2)
+    return params
+
+
+def _serialize(
+    gguf: GGUFFile,
+    scratch: Optional[mmap.mmap],
+    plans: List[_TensorPlan],
+    arch: GGUFArchitecture,
+    ptd_file: str,
+    config: Optional[FlatTensorConfig],
+    chunk_bytes: int,
+) -> None:
+    buffers: List[memoryview] = []
+    named_data: Dict[str, DataEntry] = {}
+    releases: Dict[int, Callable[[int, int], None]] = {}
+    scratch_view = memoryview(scratch) if scratch is not None else None
+    try:
+        for plan in plans:
+            for output in plan.outputs:
+                if output.scratch_offset is None:
+                    buffer = gguf.tensor_bytes(plan.info)
+                    release = _releaser(gguf.release, plan.info.offset)
+                else:
+                    start = output.scratch_offset
+                    buffer = scratch_view[start : start + output.nbytes]
+                    release = _releaser(partial(release_pages, scratch), start)
+                releases[id(buffer)] = release
+                named_data[output.key] = DataEntry(len(buffers), 1, output.layout)
+                buffers.append(buffer)
+
+        if arch.tied_embeddings and "output.weight" not in named_data:
+            # The output projection shares the data of the token embeddings
+            for suffix in ("weight", "scales"):
+                embedding = named_data.get(f"tok_embeddings.{suffix}")
+                if embedding is not None:
+                    named_data[f"output.{suffix}"] = embedding
+
+        serializer = FlatTensorSerializer(config)
+        payload = serializer.serialize(DataPayload(buffers, named_data))
+        with open(ptd_file, "wb") as f:
+            payload.write_to_file(_PageReleasingWriter(f, releases, chunk_bytes))
+        del payload
+    finally:
+        # The mappings can only be closed once no views of them are left
+        for buffer in buffers:
+            buffer.release()
+        if scratch_view is not None:
+            scratch_view.release()
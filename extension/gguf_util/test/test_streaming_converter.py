@@ -0,0 +1,260 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# All rights reserved.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+import json
+import os
+import tempfile
+import unittest
+from typing import Dict
+
+import gguf
+import numpy as np
+
+from executorch.exir._serialize._cord import Cord
+from executorch.exir.scalar_type import ScalarType
+from executorch.extension.flat_tensor.serialize.serialize import FlatTensorSerializer
+from executorch.extension.gguf_util.architectures import get_architecture
+from executorch.extension.gguf_util.gguf_file import GGMLType, GGUFFile
+from executorch.extension.gguf_util.repack import dequantize_q4_0, dequantize_q8_0, QK
+from executorch.extension.gguf_util.streaming_converter import convert_to_ptd
+
+DIM = 64
+N_HEADS = 4
+N_KV_HEADS = 2
+HIDDEN_DIM = 128
+VOCAB_SIZE = 32
+
+
+def _quantize_q8_0(x: np.ndarray) -> np.ndarray:
+    """Quantize to raw GGML Q8_0 blocks."""
+    blocks = x.reshape(-1, QK)
+    scales = np.abs(blocks).max(axis=1, keepdims=True) / 127
+    qs = np.round(blocks / np.where(scales == 0, 1, scales)).astype(np.int8)
+    return np.concatenate(
+        [scales.astype(np.float16).view(np.uint8), qs.view(np.uint8)], axis=1
+    ).reshape(-1)
+
+
+def _quantize_q4_0(x: np.ndarray) -> np.ndarray:
+    """Quantize to raw GGML Q4_0 blocks."""
+    blocks = x.reshape(-1, QK)
+    scales = np.abs(blocks).max(axis=1, keepdims=True) / 8
+    qs = np.clip(np.round(blocks / np.where(scales == 0, 1, scales)) + 8, 0, 15)
+    qs = qs.astype(np.uint8)
+    packed = qs[:, : QK // 2] | (qs[:, QK // 2 :] << 4)
+    return np.concatenate(
+        [scales.astype(np.float16).view(np.uint8), packed], axis=1
+    ).reshape(-1)
+
+
+class TestStreamingConverter(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.rng = np.random.default_rng(0)
+
+    def tearDown(self) -> None:
+        self.tmpdir.cleanup()
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.tmpdir.name, name)
+
+    def _write_gguf(self, arch: str = "llama") -> Dict[str, np.ndarray]:
+        """Write a one layer model, returning the expected dequantized tensors."""
+        writer = gguf.GGUFWriter(self._path("model.gguf"), arch)
+        writer.add_context_length(128)
+        writer.add_embedding_length(DIM)
+        writer.add_block_count(1)
+        writer.add_feed_forward_length(HIDDEN_DIM)
+        writer.add_head_count(N_HEADS)
+        writer.add_head_count_kv(N_KV_HEADS)
+        writer.add_layer_norm_rms_eps(1e-5)
+        writer.add_rope_freq_base(5e5)
+        writer.add_uint32(f"{arch}.vocab_size", VOCAB_SIZE)
+
+        kv_dim = DIM // N_HEADS * N_KV_HEADS
+        tensors = {
+            "token_embd.weight": ((VOCAB_SIZE, DIM), GGMLType.Q8_0),
+            "output_norm.weight": ((DIM,), GGMLType.F32),
+            "rope_freqs.weight": ((DIM // N_HEADS // 2,), GGMLType.F32),
+            "blk.0.attn_q.weight": ((DIM, DIM), GGMLType.Q4_0),
+            "blk.0.attn_k.weight": ((kv_dim, DIM), GGMLType.Q4_0),
+            "blk.0.attn_v.weight": ((kv_dim, DIM), GGMLType.Q8_0),
+            "blk.0.attn_output.weight": ((DIM, DIM), GGMLType.F16),
+            "blk.0.attn_norm.weight": ((DIM,), GGMLType.F32),
+            "blk.0.ffn_norm.weight": ((DIM,), GGMLType.F32),
+            "blk.0.ffn_gate.weight": ((HIDDEN_DIM, DIM), GGMLType.Q4_0),
+            "blk.0.ffn_down.weight": ((DIM, HIDDEN_DIM), GGMLType.Q8_0),
+            "blk.0.ffn_up.weight": ((HIDDEN_DIM, DIM), GGMLType.Q4_0),
+        }
+        expected = {}
+        for name, (shape, ggml_type) in tensors.items():
+            x = self.rng.standard_normal(shape).astype(np.float32)
+            if ggml_type == GGMLType.Q8_0:
+                raw = _quantize_q8_0(x)
+                expected[name] = dequantize_q8_0(raw).reshape(shape)
+                writer.add_tensor(name, raw, raw_shape=shape, raw_dtype=ggml_type)
+            elif ggml_type == GGMLType.Q4_0:
+                raw = _quantize_q4_0(x)
+                expected[name] = dequantize_q4_0(raw).reshape(shape)
+                writer.add_tensor(name, raw, raw_shape=shape, raw_dtype=ggml_type)
+            elif ggml_type == GGMLType.F16:
+                expected[name] = x.astype(np.float16)
+                writer.add_tensor(name, expected[name])
+            else:
+                expected[name] = x
+                writer.add_tensor(name, x)
+
+        writer.write_header_to_file()
+        writer.write_kv_data_to_file()
+        writer.write_tensors_to_file()
+        writer.close()
+        return expected
+
+    def test_gguf_file(self) -> None:
+        expected = self._write_gguf()
+        with GGUFFile(self._path("model.gguf")) as gguf_file:
+            self.assertEqual(gguf_file.architecture, "llama")
+            self.assertEqual(gguf_file.metadata["llama.block_count"], 1)
+            self.assertEqual(
+                [info.name for info in gguf_file.tensors], list(expected.keys())
+            )
+            for info in gguf_file.tensors:
+                self.assertEqual(info.shape, expected[info.name].shape)
+                if info.ggml_type == GGMLType.F32:
+                    np.testing.assert_array_equal(
+                        gguf_file.tensor_data(info), expected[info.name].reshape(-1)
+                    )
+                elif info.ggml_type == GGMLType.Q4_0:
+                    np.testing.assert_allclose(
+                        dequantize_q4_0(gguf_file.tensor_data(info)),
+                        expected[info.name].reshape(-1),
+                    )
+
+    def test_map_tensor_names(self) -> None:
+        llama = get_architecture("llama")
+        self.assertEqual(
+            llama.map_tensor_name("blk.12.ffn_gate.weight"),
+            "layers.12.feed_forward.w1.weight",
+        )
+        self.assertEqual(
+            llama.map_tensor_name("token_embd.weight"), "tok_embeddings.weight"
+        )
+        self.assertIsNone(llama.map_tensor_name("rope_freqs.weight"))
+        with self.assertRaises(KeyError):
+            llama.map_tensor_name("blk.0.attn_q_norm.weight")
+        self.assertEqual(
+            get_architecture("qwen3").map_tensor_name("blk.0.attn_q_norm.weight"),
+            "layers.0.attention.q_norm_fn.weight",
+        )
+        with self.assertRaises(NotImplementedError):
+            get_architecture("not_an_architecture")
+
+    def test_convert_to_ptd(self) -> None:
+        expected = self._write_gguf()
+        # A small chunk size, so that tensors are repacked in several chunks
+        params = convert_to_ptd(
+            self._path("model.gguf"),
+            self._path("model.ptd"),
+            self._path("params.json"),
+            chunk_bytes=256,
+        )
+        self.assertFalse(os.path.exists(self._path("model.ptd.scratch")))
+
+        self.assertEqual(
+            params,
+            {
+                "dim": DIM,
+                "n_layers": 1,
+                "n_heads": N_HEADS,
+                "n_kv_heads": N_KV_HEADS,
+                "hidden_dim": HIDDEN_DIM,
+                "norm_eps": params["norm_eps"],
+                "rope_theta": 5e5,
+                "vocab_size": VOCAB_SIZE,
+            },
+        )
+        self.assertAlmostEqual(params["norm_eps"], 1e-5)
+        with open(self._path("params.json")) as f:
+            self.assertEqual(json.load(f), params)
+
+        with open(self._path("model.ptd"), "rb") as f:
+            payload = FlatTensorSerializer().deserialize(Cord(f.read()))
+
+        def tensor(key: str) -> np.ndarray:
+            entry = payload.named_data[key]
+            layout = entry.tensor_layout
+            dtype = {
+                ScalarType.FLOAT: np.float32,
+                ScalarType.HALF: np.float16,
+                ScalarType.CHAR: np.int8,
+                ScalarType.BYTE: np.uint8,
+            }[layout.scalar_type]
+            data = np.frombuffer(payload.buffers[entry.buffer_index], dtype=dtype)
+            return data.reshape(layout.sizes)
+
+        def dequantized(module: str) -> np.ndarray:
+            weight = tensor(f"{module}.weight")
+            if weight.dtype == np.uint8:
+                weight = np.stack([weight >> 4, weight & 0x0F], axis=-1)
+                weight = weight.reshape(weight.shape[0], -1).astype(np.int8) - 8
+            scales = tensor(f"{module}.scales").astype(np.float32)
+            return weight * np.repeat(scales, QK, axis=-1)
+
+        np.testing.assert_array_equal(
+            tensor("norm.weight"), expected["output_norm.weight"]
+        )
+        np.testing.assert_array_equal(
+            tensor("layers.0.attention.wo.weight"),
+            expected["blk.0.attn_output.weight"],
+        )
+        for module, name in [
+            ("tok_embeddings", "token_embd.weight"),
+            ("layers.0.attention.wq", "blk.0.attn_q.weight"),
+            ("layers.0.attention.wv", "blk.0.attn_v.weight"),
+            ("layers.0.feed_forward.w2", "blk.0.ffn_down.weight"),
+            ("layers.0.feed_forward.w3", "blk.0.ffn_up.weight"),
+        ]:
+            np.testing.assert_allclose(dequantized(module), expected[name])
+
+        self.assertEqual(
+            payload.named_data["layers.0.attention.wq.weight"].tensor_layout.sizes,
+            [DIM, DIM // 2],
+        )
+        self.assertEqual(
+            payload.named_data["layers.0.attention.wq.scales"].tensor_layout.sizes,
+            [DIM, DIM // QK],
+        )
+        # Tied embeddings share the data of the token embeddings
+        for suffix in ("weight", "scales"):
+            self.assertEqual(
+                payload.named_data[f"output.{suffix}"].buffer_index,
+                payload.named_data[f"tok_embeddings.{suffix}"].buffer_index,
+            )
+        self.assertEqual(len(payload.named_data), 2 * 7 + 4 + 2)
+
+    def test_qwen3_params(self) -> None:
+        self._write_gguf(arch="qwen3")
+        params = convert_to_ptd(self._path("model.gguf"), self._path("model.ptd"))
+        self.assertTrue(params["use_hf_rope"])
+        self.assertTrue(params["use_qk_norm"])
+        self.assertTrue(params["qk_norm_before_rope"])
+
+    def test_unsupported_type(self) -> None:
+        writer = gguf.GGUFWriter(self._path("model.gguf"), "llama")
+        raw = np.zeros(DIM * 144, dtype=np.uint8)
+        writer.add_tensor(
+            "blk.0.attn_q.weight",
+            raw,
+            raw_shape=(DIM, 256),
+            raw_dtype=GGMLType.Q4_K,
+        )
+        writer.write_header_to_file()
+        writer.write_kv_data_to_file()
+        writer.write_tensors_to_file()
+        writer.close()
+        with self.assertRaisesRegex(NotImplementedError, "Q4_K"):
+            convert_to_ptd(self._path("model.gguf"), self._path("model.ptd"))
+        self.assertFalse(os.path.exists(self._path("model.ptd")))
@@ -0,0 +1,90 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# All rights reserved.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+"""
+Measure the wall-clock time of quantize_model_ on Llama-shaped stacks of
+linear layers, one layer at a time and on a thread pool, and check that both
+give the same model.
+
+Usage:
+    python -m executorch.extension.llm.export.benchmark_quantize \
+        --dims 1024 2048 4096 --num_threads 1 4 8
+"""
+
+import argparse
+import copy
+import time
+
+import torch
+
+from executorch.extension.llm.export.quantize import quantize_model_
+
+
+class _Layer(torch.nn.Module):
+    def __init__(self, dim: int, hidden_dim: int) -> None:
+        super().__init__()
+        self.wq = torch.nn.Linear(dim, dim, bias=False)
+        self.wk = torch.nn.Linear(dim, dim // 4, bias=False)
+        self.wv = torch.nn.Linear(dim, dim // 4, bias=False)
+        self.wo = torch.nn.Linear(dim, dim, bias=False)
+        self.w1 = torch.nn.Linear(dim, hidden_dim, bias=False)
+        self.w2 = torch.nn.Linear(hidden_dim, dim, bias=False)
+        self.w3 = torch.nn.Linear(dim, hidden_dim, bias=False)
+
+
+def _model(dim: int, n_layers: int) -> torch.nn.Module:
+    hidden_dim = dim * 8 // 3 // 256 * 256
+    return torch.nn.ModuleList(_Layer(dim, hidden_dim) for _ in range(n_layers))
+
+
+def _same(a: torch.nn.Module, b: torch.nn.Module) -> bool:
+    x = torch.randn(1, a[0].wq.in_features)
+    with torch.no_grad():
+        return all(
+            torch.equal(la.w2(la.w1(x)), lb.w2(lb.w1(x))) for la, lb in zip(a, b)
+        )
+
+
+def benchmark(args) -> None:
+    print(f"{'dim':>6} {'threads':>8} {'seconds':>9} {'speedup':>8} {'same':>5}")
+    for dim in args.dims:
+        torch.manual_seed(0)
+        model = _model(dim, args.n_layers)
+        reference = None
+        baseline = None
+        for num_threads in args.num_threads:
+            quantized = copy.deepcopy(model)
+            start = time.perf_counter()
+            quantize_model_(
+                quantized,
+                qlinear_config=args.qlinear_config,
+                qlinear_group_size=args.group_size,
+                num_threads=num_threads,
+            )
+            seconds = time.perf_counter() - start
+            if reference is None:
+                reference, baseline = quantized, seconds
+            same = _same(reference, quantized)
+            print(
+                f"{dim:>6} {num_threads:>8} {seconds:>9.2f} "
+                f"{baseline / seconds:>7.2f}x {str(same):>5}"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark layer-parallel source transform quantization"
+    )
+    parser.add_argument("--dims", type=int, nargs="+", default=[1024, 2048, 4096])
+    parser.add_argument("--n_layers", type=int, default=4)
+    parser.add_argument("--num_threads", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--qlinear_config", type=str, default="8da4w")
+    parser.add_argument("--group_size", type=int, default=32)
+    benchmark(parser.parse_args())
+
+
+if __name__ == "__main__":
+    main()
@@ -14,7 +14,7 @@
 import contextlib
 import logging
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import torch
 from executorch.backends.transforms.duplicate_dynamic_quant_chain import (
@@ -31,7 +31,9 @@ from executorch.exir.pass_base import ExportPass
 from executorch.exir.passes import MemoryPlanningPass
 from executorch.exir.passes.sym_shape_eval_pass import ConstraintBasedSymShapeEvalPass
 
+from executorch.extension.export_util.export_cache import ExportCache
 from executorch.extension.export_util.utils import export_to_edge, save_pte_program
+from executorch.extension.llm.export.calibrate import calibrate, CalibrationConfig
 
 from executorch.extension.llm.export.export_passes import RemoveRedundantTransposes
 from pytorch_tokenizers import get_tokenizer
@@ -90,7 +92,8 @@ class LLMEdgeManager:
         calibration_tasks: Optional[List[str]] = None,
         calibration_limit: Optional[int] = None,
         calibration_seq_length: Optional[int] = None,
-        calibration_data: Optional[str] = None,
+        calibration_data: Optional[Union[str, List[str]]] = None,
+        calibration_num_workers: int = 1,
         tokenizer_path: Optional[str] = None,
         verbose: bool = False,
         metadata: Optional[dict] = None,
@@ -98,6 +101,10 @@ class LLMEdgeManager:
         save_exported_program: bool = False,
         generate_etrecord: bool = False,
         skip_dim_order: bool = True,
+        export_cache_dir: Optional[str] = None,
+        export_cache_checkpoints: Optional[List[str]] = None,
+        export_cache_hash_weights: bool = False,
+        export_cache_config: Optional[Any] = None,
     ):
         # Store necessary constructor arguments.
         self.model = model
@@ -113,6 +120,7 @@ class LLMEdgeManager:
         self.calibration_limit = calibration_limit
         self.calibration_seq_length = calibration_seq_length
         self.calibration_data = calibration_data
+        self.calibration_num_workers = calibration_num_workers
         self.tokenizer_path = tokenizer_path
         self.verbose = verbose
         self.metadata = metadata if metadata is not None else {}
@@ -121,6 +129,20 @@ class LLMEdgeManager:
         self.save_exported_program = save_exported_program
         self.generate_etrecord = generate_etrecord
         self.skip_dim_order = skip_dim_order
+        # Reuse torch.export results of identical models and inputs
+        self.export_cache = (
+            ExportCache(export_cache_dir, hash_weights=export_cache_hash_weights)
+            if export_cache_dir
+            else None
+        )
+        # The files the weights were loaded from, identifying them in the cache
+        self.export_cache_checkpoints = export_cache_checkpoints
+        # The config the model was built, quantized and lowered with, which
+        # the checkpoints don't identify
+        self.export_cache_config = export_cache_config
+        self.applied_source_transforms: List[
+            Callable[[torch.nn.Module], torch.nn.Module]
+        ] = []
 
         # Note: treat this as the source of truth for the result of
         # torch.export'ing a model. If the overall ExportedProgram is needed,
@@ -188,6 +210,7 @@ class LLMEdgeManager:
         """
         for transform in transforms:
             self.model = transform(self.model)
+        self.applied_source_transforms.extend(transforms)
 
         if self.verbose:
             logging.info(f"Applied source transforms: {transforms}")
@@ -216,16 +239,42 @@ class LLMEdgeManager:
             logging.info(f"inputs: {self.example_inputs}")
             logging.info(f"kwargs: {self.example_kwarg_inputs}")
             logging.info(f"dynamic shapes: {dynamic_shape}")
-            exported_module = export(
-                self.model if not module else module,
-                self.example_inputs,
-                kwargs=self.example_kwarg_inputs,
-                dynamic_shapes=dynamic_shape,
-                strict=True,
-            )
-            # Functionalize the graph, and decompose subclasses from torchao quantize.
-            exported_module = exported_module.run_decompositions({})
-        return exported_module
+            model = self.model if not module else module
+
+            def run_export() -> ExportedProgram:
+                exported_module = export(
+                    model,
+                    self.example_inputs,
+                    kwargs=self.example_kwarg_inputs,
+                    dynamic_shapes=dynamic_shape,
+                    strict=True,
+                )
+                # Functionalize the graph, and decompose subclasses from torchao quantize.
+                return exported_module.run_decompositions({})
+
+            if self.export_cache is None:
+                return run_export()
+            key = self._export_cache_key(model, dynamic_shape)
+            return self.export_cache.get_or_export(key, run_export)
+
+    def _export_cache_key(self, model: torch.nn.Module, dynamic_shape: Any) -> str:
+        assert self.export_cache is not None
+        # The weights of model are already transformed, e.g. quantized, and
+        # are identified by the checkpoints they were loaded from, so the
+        # transforms and config are a part of the key too.
+        return self.export_cache.key(
+            model,
+            self.example_inputs,
+            self.example_kwarg_inputs,
+            dynamic_shape,
+            extra={
+                "strict": True,
+                "decompositions": {},
+                "source_transforms": self.applied_source_transforms,
+                "config": self.export_cache_config,
+            },
+            checkpoints=self.export_cache_checkpoints,
+        )
 
     def export(self) -> "LLMEdgeManager":
         """
@@ -277,34 +326,24 @@ class LLMEdgeManager:
             )
 
         tokenizer = get_tokenizer(tokenizer_path)
-
-        def calibrate_template(
-            module: torch.fx.GraphModule, tokenizer, prompts: str, max_len: int
-        ):
-            # TODO: change criteria & support batch inputs if necessary
-            pos = torch.tensor(0, dtype=torch.int64)
-            token_list = tokenizer.encode(prompts, bos=True, eos=False)
-
-            with torch.no_grad():
-                while token_list[-1] != tokenizer.eos_id and pos < max_len:
-                    logits = module(
-                        torch.full((1, 1), token_list[pos]),
-                        {"input_pos": torch.tensor((pos,))},
-                    )
-                    pos += 1
-                    if pos >= len(token_list):
-                        if self.generate_full_logits:
-                            token_list.append(
-                                torch.argmax(logits[:, -1], dim=-1).item()
-                            )
-                        else:
-                            token_list.append(torch.argmax(logits[:], dim=-1).item())
-
-        calibrate_template(
-            module=prepared_module,
-            tokenizer=tokenizer,
-            prompts=calibration_data,
-            max_len=calibration_seq_length,
+        prompts = (
+            [calibration_data]
+            if isinstance(calibration_data, str)
+            else list(calibration_data)
+        )
+        calibrate(
+            prepared_module,
+            [tokenizer.encode(prompt, bos=True, eos=False) for prompt in prompts],
+            CalibrationConfig(
+                max_len=calibration_seq_length,
+                use_kv_cache=self.use_kv_cache,
+                enable_dynamic_shape=self.enable_dynamic_shape,
+                generate_full_logits=self.generate_full_logits,
+                # The dynamic token dimension goes up to max_seq_len - 1
+                prefill_chunk_size=self.max_seq_len - 1,
+                eos_id=tokenizer.eos_id,
+                num_workers=self.calibration_num_workers,
+            ),
         )
 
         eval_wrapper = GraphModuleEvalWrapper(
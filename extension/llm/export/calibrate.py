@@ -0,0 +1,272 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# All rights reserved.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+"""
+Calibration of pt2e prepared LLMs on tokenized prompts.
+
+Each prompt is prefilled in chunks, as one forward per chunk when the model
+was exported with dynamic shapes, and then extended by greedy generation up
+to the calibration sequence length. Sequences can be sharded over forked
+worker processes, whose observer statistics are merged back into the module.
+"""
+
+import logging
+import multiprocessing
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+import torch
+from torchao.quantization.pt2e import (
+    FixedQParamsObserver,
+    MinMaxObserver,
+    NoopObserver,
+    ObserverBase,
+    PerChannelMinMaxObserver,
+    PlaceholderObserver,
+    ReuseInputObserver,
+)
+
+# Observers whose statistics can be merged across workers
+_MIN_MAX_OBSERVERS = (MinMaxObserver, PerChannelMinMaxObserver)
+# Observers without statistics
+_STATELESS_OBSERVERS = (
+    FixedQParamsObserver,
+    NoopObserver,
+    PlaceholderObserver,
+    ReuseInputObserver,
+)
+
+
+@dataclass
+class CalibrationStats:
+    num_sequences: int = 0
+    # Tokens fed to the model, prompt and generated
+    num_tokens: int = 0
+    num_forwards: int = 0
+    seconds: float = 0.0
+
+    @property
+    def tokens_per_second(self) -> float:
+        return self.num_tokens / self.seconds if self.seconds > 0 else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.num_sequences} sequences, {self.num_tokens} tokens in "
+            f"{self.num_forwards} forwards, {self.seconds:.1f}s "
+            f"({self.tokens_per_second:.1f} tokens/s)"
+        )
+
+
+@dataclass
+class CalibrationConfig:
+    """
+    Attributes:
+        max_len: Sequences are generated up to this many tokens.
+        use_kv_cache: Whether the model takes input_pos and caches keys and
+            values. Otherwise, every forward sees the whole sequence.
+        enable_dynamic_shape: Whether the model accepts several tokens per
+            forward.
+        generate_full_logits: Whether the model returns logits for every
+            token, instead of for the last one only.
+        prefill_chunk_size: Maximum number of tokens per forward.
+        eos_id: Generation stops at this token.
+        num_workers: Number of processes the sequences are sharded over.
+        log_interval: Log progress every this many sequences.
+    """
+
+    max_len: int
+    use_kv_cache: bool
+    enable_dynamic_shape: bool
+    generate_full_logits: bool = False
+    prefill_chunk_size: int = 128
+    eos_id: Optional[int] = None
+    num_workers: int = 1
+    log_interval: int = 10
+
+
+def _next_token(logits: torch.Tensor, config: CalibrationConfig) -> int:
+    if config.generate_full_logits:
+        logits = logits[:, -1]
+    return int(torch.argmax(logits, dim=-1).reshape(-1)[0])
+
+
+def _forward(
+    module: torch.nn.Module,
+    tokens: List[int],
+    start: int,
+    end: int,
+    config: CalibrationConfig,
+) -> torch.Tensor:
+    if not config.use_kv_cache:
+        # Without a cache, the model sees the whole sequence every time
+        return module(torch.tensor([tokens[:end]], dtype=torch.long))
+    return module(
+        torch.tensor([tokens[start:end]], dtype=torch.long),
+        {"input_pos": torch.tensor([start], dtype=torch.long)},
+    )
+
+
+def calibrate_sequence(
+    module: torch.nn.Module,
+    tokens: Sequence[int],
+    config: CalibrationConfig,
+    stats: CalibrationStats,
+) -> None:
+    """Prefill a tokenized prompt, then generate up to config.max_len tokens."""
+    if not config.enable_dynamic_shape:
+        if not config.use_kv_cache:
+            raise ValueError("Calibration without KV cache requires dynamic shapes")
+        chunk_size = 1
+    elif not config.use_kv_cache:
+        chunk_size = config.max_len
+    else:
+        chunk_size = config.prefill_chunk_size
+
+    tokens = list(tokens[: config.max_len])
+    pos = 0
+    with torch.no_grad():
+        while pos < len(tokens):
+            end = min(pos + chunk_size, len(tokens))
+            logits = _forward(module, tokens, pos, end, config)
+            stats.num_forwards += 1
+            stats.num_tokens += end - pos
+            pos = end
+            if pos == len(tokens) and pos < config.max_len:
+                token = _next_token(logits, config)
+                if token == config.eos_id:
+                    break
+                tokens.append(token)
+    stats.num_sequences += 1
+
+
+def _observers(module: torch.nn.Module) -> Dict[str, ObserverBase]:
+    return {
+        name: m for name, m in module.named_modules() if isinstance(m, ObserverBase)
+    }
+
+
+def _check_mergeable(module: torch.nn.Module) -> None:
+    unsupported = {
+        type(observer).__name__
+        for observer in _observers(module).values()
+        if type(observer) not in _MIN_MAX_OBSERVERS
+        and not isinstance(observer, _STATELESS_OBSERVERS)
+    }
+    if unsupported:
+        raise NotImplementedError(
+            f"Cannot merge the statistics of {', '.join(sorted(unsupported))} "
+            "across calibration workers, use a single worker."
+        )
+
+
+def _observer_states(module: torch.nn.Module) -> Dict[str, Dict[str, torch.Tensor]]:
+    return {
+        name: {"min_val": observer.min_val, "max_val": observer.max_val}
+        for name, observer in _observers(module).items()
+        if type(observer) in _MIN_MAX_OBSERVERS
+    }
+
+
+def merge_observer_states(
+    module: torch.nn.Module, states: List[Dict[str, Dict[str, torch.Tensor]]]
+) -> None:
+    """
+    Merge the min/max statistics that copies of the module observed into the
+    module's observers.
+    """
+    for name, observer in _observers(module).items():
+        if type(observer) not in _MIN_MAX_OBSERVERS:
+            continue
+        # Observers that saw no data are empty (per channel) or +-inf
+        seen = [
+            state[name]
+            for state in states
+            if state[name]["min_val"].numel() > 0
+            and bool(torch.all(state[name]["min_val"] <= state[name]["max_val"]))
+        ]
+        if not seen:
+            continue
+        min_val = seen[0]["min_val"]
+        max_val = seen[0]["max_val"]
+        for state in seen[1:]:
+            min_val = torch.minimum(min_val, state["min_val"])
+            max_val = torch.maximum(max_val, state["max_val"])
+        observer.min_val.resize_(min_val.shape).copy_(min_val)
+        observer.max_val.resize_(max_val.shape).copy_(max_val)
+
+
+def _calibrate_shard(
+    module: torch.nn.Module,
+    sequences: Sequence[Sequence[int]],
+    config: CalibrationConfig,
+    log_prefix: str = "",
+) -> CalibrationStats:
+    stats = CalibrationStats()
+    start = time.perf_counter()
+    for i, tokens in enumerate(sequences):
+        calibrate_sequence(module, tokens, config, stats)
+        stats.seconds = time.perf_counter() - start
+        if (i + 1) % config.log_interval == 0 or i + 1 == len(sequences):
+            logging.info(
+                f"{log_prefix}Calibrated {i + 1}/{len(sequences)} sequences: {stats}"
+            )
+    return stats
+
+
+# The module and shards, inherited by forked workers
+_worker_args: Optional[Any] = None
+
+
+def _run_worker(rank: int):
+    module, shards, config = _worker_args
+    torch.set_num_threads(max(1, torch.get_num_threads() // len(shards)))
+    stats = _calibrate_shard(module, shards[rank], config, f"[worker {rank}] ")
+    return stats, _observer_states(module)
+
+
+def calibrate(
+    module: torch.nn.Module,
+    sequences: Sequence[Sequence[int]],
+    config: CalibrationConfig,
+) -> CalibrationStats:
+    """
+    Run a prepared module on tokenized sequences, so that its observers
+    collect statistics.
+
+    With config.num_workers > 1, the sequences are sharded over forked
+    processes, and the min/max statistics they observed are merged back into
+    the module afterwards.
+    """
+    num_workers = min(config.num_workers, len(sequences))
+    if num_workers <= 1:
+        stats = _calibrate_shard(module, sequences, config)
+        logging.info(f"Calibration done: {stats}")
+        return stats
+
+    _check_mergeable(module)
+    global _worker_args
+    _worker_args = (
+        module,
+        [sequences[rank::num_workers] for rank in range(num_workers)],
+        config,
+    )
+    start = time.perf_counter()
+    try:
+        with multiprocessing.get_context("fork").Pool(num_workers) as pool:
+            results = pool.map(_run_worker, range(num_workers))
+    finally:
+        _worker_args = None
+
+    merge_observer_states(module, [states for _, states in results])
+    stats = CalibrationStats(
+        num_sequences=sum(s.num_sequences for s, _ in results),
+        num_tokens=sum(s.num_tokens for s, _ in results),
+        num_forwards=sum(s.num_forwards for s, _ in results),
+        seconds=time.perf_counter() - start,
+    )
+    logging.info(f"Calibration done with {num_workers} workers: {stats}")
+    return stats
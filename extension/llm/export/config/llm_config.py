@@ -22,7 +22,7 @@ import argparse
 import re
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import ClassVar, Dict, List, Optional
+from typing import Any, ClassVar, Dict, List, Optional
 
 
 ################################################################################
@@ -246,6 +246,12 @@ class ExportConfig:
             a separate file, external to the PTE. Pass the file name here.
         lora_weights_file: place the lora weights of the model into a
             separate file, external to the PTE. Pass the file name here.
+        export_cache_dir: Directory to cache torch.export() results in, so
+            that re-exporting an unchanged model with the same inputs loads
+            the saved program instead.
+        export_cache_hash_weights: Identify the weights in the export cache
+            by their contents instead of by the path, size and modification
+            time of the checkpoint. Slow for large models.
     """
 
     max_seq_length: int = 128
@@ -256,6 +262,8 @@ class ExportConfig:
     export_only: bool = False
     foundation_weights_file: Optional[str] = None
     lora_weights_file: Optional[str] = None
+    export_cache_dir: Optional[str] = None
+    export_cache_hash_weights: bool = False
 
     def __post_init__(self):
         if self.max_context_length < self.max_seq_length:
@@ -384,7 +392,12 @@ class QuantizationConfig:
         calibration_tasks: Tasks for GPTQ calibration from lm_eval.
         calibration_limit: Number of samples used for calibration from lm_eval.
         calibration_seq_length: Sequence length for GPTQ calibration from lm_eval.
-        calibration_data: Prompts use for calibration.
+        calibration_data: Prompt, or list of prompts, used for calibration.
+            Typed as Any since OmegaConf doesn't support a Union with a list.
+        calibration_num_workers: Number of processes the calibration prompts
+            are sharded over.
+        num_threads: Number of layers quantized concurrently by qmode
+            quantization. One by one if unspecified.
     """
 
     # Constants.
@@ -408,11 +421,26 @@ class QuantizationConfig:
     calibration_tasks: Optional[List[str]] = None
     calibration_limit: Optional[int] = None
     calibration_seq_length: Optional[int] = None
-    calibration_data: str = "Once upon a time"
+    calibration_data: Any = "Once upon a time"  # Union[str, List[str]]
+    calibration_num_workers: int = 1
+    num_threads: Optional[int] = None
 
     def __post_init__(self):
         if self.qmode:
             self._validate_qmode()
+        self._validate_calibration_data()
+
+    def _validate_calibration_data(self) -> None:
+        if isinstance(self.calibration_data, str):
+            return
+        if isinstance(self.calibration_data, (list, tuple)) and all(
+            isinstance(prompt, str) for prompt in self.calibration_data
+        ):
+            self.calibration_data = list(self.calibration_data)
+            return
+        raise ValueError(
+            f"calibration_data must be a prompt or a list of prompts, got {self.calibration_data!r}."
+        )
 
     def _validate_qmode(self) -> None:
         if not self.qmode:
@@ -695,6 +723,10 @@ class LlmConfig:
             llm_config.export.foundation_weights_file = args.foundation_weights_file
         if hasattr(args, "lora_weights_file"):
             llm_config.export.lora_weights_file = args.lora_weights_file
+        if hasattr(args, "export_cache_dir"):
+            llm_config.export.export_cache_dir = args.export_cache_dir
+        if hasattr(args, "export_cache_hash_weights"):
+            llm_config.export.export_cache_hash_weights = args.export_cache_hash_weights
 
         # QuantizationConfig
         if hasattr(args, "quantization_mode"):
@@ -717,6 +749,12 @@ class LlmConfig:
             llm_config.quantization.calibration_seq_length = args.calibration_seq_length
         if hasattr(args, "calibration_data"):
             llm_config.quantization.calibration_data = args.calibration_data
+        if hasattr(args, "quantize_num_threads"):
+            llm_config.quantization.num_threads = args.quantize_num_threads
+        if hasattr(args, "calibration_num_workers"):
+            llm_config.quantization.calibration_num_workers = (
+                args.calibration_num_workers
+            )
 
         # BackendConfig - XNNPack
         if hasattr(args, "xnnpack"):
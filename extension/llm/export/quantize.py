@@ -10,14 +10,89 @@ Supported embedding configs: "4w", "8w".
 Usage:
     from executorch.extension.llm.export.quantize import quantize_model_
     quantize_model_(model, qlinear_config="8da4w", qembedding_config="4w")
+
+Layers are independent, so they can be quantized on a thread pool with
+num_threads (the torch ops doing the work release the GIL). The result is the
+same as quantizing them one by one.
 """
 
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Tuple
 
 import torch
 from executorch.exir._warnings import experimental
 
 
+def _matching_modules(
+    module: torch.nn.Module,
+    filter_fn: Callable[[torch.nn.Module, str], bool],
+    fqn: str = "",
+) -> List[Tuple[str, torch.nn.Module]]:
+    """The modules quantize_ would transform: matches are not descended into."""
+    if filter_fn(module, fqn):
+        return [(fqn, module)]
+    matches = []
+    for name, child in module.named_children():
+        matches.extend(
+            _matching_modules(child, filter_fn, f"{fqn}.{name}" if fqn else name)
+        )
+    return matches
+
+
+class _Holder(torch.nn.Module):
+    def __init__(self, module: torch.nn.Module) -> None:
+        super().__init__()
+        self.module = module
+
+
+def parallel_quantize_(
+    module: torch.nn.Module,
+    config,
+    filter_fn: Optional[Callable[[torch.nn.Module, str], bool]] = None,
+    num_threads: Optional[int] = None,
+) -> None:
+    """torchao quantize_, quantizing the matching modules on num_threads threads.
+
+    Args:
+        module: The module to quantize in-place.
+        config: A torchao AOBaseConfig.
+        filter_fn: Selects the modules to quantize, as in quantize_. Linear
+            layers by default.
+        num_threads: Number of modules quantized concurrently. None or 1
+            quantizes them one by one.
+    """
+    from torchao.quantization.quant_api import _is_linear, quantize_
+
+    if filter_fn is None:
+        filter_fn = _is_linear
+    if num_threads is None or num_threads <= 1:
+        quantize_(module, config, filter_fn=filter_fn)
+        return
+
+    targets = _matching_modules(module, filter_fn)
+    if any(fqn == "" for fqn, _ in targets):
+        quantize_(module, config, filter_fn=filter_fn)
+        return
+
+    # Grad mode is thread local, quantize in the caller's
+    grad_enabled = torch.is_grad_enabled()
+
+    def quantize_one(target: Tuple[str, torch.nn.Module]) -> torch.nn.Module:
+        holder = _Holder(target[1])
+        with torch.set_grad_enabled(grad_enabled):
+            quantize_(holder, config, filter_fn=lambda m, fqn: fqn == "module")
+        return holder.module
+
+    with ThreadPoolExecutor(max_workers=num_threads) as pool:
+        replacements = list(pool.map(quantize_one, targets))
+
+    # Swap in replaced modules on the calling thread, in module order
+    for (fqn, child), replacement in zip(targets, replacements):
+        if replacement is not child:
+            parent_fqn, _, name = fqn.rpartition(".")
+            setattr(module.get_submodule(parent_fqn), name, replacement)
+
+
 @experimental("quantize_model_ is experimental and may change without notice.")
 def quantize_model_(  # noqa: C901
     module: torch.nn.Module,
@@ -26,6 +101,7 @@ def quantize_model_(  # noqa: C901
     qlinear_packing_format: Optional[str] = None,
     qembedding_config: Optional[str] = None,
     qembedding_group_size: int = 0,
+    num_threads: Optional[int] = None,
 ) -> None:
     """Quantize linear and embedding layers in a module in-place.
 
@@ -43,12 +119,12 @@ def quantize_model_(  # noqa: C901
         qembedding_config: Quantization config for embedding layers ("4w", "8w").
         qembedding_group_size: Group size for embedding quantization
             (default: 0 = per-axis).
+        num_threads: Number of layers quantized concurrently (default: one by
+            one).
     """
     if not qlinear_config and not qembedding_config:
         return
 
-    from torchao.quantization.quant_api import quantize_
-
     # Metal (MPS) quantization uses different API
     if qlinear_config == "fpa4w":
         import torchao.experimental.ops.mps  # noqa: F401
@@ -76,7 +152,7 @@ def quantize_model_(  # noqa: C901
             f"  Applying {qlinear_config} linear quantization "
             f"(group_size={qlinear_group_size})..."
         )
-        quantize_(module, config, filter_fn=linear_filter)
+        parallel_quantize_(module, config, linear_filter, num_threads)
         return
 
     from torchao.quantization.granularity import PerAxis, PerGroup
@@ -105,10 +181,11 @@ def quantize_model_(  # noqa: C901
             f"  Applying {qembedding_config} embedding quantization "
             f"(group_size={qembedding_group_size})..."
         )
-        quantize_(
+        parallel_quantize_(
             module,
             embedding_config,
             lambda m, fqn: isinstance(m, torch.nn.Embedding),
+            num_threads,
         )
 
     # Quantize linear layers
@@ -166,4 +243,4 @@ def quantize_model_(  # noqa: C901
             f"  Applying {qlinear_config} linear quantization "
             f"(group_size={qlinear_group_size}, packing={qlinear_packing_format})..."
         )
-        quantize_(module, config, filter_fn=linear_filter)
+        parallel_quantize_(module, config, linear_filter, num_threads)
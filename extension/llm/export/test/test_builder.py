@@ -5,7 +5,10 @@
 # LICENSE file in the root directory of this source tree.
 
 # pyre-strict
+import os
+import tempfile
 import unittest
+from functools import partial
 from unittest.mock import MagicMock
 
 import torch
@@ -13,6 +16,19 @@ import torch
 from executorch.extension.llm.export.builder import DType, LLMEdgeManager
 
 
+def _quantize_4w(model: torch.nn.Module, algorithm: str) -> torch.nn.Module:
+    from torchao.quantization.granularity import PerGroup
+    from torchao.quantization.quant_api import IntxWeightOnlyConfig, quantize_
+
+    config = IntxWeightOnlyConfig(
+        weight_dtype=torch.int4,
+        granularity=PerGroup(32),
+        intx_choose_qparams_algorithm=algorithm,
+    )
+    quantize_(model, config)
+    return model
+
+
 class TestLLMEdgeManager(unittest.TestCase):
     def setUp(self) -> None:
         # Create a mock model
@@ -116,3 +132,32 @@ class TestLLMEdgeManager(unittest.TestCase):
 
         # Verify the result is None
         self.assertIsNone(result)
+
+    def test_export_cache_key_with_source_transforms(self) -> None:
+        """Quantizing the same checkpoint differently gives different keys."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            checkpoint = os.path.join(tmpdir, "model.pth")
+            torch.manual_seed(0)
+            torch.save(torch.nn.Linear(64, 64).state_dict(), checkpoint)
+
+            def key(algorithm: str, config: str = "config") -> str:
+                model = torch.nn.Linear(64, 64)
+                model.load_state_dict(torch.load(checkpoint, weights_only=True))
+                manager = LLMEdgeManager(
+                    model=model,
+                    modelname=self.modelname,
+                    max_seq_len=self.max_seq_len,
+                    dtype=self.dtype,
+                    use_kv_cache=False,
+                    example_inputs=(torch.ones(1, 64),),
+                    export_cache_dir=os.path.join(tmpdir, "cache"),
+                    export_cache_checkpoints=[checkpoint],
+                    export_cache_config=config,
+                )
+                manager.source_transform([partial(_quantize_4w, algorithm=algorithm)])
+                return manager._export_cache_key(manager.model, None)
+
+            hqq_key = key("hqq_scale_only")
+            self.assertEqual(hqq_key, key("hqq_scale_only"))
+            self.assertNotEqual(hqq_key, key("affine"))
+            self.assertNotEqual(hqq_key, key("hqq_scale_only", config="other"))
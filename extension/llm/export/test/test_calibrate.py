@@ -0,0 +1,126 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# All rights reserved.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+# pyre-strict
+import unittest
+from typing import Dict, List, Optional, Tuple
+
+import torch
+
+from executorch.extension.llm.export.calibrate import (
+    calibrate,
+    calibrate_sequence,
+    CalibrationConfig,
+    CalibrationStats,
+)
+from torchao.quantization.pt2e import (
+    HistogramObserver,
+    MinMaxObserver,
+    PerChannelMinMaxObserver,
+)
+
+VOCAB_SIZE = 16
+
+
+class RecordingModel(torch.nn.Module):
+    """Predicts token + 1, and records the inputs of every forward."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls: List[Tuple[List[int], Optional[int]]] = []
+
+    def forward(
+        self, tokens: torch.Tensor, attn_options: Optional[Dict] = None
+    ) -> torch.Tensor:
+        pos = None if attn_options is None else int(attn_options["input_pos"][0])
+        self.calls.append((tokens[0].tolist(), pos))
+        return torch.nn.functional.one_hot(
+            (tokens[:, -1] + 1) % VOCAB_SIZE, VOCAB_SIZE
+        ).float()
+
+
+class ObservedModel(torch.nn.Module):
+    def __init__(self, activation_observer: torch.nn.Module) -> None:
+        super().__init__()
+        torch.manual_seed(0)
+        self.embedding = torch.nn.Embedding(VOCAB_SIZE, 8)
+        self.output = torch.nn.Linear(8, VOCAB_SIZE)
+        self.activation_observer = activation_observer
+        self.per_channel_observer = PerChannelMinMaxObserver(ch_axis=2)
+
+    def forward(self, tokens: torch.Tensor, attn_options: Dict) -> torch.Tensor:
+        h = self.activation_observer(self.embedding(tokens))
+        h = self.per_channel_observer(h)
+        return self.output(h)[:, -1]
+
+
+class TestCalibrate(unittest.TestCase):
+    def test_chunked_prefill_and_generation(self) -> None:
+        model = RecordingModel()
+        stats = CalibrationStats()
+        config = CalibrationConfig(
+            max_len=8,
+            use_kv_cache=True,
+            enable_dynamic_shape=True,
+            prefill_chunk_size=2,
+        )
+        calibrate_sequence(model, [3, 4, 5], config, stats)
+        self.assertEqual(
+            model.calls,
+            [([3, 4], 0), ([5], 2), ([6], 3), ([7], 4), ([8], 5), ([9], 6), ([10], 7)],
+        )
+        self.assertEqual(stats.num_sequences, 1)
+        self.assertEqual(stats.num_tokens, 8)
+        self.assertEqual(stats.num_forwards, 7)
+
+    def test_static_shape_and_eos(self) -> None:
+        model = RecordingModel()
+        config = CalibrationConfig(
+            max_len=8, use_kv_cache=True, enable_dynamic_shape=False, eos_id=5
+        )
+        calibrate_sequence(model, [2, 3], config, CalibrationStats())
+        self.assertEqual(model.calls, [([2], 0), ([3], 1), ([4], 2)])
+
+    def test_no_kv_cache(self) -> None:
+        model = RecordingModel()
+        config = CalibrationConfig(
+            max_len=4, use_kv_cache=False, enable_dynamic_shape=True
+        )
+        calibrate_sequence(model, [1, 2], config, CalibrationStats())
+        self.assertEqual(
+            model.calls, [([1, 2], None), ([1, 2, 3], None), ([1, 2, 3, 4], None)]
+        )
+
+        config.enable_dynamic_shape = False
+        with self.assertRaises(ValueError):
+            calibrate_sequence(model, [1, 2], config, CalibrationStats())
+
+    def test_workers_merge_observers(self) -> None:
+        sequences = [[i % VOCAB_SIZE, (3 * i) % VOCAB_SIZE] for i in range(6)]
+        config = CalibrationConfig(
+            max_len=6, use_kv_cache=True, enable_dynamic_shape=True
+        )
+        reference = ObservedModel(MinMaxObserver())
+        reference_stats = calibrate(reference, sequences, config)
+
+        config.num_workers = 3
+        model = ObservedModel(MinMaxObserver())
+        stats = calibrate(model, sequences, config)
+
+        self.assertEqual(stats.num_sequences, 6)
+        self.assertEqual(stats.num_tokens, reference_stats.num_tokens)
+        for name in ("activation_observer", "per_channel_observer"):
+            observer = getattr(model, name)
+            reference_observer = getattr(reference, name)
+            torch.testing.assert_close(observer.min_val, reference_observer.min_val)
+            torch.testing.assert_close(observer.max_val, reference_observer.max_val)
+
+    def test_workers_unsupported_observer(self) -> None:
+        config = CalibrationConfig(
+            max_len=4, use_kv_cache=True, enable_dynamic_shape=True, num_workers=2
+        )
+        with self.assertRaisesRegex(NotImplementedError, "HistogramObserver"):
+            calibrate(ObservedModel(HistogramObserver()), [[1], [2]], config)
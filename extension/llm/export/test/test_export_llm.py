@@ -71,6 +71,9 @@ export:
 quantization:
   pt2e_quantize: xnnpack_dynamic
   use_spin_quant: cuda
+  calibration_data:
+    - Once upon a time
+    - The quick brown fox
 backend:
   coreml:
     quantize: c4w
@@ -98,6 +101,10 @@ backend:
                 called_config.quantization.pt2e_quantize.value, "xnnpack_dynamic"
             )
             self.assertEqual(called_config.quantization.use_spin_quant.value, "cuda")
+            self.assertEqual(
+                called_config.quantization.calibration_data,
+                ["Once upon a time", "The quick brown fox"],
+            )
             self.assertEqual(called_config.backend.coreml.quantize.value, "c4w")
             self.assertEqual(
                 called_config.backend.coreml.compute_units.value, "cpu_and_gpu"
@@ -0,0 +1,94 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# All rights reserved.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+# pyre-strict
+import copy
+import unittest
+
+import torch
+
+from executorch.extension.llm.export.quantize import parallel_quantize_, quantize_model_
+from torchao.quantization.quant_api import IntxWeightOnlyConfig
+
+
+class Block(torch.nn.Module):
+    def __init__(self, dim: int) -> None:
+        super().__init__()
+        self.w1 = torch.nn.Linear(dim, 2 * dim)
+        self.w2 = torch.nn.Linear(2 * dim, dim, bias=False)
+
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        return self.w2(torch.relu(self.w1(x)))
+
+
+class Model(torch.nn.Module):
+    def __init__(self, dim: int = 64, n_layers: int = 4) -> None:
+        super().__init__()
+        self.embedding = torch.nn.Embedding(32, dim)
+        self.layers = torch.nn.ModuleList(Block(dim) for _ in range(n_layers))
+        # Not a multiple of the group size, left unquantized
+        self.proj = torch.nn.Linear(dim + 8, dim)
+        self.output = torch.nn.Linear(dim, 32)
+
+    def forward(self, tokens: torch.Tensor) -> torch.Tensor:
+        h = self.embedding(tokens)
+        for layer in self.layers:
+            h = h + layer(h)
+        h = self.proj(torch.nn.functional.pad(h, (0, 8)))
+        return self.output(h)
+
+
+class TestParallelQuantize(unittest.TestCase):
+    def setUp(self) -> None:
+        torch.manual_seed(0)
+        self.model = Model()
+        self.tokens = torch.randint(0, 32, (2, 8))
+
+    def test_matches_sequential(self) -> None:
+        for qlinear_config in ("4w", "8w", "8da4w", "8da8w"):
+            sequential = copy.deepcopy(self.model)
+            parallel = copy.deepcopy(self.model)
+            quantize_model_(
+                sequential, qlinear_config=qlinear_config, qembedding_config="4w"
+            )
+            quantize_model_(
+                parallel,
+                qlinear_config=qlinear_config,
+                qembedding_config="4w",
+                num_threads=4,
+            )
+            self.assertEqual(
+                type(parallel.layers[0].w1.weight),
+                type(sequential.layers[0].w1.weight),
+            )
+            self.assertIs(type(parallel.proj.weight), torch.nn.Parameter)
+            with torch.no_grad():
+                self.assertTrue(
+                    torch.equal(parallel(self.tokens), sequential(self.tokens)),
+                    qlinear_config,
+                )
+
+    def test_grad_mode_and_filter(self) -> None:
+        config = IntxWeightOnlyConfig(weight_dtype=torch.int8)
+        with torch.no_grad():
+            parallel_quantize_(
+                self.model,
+                config,
+                lambda m, fqn: isinstance(m, torch.nn.Linear)
+                and fqn.startswith("layers."),
+                num_threads=2,
+            )
+        for layer in self.model.layers:
+            self.assertIsNot(type(layer.w1.weight), torch.nn.Parameter)
+            self.assertFalse(layer.w1.weight.requires_grad)
+        self.assertIs(type(self.model.output.weight), torch.nn.Parameter)
+
+    def test_root_module(self) -> None:
+        linear = torch.nn.Linear(64, 64)
+        parallel_quantize_(
+            linear, IntxWeightOnlyConfig(weight_dtype=torch.int8), num_threads=2
+        )
+        self.assertIsNot(type(linear.weight), torch.nn.Parameter)
@@ -149,3 +149,32 @@ class KVCache(TuneKVCache):
         clone.v_cache.copy_(self.v_cache)
         clone.kv_cache_pos.copy_(self.kv_cache_pos)
         return clone
+
+    def snapshot(self, num_tokens: int) -> Tuple[torch.Tensor, torch.Tensor]:
+        """Copy the keys and values of the first ``num_tokens`` cache positions.
+
+        Args:
+            num_tokens (int): number of filled cache positions to copy.
+
+        Returns:
+            Tuple[torch.Tensor, torch.Tensor]: The copied key and value cache positions.
+        """
+        seq_dim = 2 if self.transpose_cache else 1
+        return (
+            self.k_cache.narrow(seq_dim, 0, num_tokens).clone(),
+            self.v_cache.narrow(seq_dim, 0, num_tokens).clone(),
+        )
+
+    def restore(self, snapshot: Tuple[torch.Tensor, torch.Tensor]) -> None:
+        """Restore a snapshot taken with ``snapshot()``, so that the next update
+        writes at the position right after the restored ones.
+
+        Args:
+            snapshot (Tuple[torch.Tensor, torch.Tensor]): key and value cache positions.
+        """
+        seq_dim = 2 if self.transpose_cache else 1
+        k, v = snapshot
+        num_tokens = k.size(seq_dim)
+        self.k_cache.narrow(seq_dim, 0, num_tokens).copy_(k)
+        self.v_cache.narrow(seq_dim, 0, num_tokens).copy_(v)
+        self.kv_cache_pos.copy_(torch.arange(0, self.max_seq_len) + num_tokens)
@@ -150,6 +150,24 @@ class KVCacheTest(unittest.TestCase):
     def test_kv_cache_eager(self):
         self._test_kv_cache(self.et_kv_cache.update)
 
+    def test_kv_cache_snapshot_restore(self):
+        k_val, v_val, _, _ = generate_cache_inputs(
+            3, self.batch_size, self.num_kv_heads, self.head_dim
+        )
+        self.et_kv_cache.update(k_val, v_val)
+        snapshot = self.et_kv_cache.snapshot(3)
+        self.et_kv_cache.update(k_val * 2, v_val * 2)
+
+        self.et_kv_cache.restore(snapshot)
+        self.assertEqual(self.et_kv_cache.kv_cache_pos[0].item(), 3)
+        # The next update continues right after the restored positions
+        k_val, v_val, _, _ = generate_cache_inputs(
+            1, self.batch_size, self.num_kv_heads, self.head_dim
+        )
+        k_cache, _ = self.et_kv_cache.update(k_val * 3, v_val * 3)
+        assert_close(k_cache[:, :3], snapshot[0])
+        self.assertTrue(torch.all(k_cache[:, 3] == 3))
+
     def test_kv_cache_export(self):
         exported_kv_cache = self.export_kv_cache(self.et_kv_cache)
         self._test_kv_cache(exported_kv_cache.module())
@@ -16,6 +16,7 @@ import torch  # preload libtorch shared libs for _llm_runner
 try:
     # Import shared components from the compiled C++ extension
     from executorch.extension.llm.runner._llm_runner import (  # noqa: F401
+        Audio,
         GenerationConfig,
         Image,
         make_audio_input,
@@ -25,6 +26,7 @@ try:
         make_token_input,
         MultimodalInput,
         MultimodalRunner,
+        RawAudio,
         Stats,
         TextLLMRunner,
     )
@@ -224,6 +226,7 @@ setattr(MultimodalRunner, "generate_text_hf", generate_text_hf)  # noqa B010
 
 
 __all__ = [
+    "Audio",
     "GenerationConfig",
     "Image",
     "make_audio_input",
@@ -233,6 +236,7 @@ __all__ = [
     "make_token_input",
     "MultimodalInput",
     "MultimodalRunner",
+    "RawAudio",
     "TextLLMRunner",
     "Stats",
 ]
@@ -4,8 +4,9 @@ Type stubs for _llm_runner module.
 This file provides type annotations for the ExecuTorch LLM Runner Python bindings.
 """
 
-from typing import Callable, List, Optional, overload
+from typing import Any, Callable, List, Optional, overload
 
+import numpy as np
 import torch
 
 class GenerationConfig:
@@ -149,6 +150,15 @@ class Image:
         """Initialize an Image with float data."""
         ...
 
+    @overload
+    def __init__(self, data: Any, width: int, height: int, channels: int) -> None:
+        """
+        Wrap (channels, height, width) uint8 or float32 data from a torch tensor,
+        a NumPy array or any object supporting the buffer protocol or DLPack,
+        without copying. Non-contiguous data and other dtypes are converted once.
+        """
+        ...
+
     def is_uint8(self) -> bool:
         """Check if image data is uint8 format."""
         ...
@@ -157,6 +167,10 @@ class Image:
         """Check if image data is float format."""
         ...
 
+    def is_external(self) -> bool:
+        """Check if the image wraps data it does not own."""
+        ...
+
     @property
     def width(self) -> int:
         """Image width in pixels."""
@@ -182,6 +196,10 @@ class Image:
         """Raw image data as float values."""
         ...
 
+    def numpy(self) -> np.ndarray:
+        """Read-only (channels, height, width) view of the image data, without copying."""
+        ...
+
     def __repr__(self) -> str: ...
 
 class Audio:
@@ -211,6 +229,23 @@ class Audio:
         """Initialize Audio with preprocessed data."""
         ...
 
+    @overload
+    def __init__(self, data: Any, batch_size: int, n_bins: int, n_frames: int) -> None:
+        """
+        Wrap uint8 or float32 preprocessed data from a torch tensor, a NumPy
+        array or any object supporting the buffer protocol or DLPack, without
+        copying.
+        """
+        ...
+
+    def is_external(self) -> bool:
+        """Check if the audio wraps data it does not own."""
+        ...
+
+    def numpy(self) -> np.ndarray:
+        """Read-only (batch_size, n_bins, n_frames) view of the audio data, without copying."""
+        ...
+
     def __repr__(self) -> str: ...
 
 class RawAudio:
@@ -240,6 +275,20 @@ class RawAudio:
         """Initialize RawAudio with raw data."""
         ...
 
+    @overload
+    def __init__(
+        self, data: Any, batch_size: int, n_channels: int, n_samples: int
+    ) -> None:
+        """
+        Wrap uint8 raw data from a torch tensor, a NumPy array or any object
+        supporting the buffer protocol or DLPack, without copying.
+        """
+        ...
+
+    def numpy(self) -> np.ndarray:
+        """Read-only (batch_size, n_channels, n_samples) view of the audio data, without copying."""
+        ...
+
     def __repr__(self) -> str: ...
 
 class MultimodalInput:
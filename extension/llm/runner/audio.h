@@ -11,6 +11,7 @@
 #pragma once
 #include <executorch/runtime/platform/compiler.h>
 #include <cstdint>
+#include <memory>
 #include <variant>
 #include <vector>
 
@@ -29,6 +30,14 @@ struct ET_EXPERIMENTAL RawAudio {
   int32_t batch_size;
   int32_t n_channels; // For mono, use n_channels = 1.
   int32_t n_samples;
+  // Data owned by someone else, e.g. a NumPy array or a torch tensor, used
+  // instead of `data` when set. `external_owner` keeps it alive.
+  const uint8_t* external_data = nullptr;
+  std::shared_ptr<const void> external_owner;
+
+  const uint8_t* data_ptr() const {
+    return external_data != nullptr ? external_data : data.data();
+  }
 };
 
 /**
@@ -82,6 +91,36 @@ class ET_EXPERIMENTAL Audio final {
         batch_size * n_bins * n_frames);
   }
 
+  // Constructor for uint8_t data owned by someone else, e.g. a NumPy array or
+  // a torch tensor. The data is not copied, `owner` keeps it alive for as long
+  // as this audio or any copy of it exists.
+  Audio(
+      const uint8_t* data,
+      int32_t batch_size,
+      int32_t n_bins,
+      int32_t n_frames,
+      std::shared_ptr<const void> owner)
+      : data_(std::vector<uint8_t>()),
+        external_data_(data),
+        external_owner_(std::move(owner)),
+        batch_size_(batch_size),
+        n_bins_(n_bins),
+        n_frames_(n_frames) {}
+
+  // Constructor for float data owned by someone else, see above.
+  Audio(
+      const float* data,
+      int32_t batch_size,
+      int32_t n_bins,
+      int32_t n_frames,
+      std::shared_ptr<const void> owner)
+      : data_(std::vector<float>()),
+        external_data_(data),
+        external_owner_(std::move(owner)),
+        batch_size_(batch_size),
+        n_bins_(n_bins),
+        n_frames_(n_frames) {}
+
   // Type checkers
   bool is_uint8() const {
     return std::holds_alternative<std::vector<uint8_t>>(data_);
@@ -91,6 +130,27 @@ class ET_EXPERIMENTAL Audio final {
     return std::holds_alternative<std::vector<float>>(data_);
   }
 
+  // Whether the data is owned by someone else. The get_*_data() vectors are
+  // empty for such audio, use data() instead.
+  bool is_external() const {
+    return external_data_ != nullptr;
+  }
+
+  // Pointer to the uint8_t or float data, whether it is owned or not.
+  const void* data() const {
+    if (is_external()) {
+      return external_data_;
+    }
+    if (is_float()) {
+      return get_float_data().data();
+    }
+    return get_uint8_data().data();
+  }
+
+  size_t numel() const {
+    return static_cast<size_t>(batch_size_) * n_bins_ * n_frames_;
+  }
+
   // Data access
   const std::vector<uint8_t>& get_uint8_data() const& {
     return std::get<std::vector<uint8_t>>(data_);
@@ -131,12 +191,12 @@ class ET_EXPERIMENTAL Audio final {
     }
     if (is_float()) {
       return executorch::extension::from_blob(
-          const_cast<float*>(get_float_data().data()),
+          const_cast<void*>(data()),
           sizes,
           ::executorch::aten::ScalarType::Float);
     } else if (is_uint8()) {
       return executorch::extension::from_blob(
-          const_cast<uint8_t*>(get_uint8_data().data()),
+          const_cast<void*>(data()),
           sizes,
           ::executorch::aten::ScalarType::Byte);
     }
@@ -149,6 +209,9 @@ class ET_EXPERIMENTAL Audio final {
  private:
   // Members
   std::variant<std::vector<uint8_t>, std::vector<float>> data_;
+  // Data owned by external_owner_, used instead of data_ when set
+  const void* external_data_ = nullptr;
+  std::shared_ptr<const void> external_owner_;
   int32_t batch_size_;
   int32_t n_bins_;
   int32_t n_frames_;
@@ -0,0 +1,94 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# All rights reserved.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+"""
+Measure the Python-side overhead of handing preprocessed images and audio to
+the LLM runner, before multimodal prefill starts: converting the data to a list
+and copying it into an Image / Audio, against wrapping NumPy arrays and torch
+tensors without copying.
+
+Usage:
+    python -m executorch.extension.llm.runner.benchmark_multimodal_input
+"""
+
+import argparse
+import statistics
+import time
+from typing import Callable
+
+import numpy as np
+import torch
+
+from executorch.extension.llm.runner import (
+    Audio,
+    Image,
+    make_audio_input,
+    make_image_input,
+    MultimodalInput,
+)
+
+
+def time_ms(fn: Callable[[], object], iterations: int) -> float:
+    fn()
+    times = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+def benchmark(args) -> None:
+    size = args.image_size
+    pixels = np.random.rand(3, size, size).astype(np.float32)
+    pixel_tensor = torch.from_numpy(pixels)
+    features = np.random.rand(1, args.n_bins, args.n_frames).astype(np.float32)
+    feature_tensor = torch.from_numpy(features)
+
+    image = Image(pixels, size, size, 3)
+    cases = {
+        f"image {size}x{size} float32": {
+            "list": lambda: MultimodalInput(
+                Image(pixels.ravel().tolist(), size, size, 3)
+            ),
+            "numpy": lambda: MultimodalInput(Image(pixels, size, size, 3)),
+            "tensor": lambda: MultimodalInput(Image(pixel_tensor, size, size, 3)),
+            "make_image_input": lambda: make_image_input(pixel_tensor),
+        },
+        f"audio {args.n_bins}x{args.n_frames} float32": {
+            "list": lambda: MultimodalInput(
+                Audio(features.ravel().tolist(), 1, args.n_bins, args.n_frames)
+            ),
+            "numpy": lambda: MultimodalInput(
+                Audio(features, 1, args.n_bins, args.n_frames)
+            ),
+            "make_audio_input": lambda: make_audio_input(feature_tensor),
+        },
+        "image data readback": {
+            "float_data": lambda: image.float_data,
+            "numpy": lambda: image.numpy(),
+        },
+    }
+
+    print(f"{'input':<32} {'path':<18} {'median (ms)':>12}")
+    for name, paths in cases.items():
+        for path, fn in paths.items():
+            print(f"{name:<32} {path:<18} {time_ms(fn, args.iterations):>12.3f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark multimodal input preprocessing overhead"
+    )
+    parser.add_argument("--image_size", type=int, default=896)
+    parser.add_argument("--n_bins", type=int, default=128)
+    parser.add_argument("--n_frames", type=int, default=3000)
+    parser.add_argument("--iterations", type=int, default=20)
+    benchmark(parser.parse_args())
+
+
+if __name__ == "__main__":
+    main()
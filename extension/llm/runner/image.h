@@ -12,6 +12,7 @@
 #include <executorch/runtime/platform/compiler.h>
 #include <cstddef>
 #include <cstdint>
+#include <memory>
 #include <variant>
 #include <vector>
 
@@ -49,6 +50,36 @@ class ET_EXPERIMENTAL Image {
         height_(height),
         channels_(channels) {}
 
+  // Constructor for uint8_t data owned by someone else, e.g. a NumPy array or
+  // a torch tensor. The data is not copied, `owner` keeps it alive for as long
+  // as this image or any copy of it exists.
+  Image(
+      const uint8_t* data,
+      int32_t width,
+      int32_t height,
+      int32_t channels,
+      std::shared_ptr<const void> owner)
+      : data_(std::vector<uint8_t>()),
+        external_data_(data),
+        external_owner_(std::move(owner)),
+        width_(width),
+        height_(height),
+        channels_(channels) {}
+
+  // Constructor for float data owned by someone else, see above.
+  Image(
+      const float* data,
+      int32_t width,
+      int32_t height,
+      int32_t channels,
+      std::shared_ptr<const void> owner)
+      : data_(std::vector<float>()),
+        external_data_(data),
+        external_owner_(std::move(owner)),
+        width_(width),
+        height_(height),
+        channels_(channels) {}
+
   // Getters
   int32_t width() const {
     return width_;
@@ -69,6 +100,27 @@ class ET_EXPERIMENTAL Image {
     return std::holds_alternative<std::vector<float>>(data_);
   }
 
+  // Whether the data is owned by someone else. The get_*_data() vectors are
+  // empty for such images, use data() instead.
+  bool is_external() const {
+    return external_data_ != nullptr;
+  }
+
+  // Pointer to the uint8_t or float data, whether it is owned or not.
+  const void* data() const {
+    if (is_external()) {
+      return external_data_;
+    }
+    if (is_float()) {
+      return get_float_data().data();
+    }
+    return get_uint8_data().data();
+  }
+
+  size_t numel() const {
+    return static_cast<size_t>(channels_) * height_ * width_;
+  }
+
   const std::vector<uint8_t>& get_uint8_data() const& {
     return std::get<std::vector<uint8_t>>(data_);
   }
@@ -96,12 +148,12 @@ class ET_EXPERIMENTAL Image {
     }
     if (is_float()) {
       return executorch::extension::from_blob(
-          const_cast<float*>(get_float_data().data()),
+          const_cast<void*>(data()),
           sizes,
           ::executorch::aten::ScalarType::Float);
     } else if (is_uint8()) {
       return executorch::extension::from_blob(
-          const_cast<uint8_t*>(get_uint8_data().data()),
+          const_cast<void*>(data()),
           sizes,
           ::executorch::aten::ScalarType::Byte);
     }
@@ -113,6 +165,9 @@ class ET_EXPERIMENTAL Image {
  private:
   // Assuming NCHW format
   std::variant<std::vector<uint8_t>, std::vector<float>> data_;
+  // Data owned by external_owner_, used instead of data_ when set
+  const void* external_data_ = nullptr;
+  std::shared_ptr<const void> external_owner_;
   int32_t width_;
   int32_t height_;
   int32_t channels_;
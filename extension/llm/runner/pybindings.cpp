@@ -43,6 +43,177 @@ using namespace executorch::runtime;
     }                                                             \
   })
 
+namespace {
+
+// A view of the data of an array-like Python object (NumPy array, torch tensor,
+// DLPack capsule provider or any object supporting the buffer protocol), with a
+// reference that keeps the data alive.
+struct ArrayView {
+  const void* data;
+  bool is_float;
+  size_t numel;
+  std::shared_ptr<const void> owner;
+};
+
+ArrayView view_tensor(torch::Tensor tensor) {
+  if (!tensor.device().is_cpu()) {
+    throw std::runtime_error("Only CPU tensors are supported.");
+  }
+  if (tensor.scalar_type() != torch::kUInt8 &&
+      tensor.scalar_type() != torch::kFloat) {
+    throw std::runtime_error(
+        "Unsupported tensor dtype. Only uint8 and float32 are supported.");
+  }
+  // No-op for contiguous tensors, otherwise copies once into a contiguous one
+  tensor = tensor.contiguous();
+  const void* data = tensor.data_ptr();
+  return ArrayView{
+      data,
+      tensor.scalar_type() == torch::kFloat,
+      static_cast<size_t>(tensor.numel()),
+      std::make_shared<torch::Tensor>(std::move(tensor))};
+}
+
+bool is_c_contiguous(const py::buffer_info& info) {
+  py::ssize_t stride = info.itemsize;
+  for (py::ssize_t i = info.ndim - 1; i >= 0; --i) {
+    if (info.shape[i] != 1 && info.strides[i] != stride) {
+      return false;
+    }
+    stride *= info.shape[i];
+  }
+  return true;
+}
+
+ArrayView view_buffer(const py::buffer& buffer) {
+  py::buffer_info info = buffer.request();
+  bool is_uint8 = info.format == py::format_descriptor<uint8_t>::format();
+  bool is_float = info.format == py::format_descriptor<float>::format();
+  if (!(is_uint8 || is_float) || !is_c_contiguous(info)) {
+    // Other dtypes and strided views are converted once with NumPy, integers
+    // to uint8 and floating point numbers to float32
+    py::module_ np = py::module_::import("numpy");
+    py::array array = np.attr("asarray")(buffer);
+    py::object dtype =
+        np.attr(array.dtype().kind() == 'f' ? "float32" : "uint8");
+    return view_buffer(np.attr("ascontiguousarray")(array, dtype));
+  }
+  const void* data = info.ptr;
+  size_t numel = static_cast<size_t>(info.size);
+  // Releasing the buffer drops the reference to the exporting object, which
+  // needs the GIL
+  std::shared_ptr<const void> owner(
+      new py::buffer_info(std::move(info)), [](const void* p) {
+        py::gil_scoped_acquire acquire;
+        delete static_cast<const py::buffer_info*>(p);
+      });
+  return ArrayView{data, is_float, numel, std::move(owner)};
+}
+
+ArrayView view_dlpack(const py::object& obj) {
+  if (!py::hasattr(obj, "__dlpack__")) {
+    throw py::type_error(
+        "Expected a list, a torch tensor, an object supporting the buffer protocol or a DLPack compatible array.");
+  }
+  return view_tensor(py::module_::import("torch")
+                         .attr("from_dlpack")(obj)
+                         .cast<torch::Tensor>());
+}
+
+void check_numel(const ArrayView& view, size_t expected, const char* name) {
+  if (view.numel != expected) {
+    throw std::runtime_error(
+        std::string(name) + " data has " + std::to_string(view.numel) +
+        " elements, but its dimensions require " + std::to_string(expected));
+  }
+}
+
+Image make_image(
+    const ArrayView& view,
+    int32_t width,
+    int32_t height,
+    int32_t channels) {
+  check_numel(view, static_cast<size_t>(channels) * height * width, "Image");
+  if (view.is_float) {
+    return Image(
+        static_cast<const float*>(view.data),
+        width,
+        height,
+        channels,
+        view.owner);
+  }
+  return Image(
+      static_cast<const uint8_t*>(view.data),
+      width,
+      height,
+      channels,
+      view.owner);
+}
+
+Audio make_audio(
+    const ArrayView& view,
+    int32_t batch_size,
+    int32_t n_bins,
+    int32_t n_frames) {
+  check_numel(
+      view, static_cast<size_t>(batch_size) * n_bins * n_frames, "Audio");
+  if (view.is_float) {
+    return Audio(
+        static_cast<const float*>(view.data),
+        batch_size,
+        n_bins,
+        n_frames,
+        view.owner);
+  }
+  return Audio(
+      static_cast<const uint8_t*>(view.data),
+      batch_size,
+      n_bins,
+      n_frames,
+      view.owner);
+}
+
+RawAudio make_raw_audio(
+    const ArrayView& view,
+    int32_t batch_size,
+    int32_t n_channels,
+    int32_t n_samples) {
+  if (view.is_float) {
+    throw std::runtime_error(
+        "Unsupported raw audio dtype. Only uint8 is supported for raw audio.");
+  }
+  check_numel(
+      view,
+      static_cast<size_t>(batch_size) * n_channels * n_samples,
+      "RawAudio");
+  RawAudio audio{{}, batch_size, n_channels, n_samples};
+  audio.external_data = static_cast<const uint8_t*>(view.data);
+  audio.external_owner = view.owner;
+  return audio;
+}
+
+// Copy the data out as a list, for the uint8_data and float_data accessors
+template <typename T>
+std::vector<T> copy_data(const void* data, size_t numel) {
+  const T* begin = static_cast<const T*>(data);
+  return std::vector<T>(begin, begin + numel);
+}
+
+// A read-only NumPy array viewing the data of `self`, which it keeps alive
+py::array numpy_view(
+    const py::object& self,
+    const void* data,
+    bool is_float,
+    std::vector<py::ssize_t> shape) {
+  py::array array = is_float
+      ? py::array(py::dtype::of<float>(), shape, data, self)
+      : py::array(py::dtype::of<uint8_t>(), shape, data, self);
+  array.attr("setflags")(py::arg("write") = false);
+  return array;
+}
+
+} // namespace
+
 // Python wrapper class for TextLLMRunner
 class PyTextLLMRunner {
  public:
@@ -351,8 +522,31 @@ PYBIND11_MODULE(_llm_runner, m) {
             " tokens_per_second=" + std::to_string(tokens_per_second) + ">";
       });
 
-  // Bind Image class
+  // Bind Image class. Tensors, NumPy arrays and other array-like objects are
+  // wrapped without copying, lists are copied.
   py::class_<Image>(m, "Image")
+      .def(
+          py::init([](torch::Tensor data,
+                      int32_t width,
+                      int32_t height,
+                      int32_t channels) {
+            return make_image(view_tensor(data), width, height, channels);
+          }),
+          py::arg("data"),
+          py::arg("width"),
+          py::arg("height"),
+          py::arg("channels"))
+      .def(
+          py::init([](const py::buffer& data,
+                      int32_t width,
+                      int32_t height,
+                      int32_t channels) {
+            return make_image(view_buffer(data), width, height, channels);
+          }),
+          py::arg("data"),
+          py::arg("width"),
+          py::arg("height"),
+          py::arg("channels"))
       .def(
           py::init<std::vector<uint8_t>&&, int32_t, int32_t, int32_t>(),
           py::arg("data"),
@@ -365,19 +559,50 @@ PYBIND11_MODULE(_llm_runner, m) {
           py::arg("width"),
           py::arg("height"),
           py::arg("channels"))
+      .def(
+          py::init([](const py::object& data,
+                      int32_t width,
+                      int32_t height,
+                      int32_t channels) {
+            return make_image(view_dlpack(data), width, height, channels);
+          }),
+          py::arg("data"),
+          py::arg("width"),
+          py::arg("height"),
+          py::arg("channels"))
       .def("is_uint8", &Image::is_uint8)
       .def("is_float", &Image::is_float)
+      .def("is_external", &Image::is_external)
       .def_property_readonly("width", &Image::width)
       .def_property_readonly("height", &Image::height)
       .def_property_readonly("channels", &Image::channels)
       .def_property_readonly(
           "uint8_data",
-          static_cast<const std::vector<uint8_t>& (Image::*)() const&>(
-              &Image::get_uint8_data))
+          [](const Image& image) {
+            if (!image.is_uint8()) {
+              throw std::runtime_error("Image data is not uint8");
+            }
+            return copy_data<uint8_t>(image.data(), image.numel());
+          })
       .def_property_readonly(
           "float_data",
-          static_cast<const std::vector<float>& (Image::*)() const&>(
-              &Image::get_float_data))
+          [](const Image& image) {
+            if (!image.is_float()) {
+              throw std::runtime_error("Image data is not float32");
+            }
+            return copy_data<float>(image.data(), image.numel());
+          })
+      .def(
+          "numpy",
+          [](const py::object& self) {
+            const Image& image = self.cast<const Image&>();
+            return numpy_view(
+                self,
+                image.data(),
+                image.is_float(),
+                {image.channels(), image.height(), image.width()});
+          },
+          "Read-only (channels, height, width) NumPy view of the image data, without copying")
       .def("__repr__", [](const Image& img) {
         std::string dtype = "unknown";
         if (img.is_uint8()) {
@@ -394,6 +619,30 @@ PYBIND11_MODULE(_llm_runner, m) {
   // Bind Audio class
   py::class_<Audio>(m, "Audio")
       .def(py::init<>())
+      .def(
+          py::init([](torch::Tensor data,
+                      int32_t batch_size,
+                      int32_t n_bins,
+                      int32_t n_frames) {
+            return make_audio(view_tensor(data), batch_size, n_bins, n_frames);
+          }),
+          py::arg("data"),
+          py::arg("batch_size"),
+          py::arg("n_bins"),
+          py::arg("n_frames"),
+          "Wrap preprocessed audio data from a tensor without copying")
+      .def(
+          py::init([](const py::buffer& data,
+                      int32_t batch_size,
+                      int32_t n_bins,
+                      int32_t n_frames) {
+            return make_audio(view_buffer(data), batch_size, n_bins, n_frames);
+          }),
+          py::arg("data"),
+          py::arg("batch_size"),
+          py::arg("n_bins"),
+          py::arg("n_frames"),
+          "Wrap preprocessed audio data from a NumPy array or buffer without copying")
       .def(
           py::init<std::vector<uint8_t>&&, int32_t, int32_t, int32_t>(),
           py::arg("data"),
@@ -408,20 +657,54 @@ PYBIND11_MODULE(_llm_runner, m) {
           py::arg("n_bins"),
           py::arg("n_frames"),
           "Create preprocessed audio data (float32)")
+      .def(
+          py::init([](const py::object& data,
+                      int32_t batch_size,
+                      int32_t n_bins,
+                      int32_t n_frames) {
+            return make_audio(view_dlpack(data), batch_size, n_bins, n_frames);
+          }),
+          py::arg("data"),
+          py::arg("batch_size"),
+          py::arg("n_bins"),
+          py::arg("n_frames"),
+          "Wrap preprocessed audio data from a DLPack compatible array without copying")
       .def("is_uint8", &Audio::is_uint8)
       .def("is_float", &Audio::is_float)
+      .def("is_external", &Audio::is_external)
       .def_property_readonly(
           "uint8_data",
-          static_cast<const std::vector<uint8_t>& (Audio::*)() const&>(
-              &Audio::get_uint8_data))
+          [](const Audio& audio) {
+            if (!audio.is_uint8()) {
+              throw std::runtime_error("Audio data is not uint8");
+            }
+            return copy_data<uint8_t>(audio.data(), audio.numel());
+          })
       .def_property_readonly(
           "float_data",
-          static_cast<const std::vector<float>& (Audio::*)() const&>(
-              &Audio::get_float_data))
+          [](const Audio& audio) {
+            if (!audio.is_float()) {
+              throw std::runtime_error("Audio data is not float32");
+            }
+            return copy_data<float>(audio.data(), audio.numel());
+          })
       .def_property_readonly("batch_size", &Audio::get_batch_size)
       .def_property_readonly("n_bins", &Audio::get_n_bins)
       .def_property_readonly("n_frames", &Audio::get_n_frames)
       .def("toTensor", &Audio::toTensor)
+      .def(
+          "numpy",
+          [](const py::object& self) {
+            const Audio& audio = self.cast<const Audio&>();
+            return numpy_view(
+                self,
+                audio.data(),
+                audio.is_float(),
+                {audio.get_batch_size(),
+                 audio.get_n_bins(),
+                 audio.get_n_frames()});
+          },
+          "Read-only (batch_size, n_bins, n_frames) NumPy view of the audio data, without copying")
       .def("__repr__", [](const Audio& audio) {
         std::string dtype = "unknown";
         if (audio.is_uint8()) {
@@ -438,6 +721,32 @@ PYBIND11_MODULE(_llm_runner, m) {
   // Bind RawAudio class
   py::class_<RawAudio>(m, "RawAudio")
       .def(py::init<>())
+      .def(
+          py::init([](torch::Tensor data,
+                      int32_t batch_size,
+                      int32_t n_channels,
+                      int32_t n_samples) {
+            return make_raw_audio(
+                view_tensor(data), batch_size, n_channels, n_samples);
+          }),
+          py::arg("data"),
+          py::arg("batch_size"),
+          py::arg("n_channels"),
+          py::arg("n_samples"),
+          "Wrap raw audio data from a uint8 tensor without copying")
+      .def(
+          py::init([](const py::buffer& data,
+                      int32_t batch_size,
+                      int32_t n_channels,
+                      int32_t n_samples) {
+            return make_raw_audio(
+                view_buffer(data), batch_size, n_channels, n_samples);
+          }),
+          py::arg("data"),
+          py::arg("batch_size"),
+          py::arg("n_channels"),
+          py::arg("n_samples"),
+          "Wrap raw audio data from a uint8 NumPy array or buffer without copying")
       .def(
           py::init<std::vector<uint8_t>&&, int32_t, int32_t, int32_t>(),
           py::arg("data"),
@@ -445,10 +754,46 @@ PYBIND11_MODULE(_llm_runner, m) {
           py::arg("n_channels"),
           py::arg("n_samples"),
           "Create raw audio data")
-      .def_readwrite("data", &RawAudio::data)
+      .def(
+          py::init([](const py::object& data,
+                      int32_t batch_size,
+                      int32_t n_channels,
+                      int32_t n_samples) {
+            return make_raw_audio(
+                view_dlpack(data), batch_size, n_channels, n_samples);
+          }),
+          py::arg("data"),
+          py::arg("batch_size"),
+          py::arg("n_channels"),
+          py::arg("n_samples"),
+          "Wrap raw audio data from a DLPack compatible array without copying")
+      .def_property(
+          "data",
+          [](const RawAudio& audio) {
+            return copy_data<uint8_t>(
+                audio.data_ptr(),
+                static_cast<size_t>(audio.batch_size) * audio.n_channels *
+                    audio.n_samples);
+          },
+          [](RawAudio& audio, std::vector<uint8_t> data) {
+            audio.data = std::move(data);
+            audio.external_data = nullptr;
+            audio.external_owner.reset();
+          })
       .def_readwrite("batch_size", &RawAudio::batch_size)
       .def_readwrite("n_channels", &RawAudio::n_channels)
       .def_readwrite("n_samples", &RawAudio::n_samples)
+      .def(
+          "numpy",
+          [](const py::object& self) {
+            const RawAudio& audio = self.cast<const RawAudio&>();
+            return numpy_view(
+                self,
+                audio.data_ptr(),
+                false,
+                {audio.batch_size, audio.n_channels, audio.n_samples});
+          },
+          "Read-only (batch_size, n_channels, n_samples) NumPy view of the audio data, without copying")
       .def("__repr__", [](const RawAudio& audio) {
         return "<RawAudio batch_size=" + std::to_string(audio.batch_size) +
             " n_channels=" + std::to_string(audio.n_channels) +
@@ -605,27 +950,13 @@ PYBIND11_MODULE(_llm_runner, m) {
               "Image must have 3 (RGB) or 4 (RGBA) channels");
         }
 
-        image_tensor = image_tensor.contiguous();
-        if (image_tensor.scalar_type() == torch::kUInt8) {
-          uint8_t* data = image_tensor.data_ptr<uint8_t>();
-          std::vector<uint8_t> image_data(data, data + image_tensor.numel());
-          return MultimodalInput(Image(
-              std::move(image_data),
-              static_cast<int32_t>(width),
-              static_cast<int32_t>(height),
-              static_cast<int32_t>(channels)));
-        } else if (image_tensor.scalar_type() == torch::kFloat) {
-          float* data = image_tensor.data_ptr<float>();
-          std::vector<float> image_data(data, data + image_tensor.numel());
-          return MultimodalInput(Image(
-              std::move(image_data),
-              static_cast<int32_t>(width),
-              static_cast<int32_t>(height),
-              static_cast<int32_t>(channels)));
-        } else {
-          throw std::runtime_error(
-              "Unsupported image tensor dtype. Only uint8 and float32 are supported.");
-        }
+        // Wraps the tensor without copying when it is already (C, H, W)
+        // contiguous
+        return MultimodalInput(make_image(
+            view_tensor(image_tensor),
+            static_cast<int32_t>(width),
+            static_cast<int32_t>(height),
+            static_cast<int32_t>(channels)));
       },
       "Create an image input from a torch tensor (H, W, C), (1, H, W, C), (C, H, W), or (1, C, H, W)",
       py::arg("image_tensor"));
@@ -642,27 +973,11 @@ PYBIND11_MODULE(_llm_runner, m) {
         int64_t n_bins = audio_tensor.size(1);
         int64_t n_frames = audio_tensor.size(2);
 
-        audio_tensor = audio_tensor.contiguous();
-        if (audio_tensor.scalar_type() == torch::kUInt8) {
-          uint8_t* data = audio_tensor.data_ptr<uint8_t>();
-          std::vector<uint8_t> audio_data(data, data + audio_tensor.numel());
-          return MultimodalInput(Audio(
-              std::move(audio_data),
-              static_cast<int32_t>(batch_size),
-              static_cast<int32_t>(n_bins),
-              static_cast<int32_t>(n_frames)));
-        } else if (audio_tensor.scalar_type() == torch::kFloat) {
-          float* data = audio_tensor.data_ptr<float>();
-          std::vector<float> audio_data(data, data + audio_tensor.numel());
-          return MultimodalInput(Audio(
-              std::move(audio_data),
-              static_cast<int32_t>(batch_size),
-              static_cast<int32_t>(n_bins),
-              static_cast<int32_t>(n_frames)));
-        } else {
-          throw std::runtime_error(
-              "Unsupported audio tensor dtype. Only uint8 and float32 are supported for preprocessed audio.");
-        }
+        return MultimodalInput(make_audio(
+            view_tensor(audio_tensor),
+            static_cast<int32_t>(batch_size),
+            static_cast<int32_t>(n_bins),
+            static_cast<int32_t>(n_frames)));
       },
       "Create a preprocessed audio input from a torch tensor (batch_size, n_bins, n_frames)",
       py::arg("audio_tensor"));
@@ -679,19 +994,11 @@ PYBIND11_MODULE(_llm_runner, m) {
         int64_t n_channels = audio_tensor.size(1);
         int64_t n_samples = audio_tensor.size(2);
 
-        audio_tensor = audio_tensor.contiguous();
-        if (audio_tensor.scalar_type() == torch::kUInt8) {
-          uint8_t* data = audio_tensor.data_ptr<uint8_t>();
-          std::vector<uint8_t> audio_data(data, data + audio_tensor.numel());
-          return MultimodalInput(RawAudio{
-              std::move(audio_data),
-              static_cast<int32_t>(batch_size),
-              static_cast<int32_t>(n_channels),
-              static_cast<int32_t>(n_samples)});
-        } else {
-          throw std::runtime_error(
-              "Unsupported raw audio tensor dtype. Only uint8 is supported for raw audio.");
-        }
+        return MultimodalInput(make_raw_audio(
+            view_tensor(audio_tensor),
+            static_cast<int32_t>(batch_size),
+            static_cast<int32_t>(n_channels),
+            static_cast<int32_t>(n_samples)));
       },
       "Create a raw audio input from a torch tensor (batch_size, n_channels, n_samples)",
       py::arg("audio_tensor"));
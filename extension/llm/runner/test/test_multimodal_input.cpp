@@ -11,11 +11,13 @@
 #include <gtest/gtest.h>
 
 using namespace ::testing;
+using executorch::extension::llm::Audio;
 using executorch::extension::llm::Image;
 using executorch::extension::llm::make_image_input;
 using executorch::extension::llm::make_text_input;
 using executorch::extension::llm::make_token_input;
 using executorch::extension::llm::MultimodalInput;
+using executorch::extension::llm::RawAudio;
 
 class MultimodalInputTest : public Test {
  protected:
@@ -417,6 +419,53 @@ TEST_F(MultimodalInputTest, AssignmentBetweenTypes) {
   EXPECT_EQ(input.get_text(), text);
 }
 
+// Test images wrapping data they do not own
+TEST_F(MultimodalInputTest, ExternalImageSharesData) {
+  auto pixels = std::make_shared<std::vector<float>>(2 * 3 * 4, 0.5f);
+  std::weak_ptr<std::vector<float>> weak_pixels = pixels;
+  MultimodalInput input(Image(pixels->data(), 4, 3, 2, pixels));
+  pixels.reset();
+
+  // The input keeps the data alive, and copies share it
+  EXPECT_FALSE(weak_pixels.expired());
+  MultimodalInput copy(input);
+  const Image& image = copy.get_image();
+  EXPECT_TRUE(image.is_float());
+  EXPECT_TRUE(image.is_external());
+  EXPECT_EQ(image.data(), input.get_image().data());
+  EXPECT_EQ(image.numel(), 2 * 3 * 4);
+  EXPECT_TRUE(image.get_float_data().empty());
+
+  auto tensor = image.toTensor(/*with_batch*/ true);
+  ASSERT_TRUE(tensor.ok());
+  EXPECT_EQ(tensor.get()->dim(), 4);
+  EXPECT_EQ(tensor.get()->const_data_ptr<float>(), image.data());
+
+  input = MultimodalInput("text");
+  copy = MultimodalInput("text");
+  EXPECT_TRUE(weak_pixels.expired());
+}
+
+// Test audio wrapping data it does not own
+TEST_F(MultimodalInputTest, ExternalAudioSharesData) {
+  auto features = std::make_shared<std::vector<uint8_t>>(1 * 8 * 5, 7);
+  Audio audio(features->data(), 1, 8, 5, features);
+  EXPECT_TRUE(audio.is_uint8());
+  EXPECT_TRUE(audio.is_external());
+  EXPECT_EQ(audio.data(), features->data());
+
+  auto tensor = audio.toTensor();
+  ASSERT_TRUE(tensor.ok());
+  EXPECT_EQ(tensor.get()->numel(), 40);
+  EXPECT_EQ(tensor.get()->const_data_ptr<uint8_t>(), features->data());
+
+  RawAudio raw_audio{{}, 1, 1, 40};
+  EXPECT_EQ(raw_audio.data_ptr(), raw_audio.data.data());
+  raw_audio.external_data = features->data();
+  raw_audio.external_owner = features;
+  EXPECT_EQ(MultimodalInput(raw_audio).get_raw_audio().data_ptr()[39], 7);
+}
+
 // Token-related tests
 class MultimodalInputTokenTest : public Test {
  protected:
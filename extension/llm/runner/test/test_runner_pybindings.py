@@ -16,14 +16,17 @@ import os
 import tempfile
 import unittest
 
+import numpy as np
 import torch
 from executorch.extension.llm.runner import (
+    Audio,
     GenerationConfig,
     Image,
     make_image_input,
     make_text_input,
     MultimodalInput,
     MultimodalRunner,
+    RawAudio,
 )
 
 
@@ -137,6 +140,87 @@ class TestImage(unittest.TestCase):
         self.assertIn("width=640", repr_str)
         self.assertIn("channels=3", repr_str)
 
+    def test_from_numpy_without_copy(self):
+        """Test wrapping a NumPy array without copying it."""
+        array = np.arange(24, dtype=np.uint8).reshape(3, 2, 4)
+        image = Image(array, 4, 2, 3)
+
+        self.assertTrue(image.is_uint8())
+        self.assertTrue(image.is_external())
+        view = image.numpy()
+        self.assertTrue(np.shares_memory(view, array))
+        self.assertEqual(view.shape, (3, 2, 4))
+        self.assertFalse(view.flags.writeable)
+        self.assertEqual(image.uint8_data, array.flatten().tolist())
+
+        # The image keeps the array alive
+        del array
+        self.assertEqual(image.numpy()[2, 1, 3], 23)
+
+    def test_from_tensor_without_copy(self):
+        """Test wrapping a torch tensor without copying it."""
+        tensor = torch.rand(3, 4, 5)
+        image = Image(tensor, 5, 4, 3)
+
+        self.assertTrue(image.is_float())
+        self.assertEqual(
+            image.numpy().__array_interface__["data"][0], tensor.data_ptr()
+        )
+        self.assertTrue(torch.equal(torch.from_numpy(image.numpy()), tensor))
+
+    def test_from_non_contiguous_array(self):
+        """Test that non-contiguous arrays and other dtypes are converted."""
+        array = np.arange(24, dtype=np.float64).reshape(2, 4, 3).transpose(2, 0, 1)
+        image = Image(array, 4, 2, 3)
+
+        self.assertTrue(image.is_float())
+        np.testing.assert_array_equal(image.numpy(), array.astype(np.float32))
+
+    def test_list_is_copied(self):
+        """Test that list data is still accepted and owned by the image."""
+        image = Image([0.5] * 12, 2, 2, 3)
+
+        self.assertTrue(image.is_float())
+        self.assertFalse(image.is_external())
+        self.assertEqual(image.numpy().shape, (3, 2, 2))
+
+    def test_size_mismatch(self):
+        """Test that data of the wrong size is rejected."""
+        with self.assertRaises(RuntimeError):
+            Image(np.zeros(10, dtype=np.uint8), 2, 2, 3)
+
+
+class TestAudio(unittest.TestCase):
+    """Test the Audio and RawAudio classes."""
+
+    def test_audio_from_numpy_without_copy(self):
+        """Test wrapping preprocessed audio without copying it."""
+        array = np.random.rand(1, 128, 30).astype(np.float32)
+        audio = Audio(array, 1, 128, 30)
+
+        self.assertTrue(audio.is_float())
+        self.assertTrue(np.shares_memory(audio.numpy(), array))
+        self.assertTrue(torch.equal(audio.toTensor(), torch.from_numpy(array)))
+
+    def test_raw_audio_from_tensor_without_copy(self):
+        """Test wrapping raw audio without copying it."""
+        tensor = torch.randint(0, 256, (1, 2, 100), dtype=torch.uint8)
+        raw_audio = RawAudio(tensor, 1, 2, 100)
+
+        self.assertEqual(
+            raw_audio.numpy().__array_interface__["data"][0], tensor.data_ptr()
+        )
+        self.assertEqual(raw_audio.data, tensor.flatten().tolist())
+
+        # Assigning data replaces the wrapped tensor
+        raw_audio.data = [7] * 200
+        self.assertEqual(raw_audio.numpy()[0, 1, 99], 7)
+
+    def test_raw_audio_rejects_float(self):
+        """Test that raw audio only accepts uint8 data."""
+        with self.assertRaises(RuntimeError):
+            RawAudio(np.zeros((1, 1, 8), dtype=np.float32), 1, 1, 8)
+
 
 class TestMultimodalInput(unittest.TestCase):
     """Test the MultimodalInput class."""
@@ -256,3 +340,9 @@ class TestHelperFunctions(unittest.TestCase):
         img_tensor_rgba = torch.ones((4, 50, 50), dtype=torch.uint8) * 128
         image_input_rgba = make_image_input(img_tensor_rgba)
         self.assertTrue(image_input_rgba.is_image())
+
+        # CHW tensors are wrapped without copying
+        image = image_input_rgba.get_image()
+        self.assertEqual(
+            image.numpy().__array_interface__["data"][0], img_tensor_rgba.data_ptr()
+        )
@@ -0,0 +1,95 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# All rights reserved.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+"""
+Measure the inference throughput of a method against the number of Python
+threads running it, each on its own instance from
+ExecuTorchProgram.load_method_instances. Inputs are random tensors shaped
+after the method's input metadata.
+
+Usage:
+    python -m executorch.extension.pybindings.benchmark_method_instances \
+        --model_path model.pte --max_threads 8
+"""
+
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+import torch
+
+from executorch.extension.pybindings.portable_lib import _load_program, ExecuTorchMethod
+
+# ScalarType values of MethodMeta dtypes, see runtime/core/portable_type
+_DTYPES = {
+    0: torch.uint8,
+    1: torch.int8,
+    2: torch.int16,
+    3: torch.int32,
+    4: torch.int64,
+    5: torch.float16,
+    6: torch.float32,
+    7: torch.float64,
+    11: torch.bool,
+    15: torch.bfloat16,
+}
+
+
+def make_inputs(method: ExecuTorchMethod) -> List[torch.Tensor]:
+    meta = method.method_meta()
+    inputs = []
+    for i in range(meta.num_inputs()):
+        info = meta.input_tensor_meta(i)
+        dtype = _DTYPES[info.dtype()]
+        if dtype.is_floating_point:
+            inputs.append(torch.randn(info.sizes(), dtype=dtype))
+        else:
+            inputs.append(torch.zeros(info.sizes(), dtype=dtype))
+    return inputs
+
+
+def throughput(methods: List[ExecuTorchMethod], iterations: int) -> float:
+    """Inferences per second of all methods running concurrently."""
+
+    def run(method: ExecuTorchMethod) -> None:
+        inputs = make_inputs(method)
+        for _ in range(iterations):
+            method(inputs)
+
+    # Warm up every instance
+    for method in methods:
+        method(make_inputs(method))
+    with ThreadPoolExecutor(max_workers=len(methods)) as pool:
+        start = time.perf_counter()
+        list(pool.map(run, methods))
+        seconds = time.perf_counter() - start
+    return len(methods) * iterations / seconds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--model_path", required=True, help="The .pte file.")
+    parser.add_argument("--method", default="forward")
+    parser.add_argument("--max_threads", type=int, default=4)
+    parser.add_argument(
+        "--iterations", type=int, default=50, help="Inferences per thread."
+    )
+    args = parser.parse_args()
+
+    program = _load_program(args.model_path)
+    methods = program.load_method_instances(args.method, args.max_threads)
+
+    print(f"{'threads':>8} {'inferences/s':>14} {'speedup':>8}")
+    baseline = None
+    for num_threads in range(1, args.max_threads + 1):
+        result = throughput(methods[:num_threads], args.iterations)
+        baseline = baseline or result
+        print(f"{num_threads:>8} {result:>14.1f} {result / baseline:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,12 +7,18 @@
  */
 
 #include <algorithm>
+#include <chrono>
 #include <cstdio>
+#include <cstring>
 #include <iostream>
 #include <memory>
+#include <mutex>
+#include <optional>
 #include <stdexcept>
+#include <string>
+#include <thread>
+#include <unordered_map>
 
-#include <pybind11/iostream.h>
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
 
@@ -133,6 +139,119 @@ void write_data_to_file(const std::string& path, void* buf, size_t size) {
   }
 }
 
+/// Stream buffer writing to a python stream, like the one of
+/// py::scoped_ostream_redirect, that threads may write to concurrently, with
+/// or without the GIL. Writes are buffered per thread and every complete line
+/// is written to the python stream at once, so the lines of concurrent
+/// threads are not mixed up. Incomplete lines are written when the buffer is
+/// destroyed, with the GIL held.
+class ConcurrentPythonBuf final : public std::streambuf {
+ public:
+  explicit ConcurrentPythonBuf(const py::object& stream)
+      : write_(stream.attr("write")), flush_(stream.attr("flush")) {}
+
+  ~ConcurrentPythonBuf() override {
+    std::string rest;
+    for (const auto& [thread, pending] : pending_) {
+      rest += pending;
+    }
+    write(rest);
+  }
+
+  ConcurrentPythonBuf(const ConcurrentPythonBuf&) = delete;
+  ConcurrentPythonBuf& operator=(const ConcurrentPythonBuf&) = delete;
+
+ protected:
+  int_type overflow(int_type c) override {
+    if (!traits_type::eq_int_type(c, traits_type::eof())) {
+      const char ch = traits_type::to_char_type(c);
+      xsputn(&ch, 1);
+    }
+    return traits_type::not_eof(c);
+  }
+
+  std::streamsize xsputn(const char* s, std::streamsize n) override {
+    std::string lines;
+    {
+      std::lock_guard<std::mutex> guard(mutex_);
+      auto pending = pending_.find(std::this_thread::get_id());
+      if (pending == pending_.end()) {
+        pending = pending_.emplace(std::this_thread::get_id(), "").first;
+      }
+      pending->second.append(s, n);
+      const auto end = pending->second.rfind('\n');
+      if (end != std::string::npos) {
+        lines = pending->second.substr(0, end + 1);
+        pending->second.erase(0, end + 1);
+      }
+      if (pending->second.empty()) {
+        pending_.erase(pending);
+      }
+    }
+    write(lines);
+    return n;
+  }
+
+ private:
+  void write(const std::string& text) {
+    if (text.empty()) {
+      return;
+    }
+    // Not under mutex_, a thread holding the GIL may be waiting for it.
+    py::gil_scoped_acquire gil;
+    try {
+      write_(py::bytes(text).attr("decode")("utf-8", "replace"));
+      flush_();
+    } catch (py::error_already_set& e) {
+      e.discard_as_unraisable(__func__);
+    }
+  }
+
+  py::object write_;
+  py::object flush_;
+  std::mutex mutex_;
+  // Incomplete lines of the threads writing to the buffer.
+  std::unordered_map<std::thread::id, std::string> pending_;
+};
+
+/// Redirects cout and cerr to python's sys.stdout and sys.stderr for the
+/// calls it guards. Calls that release the GIL may run concurrently, and a
+/// redirect per call would be undone out of order when they return, so the
+/// calls share one redirect, which the last of them removes. Its buffers are
+/// safe to write to concurrently. The GIL is held while guards are created
+/// and destroyed.
+class SharedOstreamRedirect final {
+ public:
+  SharedOstreamRedirect() {
+    if (num_active_++ == 0) {
+      auto sys = py::module_::import("sys");
+      stdout_buf_ = std::make_unique<ConcurrentPythonBuf>(sys.attr("stdout"));
+      stderr_buf_ = std::make_unique<ConcurrentPythonBuf>(sys.attr("stderr"));
+      old_stdout_buf_ = std::cout.rdbuf(stdout_buf_.get());
+      old_stderr_buf_ = std::cerr.rdbuf(stderr_buf_.get());
+    }
+  }
+
+  ~SharedOstreamRedirect() {
+    if (--num_active_ == 0) {
+      std::cerr.rdbuf(old_stderr_buf_);
+      std::cout.rdbuf(old_stdout_buf_);
+      stderr_buf_.reset();
+      stdout_buf_.reset();
+    }
+  }
+
+  SharedOstreamRedirect(const SharedOstreamRedirect&) = delete;
+  SharedOstreamRedirect& operator=(const SharedOstreamRedirect&) = delete;
+
+ private:
+  static inline size_t num_active_ = 0;
+  static inline std::unique_ptr<ConcurrentPythonBuf> stdout_buf_;
+  static inline std::unique_ptr<ConcurrentPythonBuf> stderr_buf_;
+  static inline std::streambuf* old_stdout_buf_ = nullptr;
+  static inline std::streambuf* old_stderr_buf_ = nullptr;
+};
+
 void setup_output_storage(
     Method& method,
     const std::vector<Span<uint8_t>>& output_storages) {
@@ -312,6 +431,224 @@ inline py::list get_outputs_as_py_list(
   return list;
 }
 
+/// Converts a python input into an EValue. In portable mode, the ETensor
+/// aliasing a torch.Tensor input is appended to `tensors`, which must outlive
+/// the EValue.
+EValue input_to_evalue(
+    const py::handle& python_input,
+    size_t index,
+    const std::string& method_name,
+    std::vector<TensorPtr>& tensors) {
+  const std::string& type_str = py::str(python_input.get_type());
+  if (type_str == "<class 'torch.Tensor'>") {
+    auto at_tensor = python_input.cast<at::Tensor>();
+
+#ifdef USE_ATEN_LIB
+    return EValue(at_tensor);
+#else
+    // convert at::Tensor to torch::executor::Tensor
+    auto type = torch_to_executorch_scalar_type(at_tensor.options().dtype());
+    size_t dim = at_tensor.dim();
+    // cant directly alias at::Tensor sizes and strides due to int64 vs
+    // int32 typing conflict
+    std::vector<int> sizes(at_tensor.sizes().begin(), at_tensor.sizes().end());
+    std::vector<int> strides(
+        at_tensor.strides().begin(), at_tensor.strides().end());
+
+    // Only works for MemoryFormat::Contiguous or MemoryFormat::ChannelsLast
+    // inputs
+    std::vector<torch::executor::Tensor::DimOrderType> dim_order;
+    if (at_tensor.is_contiguous()) {
+      for (size_t cur_dim = 0; cur_dim < dim; cur_dim++) {
+        dim_order.push_back(cur_dim);
+      }
+    } else if (
+        at_tensor.is_contiguous(at::MemoryFormat::ChannelsLast) &&
+        at_tensor.dim() == 4) {
+      dim_order = decltype(dim_order)({0, 2, 3, 1});
+    } else {
+      auto error_msg = "Input " + std::to_string(index) + "for method " +
+          method_name + " should be contiguous or channels-last.";
+      throw std::runtime_error(error_msg);
+    }
+    TensorPtr tensor = for_blob(at_tensor.data_ptr(), std::move(sizes), type)
+                           .strides(std::move(strides))
+                           .dim_order(std::move(dim_order))
+                           .dynamism(aten::TensorShapeDynamism::STATIC)
+                           .make_tensor_ptr();
+    tensors.push_back(tensor);
+    return EValue(tensors.back());
+#endif
+  } else if (py::isinstance<py::none>(python_input)) {
+    return EValue();
+  } else if (py::isinstance<py::bool_>(python_input)) {
+    return EValue(py::cast<bool>(python_input));
+  } else if (py::isinstance<py::int_>(python_input)) {
+    return EValue(py::cast<int64_t>(python_input));
+  }
+  throw std::runtime_error(
+      "Unsupported python type " + type_str +
+      ". Ensure that inputs are passed as a flat list of tensors.");
+}
+
+/// Input sets of a batch, converted to EValues up front so that the batch
+/// can run without holding the GIL.
+struct BatchInputs final {
+  std::vector<std::vector<EValue>> evalues;
+  // Keeps the ETensors the EValues refer to alive.
+  std::vector<TensorPtr> tensors;
+
+  BatchInputs(const py::sequence& input_sets, const std::string& method_name) {
+    const auto num_iterations = py::len(input_sets);
+    evalues.reserve(num_iterations);
+    for (size_t i = 0; i < num_iterations; ++i) {
+      const auto inputs = input_sets[i].cast<py::sequence>();
+      const auto inputs_size = py::len(inputs);
+      std::vector<EValue> cpp_inputs;
+      cpp_inputs.reserve(inputs_size);
+      for (size_t j = 0; j < inputs_size; ++j) {
+        cpp_inputs.push_back(
+            input_to_evalue(inputs[j], j, method_name, tensors));
+      }
+      evalues.push_back(std::move(cpp_inputs));
+    }
+  }
+};
+
+/// Caller provided output buffers of a batch: one span per output of every
+/// iteration, empty for outputs the caller did not provide a buffer for.
+/// Buffers may be torch.Tensors or NumPy arrays, which are aliased rather
+/// than copied. They may be larger than the outputs, whose sizes vary with
+/// dynamic shapes.
+struct BatchOutputs final {
+  std::vector<std::vector<Span<uint8_t>>> buffers;
+  // Keeps the tensors aliasing NumPy buffers alive.
+  std::vector<at::Tensor> tensors;
+
+  BatchOutputs(
+      const py::object& output_sets,
+      size_t num_iterations,
+      const torch::executor::MethodMeta& meta)
+      : buffers(
+            num_iterations,
+            std::vector<Span<uint8_t>>(meta.num_outputs())) {
+    if (output_sets.is_none()) {
+      return;
+    }
+    const auto sets = output_sets.cast<py::sequence>();
+    if (py::len(sets) != num_iterations) {
+      THROW_IF_ERROR(
+          Error::InvalidArgument,
+          "got %zu output sets for %zu input sets",
+          py::len(sets),
+          num_iterations);
+    }
+    auto from_numpy = py::module_::import("torch").attr("from_numpy");
+    for (size_t i = 0; i < num_iterations; ++i) {
+      const auto outputs = sets[i].cast<py::sequence>();
+      if (py::len(outputs) != meta.num_outputs()) {
+        THROW_IF_ERROR(
+            Error::InvalidArgument,
+            "output set %zu has %zu buffers, expected %zu",
+            i,
+            py::len(outputs),
+            meta.num_outputs());
+      }
+      for (size_t j = 0; j < meta.num_outputs(); ++j) {
+        py::object output = outputs[j];
+        if (output.is_none()) {
+          continue;
+        }
+        if (!THPVariable_Check(output.ptr())) {
+          output = from_numpy(output);
+        }
+        auto tensor = output.cast<at::Tensor>();
+        const auto tensor_meta = meta.output_tensor_meta(j);
+        THROW_IF_ERROR(
+            tensor_meta.error(), "Output %zu is not a tensor, pass None", j);
+        if (!tensor.is_contiguous() ||
+            static_cast<int8_t>(tensor.scalar_type()) !=
+                static_cast<int8_t>(tensor_meta->scalar_type())) {
+          THROW_IF_ERROR(
+              Error::InvalidArgument,
+              "Output buffer %zu of set %zu must be contiguous, of the output's "
+              "dtype",
+              j,
+              i);
+        }
+        buffers[i][j] = Span<uint8_t>(
+            static_cast<uint8_t*>(tensor.mutable_data_ptr()), tensor.nbytes());
+        tensors.push_back(std::move(tensor));
+      }
+    }
+  }
+};
+
+/// Sizes of the outputs of an iteration, empty for non tensor outputs.
+using OutputSizes = std::vector<std::optional<std::vector<int64_t>>>;
+
+/// Copies the outputs a method did not write in place into the start of their
+/// buffers, and returns the sizes of the outputs.
+OutputSizes copy_outputs_to_buffers(
+    const std::vector<EValue>& outputs,
+    const std::vector<Span<uint8_t>>& buffers) {
+  OutputSizes sizes(buffers.size());
+  for (size_t j = 0; j < buffers.size(); ++j) {
+    if (!outputs[j].isTensor()) {
+      continue;
+    }
+    const auto& tensor = outputs[j].toTensor();
+    sizes[j].emplace(tensor.sizes().begin(), tensor.sizes().end());
+    if (buffers[j].size() == 0 ||
+        tensor.const_data_ptr() == buffers[j].data()) {
+      continue;
+    }
+    if (tensor.nbytes() > buffers[j].size()) {
+      THROW_IF_ERROR(
+          Error::InvalidArgument,
+          "output %zu has %zu bytes, its buffer only %zu",
+          j,
+          static_cast<size_t>(tensor.nbytes()),
+          buffers[j].size());
+    }
+    std::memcpy(buffers[j].data(), tensor.const_data_ptr(), tensor.nbytes());
+  }
+  return sizes;
+}
+
+/// Summarizes the per-iteration latencies of a batch, with the sizes of the
+/// outputs of every iteration.
+py::dict batch_stats(
+    const std::vector<double>& latencies_ms,
+    const std::vector<OutputSizes>& output_sizes) {
+  py::dict stats;
+  stats["num_iterations"] = latencies_ms.size();
+  stats["latencies_ms"] = latencies_ms;
+  stats["output_sizes"] = output_sizes;
+  if (latencies_ms.empty()) {
+    return stats;
+  }
+  std::vector<double> sorted = latencies_ms;
+  std::sort(sorted.begin(), sorted.end());
+  double total_ms = 0;
+  for (double latency_ms : sorted) {
+    total_ms += latency_ms;
+  }
+  stats["total_ms"] = total_ms;
+  stats["mean_ms"] = total_ms / sorted.size();
+  stats["min_ms"] = sorted.front();
+  stats["max_ms"] = sorted.back();
+  stats["p50_ms"] = sorted[(sorted.size() - 1) / 2];
+  stats["p90_ms"] = sorted[(sorted.size() - 1) * 9 / 10];
+  return stats;
+}
+
+double elapsed_ms(std::chrono::steady_clock::time_point start) {
+  return std::chrono::duration<double, std::milli>(
+             std::chrono::steady_clock::now() - start)
+      .count();
+}
+
 static constexpr size_t kDEFAULT_BUNDLED_INPUT_POOL_SIZE = 16 * 1024U;
 
 struct PyBundledModule : public BundledModule {
@@ -640,8 +977,8 @@ struct PyModule final {
 
   PyModule(const PyModule&) = delete;
   PyModule& operator=(const PyModule&) = delete;
-  PyModule(PyModule&&) = default;
-  PyModule& operator=(PyModule&&) = default;
+  PyModule(PyModule&&) = delete;
+  PyModule& operator=(PyModule&&) = delete;
 
   // Module is only valid as long as the python buffer is alive.
   static std::unique_ptr<PyModule> load_from_buffer(
@@ -728,6 +1065,7 @@ struct PyModule final {
       const std::string& method_name,
       const py::sequence& inputs,
       bool clone_outputs = true) {
+    auto lock = lock_module();
     const auto inputs_size = py::len(inputs);
     std::vector<EValue> cpp_inputs;
     cpp_inputs.reserve(inputs_size);
@@ -839,6 +1177,79 @@ struct PyModule final {
     return run_method("forward", py_list, clone_outputs);
   }
 
+  py::dict run_batch(
+      const std::string& method_name,
+      const py::sequence& inputs,
+      const py::object& outputs) {
+    auto lock = lock_module();
+    auto method_meta_result = module_->method_meta(method_name);
+    THROW_IF_ERROR(
+        method_meta_result.error(),
+        "Failed to get method_meta for %s, error: 0x%" PRIx32,
+        method_name.c_str(),
+        static_cast<uint32_t>(method_meta_result.error()));
+    const auto num_iterations = py::len(inputs);
+    BatchInputs batch_inputs(inputs, method_name);
+    BatchOutputs batch_outputs(
+        outputs, num_iterations, method_meta_result.get());
+
+    // Outputs that are not memory planned are written in place to the
+    // caller's buffer if it fits the largest output, or to the module's own
+    // storage otherwise.
+    allocate_output_tensors(method_name);
+    std::vector<std::vector<TensorPtr>> output_views(num_iterations);
+    for (size_t i = 0; i < num_iterations; ++i) {
+      for (size_t j = 0; j < output_tensors_.size(); ++j) {
+        const auto& buffer = batch_outputs.buffers[i][j];
+        if (!output_tensors_[j].has_value() ||
+            buffer.size() < output_tensors_[j].value()->nbytes()) {
+          output_views[i].push_back(nullptr);
+          continue;
+        }
+        const auto& tensor = *output_tensors_[j].value();
+        output_views[i].push_back(
+            for_blob(
+                buffer.data(),
+                std::vector<executorch::aten::SizesType>(
+                    tensor.sizes().begin(), tensor.sizes().end()),
+                tensor.scalar_type())
+                .make_tensor_ptr());
+      }
+    }
+
+    std::vector<double> latencies_ms(num_iterations);
+    std::vector<OutputSizes> output_sizes(num_iterations);
+    {
+      py::gil_scoped_release no_gil;
+      for (size_t i = 0; i < num_iterations; ++i) {
+        const auto start = std::chrono::steady_clock::now();
+        for (size_t j = 0; j < output_tensors_.size(); ++j) {
+          if (!output_tensors_[j].has_value()) {
+            continue;
+          }
+          const auto& view = output_views[i][j] ? output_views[i][j]
+                                                : output_tensors_[j].value();
+          auto status = module_->set_output(method_name, view, j);
+          THROW_IF_ERROR(
+              status,
+              "Failed to set output for method %s, error: 0x%" PRIx32,
+              method_name.c_str(),
+              static_cast<uint32_t>(status));
+        }
+        auto result = module_->execute(method_name, batch_inputs.evalues[i]);
+        THROW_IF_ERROR(
+            result.error(),
+            "Failed to execute method %s, error: 0x%" PRIx32,
+            method_name.c_str(),
+            static_cast<uint32_t>(result.error()));
+        output_sizes[i] =
+            copy_outputs_to_buffers(result.get(), batch_outputs.buffers[i]);
+        latencies_ms[i] = elapsed_ms(start);
+      }
+    }
+    return batch_stats(latencies_ms, output_sizes);
+  }
+
   bool has_etdump() {
     ETDumpGen* etdump = dynamic_cast<ETDumpGen*>(module_->event_tracer());
     return etdump != nullptr;
@@ -847,6 +1258,7 @@ struct PyModule final {
   void write_etdump_result_to_file(
       const std::string& path,
       const py::object& debug_buffer_path) {
+    auto lock = lock_module();
     if (!has_etdump()) {
       throw std::runtime_error("No etdump found");
     }
@@ -876,6 +1288,7 @@ struct PyModule final {
   py::list plan_execute(
       const std::string method_name,
       bool clone_outputs = true) {
+    auto lock = lock_module();
     auto status = module_->load_method(method_name);
 
     THROW_IF_ERROR(
@@ -919,6 +1332,14 @@ struct PyModule final {
   // Need to keep-alive output tensors until they can be compared in case of
   // bundled programs.
   std::vector<std::optional<TensorPtr>> output_tensors_;
+  // Serializes threads running methods, run_batch releases the GIL.
+  std::mutex mutex_;
+
+  std::unique_lock<std::mutex> lock_module() {
+    // Wait without the GIL, the thread holding the lock may need it.
+    py::gil_scoped_release no_gil;
+    return std::unique_lock<std::mutex>(mutex_);
+  }
 
   // Set debug buffer for potential event tracer.
   std::unique_ptr<torch::executor::ETDumpGen> setup_event_tracer(
@@ -1070,76 +1491,14 @@ struct PyMethod final {
     const auto inputs_size = py::len(inputs);
     std::vector<EValue> cpp_inputs;
     cpp_inputs.reserve(inputs_size);
-
-#ifndef USE_ATEN_LIB // Portable mode
     // So the ETensors and their metadata stay in scope for
-    // Module->set_inputs.
+    // Method->set_inputs.
     std::vector<TensorPtr> input_tensors;
-    // We store pointers to these vector elements so important to reserve so
-    // that we don't lose those on a vector resize.
-    input_tensors.reserve(inputs_size);
-#endif
 
     // Convert python objects into EValues.
     for (size_t i = 0; i < inputs_size; ++i) {
-      auto python_input = inputs[i];
-      const std::string& type_str = py::str(python_input.get_type());
-      if (type_str == "<class 'torch.Tensor'>") {
-        auto at_tensor = python_input.cast<at::Tensor>();
-
-#ifdef USE_ATEN_LIB
-        EValue evalue(at_tensor);
-#else
-        // convert at::Tensor to torch::executor::Tensor
-        auto type =
-            torch_to_executorch_scalar_type(at_tensor.options().dtype());
-        size_t dim = at_tensor.dim();
-        // cant directly alias at::Tensor sizes and strides due to int64 vs
-        // int32 typing conflict
-        std::vector<int> sizes(
-            at_tensor.sizes().begin(), at_tensor.sizes().end());
-        std::vector<int> strides(
-            at_tensor.strides().begin(), at_tensor.strides().end());
-
-        // Only works for MemoryFormat::Contiguous or MemoryFormat::ChannelsLast
-        // inputs
-        std::vector<torch::executor::Tensor::DimOrderType> dim_order;
-        if (at_tensor.is_contiguous()) {
-          for (size_t cur_dim = 0; cur_dim < dim; cur_dim++) {
-            dim_order.push_back(cur_dim);
-          }
-        } else if (
-            at_tensor.is_contiguous(at::MemoryFormat::ChannelsLast) &&
-            at_tensor.dim() == 4) {
-          dim_order = decltype(dim_order)({0, 2, 3, 1});
-        } else {
-          auto error_msg = "Input " + std::to_string(i) + "for method " +
-              method_->method_meta().name() +
-              " should be contiguous or channels-last.";
-          throw std::runtime_error(error_msg);
-        }
-        TensorPtr tensor =
-            for_blob(at_tensor.data_ptr(), std::move(sizes), type)
-                .strides(std::move(strides))
-                .dim_order(std::move(dim_order))
-                .dynamism(aten::TensorShapeDynamism::STATIC)
-                .make_tensor_ptr();
-        input_tensors.push_back(tensor);
-        EValue evalue(input_tensors.back());
-#endif
-
-        cpp_inputs.push_back(evalue);
-      } else if (py::isinstance<py::none>(python_input)) {
-        cpp_inputs.push_back(EValue());
-      } else if (py::isinstance<py::bool_>(python_input)) {
-        cpp_inputs.push_back(EValue(py::cast<bool>(python_input)));
-      } else if (py::isinstance<py::int_>(python_input)) {
-        cpp_inputs.push_back(EValue(py::cast<int64_t>(python_input)));
-      } else {
-        throw std::runtime_error(
-            "Unsupported python type " + type_str +
-            ". Ensure that inputs are passed as a flat list of tensors.");
-      }
+      cpp_inputs.push_back(input_to_evalue(
+          inputs[i], i, method_->method_meta().name(), input_tensors));
     }
 
     executorch::aten::ArrayRef<EValue> input_evalue_list(
@@ -1154,32 +1513,8 @@ struct PyMethod final {
   }
 
   void execute() {
-    const auto num_outputs = method_->outputs_size();
-    allocate_output_storages();
-    std::vector<Span<uint8_t>> output_storage_spans(num_outputs);
-    for (int i = 0; i < output_storages_.size(); ++i) {
-      output_storage_spans[i] =
-          Span<uint8_t>(output_storages_[i].data(), output_storages_[i].size());
-    }
-#ifdef USE_ATEN_LIB
-    // [TLS handling] This is to workaround an assertion failure
-    // (https://fburl.com/code/302jyn8d) running `gelu` in ATen mode in fbcode
-    // (such as bento). The problem is ExecuTorch ATen mode doesn't have
-    // Thread Local State, but `torch-cpp` is assuming tls init is done. There
-    // are two more checks: MKLDNN disabled and C10_MOBILE, if any of them is
-    // true we won't be hitting this assertion error. However in `torch-cpp`
-    // lib both checks are false. Production impact: this should not make any
-    // impact in production environment, given that in xplat we are depending
-    // on a library that enables C10_MOBILE (`torch_mobile_core`).
-    c10::impl::ExcludeDispatchKeyGuard no_autograd(
-        c10::autograd_dispatch_keyset);
-#endif
-    setup_output_storage(*method_, output_storage_spans);
-    Error execute_status = method_->execute();
-    THROW_IF_ERROR(
-        execute_status,
-        "method->execute() failed with error 0x%" PRIx32,
-        static_cast<uint32_t>(execute_status));
+    auto lock = lock_method();
+    execute_unlocked();
   }
 
   py::list get_outputs(bool clone_outputs = true) {
@@ -1198,8 +1533,9 @@ struct PyMethod final {
   }
 
   py::list call(const py::sequence& inputs, bool clone_outputs = true) {
+    auto lock = lock_method();
     set_inputs(inputs);
-    execute();
+    execute_unlocked();
     return get_outputs(clone_outputs);
   }
 
@@ -1211,6 +1547,66 @@ struct PyMethod final {
     return call(py_list, clone_outputs);
   }
 
+  py::dict run_batch(const py::sequence& inputs, const py::object& outputs) {
+    auto lock = lock_method();
+    const std::string method_name = method_->method_meta().name();
+    const auto num_iterations = py::len(inputs);
+    BatchInputs batch_inputs(inputs, method_name);
+    BatchOutputs batch_outputs(outputs, num_iterations, method_->method_meta());
+
+    const auto num_outputs = method_->outputs_size();
+    allocate_output_storages();
+    std::vector<double> latencies_ms(num_iterations);
+    std::vector<OutputSizes> output_sizes(num_iterations);
+    {
+      py::gil_scoped_release no_gil;
+#ifdef USE_ATEN_LIB
+      // See [TLS handling] in execute().
+      c10::impl::ExcludeDispatchKeyGuard no_autograd(
+          c10::autograd_dispatch_keyset);
+#endif
+      std::vector<EValue> results(num_outputs);
+      std::vector<Span<uint8_t>> output_storage_spans(num_outputs);
+      for (size_t i = 0; i < num_iterations; ++i) {
+        const auto start = std::chrono::steady_clock::now();
+        const auto& evalues = batch_inputs.evalues[i];
+        Error status = method_->set_inputs(
+            executorch::aten::ArrayRef<EValue>(evalues.data(), evalues.size()));
+        THROW_IF_ERROR(
+            status,
+            "method->set_inputs() for method '%s' failed with error 0x%" PRIx32,
+            method_name.c_str(),
+            static_cast<uint32_t>(status));
+        // Write outputs that are not memory planned in place, to buffers
+        // that fit the largest output.
+        for (size_t j = 0; j < num_outputs; ++j) {
+          const auto& buffer = batch_outputs.buffers[i][j];
+          output_storage_spans[j] = output_storages_[j].empty() ||
+                  buffer.size() < output_storages_[j].size()
+              ? Span<uint8_t>(
+                    output_storages_[j].data(), output_storages_[j].size())
+              : buffer;
+        }
+        setup_output_storage(*method_, output_storage_spans);
+        status = method_->execute();
+        THROW_IF_ERROR(
+            status,
+            "method->execute() failed with error 0x%" PRIx32,
+            static_cast<uint32_t>(status));
+        status = method_->get_outputs(results.data(), num_outputs);
+        THROW_IF_ERROR(
+            status,
+            "method->get_outputs() for method '%s' failed with error 0x%" PRIx32,
+            method_name.c_str(),
+            static_cast<uint32_t>(status));
+        output_sizes[i] =
+            copy_outputs_to_buffers(results, batch_outputs.buffers[i]);
+        latencies_ms[i] = elapsed_ms(start);
+      }
+    }
+    return batch_stats(latencies_ms, output_sizes);
+  }
+
   py::object get_attribute(const std::string& name) {
     Result<executorch::aten::Tensor> attr = method_->get_attribute(name);
     THROW_IF_ERROR(
@@ -1240,6 +1636,48 @@ struct PyMethod final {
   // Need to keep-alive output storages until they can be compared in case of
   // bundled programs.
   std::vector<std::vector<uint8_t>> output_storages_;
+  // Serializes threads executing this method, which release the GIL.
+  std::mutex mutex_;
+
+  std::unique_lock<std::mutex> lock_method() {
+    // Wait without the GIL, the thread holding the lock may need it.
+    py::gil_scoped_release no_gil;
+    return std::unique_lock<std::mutex>(mutex_);
+  }
+
+  void execute_unlocked() {
+    const auto num_outputs = method_->outputs_size();
+    allocate_output_storages();
+    std::vector<Span<uint8_t>> output_storage_spans(num_outputs);
+    for (int i = 0; i < output_storages_.size(); ++i) {
+      output_storage_spans[i] =
+          Span<uint8_t>(output_storages_[i].data(), output_storages_[i].size());
+    }
+#ifdef USE_ATEN_LIB
+    // [TLS handling] This is to workaround an assertion failure
+    // (https://fburl.com/code/302jyn8d) running `gelu` in ATen mode in fbcode
+    // (such as bento). The problem is ExecuTorch ATen mode doesn't have
+    // Thread Local State, but `torch-cpp` is assuming tls init is done. There
+    // are two more checks: MKLDNN disabled and C10_MOBILE, if any of them is
+    // true we won't be hitting this assertion error. However in `torch-cpp`
+    // lib both checks are false. Production impact: this should not make any
+    // impact in production environment, given that in xplat we are depending
+    // on a library that enables C10_MOBILE (`torch_mobile_core`).
+    c10::impl::ExcludeDispatchKeyGuard no_autograd(
+        c10::autograd_dispatch_keyset);
+#endif
+    setup_output_storage(*method_, output_storage_spans);
+    Error execute_status;
+    {
+      // Other threads may run Python, or other methods, meanwhile.
+      py::gil_scoped_release no_gil;
+      execute_status = method_->execute();
+    }
+    THROW_IF_ERROR(
+        execute_status,
+        "method->execute() failed with error 0x%" PRIx32,
+        static_cast<uint32_t>(execute_status));
+  }
 
   void allocate_output_storages() {
     const auto num_outputs = method_->outputs_size();
@@ -1328,34 +1766,12 @@ struct PyProgram final {
       : state_(load_program(std::move(loader), program_verification)),
         event_tracer_(std::move(tracer)),
         debug_buffer_size_(debug_buffer_size) {
-    // Figure out the size of each non_const layer we need to support every
-    // method in the program. Map will be easier to use than a list because we
-    // dont know how many non_const arenas there will be
-    std::map<size_t, int64_t> non_const_buffer_sizes;
+    // Share the non_const layers between all methods of the program.
+    std::vector<std::string> method_names;
     for (size_t i = 0; i < state_->program_->num_methods(); ++i) {
-      auto name = state_->program_->get_method_name(i).get();
-      auto method_meta = state_->program_->method_meta(name).get();
-      for (size_t j = 0; j < method_meta.num_non_const_buffers(); j++) {
-        int64_t buffer_size = method_meta.non_const_buffer_size(j).get();
-        if (non_const_buffer_sizes.find(j) == non_const_buffer_sizes.end()) {
-          non_const_buffer_sizes.insert({j, buffer_size});
-        } else {
-          non_const_buffer_sizes[j] =
-              std::max(non_const_buffer_sizes[j], buffer_size);
-        }
-      }
+      method_names.push_back(state_->program_->get_method_name(i).get());
     }
-
-    // Allocate the arenas. Using vector because we need to remember the size as
-    // well, so vector is easier then unique_ptr.
-    std::vector<std::vector<uint8_t>> non_const_buffers_;
-    for (std::map<size_t, int64_t>::iterator i = non_const_buffer_sizes.begin();
-         i != non_const_buffer_sizes.end();
-         i++) {
-      non_const_buffers_.push_back(std::vector<uint8_t>(i->second));
-    }
-
-    memory_ = std::make_shared<ProgramMemory>(std::move(non_const_buffers_));
+    memory_ = allocate_memory(method_names);
     if (event_tracer_ && debug_buffer_size > 0) {
       // If a debug buffer was requested for the ETDump, allocate it and make
       // sure its lifetime is as long as the event_tracer.
@@ -1427,6 +1843,34 @@ struct PyProgram final {
         memory_, state_, std::make_unique<Method>(std::move(res.get())));
   }
 
+  std::vector<std::unique_ptr<PyMethod>> load_method_instances(
+      const std::string& method_name,
+      size_t num_instances) {
+    if (event_tracer_ && num_instances > 1) {
+      throw std::runtime_error(
+          "Cannot load several instances of method " + method_name +
+          " with an ETDump, which is not thread safe.");
+    }
+    std::vector<std::unique_ptr<PyMethod>> methods;
+    methods.reserve(num_instances);
+    for (size_t i = 0; i < num_instances; ++i) {
+      // Constants are shared through the program, planned memory is not.
+      auto memory = allocate_memory({method_name});
+      Result<Method> res = state_->program_->load_method(
+          method_name.c_str(), memory->mem_manager(), event_tracer_.get());
+      THROW_IF_ERROR(
+          res.error(),
+          "Failed to load method %s, error: 0x:%" PRIx32,
+          method_name.c_str(),
+          static_cast<uint32_t>(res.error()));
+      methods.push_back(std::make_unique<PyMethod>(
+          std::move(memory),
+          state_,
+          std::make_unique<Method>(std::move(res.get()))));
+    }
+    return methods;
+  }
+
   Span<uint8_t> get_etdump_debug_buffer() {
     return Span<uint8_t>(debug_buffer_.get(), debug_buffer_size_);
   }
@@ -1481,6 +1925,43 @@ struct PyProgram final {
   std::unique_ptr<ETDumpGen> event_tracer_;
   std::unique_ptr<uint8_t[]> debug_buffer_;
   size_t debug_buffer_size_;
+
+  // Allocates non_const layers large enough for each of the methods.
+  std::shared_ptr<ProgramMemory> allocate_memory(
+      const std::vector<std::string>& method_names) {
+    // Figure out the size of each non_const layer we need to support every
+    // method. Map will be easier to use than a list because we dont know how
+    // many non_const arenas there will be
+    std::map<size_t, int64_t> non_const_buffer_sizes;
+    for (const auto& name : method_names) {
+      auto method_meta_result = state_->program_->method_meta(name.c_str());
+      THROW_IF_ERROR(
+          method_meta_result.error(),
+          "Failed to get method meta for method %s, error: 0x:%" PRIx32,
+          name.c_str(),
+          static_cast<uint32_t>(method_meta_result.error()));
+      auto method_meta = method_meta_result.get();
+      for (size_t j = 0; j < method_meta.num_non_const_buffers(); j++) {
+        int64_t buffer_size = method_meta.non_const_buffer_size(j).get();
+        if (non_const_buffer_sizes.find(j) == non_const_buffer_sizes.end()) {
+          non_const_buffer_sizes.insert({j, buffer_size});
+        } else {
+          non_const_buffer_sizes[j] =
+              std::max(non_const_buffer_sizes[j], buffer_size);
+        }
+      }
+    }
+
+    // Allocate the arenas. Using vector because we need to remember the size as
+    // well, so vector is easier then unique_ptr.
+    std::vector<std::vector<uint8_t>> non_const_buffers;
+    for (std::map<size_t, int64_t>::iterator i = non_const_buffer_sizes.begin();
+         i != non_const_buffer_sizes.end();
+         i++) {
+      non_const_buffers.push_back(std::vector<uint8_t>(i->second));
+    }
+    return std::make_shared<ProgramMemory>(std::move(non_const_buffers));
+  }
 };
 
 void create_profile_block(const std::string& name) {
@@ -1522,8 +2003,8 @@ py::bool_ is_available(const std::string& backend_name) {
 
 PYBIND11_MODULE(EXECUTORCH_PYTHON_MODULE_NAME, m) {
   // Redirects cout and cerr for function calls this guards to the python env.
-  auto call_guard = py::
-      call_guard<py::scoped_ostream_redirect, py::scoped_estream_redirect>();
+  // Shared by all calls, since some release the GIL while executing.
+  auto call_guard = py::call_guard<SharedOstreamRedirect>();
 
   // Bind the verification enum to python.
   py::enum_<Program::Verification>(m, "Verification")
@@ -1654,6 +2135,13 @@ PYBIND11_MODULE(EXECUTORCH_PYTHON_MODULE_NAME, m) {
           py::arg("inputs") = py::list(),
           py::arg("clone_outputs") = true,
           call_guard)
+      .def(
+          "run_batch",
+          &PyModule::run_batch,
+          py::arg("method_name"),
+          py::arg("inputs"),
+          py::arg("outputs") = py::none(),
+          call_guard)
       .def("has_etdump", &PyModule::has_etdump, call_guard)
       .def(
           "write_etdump_result_to_file",
@@ -1740,6 +2228,12 @@ PYBIND11_MODULE(EXECUTORCH_PYTHON_MODULE_NAME, m) {
           &PyProgram::load_method,
           py::arg("method_name"),
           call_guard)
+      .def(
+          "load_method_instances",
+          &PyProgram::load_method_instances,
+          py::arg("method_name"),
+          py::arg("num_instances"),
+          call_guard)
       .def(
           "method_meta",
           &PyProgram::method_meta,
@@ -1784,6 +2278,12 @@ PYBIND11_MODULE(EXECUTORCH_PYTHON_MODULE_NAME, m) {
           py::arg("inputs") = py::list(),
           py::arg("clone_outputs") = true,
           call_guard)
+      .def(
+          "run_batch",
+          &PyMethod::run_batch,
+          py::arg("inputs"),
+          py::arg("outputs") = py::none(),
+          call_guard)
       .def(
           "get_attribute",
           &PyMethod::get_attribute,
@@ -1797,7 +2297,7 @@ namespace {
 // Our logs work by writing to stderr. By default this is done through fprintf
 // (as defined in posix.cpp) which then does not show up in python environments.
 // Here we override the pal to use std::cerr which can be properly redirected by
-// scoped_estream_redirect.
+// SharedOstreamRedirect.
 void emit_log_message(
     et_timestamp_t timestamp,
     et_pal_log_level_t level,
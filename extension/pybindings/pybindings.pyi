@@ -51,6 +51,36 @@ class ExecuTorchModule:
     def plan_execute(
         self, method_name: str, clone_outputs: bool = True
     ) -> List[Any]: ...
+    # pyre-ignore[2, 3]: "Any" in parameter and return type annotations.
+    def run_batch(
+        self,
+        method_name: str,
+        inputs: Sequence[Sequence[Any]],
+        outputs: Optional[Sequence[Sequence[Any]]] = None,
+    ) -> Dict[str, Any]:
+        """Run a method once per input set, without holding the GIL.
+
+        Args:
+            method_name: The method to run.
+            inputs: One sequence of inputs per iteration.
+            outputs: Optional preallocated output buffers, one sequence per
+                iteration with a contiguous torch.Tensor or NumPy array of the
+                output's dtype per output, or None for outputs that are not
+                needed. Outputs are written to the start of their buffer,
+                which must be at least as large as the output. Outputs that
+                are not memory planned are written to buffers that fit their
+                largest size in place, others are copied into them.
+
+        Returns:
+            Latency stats of the iterations: num_iterations, latencies_ms,
+            total_ms, mean_ms, min_ms, max_ms, p50_ms and p90_ms, and
+            output_sizes, the sizes of the outputs of every iteration, which
+            vary for outputs with dynamic shapes, or None for non tensor
+            outputs.
+
+        Calls on the same module wait for each other.
+        """
+        ...
     # Bundled program methods.
     def load_bundled_input(
         self, bundle: BundledModule, method_name: str, testset_idx: int
@@ -82,7 +112,22 @@ class ExecuTorchProgram:
 
     def num_methods(self) -> int: ...
     def get_method_name(self, method_index: int) -> str: ...
-    def load_method(self, method_name: str) -> ExecuTorchMethod: ...
+    def load_method(self, method_name: str) -> ExecuTorchMethod:
+        """Load a method. Methods loaded this way share one planned memory
+        arena, so only one of them may execute at a time."""
+        ...
+
+    def load_method_instances(
+        self, method_name: str, num_instances: int
+    ) -> List[ExecuTorchMethod]:
+        """Load independent instances of a method, which share the constants
+        of the program but each have their own planned memory. They execute
+        without holding the GIL, so different instances can run concurrently
+        from Python threads. Not supported with an ETDump for more than one
+        instance.
+        """
+        ...
+
     def method_meta(self, method_name: str) -> MethodMeta: ...
     def has_etdump(self) -> bool: ...
     def write_etdump_result_to_file(
@@ -93,6 +138,9 @@ class ExecuTorchProgram:
 class ExecuTorchMethod:
     """ExecuTorchMethod is a Python wrapper around a loaded C++ method.
 
+    execute(), call() and run_batch() release the GIL while the method runs.
+    Calls on the same method wait for each other.
+
     .. warning::
 
         This API is experimental and subject to change without notice.
@@ -115,6 +163,15 @@ class ExecuTorchMethod:
         inputs: Sequence[Any] = ...,  # pyre-ignore[2]
         clone_outputs: bool = True,
     ) -> List[Any]: ...
+    # pyre-ignore[2, 3]: "Any" in parameter and return type annotations.
+    def run_batch(
+        self,
+        inputs: Sequence[Sequence[Any]],
+        outputs: Optional[Sequence[Sequence[Any]]] = None,
+    ) -> Dict[str, Any]:
+        """Same as ExecuTorchModule.run_batch, for this method."""
+        ...
+
     def method_meta(self) -> MethodMeta: ...
     # pyre-ignore[2, 3]: "Any" in parameter and return type annotations.
     def get_attribute(self, name: str) -> Any: ...
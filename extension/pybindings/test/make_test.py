@@ -133,6 +133,26 @@ class ModuleAddWithAttributes(torch.nn.Module):
         return (torch.ones(2, 2), torch.ones(2, 2))
 
 
+class ModuleAddDynamic(torch.nn.Module):
+    """The module to serialize and execute, with up to 4 rows of inputs."""
+
+    def __init__(self):
+        super(ModuleAddDynamic, self).__init__()
+
+    def forward(self, x, y):
+        return x + y
+
+    def get_methods_to_export(self):
+        return ("forward",)
+
+    def get_inputs(self):
+        return (torch.ones(2, 2), torch.ones(2, 2))
+
+    def get_dynamic_shapes(self):
+        rows = torch.export.Dim("rows", min=1, max=4)
+        return ({0: rows}, {0: rows})
+
+
 class ModuleLinear(torch.nn.Module):
     def __init__(self):
         super().__init__()
@@ -175,9 +195,15 @@ def create_program(
     exported_methods = {}
     # These cleanup passes are required to convert the `add` op to its out
     # variant, along with some other transformations.
+    dynamic_shapes = None
+    if hasattr(eager_module, "get_dynamic_shapes"):
+        # The inputs are all passed as the *args of the wrapper.
+        dynamic_shapes = (eager_module.get_dynamic_shapes(),)
     for method_name, method_input in input_map.items():
         wrapped_mod = WrapperModule(getattr(eager_module, method_name))
-        exported_methods[method_name] = export(wrapped_mod, method_input, strict=True)
+        exported_methods[method_name] = export(
+            wrapped_mod, method_input, dynamic_shapes=dynamic_shapes, strict=True
+        )
 
     exec_prog = to_edge(exported_methods).to_executorch(config=et_config)
 
@@ -8,6 +8,7 @@
 
 import sys
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from io import StringIO
 
 import torch
@@ -18,6 +19,7 @@ from executorch.extension.pybindings.test.make_test import (
     create_program,
     ModuleAdd,
     ModuleAddConstReturn,
+    ModuleAddDynamic,
     ModuleAddSingleInput,
     ModuleAddWithAttributes,
     ModuleChannelsLast,
@@ -176,6 +178,107 @@ class PybindingsTest(unittest.TestCase):
         self.assertTrue(torch.allclose(expected, executorch_output[0]))
         self.assertEqual(str(torch.ones(2, 2)), str(executorch_output[1]))
 
+    def test_run_batch(self):
+        exported_program, _ = create_program(ModuleAdd())
+        executorch_module = self.load_fn(exported_program.buffer)
+
+        inputs = [(torch.randn(2, 2), torch.randn(2, 2)) for _ in range(4)]
+        outputs = [[torch.empty(2, 2)] for _ in inputs]
+        stats = executorch_module.run_batch("forward", inputs, outputs)
+
+        for (x, y), (output,) in zip(inputs, outputs):
+            self.assertTrue(torch.allclose(x + y, output))
+        self.assertEqual(stats["num_iterations"], 4)
+        self.assertEqual(len(stats["latencies_ms"]), 4)
+        self.assertLessEqual(stats["min_ms"], stats["p50_ms"])
+        self.assertLessEqual(stats["p50_ms"], stats["max_ms"])
+
+        # Without output buffers, only the stats are returned.
+        stats = executorch_module.run_batch("forward", inputs)
+        self.assertEqual(stats["num_iterations"], 4)
+
+    def test_run_batch_output_not_memory_planned(self):
+        exported_program, _ = create_program(
+            ModuleAdd(),
+            et_config=ExecutorchBackendConfig(
+                memory_planning_pass=MemoryPlanningPass(alloc_graph_output=False)
+            ),
+        )
+        executorch_module = self.load_fn(exported_program.buffer)
+
+        # NumPy buffers, and an iteration without one.
+        inputs = [(torch.randn(2, 2), torch.randn(2, 2)) for _ in range(3)]
+        outputs = [[torch.empty(2, 2).numpy()], [None], [torch.empty(2, 2).numpy()]]
+        executorch_module.run_batch("forward", inputs, outputs)
+
+        for i in (0, 2):
+            expected = inputs[i][0] + inputs[i][1]
+            self.assertTrue(torch.allclose(expected, torch.from_numpy(outputs[i][0])))
+
+    def test_run_batch_bad_output_buffer(self):
+        exported_program, inputs = create_program(ModuleAdd())
+        executorch_module = self.load_fn(exported_program.buffer)
+
+        with self.assertRaises(RuntimeError):
+            executorch_module.run_batch("forward", [inputs], [[torch.empty(1, 2)]])
+        with self.assertRaises(RuntimeError):
+            executorch_module.run_batch(
+                "forward", [inputs], [[torch.empty(2, 2, dtype=torch.int32)]]
+            )
+        with self.assertRaises(RuntimeError):
+            executorch_module.run_batch("forward", [inputs, inputs], [[None]])
+
+    def test_run_batch_dynamic_shapes(self):
+        for alloc_graph_output in (True, False):
+            exported_program, _ = create_program(
+                ModuleAddDynamic(),
+                et_config=ExecutorchBackendConfig(
+                    memory_planning_pass=MemoryPlanningPass(
+                        alloc_graph_output=alloc_graph_output
+                    )
+                ),
+            )
+            executorch_module = self.load_fn(exported_program.buffer)
+
+            # Buffers of the largest output, of the actual output and larger.
+            inputs = [(torch.randn(n, 2), torch.randn(n, 2)) for n in (1, 3, 4, 2)]
+            outputs = [
+                [torch.empty(4, 2)],
+                [torch.empty(3, 2)],
+                [torch.empty(5, 2)],
+                [torch.empty(4, 2).numpy()],
+            ]
+            stats = executorch_module.run_batch("forward", inputs, outputs)
+
+            for (x, y), (output,), (sizes,) in zip(
+                inputs, outputs, stats["output_sizes"]
+            ):
+                self.assertEqual(sizes, list(x.shape))
+                output = torch.as_tensor(output).flatten()[: x.numel()]
+                self.assertTrue(torch.allclose(x + y, output.view(sizes)))
+
+            with self.assertRaises(RuntimeError):
+                executorch_module.run_batch(
+                    "forward", [inputs[1]], [[torch.empty(2, 2)]]
+                )
+
+    def test_run_batch_concurrent_calls(self):
+        exported_program, _ = create_program(ModuleAdd())
+        executorch_module = self.load_fn(exported_program.buffer)
+
+        def run(i):
+            inputs = [(torch.full((2, 2), float(i)), torch.ones(2, 2))] * 4
+            outputs = [[torch.empty(2, 2)] for _ in inputs]
+            executorch_module.run_batch("forward", inputs, outputs)
+            # Interleaved with the batches of other threads.
+            forward_output = executorch_module.forward(inputs[0])[0]
+            return [output for (output,) in outputs] + [forward_output]
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            for i, outputs in enumerate(pool.map(run, range(16))):
+                for output in outputs:
+                    self.assertTrue(torch.allclose(output, torch.full((2, 2), i + 1.0)))
+
     def test_channels_last(self) -> None:
         model = ModuleChannelsLast()
         exported_program, inputs = create_program(model)
@@ -289,6 +392,71 @@ class PybindingsTest(unittest.TestCase):
         self.assertEqual(executorch_program.get_method_name(0), "forward")
         self.assertEqual(executorch_program.get_method_name(1), "forward2")
 
+    def test_program_load_method_instances(self):
+        exported_program, _ = create_program(ModuleMulti())
+        executorch_program = self.load_prog_fn(exported_program.buffer)
+        methods = executorch_program.load_method_instances("forward", 4)
+        self.assertEqual(len(methods), 4)
+
+        def run(method):
+            results = []
+            for _ in range(20):
+                x, y = torch.randn(2, 2), torch.randn(2, 2)
+                results.append((x + y, method((x, y))[0]))
+            return results
+
+        with ThreadPoolExecutor(max_workers=len(methods)) as pool:
+            for results in pool.map(run, methods):
+                for expected, output in results:
+                    self.assertTrue(torch.allclose(expected, output))
+
+        # Instances do not share planned memory.
+        outputs = [
+            method((torch.full((2, 2), float(i)), torch.zeros(2, 2)), False)[0]
+            for i, method in enumerate(methods)
+        ]
+        for i, output in enumerate(outputs):
+            self.assertTrue(torch.allclose(output, torch.full((2, 2), float(i))))
+
+    def test_program_load_method_instances_etdump(self):
+        exported_program, _ = create_program(ModuleAdd())
+        executorch_program = self.load_prog_fn(
+            exported_program.buffer, enable_etdump=True
+        )
+        self.assertEqual(len(executorch_program.load_method_instances("forward", 1)), 1)
+        with self.assertRaises(RuntimeError):
+            executorch_program.load_method_instances("forward", 2)
+
+    def test_program_method_instances_concurrent_logs(self):
+        exported_program, _ = create_program(ModuleAdd())
+        executorch_program = self.load_prog_fn(exported_program.buffer)
+        methods = executorch_program.load_method_instances("forward", 4)
+
+        def execute(method):
+            # Logs an error without the GIL, the inputs were not set.
+            for _ in range(50):
+                with self.assertRaises(RuntimeError):
+                    method.execute()
+
+        stderr = sys.stderr
+        sys.stderr = string_io = StringIO()
+        try:
+            with ThreadPoolExecutor(max_workers=len(methods)) as pool:
+                list(pool.map(execute, methods))
+        finally:
+            sys.stderr = stderr
+
+        # The log lines of the threads are not mixed up.
+        lines = [
+            line
+            for line in string_io.getvalue().splitlines()
+            if "has not been set" in line
+        ]
+        for line in lines:
+            self.assertRegex(line, r"^\[[^\[\]]+:\d+\] Input 0 has not been set\.$")
+        # Logging may be compiled out.
+        self.assertIn(len(lines), (0, 50 * len(methods)))
+
     def test_program_method_index_out_of_bounds(self):
         exported_program, _ = create_program(ModuleMulti())
         executorch_program = self.load_prog_fn(exported_program.buffer)
@@ -435,6 +603,33 @@ class PybindingsTest(unittest.TestCase):
         self.assertTrue(torch.allclose(expected, executorch_output[0]))
         self.assertEqual(str(torch.ones(2, 2)), str(executorch_output[1]))
 
+    def test_method_run_batch(self):
+        for alloc_graph_output in (True, False):
+            exported_program, _ = create_program(
+                ModuleAdd(),
+                et_config=ExecutorchBackendConfig(
+                    memory_planning_pass=MemoryPlanningPass(
+                        alloc_graph_output=alloc_graph_output
+                    )
+                ),
+            )
+            executorch_program = self.load_prog_fn(exported_program.buffer)
+            executorch_method = executorch_program.load_method("forward")
+
+            inputs = [(torch.randn(2, 2), torch.randn(2, 2)) for _ in range(4)]
+            outputs = [[torch.empty(2, 2)] for _ in inputs]
+            stats = executorch_method.run_batch(inputs, outputs)
+
+            for (x, y), (output,) in zip(inputs, outputs):
+                self.assertTrue(torch.allclose(x + y, output))
+            self.assertEqual(stats["num_iterations"], 4)
+
+            # The method's own outputs are still usable afterwards.
+            executorch_output = executorch_method(inputs[0])[0]
+            self.assertTrue(
+                torch.allclose(inputs[0][0] + inputs[0][1], executorch_output)
+            )
+
     def test_method_channels_last(self) -> None:
         model = ModuleChannelsLast()
         exported_program, inputs = create_program(model)